@@ -25,6 +25,7 @@ from src.modules.translations import Translation  # noqa: F401
 from src.modules.translations._models import (  # noqa: F401
     TranslationCategoryMapping,
     TranslationContextPrompt,
+    TranslationCounter,
     TranslationPrimaryCategory,
     TranslationSubCategory,
     TranslationThread,
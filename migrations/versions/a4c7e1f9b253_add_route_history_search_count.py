@@ -0,0 +1,39 @@
+"""add search_count/last_searched_at to route_history
+
+Revision ID: a4c7e1f9b253
+Revises: f3b9d2e6a481
+Create Date: 2026-10-19 14:00:00.000000
+
+Repeated searches of the same route are upserted into one row instead of
+inserting a new path each time. A search reuses the id of the latest row
+with the same (profile_id, route_key) whose last_searched_at is within the
+dedup window (route_key column added in b7d3e9a1c524).
+/routes/recent orders by last_searched_at.
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4c7e1f9b253'
+down_revision: str | Sequence[str] | None = 'f3b9d2e6a481'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add dedup counter columns and recent-order index."""
+    op.add_column('route_history', sa.Column('search_count', sa.Integer(), server_default='1', nullable=False))
+    op.add_column('route_history', sa.Column('last_searched_at', sa.DateTime(), nullable=True))
+    op.execute("UPDATE route_history SET last_searched_at = created_at")
+    op.alter_column('route_history', 'last_searched_at', nullable=False)
+    op.create_index('ix_route_history_profile_last_searched', 'route_history', ['profile_id', 'last_searched_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Drop dedup counter columns."""
+    op.drop_index('ix_route_history_profile_last_searched', table_name='route_history')
+    op.drop_column('route_history', 'last_searched_at')
+    op.drop_column('route_history', 'search_count')
@@ -0,0 +1,35 @@
+"""add memory_key to translations
+
+Revision ID: b6d2f8a3c914
+Revises: a4c7e1f9b253
+Create Date: 2026-10-19 15:00:00.000000
+
+Translation memory: SHA-256 of normalized (source_text, source_lang,
+target_lang, context_primary, context_sub) plus model/prompt version.
+Indexed so /translate/text can reuse a prior translation without
+calling Vertex AI. Existing rows stay NULL (never reused).
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'b6d2f8a3c914'
+down_revision: str | Sequence[str] | None = 'a4c7e1f9b253'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add memory_key column and index."""
+    op.add_column('translations', sa.Column('memory_key', sqlmodel.sql.sqltypes.AutoString(length=64), nullable=True))
+    op.create_index(op.f('ix_translations_memory_key'), 'translations', ['memory_key'], unique=False)
+
+
+def downgrade() -> None:
+    """Drop memory_key column and index."""
+    op.drop_index(op.f('ix_translations_memory_key'), table_name='translations')
+    op.drop_column('translations', 'memory_key')
@@ -0,0 +1,46 @@
+"""add route_history.route_key
+
+Revision ID: b7d3e9a1c524
+Revises: e4b8c2d6f315
+Create Date: 2026-10-19 22:00:00.000000
+
+Duplicate searches are merged into the latest row for the same
+(profile, route key) searched within ROUTE_HISTORY_DEDUP_WINDOW_S,
+instead of fixed epoch buckets. Existing rows have no key and are not
+merged with new searches.
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b7d3e9a1c524"
+down_revision: str | Sequence[str] | None = "e4b8c2d6f315"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add route_key and its lookup index."""
+    op.add_column(
+        "route_history",
+        sa.Column(
+            "route_key", sqlmodel.sql.sqltypes.AutoString(length=64), nullable=True
+        ),
+    )
+    op.create_index(
+        "ix_route_history_profile_route_key",
+        "route_history",
+        ["profile_id", "route_key", "last_searched_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Drop route_key."""
+    op.drop_index("ix_route_history_profile_route_key", table_name="route_history")
+    op.drop_column("route_history", "route_key")
@@ -0,0 +1,53 @@
+"""add composite/partial indexes for hot list queries
+
+Revision ID: c8e4a2f6b917
+Revises: b6d2f8a3c914
+Create Date: 2026-10-19 17:00:00.000000
+
+Every list query filters on the owner and orders by time, so each access
+path gets an index whose trailing columns match the ORDER BY (created_at,
+id keyset): rows come out of an index range scan already ordered and the
+LIMIT stops early, instead of sorting every row of a heavy user.
+
+- translations: profile (+ translation_type / + mission_progress_id) and
+  thread_id → created_at, id. The single-column profile_id/thread_id
+  indexes are prefixes of the new ones and are dropped.
+- translation_threads: profile → created_at, id WHERE deleted_at IS NULL.
+- route_destinations: profile → visit_count, last_visited_at.
+  (route_history already has ix_route_history_profile_last_searched.)
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'c8e4a2f6b917'
+down_revision: str | Sequence[str] | None = 'b6d2f8a3c914'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add list-query indexes and drop the indexes they supersede."""
+    op.create_index('ix_translations_profile_created', 'translations', ['profile_id', 'created_at', 'id'], unique=False)
+    op.create_index('ix_translations_profile_type_created', 'translations', ['profile_id', 'translation_type', 'created_at', 'id'], unique=False)
+    op.create_index('ix_translations_profile_mission_created', 'translations', ['profile_id', 'mission_progress_id', 'created_at', 'id'], unique=False, postgresql_where=sa.text('mission_progress_id IS NOT NULL'))
+    op.create_index('ix_translations_thread_created', 'translations', ['thread_id', 'created_at', 'id'], unique=False, postgresql_where=sa.text('thread_id IS NOT NULL'))
+    op.drop_index(op.f('ix_translations_profile_id'), table_name='translations')
+    op.drop_index(op.f('ix_translations_thread_id'), table_name='translations')
+    op.create_index('ix_translation_threads_profile_active_created', 'translation_threads', ['profile_id', 'created_at', 'id'], unique=False, postgresql_where=sa.text('deleted_at IS NULL'))
+    op.create_index('ix_route_destinations_profile_visits', 'route_destinations', ['profile_id', 'visit_count', 'last_visited_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Restore single-column indexes and drop list-query indexes."""
+    op.drop_index('ix_route_destinations_profile_visits', table_name='route_destinations')
+    op.drop_index('ix_translation_threads_profile_active_created', table_name='translation_threads')
+    op.create_index(op.f('ix_translations_thread_id'), 'translations', ['thread_id'], unique=False)
+    op.create_index(op.f('ix_translations_profile_id'), 'translations', ['profile_id'], unique=False)
+    op.drop_index('ix_translations_thread_created', table_name='translations')
+    op.drop_index('ix_translations_profile_mission_created', table_name='translations')
+    op.drop_index('ix_translations_profile_type_created', table_name='translations')
+    op.drop_index('ix_translations_profile_created', table_name='translations')
@@ -0,0 +1,55 @@
+"""add translation_counters
+
+Revision ID: d2f7b9c4e618
+Revises: c8e4a2f6b917
+Create Date: 2026-10-19 18:00:00.000000
+
+Per-profile list totals (translations, translations.<type>, threads) so
+/translations and /translation/threads read the total by primary key
+instead of COUNT(*) on every request. The repository bumps the counters
+in the same transaction as insert/delete/soft-delete; existing rows are
+backfilled here.
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'd2f7b9c4e618'
+down_revision: str | Sequence[str] | None = 'c8e4a2f6b917'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create translation_counters and backfill from existing rows."""
+    op.create_table('translation_counters',
+        sa.Column('profile_id', sa.Uuid(), nullable=False),
+        sa.Column('name', sqlmodel.sql.sqltypes.AutoString(length=32), nullable=False),
+        sa.Column('value', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['profile_id'], ['profiles.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('profile_id', 'name')
+    )
+    op.execute(
+        "INSERT INTO translation_counters (profile_id, name, value) "
+        "SELECT profile_id, 'translations', count(*) FROM translations "
+        "GROUP BY profile_id"
+    )
+    op.execute(
+        "INSERT INTO translation_counters (profile_id, name, value) "
+        "SELECT profile_id, 'translations.' || translation_type, count(*) "
+        "FROM translations GROUP BY profile_id, translation_type"
+    )
+    op.execute(
+        "INSERT INTO translation_counters (profile_id, name, value) "
+        "SELECT profile_id, 'threads', count(*) FROM translation_threads "
+        "WHERE deleted_at IS NULL GROUP BY profile_id"
+    )
+
+
+def downgrade() -> None:
+    """Drop translation_counters."""
+    op.drop_table('translation_counters')
@@ -0,0 +1,55 @@
+"""add phrase_assets
+
+Revision ID: e4b8c2d6f315
+Revises: d2f7b9c4e618
+Create Date: 2026-10-19 20:00:00.000000
+
+Precomputed per-language results for recommended phrases (translated
+text + synthesized audio URL), keyed by (phrase_id, target_lang). A
+background warmup job fills and refreshes the rows so phrase lookups
+need no LLM or TTS call at request time.
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e4b8c2d6f315"
+down_revision: str | Sequence[str] | None = "d2f7b9c4e618"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create phrase_assets."""
+    op.create_table(
+        "phrase_assets",
+        sa.Column("phrase_id", sa.Uuid(), nullable=False),
+        sa.Column(
+            "target_lang", sqlmodel.sql.sqltypes.AutoString(length=10), nullable=False
+        ),
+        sa.Column("source_text", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column(
+            "translated_text", sqlmodel.sql.sqltypes.AutoString(), nullable=False
+        ),
+        sa.Column(
+            "source_hash", sqlmodel.sql.sqltypes.AutoString(length=64), nullable=False
+        ),
+        sa.Column(
+            "audio_key", sqlmodel.sql.sqltypes.AutoString(length=64), nullable=False
+        ),
+        sa.Column("audio_url", sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+        sa.Column("audio_url_expires_at", sa.DateTime(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["phrase_id"], ["phrases.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("phrase_id", "target_lang"),
+    )
+
+
+def downgrade() -> None:
+    """Drop phrase_assets."""
+    op.drop_table("phrase_assets")
@@ -0,0 +1,47 @@
+"""add plain lat/lng columns to route_history
+
+Revision ID: e8a1c3d5f724
+Revises: 59725ea892a8
+Create Date: 2026-10-19 10:00:00.000000
+
+Store decoded coordinates alongside the GEOGRAPHY columns so the read
+path (/routes/{id}, /routes/search response) never parses WKB.
+GEOGRAPHY columns remain the source for spatial queries/indexes.
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'e8a1c3d5f724'
+down_revision: str | Sequence[str] | None = '59725ea892a8'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_COLUMNS = ('start_lat', 'start_lng', 'end_lat', 'end_lng')
+
+
+def upgrade() -> None:
+    """Add lat/lng float columns and backfill from geography points."""
+    for name in _COLUMNS:
+        op.add_column('route_history', sa.Column(name, sa.Float(), nullable=True))
+
+    # Backfill existing rows from PostGIS points
+    op.execute("""
+        UPDATE route_history
+        SET start_lat = ST_Y(start_point::geometry),
+            start_lng = ST_X(start_point::geometry),
+            end_lat = ST_Y(end_point::geometry),
+            end_lng = ST_X(end_point::geometry)
+    """)
+
+    for name in _COLUMNS:
+        op.alter_column('route_history', name, nullable=False)
+
+
+def downgrade() -> None:
+    """Drop lat/lng float columns (geography columns keep the data)."""
+    for name in _COLUMNS:
+        op.drop_column('route_history', name)
@@ -0,0 +1,71 @@
+"""add route_destinations cluster table
+
+Revision ID: f3b9d2e6a481
+Revises: e8a1c3d5f724
+Create Date: 2026-10-19 12:00:00.000000
+
+Frequent destinations per profile, clustered on a 0.002 degree grid of
+route_history.end_lat/end_lng. Rows are maintained incrementally when a
+route is saved, so the read path never scans route_history.
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3b9d2e6a481'
+down_revision: str | Sequence[str] | None = 'e8a1c3d5f724'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Must match src.modules.routes._utils.DESTINATION_CELL_DEG
+_CELL_DEG = 0.002
+
+
+def upgrade() -> None:
+    """Create route_destinations and backfill from existing history."""
+    op.create_table('route_destinations',
+        sa.Column('id', sa.Uuid(), nullable=False),
+        sa.Column('profile_id', sa.Uuid(), nullable=False),
+        sa.Column('cell', sqlmodel.sql.sqltypes.AutoString(length=32), nullable=False),
+        sa.Column('name', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column('lat', sa.Float(), nullable=False),
+        sa.Column('lng', sa.Float(), nullable=False),
+        sa.Column('visit_count', sa.Integer(), nullable=False),
+        sa.Column('last_visited_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['profile_id'], ['profiles.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('profile_id', 'cell', name='uq_route_destination_cell')
+    )
+    op.create_index(op.f('ix_route_destinations_profile_id'), 'route_destinations', ['profile_id'], unique=False)
+
+    # Backfill clusters from existing route_history
+    op.execute(sa.text("""
+        INSERT INTO route_destinations
+            (id, profile_id, cell, name, lat, lng, visit_count, last_visited_at)
+        SELECT
+            uuid_generate_v7(),
+            profile_id,
+            cell,
+            (array_agg(end_name ORDER BY created_at DESC))[1],
+            avg(end_lat),
+            avg(end_lng),
+            count(*),
+            max(created_at)
+        FROM (
+            SELECT *,
+                floor(end_lat / :cell_deg)::bigint || ':' ||
+                floor(end_lng / :cell_deg)::bigint AS cell
+            FROM route_history
+        ) h
+        GROUP BY profile_id, cell
+    """).bindparams(cell_deg=_CELL_DEG))
+
+
+def downgrade() -> None:
+    """Drop route_destinations."""
+    op.drop_index(op.f('ix_route_destinations_profile_id'), table_name='route_destinations')
+    op.drop_table('route_destinations')
@@ -3,9 +3,11 @@
 Kkachie 백엔드 - 외국인 여행자를 위한 실시간 번역 및 미션 가이드 앱
 """
 
+import logging
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
+from sqlalchemy.exc import SQLAlchemyError
 
 from src.core.config import settings
 from src.core.exceptions import register_error_handlers
@@ -17,7 +19,12 @@ from src.modules.missions import router as missions_router
 from src.modules.phrases import router as phrases_router
 from src.modules.profiles import router as profiles_router
 from src.modules.routes import router as routes_router
+from src.modules.routes._writer import get_route_history_writer
 from src.modules.translations import router as translations_router
+from src.modules.translations._category_catalog import preload_category_catalog
+from src.modules.translations._phrase_warmup import get_phrase_warmup_job
+
+logger = logging.getLogger(__name__)
 
 
 @asynccontextmanager
@@ -26,8 +33,21 @@ async def lifespan(app: FastAPI):
     # Startup
     # 마이그레이션은 서버 시작 전에 수동으로 실행:
     # uv run alembic upgrade head
+    if settings.ROUTE_HISTORY_WRITE_BEHIND:
+        await get_route_history_writer().start()
+    if settings.TRANSLATION_CATALOG_PRELOAD:
+        # 실패해도 기동은 계속 (첫 요청에서 적재)
+        try:
+            preload_category_catalog()
+        except SQLAlchemyError:
+            logger.warning("번역 카테고리 카탈로그 미리 적재 실패", exc_info=True)
+    if settings.TRANSLATION_PHRASE_WARMUP_ENABLED:
+        await get_phrase_warmup_job().start()
     yield
     # Shutdown
+    await get_phrase_warmup_job().stop()
+    # 큐에 남은 경로 기록을 모두 저장한 뒤 종료
+    await get_route_history_writer().stop()
 
 
 app = FastAPI(
@@ -33,6 +33,77 @@ class Settings(BaseSettings):
     # 서버: GOOGLE_CREDENTIALS_JSON 환경변수에 JSON 내용 직접 설정
     GOOGLE_CLOUD_PROJECT: str | None = None
     GOOGLE_CREDENTIALS_JSON: str | None = None  # JSON 문자열 (서버용)
+    VERTEX_MODEL: str = "gemini-2.0-flash-lite-001"  # 번역/생성 Gemini 모델
+    SPEECH_SAMPLE_RATE_HZ: int = 16000  # 음성 번역 업로드 오디오 샘플링 레이트
+    # 동시 단건 번역을 (언어쌍, 컨텍스트)별로 모아 묶음 프롬프트 한 번으로 호출
+    # True면 단건 번역마다 최대 WINDOW_MS만큼 대기 (피크 시 호출 수 절감)
+    VERTEX_MICRO_BATCH_ENABLED: bool = False
+    VERTEX_MICRO_BATCH_WINDOW_MS: float = 5  # 첫 요청 후 모으는 시간
+    VERTEX_MICRO_BATCH_MAX_ITEMS: int = 16  # 도달 시 즉시 호출
+
+    # Translation Memory (반복 문장 번역 재사용)
+    TRANSLATION_MEMORY_ENABLED: bool = True
+    # 프롬프트 변경 시 올려서 기존 번역 메모리 무효화 (모델 변경은 자동 반영)
+    TRANSLATION_MEMORY_VERSION: str = "1"
+    TRANSLATION_MEMORY_SIZE: int = 5000  # 프로세스 내 LRU 항목 수
+    TRANSLATION_MEMORY_TTL_S: float = 30 * 24 * 3600  # 재사용 기간 (30일)
+    TRANSLATION_MEMORY_MAX_CHARS: int = 200  # 이 길이 이하 원문만 메모리 사용
+
+    # Translation Category Catalog (카테고리 마스터 데이터 프로세스 내 적재)
+    TRANSLATION_CATALOG_PRELOAD: bool = True  # 시작 시 미리 적재
+    # 카테고리/프롬프트 데이터 변경 배포 시 올려서 즉시 재적재
+    TRANSLATION_CATALOG_VERSION: str = "1"
+    TRANSLATION_CATALOG_TTL_S: float = 600  # 주기적 재적재 (10분)
+
+    # Batch Translation (여러 문장을 한 프롬프트로 묶어 번역)
+    TRANSLATION_BATCH_MAX_SEGMENTS: int = 50  # 요청당 최대 문장 수
+
+    # Thread Conversation (WebSocket 스레드 대화)
+    # 번역 대기 메시지 수, 가득 차면 소켓 수신을 멈춰 클라이언트 전송 속도 제한
+    TRANSLATION_CONVERSATION_QUEUE_SIZE: int = 8
+    TRANSLATION_CONVERSATION_FLUSH_SIZE: int = 20  # 번역 기록 일괄 저장 행 수
+    TRANSLATION_CONVERSATION_FLUSH_INTERVAL_S: float = 2.0  # 유휴 시 저장 간격
+
+    # Voice Translation (POST /translate/voice, STT → 번역 → TTS 파이프라인)
+    TRANSLATION_VOICE_MAX_AUDIO_BYTES: int = 10 * 1024 * 1024  # 업로드 최대 크기
+
+    # Translation Audio Cache (TTS 결과 재사용, 메모리 → 디스크 → Storage → 합성)
+    # 목소리/오디오 형식 외의 합성 설정이 바뀌면 버전을 올려 기존 캐시 무효화
+    TRANSLATION_AUDIO_CACHE_VERSION: str = "1"
+    TRANSLATION_AUDIO_CACHE_MEMORY_BYTES: int = 64 * 1024 * 1024  # 프로세스 내 총량
+    TRANSLATION_AUDIO_CACHE_DIR: str | None = None  # 로컬 디스크 계층 (None=미사용)
+    TRANSLATION_AUDIO_URL_EXPIRES_S: int = 7 * 24 * 3600  # 서명 URL 유효 시간
+
+    # Phrase Warmup (추천 문장 음성 사전 합성 → GET /translate/phrases/{id} 조회만)
+    # True면 시작 시 백그라운드 작업 시작 (Google TTS 인증 정보 필요)
+    TRANSLATION_PHRASE_WARMUP_ENABLED: bool = False
+    TRANSLATION_PHRASE_WARMUP_INTERVAL_S: float = 600  # 변경 감지 주기
+    TRANSLATION_PHRASE_WARMUP_URL_REFRESH_S: float = 24 * 3600  # 만료 전 URL 재발급
+
+    # Phrase Index (원문이 추천 문장과 정확히 같으면 번역 API 없이 문장 행의 번역 사용)
+    TRANSLATION_PHRASE_INDEX_ENABLED: bool = True
+    TRANSLATION_PHRASE_INDEX_TTL_S: float = 60  # 문장 변경 반영 주기
+
+    # Route History (경로 기록 write-behind 저장)
+    # True면 /routes/search 응답 후 백그라운드에서 배치 INSERT
+    ROUTE_HISTORY_WRITE_BEHIND: bool = False
+    ROUTE_HISTORY_QUEUE_SIZE: int = 1000  # 큐 최대 크기 (초과 시 동기 저장)
+    ROUTE_HISTORY_BATCH_SIZE: int = 50  # 한 번에 INSERT할 최대 행 수
+    ROUTE_HISTORY_FLUSH_INTERVAL_S: float = 0.5  # 배치 수집 최대 대기 시간
+    ROUTE_HISTORY_FLUSH_RETRIES: int = 3  # 배치 저장 재시도 (이후 행 단위 저장)
+    ROUTE_HISTORY_RETRY_BACKOFF_S: float = 0.2  # 첫 재시도 대기 (재시도마다 2배)
+    # 동일 경로 재검색 합산 기간 (0이면 매번 새 기록)
+    ROUTE_HISTORY_DEDUP_WINDOW_S: int = 7 * 24 * 3600
+
+    # Route Directions (Kakao 기본 + Naver hedged request)
+    # True면 Kakao가 p95 지연 내 응답하지 않을 때 Naver를 동시 호출
+    ROUTE_HEDGE_ENABLED: bool = False
+    ROUTE_HEDGE_DEFAULT_DELAY_S: float = 1.0  # 샘플 부족 시 hedge 지연
+
+    # Route ETA Matrix (POST /routes/matrix)
+    ROUTE_MATRIX_CONCURRENCY: int = 5  # Directions 동시 호출 최대 수
+    ROUTE_MATRIX_CACHE_SIZE: int = 10000  # (출발 셀, 도착 셀, 옵션) 캐시 항목 수
+    ROUTE_MATRIX_CACHE_TTL_S: float = 300.0  # 캐시 유효 시간
 
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -14,7 +14,7 @@ from typing import TYPE_CHECKING, Annotated
 from uuid import UUID
 
 import jwt
-from fastapi import Depends
+from fastapi import Depends, WebSocket, WebSocketException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from jwt import PyJWKClient
 from sqlmodel import Session, select
@@ -139,10 +139,38 @@ def get_current_profile(
     session: Annotated[Session, Depends(get_session)],
 ) -> Profile:
     """현재 인증된 사용자의 프로필 반환"""
+    token = _extract_token(credentials)
+    return _get_profile_by_token(token, session)
+
+
+def get_websocket_profile(
+    websocket: WebSocket,
+    session: Annotated[Session, Depends(get_session)],
+) -> Profile:
+    """WebSocket 연결 사용자의 프로필 반환 (연결 시 한 번만 검증)
+
+    토큰: Authorization 헤더 또는 token 쿼리 파라미터 (브라우저는 헤더 설정 불가)
+    실패 시 핸드셰이크를 정책 위반(1008)으로 종료
+    """
+    scheme, _, token = websocket.headers.get("authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        token = websocket.query_params.get("token", "")
+
+    try:
+        if not token:
+            raise UnauthorizedError("인증 토큰이 필요해요")
+        return _get_profile_by_token(token, session)
+    except (UnauthorizedError, TokenInvalidError) as e:
+        raise WebSocketException(
+            code=status.WS_1008_POLICY_VIOLATION, reason=e.message
+        ) from e
+
+
+def _get_profile_by_token(token: str, session: Session) -> Profile:
+    """토큰 검증 후 profiles 테이블에서 프로필 조회"""
     # 런타임 import로 순환 참조 방지
     from src.modules.profiles._models import Profile
 
-    token = _extract_token(credentials)
     user_info = verify_supabase_token(token)
     supabase_user_id = UUID(user_info["id"])
 
@@ -160,4 +188,5 @@ def get_current_profile(
 # 타입 별칭
 CurrentSupabaseUserId = Annotated[UUID, Depends(get_current_supabase_user_id)]
 CurrentProfile = Annotated["Profile", Depends(get_current_profile)]
+WebSocketProfile = Annotated["Profile", Depends(get_websocket_profile)]
 DbSession = Annotated[Session, Depends(get_session)]
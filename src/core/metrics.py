@@ -0,0 +1,113 @@
+"""프로세스 내 메트릭
+
+외부 수집기 없이 요청 간 공유되는 지연 히스토그램과 카운터
+- LatencyHistogram: 로그 스케일 버킷 지연 분포 (p50/p95 조회)
+- Metrics: 이름별 히스토그램/카운터 레지스트리 (GET /health/metrics로 노출)
+"""
+
+from __future__ import annotations
+
+import bisect
+
+
+class LatencyHistogram:
+    """지연 시간 히스토그램 (로그 스케일 버킷 + 지수 감쇠)
+
+    전체 샘플을 보관하지 않고 버킷 카운트만 유지
+    샘플 수가 max_samples에 도달하면 카운트를 절반으로 줄여 최근 값에 가중
+    """
+
+    # 버킷 상한 (초), 마지막 버킷은 그 이상 전부
+    BOUNDS_S = (
+        0.05, 0.075, 0.1, 0.15, 0.2, 0.3, 0.4, 0.5,
+        0.75, 1.0, 1.5, 2.0, 3.0, 5.0, 7.5, 10.0,
+    )  # fmt: skip
+
+    def __init__(self, max_samples: int = 500) -> None:
+        self._max_samples = max_samples
+        self._counts = [0] * (len(self.BOUNDS_S) + 1)
+        self._total = 0
+
+    @property
+    def count(self) -> int:
+        """현재 (감쇠 반영) 샘플 수"""
+        return self._total
+
+    def record(self, latency_s: float) -> None:
+        """지연 시간 기록"""
+        if self._total >= self._max_samples:
+            self._counts = [c // 2 for c in self._counts]
+            self._total = sum(self._counts)
+        self._counts[bisect.bisect_left(self.BOUNDS_S, latency_s)] += 1
+        self._total += 1
+
+    def percentile(self, q: float) -> float | None:
+        """q 분위 지연 (버킷 상한, 샘플 없으면 None)"""
+        if self._total == 0:
+            return None
+        threshold = q * self._total
+        cumulative = 0
+        for index, count in enumerate(self._counts):
+            cumulative += count
+            if cumulative >= threshold:
+                if index < len(self.BOUNDS_S):
+                    return self.BOUNDS_S[index]
+                break
+        return self.BOUNDS_S[-1]
+
+
+class Metrics:
+    """이름별 지연 히스토그램/카운터 레지스트리"""
+
+    def __init__(self) -> None:
+        self._histograms: dict[str, LatencyHistogram] = {}
+        self._counters: dict[str, int] = {}
+
+    def histogram(self, name: str) -> LatencyHistogram:
+        """이름별 지연 히스토그램 (없으면 생성)"""
+        if name not in self._histograms:
+            self._histograms[name] = LatencyHistogram()
+        return self._histograms[name]
+
+    def observe(self, name: str, latency_s: float) -> None:
+        """지연 시간 기록"""
+        self.histogram(name).record(latency_s)
+
+    def increment(self, name: str, value: int = 1) -> None:
+        """카운터 증가"""
+        self._counters[name] = self._counters.get(name, 0) + value
+
+    def counter(self, name: str) -> int:
+        """카운터 값"""
+        return self._counters.get(name, 0)
+
+    def snapshot(self) -> dict:
+        """전체 메트릭 스냅샷 (히스토그램은 샘플 수와 p50/p95 초)"""
+        return {
+            "histograms": {
+                name: {
+                    "count": h.count,
+                    "p50_s": h.percentile(0.5),
+                    "p95_s": h.percentile(0.95),
+                }
+                for name, h in sorted(self._histograms.items())
+            },
+            "counters": dict(sorted(self._counters.items())),
+        }
+
+    def clear(self) -> None:
+        """전체 삭제"""
+        self._histograms.clear()
+        self._counters.clear()
+
+
+# 싱글톤 인스턴스
+_metrics: Metrics | None = None
+
+
+def get_metrics() -> Metrics:
+    """Metrics 싱글톤 반환"""
+    global _metrics
+    if _metrics is None:
+        _metrics = Metrics()
+    return _metrics
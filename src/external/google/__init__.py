@@ -1,20 +1,38 @@
-"""Google Vertex AI Provider
+"""Google Cloud Provider
 
-Vertex AI (Gemini) 기반 AI 기능 연동
+Vertex AI (Gemini), Speech-to-Text, Text-to-Speech 연동
 
 기능 목록:
 1. 범용 콘텐츠 생성 - generate_content()
 2. 컨텍스트 기반 번역 - translate()
+3. 묶음 번역 (단일 프롬프트, 비동기) - translate_batch()
+4. 번역 스트리밍 (비동기) - translate_stream()
+5. 스트리밍 음성 인식 (비동기) - streaming_recognize()
+6. 음성 합성 (비동기) - synthesize()
+
+오프라인 개발/테스트용 가짜 구현은 fakes 모듈
+동시 단건 번역을 묶음 번역으로 모아 호출하는 마이크로 배칭은 batching 모듈
 """
 
 import os
 
 from src.core.config import settings
 
-from ._base import IAsyncVertexAIProvider, IVertexAIProvider, VertexAIError
+from ._base import (
+    IAsyncSpeechProvider,
+    IAsyncTextToSpeechProvider,
+    IAsyncVertexAIProvider,
+    IVertexAIProvider,
+    SpeechError,
+    SpeechRecognitionResult,
+    VertexAIError,
+    VertexAIResponseFormatError,
+)
 
 _vertex_instance: IVertexAIProvider | None = None
 _async_vertex_instance: IAsyncVertexAIProvider | None = None
+_speech_instance: IAsyncSpeechProvider | None = None
+_tts_instance: IAsyncTextToSpeechProvider | None = None
 
 
 def _has_google_credentials() -> bool:
@@ -50,6 +68,8 @@ def get_vertex_provider() -> IVertexAIProvider | None:
 def get_async_vertex_provider() -> IAsyncVertexAIProvider | None:
     """Vertex AI Provider 반환 - 비동기
 
+    VERTEX_MICRO_BATCH_ENABLED=True면 단건 번역을 마이크로 배칭
+
     Note:
         GOOGLE_CLOUD_PROJECT와 GOOGLE_CREDENTIALS_JSON (또는 ADC) 필요
     """
@@ -63,16 +83,74 @@ def get_async_vertex_provider() -> IAsyncVertexAIProvider | None:
 
     from .gemini import AsyncVertexAIProvider
 
-    _async_vertex_instance = AsyncVertexAIProvider(
+    provider: IAsyncVertexAIProvider = AsyncVertexAIProvider(
         project_id=settings.GOOGLE_CLOUD_PROJECT,
     )
+    if settings.VERTEX_MICRO_BATCH_ENABLED:
+        from .batching import MicroBatchingVertexAIProvider
+
+        provider = MicroBatchingVertexAIProvider(
+            provider,
+            window_s=settings.VERTEX_MICRO_BATCH_WINDOW_MS / 1000,
+            max_items=settings.VERTEX_MICRO_BATCH_MAX_ITEMS,
+        )
+    _async_vertex_instance = provider
     return _async_vertex_instance
 
 
+def get_async_speech_provider() -> IAsyncSpeechProvider | None:
+    """Speech-to-Text Provider 반환 - 비동기 스트리밍
+
+    Note:
+        GOOGLE_CLOUD_PROJECT와 GOOGLE_CREDENTIALS_JSON (또는 ADC) 필요
+    """
+    global _speech_instance
+
+    if not settings.GOOGLE_CLOUD_PROJECT or not _has_google_credentials():
+        return None
+
+    if _speech_instance is not None:
+        return _speech_instance
+
+    from .speech import AsyncSpeechProvider
+
+    _speech_instance = AsyncSpeechProvider(
+        sample_rate_hz=settings.SPEECH_SAMPLE_RATE_HZ,
+    )
+    return _speech_instance
+
+
+def get_async_tts_provider() -> IAsyncTextToSpeechProvider | None:
+    """Text-to-Speech Provider 반환 - 비동기
+
+    Note:
+        GOOGLE_CLOUD_PROJECT와 GOOGLE_CREDENTIALS_JSON (또는 ADC) 필요
+    """
+    global _tts_instance
+
+    if not settings.GOOGLE_CLOUD_PROJECT or not _has_google_credentials():
+        return None
+
+    if _tts_instance is not None:
+        return _tts_instance
+
+    from .text_to_speech import AsyncTextToSpeechProvider
+
+    _tts_instance = AsyncTextToSpeechProvider()
+    return _tts_instance
+
+
 __all__ = [
+    "IAsyncSpeechProvider",
+    "IAsyncTextToSpeechProvider",
     "IAsyncVertexAIProvider",
     "IVertexAIProvider",
+    "SpeechError",
+    "SpeechRecognitionResult",
     "VertexAIError",
+    "VertexAIResponseFormatError",
+    "get_async_speech_provider",
+    "get_async_tts_provider",
     "get_async_vertex_provider",
     "get_vertex_provider",
 ]
@@ -1,6 +1,16 @@
-"""Google Vertex AI 인터페이스 및 에러 클래스"""
+"""Google Cloud (Vertex AI, Speech-to-Text, Text-to-Speech) 인터페이스 및 에러 클래스"""
 
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+
+# 앱 언어 코드 → Google Cloud 언어 코드 (BCP-47)
+_LANGUAGE_CODES = {"ko": "ko-KR", "en": "en-US"}
+
+
+def language_code(lang: str) -> str:
+    """Google Cloud 언어 코드 ("ko" → "ko-KR", 지역 포함 코드는 그대로)"""
+    return _LANGUAGE_CODES.get(lang.lower(), lang)
 
 
 class VertexAIError(Exception):
@@ -12,6 +22,33 @@ class VertexAIError(Exception):
         super().__init__(message)
 
 
+class VertexAIResponseFormatError(VertexAIError):
+    """Vertex AI 응답 형식 에러 (묶음 번역 결과 파싱 실패)"""
+
+
+class SpeechError(Exception):
+    """Speech-to-Text / Text-to-Speech API 에러"""
+
+    def __init__(self, message: str, code: int | None = None):
+        self.message = message
+        self.code = code
+        super().__init__(message)
+
+
+@dataclass(frozen=True)
+class SpeechRecognitionResult:
+    """스트리밍 음성 인식 결과
+
+    is_final=False는 부분 인식 (이후 바뀔 수 있음)
+    is_final=True는 확정 구간 (이후 결과는 다음 구간)
+    """
+
+    transcript: str
+    is_final: bool
+    confidence: float | None = None
+    end_offset_ms: int | None = None  # 오디오 시작부터 이 결과 끝까지
+
+
 class IVertexAIProvider(ABC):
     """Vertex AI Provider 인터페이스"""
 
@@ -84,3 +121,102 @@ class IAsyncVertexAIProvider(ABC):
             번역된 텍스트
         """
         ...
+
+    @abstractmethod
+    def translate_stream(
+        self,
+        text: str,
+        source_lang: str,
+        target_lang: str,
+        context: str | None = None,
+    ) -> AsyncIterator[str]:
+        """텍스트 번역 스트리밍 (비동기)
+
+        Args:
+            text: 번역할 텍스트
+            source_lang: 원본 언어 코드 (예: "en", "ko")
+            target_lang: 대상 언어 코드 (예: "en", "ko")
+            context: 번역 컨텍스트 (상황 설명, 선택)
+
+        Yields:
+            생성되는 순서대로의 번역 텍스트 조각
+        """
+        ...
+
+    @abstractmethod
+    async def translate_batch(
+        self,
+        texts: list[str],
+        source_lang: str,
+        target_lang: str,
+        context: str | None = None,
+    ) -> list[str]:
+        """여러 텍스트를 한 번의 프롬프트로 묶어 번역 (비동기)
+
+        Args:
+            texts: 번역할 텍스트 목록 (같은 언어쌍/컨텍스트)
+            source_lang: 원본 언어 코드 (예: "en", "ko")
+            target_lang: 대상 언어 코드 (예: "en", "ko")
+            context: 번역 컨텍스트 (상황 설명, 선택)
+
+        Returns:
+            texts와 같은 순서의 번역된 텍스트 목록
+
+        Raises:
+            VertexAIResponseFormatError: 응답을 항목별로 파싱하지 못한 경우
+        """
+        ...
+
+
+class IAsyncSpeechProvider(ABC):
+    """Speech-to-Text Provider 인터페이스 (비동기 스트리밍)"""
+
+    @abstractmethod
+    def streaming_recognize(
+        self,
+        audio_chunks: AsyncIterator[bytes],
+        language: str,
+        content_type: str | None = None,
+    ) -> AsyncIterator[SpeechRecognitionResult]:
+        """오디오 조각을 받는 대로 인식 (부분/확정 결과 스트리밍)
+
+        Args:
+            audio_chunks: 업로드 순서대로의 오디오 바이트 조각
+            language: 음성 언어 코드 (예: "ko", "en")
+            content_type: 오디오 MIME 타입 (예: "audio/webm", 인코딩 결정)
+
+        Yields:
+            부분 인식 결과와 확정 구간 결과
+
+        Raises:
+            SpeechError: 인식 API 호출 실패
+        """
+        ...
+
+
+class IAsyncTextToSpeechProvider(ABC):
+    """Text-to-Speech Provider 인터페이스 (비동기)"""
+
+    audio_format: str = "mp3"
+    content_type: str = "audio/mpeg"
+
+    @abstractmethod
+    def voice(self, language: str) -> str:
+        """언어별 목소리 식별자 (합성 결과 캐시 키용, 목소리 설정이 바뀌면 값도 변경)"""
+        ...
+
+    @abstractmethod
+    async def synthesize(self, text: str, language: str) -> bytes:
+        """텍스트 음성 합성
+
+        Args:
+            text: 합성할 텍스트 (문장 단위 권장)
+            language: 언어 코드 (예: "ko", "en")
+
+        Returns:
+            MP3 오디오 바이트
+
+        Raises:
+            SpeechError: 합성 API 호출 실패
+        """
+        ...
@@ -0,0 +1,15 @@
+"""Google Cloud 서비스 계정 인증 정보 (Vertex AI, Speech, Text-to-Speech 공용)"""
+
+import json
+
+from google.oauth2 import service_account
+
+from src.core.config import settings
+
+
+def get_credentials() -> service_account.Credentials | None:
+    """Google Cloud 인증 정보 가져오기 (없으면 ADC 사용)"""
+    if settings.GOOGLE_CREDENTIALS_JSON:
+        info = json.loads(settings.GOOGLE_CREDENTIALS_JSON)
+        return service_account.Credentials.from_service_account_info(info)
+    return None
@@ -1,5 +1,11 @@
 """Vertex AI 프롬프트 템플릿"""
 
+import json
+import re
+
+# 묶음 번역 응답의 ```json 코드 펜스
+_CODE_FENCE = re.compile(r"^```(?:json)?\s*|\s*```$")
+
 # 언어 코드 -> 언어 이름 매핑
 LANG_NAMES = {
     "ko": "한국어",
@@ -39,3 +45,63 @@ def build_translation_prompt(
 원문: {text}
 
 번역:"""
+
+
+def build_batch_translation_prompt(
+    texts: list[str],
+    target_lang_name: str,
+    context: str | None = None,
+) -> str:
+    """묶음 번역 프롬프트 생성 (번호별 JSON 배열 출력)
+
+    지시문/컨텍스트를 한 번만 넣어 항목당 프롬프트 토큰을 줄임
+    """
+    segments = "\n".join(
+        f"{i}. {json.dumps(text, ensure_ascii=False)}"
+        for i, text in enumerate(texts, start=1)
+    )
+    situation = f"\n{context}\n\n위 상황을 고려하여 " if context else "\n"
+    instruction = (
+        f"다음 {len(texts)}개의 번호 붙은 텍스트를 각각 "
+        f"{target_lang_name}로 자연스럽게 번역해주세요."
+    )
+    return f"""당신은 전문 번역가입니다.
+{situation}{instruction}
+각 항목은 독립적으로 번역하고, 합치거나 나누지 마세요.
+결과는 JSON 배열만 출력하고, 다른 설명은 하지 마세요.
+형식: [{{"id": 1, "translation": "..."}}, ...]
+
+원문:
+{segments}
+
+번역:"""
+
+
+def parse_batch_translation(response_text: str, count: int) -> list[str] | None:
+    """묶음 번역 응답 파싱
+
+    Returns:
+        id 순서의 번역 목록 (형식 오류, 항목 누락/중복 시 None)
+    """
+    try:
+        items = json.loads(_CODE_FENCE.sub("", response_text.strip()))
+    except json.JSONDecodeError:
+        return None
+    if not isinstance(items, list) or len(items) != count:
+        return None
+
+    translations: dict[int, str] = {}
+    for item in items:
+        if not isinstance(item, dict):
+            return None
+        item_id = item.get("id")
+        translation = item.get("translation")
+        if (
+            not isinstance(item_id, int)
+            or not isinstance(translation, str)
+            or not 1 <= item_id <= count
+            or item_id in translations
+        ):
+            return None
+        translations[item_id] = translation.strip()
+    return [translations[i] for i in range(1, count + 1)]
@@ -0,0 +1,193 @@
+"""Vertex AI 번역 마이크로 배칭 (비동기)
+
+동시에 들어온 단건 번역 요청을 짧은 시간 모아 한 번의 묶음 번역 프롬프트로 호출
+- 묶는 단위: (원본 언어, 대상 언어, 컨텍스트) — 같은 프롬프트로 번역 가능한 요청만
+- 전송 시점: 첫 요청 후 window_s 경과 또는 max_items개 도달
+- 같은 묶음의 중복 원문은 한 번만 번역
+- 결과는 요청마다 기다리는 코루틴으로 전달 (입력 순서 기준)
+
+묶음 응답 파싱 실패(VertexAIResponseFormatError) 시 항목별 단건 호출로 전환
+(단건 폴백은 감싼 Provider로 직접 호출, 다시 묶지 않음)
+그 외 Vertex AI 에러는 묶음의 모든 요청에 그대로 전달
+"""
+
+import asyncio
+import logging
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
+
+from ._base import IAsyncVertexAIProvider, VertexAIResponseFormatError
+
+logger = logging.getLogger(__name__)
+
+_BatchKey = tuple[str, str, str | None]  # (원본 언어, 대상 언어, 컨텍스트)
+
+
+@dataclass
+class _Batch:
+    """전송 대기 중인 묶음 (요청 원문 + 결과를 받을 Future)"""
+
+    loop: asyncio.AbstractEventLoop
+    items: list[tuple[str, asyncio.Future[str]]] = field(default_factory=list)
+    timer: asyncio.TimerHandle | None = None
+
+
+class MicroBatchingVertexAIProvider(IAsyncVertexAIProvider):
+    """단건 번역을 묶음 번역으로 모아 호출하는 Provider (그 외 기능은 그대로 위임)"""
+
+    def __init__(
+        self,
+        provider: IAsyncVertexAIProvider,
+        window_s: float = 0.005,
+        max_items: int = 16,
+    ) -> None:
+        """마이크로 배처 초기화
+
+        Args:
+            provider: 실제 호출할 Provider
+            window_s: 첫 요청 후 묶음을 모으는 최대 시간 (초)
+            max_items: 묶음 최대 요청 수 (도달 시 즉시 전송)
+        """
+        self._provider = provider
+        self._window_s = window_s
+        self._max_items = max_items
+        self._pending: dict[_BatchKey, _Batch] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+    async def generate_content(self, prompt: str) -> str:
+        """범용 콘텐츠 생성 (위임)"""
+        return await self._provider.generate_content(prompt)
+
+    async def translate(
+        self,
+        text: str,
+        source_lang: str,
+        target_lang: str,
+        context: str | None = None,
+    ) -> str:
+        """텍스트 번역 (같은 언어쌍/컨텍스트 요청과 묶어 호출)"""
+        if self._max_items <= 1:
+            return await self._provider.translate(
+                text, source_lang, target_lang, context
+            )
+
+        loop = asyncio.get_running_loop()
+        key = (source_lang, target_lang, context)
+        batch = self._pending.get(key)
+        if batch is None or batch.loop is not loop:
+            batch = _Batch(loop=loop)
+            batch.timer = loop.call_later(self._window_s, self._flush, key, batch)
+            self._pending[key] = batch
+
+        future: asyncio.Future[str] = loop.create_future()
+        batch.items.append((text, future))
+        if len(batch.items) >= self._max_items:
+            self._flush(key, batch)
+        return await future
+
+    def translate_stream(
+        self,
+        text: str,
+        source_lang: str,
+        target_lang: str,
+        context: str | None = None,
+    ) -> AsyncIterator[str]:
+        """텍스트 번역 스트리밍 (위임, 묶지 않음)"""
+        return self._provider.translate_stream(text, source_lang, target_lang, context)
+
+    async def translate_batch(
+        self,
+        texts: list[str],
+        source_lang: str,
+        target_lang: str,
+        context: str | None = None,
+    ) -> list[str]:
+        """묶음 번역 (위임, 이미 묶인 요청)
+
+        파싱 실패 시 감싼 Provider로 항목별 호출
+        (호출자의 단건 폴백이 다시 묶여 같은 프롬프트가 재전송되지 않도록)
+        """
+        try:
+            return await self._provider.translate_batch(
+                texts, source_lang, target_lang, context
+            )
+        except VertexAIResponseFormatError:
+            logger.warning(
+                "묶음 번역 응답 파싱 실패, 항목별 번역으로 전환: %d건", len(texts)
+            )
+
+        translations = await asyncio.gather(
+            *(
+                self._provider.translate(text, source_lang, target_lang, context)
+                for text in texts
+            )
+        )
+        return list(translations)
+
+    def _flush(self, key: _BatchKey, batch: _Batch) -> None:
+        """묶음 전송 시작 (타이머 만료 또는 최대 수 도달)"""
+        if self._pending.get(key) is batch:
+            del self._pending[key]
+        if batch.timer is not None:
+            batch.timer.cancel()
+            batch.timer = None
+        if not batch.items:
+            return
+
+        items, batch.items = batch.items, []
+        task = batch.loop.create_task(self._send(key, items))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _send(
+        self, key: _BatchKey, items: list[tuple[str, asyncio.Future[str]]]
+    ) -> None:
+        """묶음 번역 호출 후 요청별 결과 전달"""
+        # 기다리던 요청이 취소된 항목은 제외
+        items = [(text, future) for text, future in items if not future.done()]
+        texts = list(dict.fromkeys(text for text, _ in items))
+        if not texts:
+            return
+
+        try:
+            results = await self._translate_texts(texts, key)
+        except Exception as e:
+            for _, future in items:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for text, future in items:
+            if future.done():
+                continue
+            result = results[text]
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    async def _translate_texts(
+        self, texts: list[str], key: _BatchKey
+    ) -> dict[str, str | BaseException]:
+        """원문별 번역 (2건 이상은 묶음 프롬프트, 파싱 실패 시 항목별 호출)"""
+        source_lang, target_lang, context = key
+        if len(texts) > 1:
+            try:
+                translations = await self._provider.translate_batch(
+                    texts, source_lang, target_lang, context
+                )
+                return dict(zip(texts, translations, strict=True))
+            except VertexAIResponseFormatError:
+                logger.warning(
+                    "마이크로 배치 응답 파싱 실패, 항목별 번역으로 전환: %d건",
+                    len(texts),
+                )
+
+        results = await asyncio.gather(
+            *(
+                self._provider.translate(text, source_lang, target_lang, context)
+                for text in texts
+            ),
+            return_exceptions=True,
+        )
+        return dict(zip(texts, results, strict=True))
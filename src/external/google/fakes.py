@@ -0,0 +1,138 @@
+"""Google Cloud Provider 로컬 가짜 구현 (오프라인 개발/테스트용)
+
+네트워크/인증 없이 파이프라인 전체를 실행하기 위한 결정적 Provider
+- FakeSpeechProvider: 오디오 바이트를 UTF-8 텍스트로 간주, 문장 부호마다 확정 구간
+- FakeTextToSpeechProvider: "FAKE-MP3" 헤더 + 텍스트 바이트
+- FakeAsyncVertexAIProvider: "[대상 언어] 원문" 번역
+
+latency_s로 호출마다 지연을 넣어 단계 중첩/지연 계측을 재현
+"""
+
+import asyncio
+import codecs
+import re
+from collections.abc import AsyncIterator
+
+from ._base import (
+    IAsyncSpeechProvider,
+    IAsyncTextToSpeechProvider,
+    IAsyncVertexAIProvider,
+    SpeechRecognitionResult,
+)
+
+# 확정 구간 경계 (문장 부호 + 공백 또는 끝)
+_SENTENCE_END = re.compile(r"(?<=[.!?\u3002\uff1f\uff01])\s+")
+
+FAKE_AUDIO_HEADER = b"FAKE-MP3:"
+
+
+class FakeSpeechProvider(IAsyncSpeechProvider):
+    """가짜 Speech-to-Text (오디오 바이트 = UTF-8 텍스트)
+
+    조각마다 현재 구간의 부분 인식 결과를 내고, 문장 부호로 끝난 구간은 확정
+    스트림이 끝나면 남은 텍스트를 마지막 확정 구간으로 반환
+    """
+
+    def __init__(self, latency_s: float = 0.0) -> None:
+        self.latency_s = latency_s
+        self.chunks: list[bytes] = []
+
+    async def _result(self, text: str, *, is_final: bool) -> SpeechRecognitionResult:
+        if self.latency_s:
+            await asyncio.sleep(self.latency_s)
+        return SpeechRecognitionResult(
+            transcript=text,
+            is_final=is_final,
+            confidence=0.9 if is_final else None,
+        )
+
+    async def streaming_recognize(
+        self,
+        audio_chunks: AsyncIterator[bytes],
+        language: str,
+        content_type: str | None = None,
+    ) -> AsyncIterator[SpeechRecognitionResult]:
+        """오디오 조각을 받는 대로 인식 (부분/확정 결과 스트리밍)"""
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="ignore")
+        pending = ""
+        async for chunk in audio_chunks:
+            self.chunks.append(chunk)
+            pending += decoder.decode(chunk)
+            *segments, pending = _SENTENCE_END.split(pending)
+            for segment in segments:
+                yield await self._result(segment.strip(), is_final=True)
+            if pending.strip():
+                yield await self._result(pending.strip(), is_final=False)
+
+        pending += decoder.decode(b"", final=True)
+        if pending.strip():
+            yield await self._result(pending.strip(), is_final=True)
+
+
+class FakeTextToSpeechProvider(IAsyncTextToSpeechProvider):
+    """가짜 Text-to-Speech (FAKE_AUDIO_HEADER + 텍스트)"""
+
+    def __init__(self, latency_s: float = 0.0) -> None:
+        self.latency_s = latency_s
+        self.calls: list[str] = []
+
+    def voice(self, language: str) -> str:
+        """언어별 목소리 식별자"""
+        return f"fake-{language}"
+
+    async def synthesize(self, text: str, language: str) -> bytes:
+        """텍스트 음성 합성"""
+        self.calls.append(text)
+        if self.latency_s:
+            await asyncio.sleep(self.latency_s)
+        return FAKE_AUDIO_HEADER + text.encode()
+
+
+class FakeAsyncVertexAIProvider(IAsyncVertexAIProvider):
+    """가짜 Vertex AI ("[대상 언어] 원문" 번역)"""
+
+    def __init__(self, latency_s: float = 0.0) -> None:
+        self.latency_s = latency_s
+        self.calls: list[str] = []
+
+    async def generate_content(self, prompt: str) -> str:
+        """범용 콘텐츠 생성 (프롬프트 그대로)"""
+        return prompt
+
+    async def translate(
+        self,
+        text: str,
+        source_lang: str,
+        target_lang: str,
+        context: str | None = None,
+    ) -> str:
+        """텍스트 번역"""
+        self.calls.append(text)
+        if self.latency_s:
+            await asyncio.sleep(self.latency_s)
+        return f"[{target_lang}] {text}"
+
+    async def translate_stream(
+        self,
+        text: str,
+        source_lang: str,
+        target_lang: str,
+        context: str | None = None,
+    ) -> AsyncIterator[str]:
+        """텍스트 번역 스트리밍 (단어 단위 조각)"""
+        translated = await self.translate(text, source_lang, target_lang, context)
+        for word in translated.split(" "):
+            yield word + " "
+
+    async def translate_batch(
+        self,
+        texts: list[str],
+        source_lang: str,
+        target_lang: str,
+        context: str | None = None,
+    ) -> list[str]:
+        """여러 텍스트 묶음 번역"""
+        return [
+            await self.translate(text, source_lang, target_lang, context)
+            for text in texts
+        ]
@@ -5,23 +5,28 @@
 동기/비동기 버전 모두 제공
 """
 
-import json
+from collections.abc import AsyncIterator
 
-from google.oauth2 import service_account
-from vertexai.generative_models import GenerativeModel
+from vertexai.generative_models import GenerationConfig, GenerativeModel
 
 from src.core.config import settings
 
-from ._base import IAsyncVertexAIProvider, IVertexAIProvider, VertexAIError
-from ._prompts import build_translation_prompt, get_language_name
+from ._base import (
+    IAsyncVertexAIProvider,
+    IVertexAIProvider,
+    VertexAIError,
+    VertexAIResponseFormatError,
+)
+from ._credentials import get_credentials
+from ._prompts import (
+    build_batch_translation_prompt,
+    build_translation_prompt,
+    get_language_name,
+    parse_batch_translation,
+)
 
-
-def _get_credentials() -> service_account.Credentials | None:
-    """Google Cloud 인증 정보 가져오기"""
-    if settings.GOOGLE_CREDENTIALS_JSON:
-        info = json.loads(settings.GOOGLE_CREDENTIALS_JSON)
-        return service_account.Credentials.from_service_account_info(info)
-    return None
+# 묶음 번역은 JSON 응답 강제 (항목별 파싱)
+_BATCH_GENERATION_CONFIG = GenerationConfig(response_mime_type="application/json")
 
 
 class VertexAIProvider(IVertexAIProvider):
@@ -36,13 +41,13 @@ class VertexAIProvider(IVertexAIProvider):
         """
         import vertexai
 
-        credentials = _get_credentials()
+        credentials = get_credentials()
         vertexai.init(
             project=project_id,
             location=location,
             credentials=credentials,
         )
-        self._model = GenerativeModel("gemini-2.0-flash-lite-001")
+        self._model = GenerativeModel(settings.VERTEX_MODEL)
 
     def generate_content(self, prompt: str) -> str:
         """범용 콘텐츠 생성 (동기)"""
@@ -87,13 +92,13 @@ class AsyncVertexAIProvider(IAsyncVertexAIProvider):
         """
         import vertexai
 
-        credentials = _get_credentials()
+        credentials = get_credentials()
         vertexai.init(
             project=project_id,
             location=location,
             credentials=credentials,
         )
-        self._model = GenerativeModel("gemini-2.0-flash-lite-001")
+        self._model = GenerativeModel(settings.VERTEX_MODEL)
 
     async def generate_content(self, prompt: str) -> str:
         """범용 콘텐츠 생성 (비동기)"""
@@ -124,3 +129,50 @@ class AsyncVertexAIProvider(IAsyncVertexAIProvider):
             return response.text.strip()
         except Exception as e:
             raise VertexAIError(f"Translation failed: {e}") from e
+
+    async def translate_stream(
+        self,
+        text: str,
+        source_lang: str,
+        target_lang: str,
+        context: str | None = None,
+    ) -> AsyncIterator[str]:
+        """텍스트 번역 스트리밍 (비동기, Gemini 스트리밍 생성)"""
+        if not text:
+            return
+
+        try:
+            target_lang_name = get_language_name(target_lang)
+            prompt = build_translation_prompt(text, target_lang_name, context)
+            responses = await self._model.generate_content_async(prompt, stream=True)
+            async for chunk in responses:
+                if chunk.text:
+                    yield chunk.text
+        except Exception as e:
+            raise VertexAIError(f"Translation stream failed: {e}") from e
+
+    async def translate_batch(
+        self,
+        texts: list[str],
+        source_lang: str,
+        target_lang: str,
+        context: str | None = None,
+    ) -> list[str]:
+        """여러 텍스트를 한 번의 프롬프트로 묶어 번역 (비동기)"""
+        if not texts:
+            return []
+
+        try:
+            target_lang_name = get_language_name(target_lang)
+            prompt = build_batch_translation_prompt(texts, target_lang_name, context)
+            response = await self._model.generate_content_async(
+                prompt, generation_config=_BATCH_GENERATION_CONFIG
+            )
+            response_text = response.text
+        except Exception as e:
+            raise VertexAIError(f"Batch translation failed: {e}") from e
+
+        translations = parse_batch_translation(response_text, len(texts))
+        if translations is None:
+            raise VertexAIResponseFormatError("Batch translation parse failed")
+        return translations
@@ -0,0 +1,90 @@
+"""Google Cloud Speech-to-Text Provider
+
+스트리밍 인식 (StreamingRecognize, 비동기)
+업로드되는 오디오 조각을 그대로 전달하고 부분/확정 결과를 받는 대로 반환
+"""
+
+from collections.abc import AsyncIterator
+
+from google.api_core.exceptions import GoogleAPICallError
+from google.cloud import speech
+
+from ._base import (
+    IAsyncSpeechProvider,
+    SpeechError,
+    SpeechRecognitionResult,
+    language_code,
+)
+from ._credentials import get_credentials
+
+# 오디오 MIME 타입 → 인코딩 (그 외는 WEBM_OPUS로 간주, 모바일 녹음 기본값)
+_ENCODINGS = {
+    "audio/webm": speech.RecognitionConfig.AudioEncoding.WEBM_OPUS,
+    "audio/ogg": speech.RecognitionConfig.AudioEncoding.OGG_OPUS,
+    "audio/flac": speech.RecognitionConfig.AudioEncoding.FLAC,
+    "audio/l16": speech.RecognitionConfig.AudioEncoding.LINEAR16,
+    "audio/wav": speech.RecognitionConfig.AudioEncoding.LINEAR16,
+}
+
+
+class AsyncSpeechProvider(IAsyncSpeechProvider):
+    """Google Cloud Speech-to-Text Provider (비동기 스트리밍)"""
+
+    def __init__(self, sample_rate_hz: int = 16000) -> None:
+        """Speech 클라이언트 초기화
+
+        Args:
+            sample_rate_hz: 오디오 샘플링 레이트 (WEBM/OGG Opus는 헤더 값 우선)
+        """
+        self._client = speech.SpeechAsyncClient(credentials=get_credentials())
+        self._sample_rate_hz = sample_rate_hz
+
+    def _streaming_config(
+        self, language: str, content_type: str | None
+    ) -> speech.StreamingRecognitionConfig:
+        mime_type = (content_type or "").split(";", maxsplit=1)[0].strip().lower()
+        return speech.StreamingRecognitionConfig(
+            config=speech.RecognitionConfig(
+                encoding=_ENCODINGS.get(
+                    mime_type, speech.RecognitionConfig.AudioEncoding.WEBM_OPUS
+                ),
+                sample_rate_hertz=self._sample_rate_hz,
+                language_code=language_code(language),
+                enable_automatic_punctuation=True,
+            ),
+            interim_results=True,
+        )
+
+    async def streaming_recognize(
+        self,
+        audio_chunks: AsyncIterator[bytes],
+        language: str,
+        content_type: str | None = None,
+    ) -> AsyncIterator[SpeechRecognitionResult]:
+        """오디오 조각을 받는 대로 인식 (부분/확정 결과 스트리밍)"""
+        streaming_config = self._streaming_config(language, content_type)
+
+        async def requests() -> AsyncIterator[speech.StreamingRecognizeRequest]:
+            # 첫 요청은 설정, 이후 오디오 조각
+            yield speech.StreamingRecognizeRequest(streaming_config=streaming_config)
+            async for chunk in audio_chunks:
+                yield speech.StreamingRecognizeRequest(audio_content=chunk)
+
+        try:
+            stream = await self._client.streaming_recognize(requests=requests())
+            async for response in stream:
+                for result in response.results:
+                    if not result.alternatives:
+                        continue
+                    alternative = result.alternatives[0]
+                    end_time = result.result_end_time
+                    yield SpeechRecognitionResult(
+                        transcript=alternative.transcript,
+                        is_final=result.is_final,
+                        confidence=alternative.confidence if result.is_final else None,
+                        end_offset_ms=(
+                            int(end_time.total_seconds() * 1000) if end_time else None
+                        ),
+                    )
+        except GoogleAPICallError as e:
+            raise SpeechError(f"Speech recognition failed: {e}") from e
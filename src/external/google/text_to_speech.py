@@ -0,0 +1,45 @@
+"""Google Cloud Text-to-Speech Provider
+
+문장 단위 음성 합성 (비동기, MP3)
+"""
+
+from google.api_core.exceptions import GoogleAPICallError
+from google.cloud import texttospeech
+
+from ._base import IAsyncTextToSpeechProvider, SpeechError, language_code
+from ._credentials import get_credentials
+
+_AUDIO_CONFIG = texttospeech.AudioConfig(audio_encoding=texttospeech.AudioEncoding.MP3)
+_VOICE_GENDER = texttospeech.SsmlVoiceGender.NEUTRAL
+
+
+class AsyncTextToSpeechProvider(IAsyncTextToSpeechProvider):
+    """Google Cloud Text-to-Speech Provider (비동기)"""
+
+    def __init__(self) -> None:
+        """Text-to-Speech 클라이언트 초기화"""
+        self._client = texttospeech.TextToSpeechAsyncClient(
+            credentials=get_credentials()
+        )
+
+    def voice(self, language: str) -> str:
+        """언어별 목소리 식별자 (언어 코드 + 성별)"""
+        return f"{language_code(language)}:{_VOICE_GENDER.name}"
+
+    async def synthesize(self, text: str, language: str) -> bytes:
+        """텍스트 음성 합성 (MP3)"""
+        if not text:
+            return b""
+
+        try:
+            response = await self._client.synthesize_speech(
+                input=texttospeech.SynthesisInput(text=text),
+                voice=texttospeech.VoiceSelectionParams(
+                    language_code=language_code(language),
+                    ssml_gender=_VOICE_GENDER,
+                ),
+                audio_config=_AUDIO_CONFIG,
+            )
+        except GoogleAPICallError as e:
+            raise SpeechError(f"Speech synthesis failed: {e}") from e
+        return response.audio_content
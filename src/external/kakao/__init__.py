@@ -34,6 +34,8 @@ class KakaoProvider(IKakaoProvider):
         goal_lat: float,
         waypoints: list[tuple[float, float]] | None = None,
         option: str = "traoptimal",
+        *,
+        summary_only: bool = False,
     ) -> dict:
         """경로 검색"""
         return await _directions(
@@ -44,6 +46,7 @@ class KakaoProvider(IKakaoProvider):
             self._api_key,
             waypoints,
             option,
+            summary_only=summary_only,
         )
 
     async def search_by_category(
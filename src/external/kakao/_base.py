@@ -24,6 +24,8 @@ class IKakaoProvider(ABC):
         goal_lat: float,
         waypoints: list[tuple[float, float]] | None = None,
         option: str = "traoptimal",
+        *,
+        summary_only: bool = False,
     ) -> dict:
         """경로 검색
 
@@ -34,6 +36,7 @@ class IKakaoProvider(ABC):
             goal_lat: 도착지 위도
             waypoints: 경유지 리스트 [(lng, lat), ...]
             option: 경로 옵션
+            summary_only: True면 요약(거리/시간)만 요청 (path는 빈 배열)
 
         Returns:
             dict: {
@@ -29,6 +29,8 @@ async def directions(
     api_key: str,
     waypoints: list[tuple[float, float]] | None = None,
     option: str = "traoptimal",
+    *,
+    summary_only: bool = False,
 ) -> dict:
     """Kakao Mobility Directions API 호출
 
@@ -40,6 +42,7 @@ async def directions(
         api_key: Kakao REST API Key
         waypoints: 경유지 리스트 [(lng, lat), ...]
         option: 경로 옵션 (traoptimal, trafast 등 - 네이버 호환)
+        summary_only: True면 요약 정보만 요청 (sections/roads 미전송, path는 빈 배열)
 
     Returns:
         dict: {
@@ -62,7 +65,8 @@ async def directions(
         "origin": f"{start_lng},{start_lat}",
         "destination": f"{goal_lng},{goal_lat}",
         "priority": _OPTION_MAPPING.get(option, "RECOMMEND"),
-        "summary": "false",  # 상세 정보 포함 (path 추출 위해)
+        # false: 상세 정보 포함 (path 추출 위해), true: 거리/시간만
+        "summary": "true" if summary_only else "false",
     }
 
     # 경유지 추가 (최대 5개, "|"로 구분)
@@ -62,8 +62,10 @@ class NaverProvider(INaverProvider):
         goal_lat: float,
         waypoints: list[tuple[float, float]] | None = None,
         option: str = "traoptimal",
+        *,
+        summary_only: bool = False,
     ) -> dict:
-        """경로 검색"""
+        """경로 검색 (summary_only는 무시)"""
         return await _directions(
             start_lng,
             start_lat,
@@ -73,6 +75,7 @@ class NaverProvider(INaverProvider):
             self._client_secret,
             waypoints,
             option,
+            summary_only=summary_only,
         )
 
     async def close(self) -> None:
@@ -50,6 +50,8 @@ class INaverProvider(ABC):
         goal_lat: float,
         waypoints: list[tuple[float, float]] | None = None,
         option: str = "traoptimal",
+        *,
+        summary_only: bool = False,
     ) -> dict:
         """경로 검색
 
@@ -60,6 +62,7 @@ class INaverProvider(ABC):
             goal_lat: 도착지 위도
             waypoints: 경유지 리스트 [(lng, lat), ...]
             option: 경로 옵션
+            summary_only: Kakao 호환용 (요약 모드 미지원, 무시)
 
         Returns:
             dict: {
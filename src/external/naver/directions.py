@@ -20,6 +20,8 @@ async def directions(
     client_secret: str,
     waypoints: list[tuple[float, float]] | None = None,
     option: str = "traoptimal",
+    *,
+    summary_only: bool = False,
 ) -> dict:
     """Naver Cloud Directions API 호출
 
@@ -32,6 +34,7 @@ async def directions(
         client_secret: Naver Cloud Platform API Key
         waypoints: 경유지 리스트 [(lng, lat), ...]
         option: 경로 옵션 (traoptimal, trafast, tracomfort 등)
+        summary_only: Kakao 호환용 (Naver는 요약 모드가 없어 무시, 항상 path 포함)
 
     Returns:
         dict: {
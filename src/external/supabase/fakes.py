@@ -0,0 +1,53 @@
+"""Supabase Storage 로컬 가짜 구현 (오프라인 개발/테스트용)
+
+네트워크/인증 없이 스토리지 계층을 실행하기 위한 메모리 Provider
+- 없는 객체의 다운로드/서명 URL은 실제 API처럼 StorageError
+- calls에 (동작, 키) 기록
+"""
+
+from typing import BinaryIO
+
+from ._base import IAsyncStorageProvider, StorageError
+
+_BASE_URL = "https://storage.test"
+
+
+class MemoryStorageProvider(IAsyncStorageProvider):
+    """메모리 스토리지 (비동기)"""
+
+    def __init__(self) -> None:
+        self.objects: dict[str, bytes] = {}
+        self.calls: list[tuple[str, str]] = []
+
+    async def upload(
+        self,
+        file: BinaryIO,
+        key: str,
+        content_type: str | None = None,
+    ) -> str:
+        self.calls.append(("upload", key))
+        self.objects[key] = file.read()
+        return f"{_BASE_URL}/public/{key}"
+
+    async def download(self, key: str) -> bytes:
+        self.calls.append(("download", key))
+        if key not in self.objects:
+            raise StorageError(f"Download failed: {key} not found", 404)
+        return self.objects[key]
+
+    async def delete(self, key: str) -> bool:
+        self.calls.append(("delete", key))
+        return self.objects.pop(key, None) is not None
+
+    async def get_presigned_url(self, key: str, expires_in: int = 3600) -> str:
+        self.calls.append(("sign", key))
+        if key not in self.objects:
+            raise StorageError(f"Create signed URL failed: {key} not found", 404)
+        return f"{_BASE_URL}/sign/{key}?expires_in={expires_in}"
+
+    async def get_upload_url(self, key: str, expires_in: int = 3600) -> str:
+        self.calls.append(("upload_url", key))
+        return f"{_BASE_URL}/upload/{key}?expires_in={expires_in}"
+
+    async def close(self) -> None:
+        """클라이언트 종료 (없음)"""
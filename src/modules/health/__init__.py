@@ -1,12 +1,14 @@
-"""Health 모듈 - Liveness & Readiness 체크"""
+"""Health 모듈 - Liveness & Readiness 체크, 메트릭 조회"""
 
 from fastapi import APIRouter
 
 from src.modules.health.health import router as health_router
+from src.modules.health.metrics import router as metrics_router
 from src.modules.health.ready import router as ready_router
 
 router = APIRouter(prefix="/health", tags=["Health"])
 router.include_router(health_router)
 router.include_router(ready_router)
+router.include_router(metrics_router)
 
 __all__ = ["router"]
@@ -0,0 +1,19 @@
+"""GET /health/metrics - 프로세스 내 메트릭 조회 (인증 필요)"""
+
+from fastapi import APIRouter
+
+from src.core.deps import CurrentProfile
+from src.core.metrics import get_metrics
+from src.core.response import ApiResponse, Status
+
+router = APIRouter()
+
+
+@router.get("/metrics")
+def metrics_snapshot(_profile: CurrentProfile) -> ApiResponse[dict]:
+    """지연 히스토그램(p50/p95)과 카운터 조회 (인스턴스별 값)"""
+    return ApiResponse(
+        status=Status.SUCCESS,
+        message="메트릭 조회에 성공했어요",
+        data=get_metrics().snapshot(),
+    )
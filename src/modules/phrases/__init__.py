@@ -9,6 +9,8 @@ Vertical Slice 구조:
 
 from fastapi import APIRouter
 
+# Phrase 모델을 먼저 export (다른 모듈에서 사용)
+from ._models import Phrase  # noqa: F401
 from .list import router as list_router
 from .use import router as use_router
 
@@ -2,20 +2,38 @@
 
 Vertical Slice 구조:
 - search.py: POST /routes/search
+- search_stream.py: POST /routes/search/stream (NDJSON)
+- compare.py: POST /routes/compare
+- matrix.py: POST /routes/matrix
 - recent.py: GET /routes/recent
+- destinations.py: GET /routes/destinations/frequent
 - detail.py: GET /routes/{route_id}
-- _models.py: RouteHistory 모델
+- eta.py: POST /routes/{route_id}/eta
+- _models.py: RouteHistory, RouteDestination 모델
 - _repository.py: DB 접근
+- _directions.py: 경로 검색 전략 (Kakao/Naver hedged request)
+- _writer.py: 경로 기록 write-behind 저장
+- _eta_cache.py: ETA 매트릭스 캐시
 - _utils.py: 포맷팅 유틸리티
 """
 
 from fastapi import APIRouter
 
+from .compare import router as compare_router
+from .destinations import router as destinations_router
 from .detail import router as detail_router
+from .eta import router as eta_router
+from .matrix import router as matrix_router
 from .recent import router as recent_router
 from .search import router as search_router
+from .search_stream import router as search_stream_router
 
 router = APIRouter(prefix="/routes", tags=["routes"])
 router.include_router(search_router)
+router.include_router(search_stream_router)
+router.include_router(compare_router)
+router.include_router(matrix_router)
 router.include_router(recent_router)
+router.include_router(destinations_router)
 router.include_router(detail_router)
+router.include_router(eta_router)
@@ -0,0 +1,138 @@
+"""routes 경로 검색 전략 (hedged request)
+
+Kakao(기본)와 Naver(보조) Directions를 경쟁시키는 전략 레이어
+- 기본 Provider 호출 후 hedge 지연 내 응답이 없으면 보조 Provider 호출
+- 먼저 성공한 결과를 사용하고 나머지 요청은 취소
+- Provider별 지연 히스토그램의 p95로 hedge 지연 자동 조정
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any
+
+from src.core.config import settings
+from src.core.metrics import LatencyHistogram
+from src.external.kakao import IKakaoProvider
+from src.external.naver import INaverProvider
+
+# (이름, Provider) - 두 Provider의 directions() 입출력 형식이 동일
+DirectionsProvider = tuple[str, IKakaoProvider | INaverProvider]
+
+
+class HedgedDirections:
+    """Hedged 경로 검색 전략"""
+
+    def __init__(
+        self,
+        default_delay_s: float = 1.0,
+        min_delay_s: float = 0.1,
+        max_delay_s: float = 3.0,
+        min_samples: int = 20,
+        quantile: float = 0.95,
+    ) -> None:
+        """전략 초기화
+
+        Args:
+            default_delay_s: 샘플이 min_samples 미만일 때 hedge 지연
+            min_delay_s: hedge 지연 하한
+            max_delay_s: hedge 지연 상한
+            min_samples: 히스토그램 기반 지연을 사용하기 위한 최소 샘플 수
+            quantile: hedge 지연으로 사용할 분위 (기본 p95)
+        """
+        self._default_delay_s = default_delay_s
+        self._min_delay_s = min_delay_s
+        self._max_delay_s = max_delay_s
+        self._min_samples = min_samples
+        self._quantile = quantile
+        self._histograms: dict[str, LatencyHistogram] = {}
+
+    def histogram(self, name: str) -> LatencyHistogram:
+        """Provider별 지연 히스토그램"""
+        if name not in self._histograms:
+            self._histograms[name] = LatencyHistogram()
+        return self._histograms[name]
+
+    def hedge_delay(self, name: str) -> float:
+        """기본 Provider의 p95 지연 기반 hedge 지연 (초)"""
+        histogram = self.histogram(name)
+        p95 = histogram.percentile(self._quantile)
+        if p95 is None or histogram.count < self._min_samples:
+            return self._default_delay_s
+        return min(max(p95, self._min_delay_s), self._max_delay_s)
+
+    async def directions(
+        self,
+        primary: DirectionsProvider,
+        secondary: DirectionsProvider | None = None,
+        **params: Any,
+    ) -> dict:
+        """경로 검색 (hedged)
+
+        Args:
+            primary: 기본 Provider (이름, 인스턴스)
+            secondary: 보조 Provider (None이면 기본 Provider만 호출)
+            **params: directions() 인자 (start_lng, start_lat, ...)
+
+        Returns:
+            먼저 성공한 Provider의 directions() 결과
+
+        Raises:
+            Exception: 모든 Provider 실패 시 마지막 예외
+        """
+        primary_task = asyncio.create_task(self._timed(primary, params))
+        if secondary is None:
+            return await primary_task
+
+        tasks = {primary_task}
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=self.hedge_delay(primary[0]))
+            if done and primary_task.exception() is None:
+                return primary_task.result()
+
+            # 기본 Provider가 지연되거나 실패 → 보조 Provider 호출
+            errors: list[BaseException] = []
+            if done:
+                errors.append(primary_task.exception())  # type: ignore[arg-type]
+                tasks.clear()
+            tasks.add(asyncio.create_task(self._timed(secondary, params)))
+
+            while tasks:
+                done, tasks = await asyncio.wait(
+                    tasks, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    error = task.exception()
+                    if error is None:
+                        return task.result()
+                    errors.append(error)
+            raise errors[-1]
+        finally:
+            # 패배한 요청 취소
+            for task in tasks:
+                task.cancel()
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _timed(self, provider: DirectionsProvider, params: dict) -> dict:
+        """Provider 호출 + 성공 시 지연 기록 (취소/실패는 기록하지 않음)"""
+        name, instance = provider
+        started = time.perf_counter()
+        result = await instance.directions(**params)
+        self.histogram(name).record(time.perf_counter() - started)
+        return result
+
+
+# 싱글톤 인스턴스 (히스토그램을 요청 간 공유)
+_instance: HedgedDirections | None = None
+
+
+def get_hedged_directions() -> HedgedDirections:
+    """HedgedDirections 싱글톤 반환"""
+    global _instance
+    if _instance is None:
+        _instance = HedgedDirections(
+            default_delay_s=settings.ROUTE_HEDGE_DEFAULT_DELAY_S,
+        )
+    return _instance
@@ -0,0 +1,78 @@
+"""routes ETA 캐시
+
+ETA 매트릭스용 (출발 셀, 도착 셀, 옵션) → (거리, 시간) 인메모리 캐시
+- LRU + TTL (교통 상황 반영을 위해 짧게 유지)
+- 프로세스 로컬 (워커 간 공유하지 않음)
+"""
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+
+from src.core.config import settings
+
+EtaKey = tuple[str, str, str]
+EtaValue = tuple[int, int]
+
+
+class EtaCache:
+    """LRU + TTL ETA 캐시"""
+
+    def __init__(
+        self,
+        max_size: int = 10000,
+        ttl_s: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """캐시 초기화
+
+        Args:
+            max_size: 최대 항목 수 (초과 시 가장 오래 사용하지 않은 항목 제거)
+            ttl_s: 항목 유효 시간 (초)
+            clock: 시간 함수 (테스트용 주입)
+        """
+        self._max_size = max_size
+        self._ttl_s = ttl_s
+        self._clock = clock
+        self._items: OrderedDict[EtaKey, tuple[float, EtaValue]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def get(self, key: EtaKey) -> EtaValue | None:
+        """캐시 조회 (만료 항목은 제거 후 None)"""
+        item = self._items.get(key)
+        if item is None:
+            return None
+        expires_at, value = item
+        if expires_at <= self._clock():
+            del self._items[key]
+            return None
+        self._items.move_to_end(key)
+        return value
+
+    def set(self, key: EtaKey, value: EtaValue) -> None:
+        """캐시 저장"""
+        self._items[key] = (self._clock() + self._ttl_s, value)
+        self._items.move_to_end(key)
+        while len(self._items) > self._max_size:
+            self._items.popitem(last=False)
+
+    def clear(self) -> None:
+        """전체 삭제"""
+        self._items.clear()
+
+
+# 싱글톤 인스턴스
+_cache: EtaCache | None = None
+
+
+def get_eta_cache() -> EtaCache:
+    """EtaCache 싱글톤 반환"""
+    global _cache
+    if _cache is None:
+        _cache = EtaCache(
+            max_size=settings.ROUTE_MATRIX_CACHE_SIZE,
+            ttl_s=settings.ROUTE_MATRIX_CACHE_TTL_S,
+        )
+    return _cache
@@ -2,7 +2,10 @@
 
 DDD_CLASS_DIAGRAM.md 기반:
 - route_history: 경로 검색 기록
+- route_destinations: 자주 가는 도착지 (격자 클러스터, 기록 저장 시 증분 갱신)
 - PostGIS GEOGRAPHY(Point, 4326) 타입 사용
+- 응답용 위경도는 float 컬럼으로 함께 저장 (조회 시 WKB 파싱 없음)
+- 동일 경로 반복 검색은 한 행으로 합치고 search_count/last_searched_at 갱신
 """
 
 from datetime import UTC, datetime
@@ -10,9 +13,9 @@ from typing import Any
 from uuid import UUID, uuid4
 
 from geoalchemy2 import Geography, WKBElement
-from geoalchemy2.shape import from_shape, to_shape
+from geoalchemy2.shape import from_shape
 from shapely.geometry import Point
-from sqlalchemy import JSON
+from sqlalchemy import JSON, Index, UniqueConstraint
 from sqlmodel import Column, Field, SQLModel
 
 from src.core.enums import RouteOption
@@ -27,18 +30,24 @@ def make_point(lng: float, lat: float) -> WKBElement:
     return from_shape(Point(lng, lat), srid=4326)
 
 
-def get_coords(point: WKBElement | None) -> tuple[float, float] | None:
-    """Extract (lat, lng) from a PostGIS GEOGRAPHY point."""
-    if point is None:
-        return None
-    shape = to_shape(point)
-    return (shape.y, shape.x)  # lat, lng
-
-
 class RouteHistory(SQLModel, table=True):
     """경로 검색 기록"""
 
     __tablename__ = "route_history"
+    __table_args__ = (
+        Index(
+            "ix_route_history_profile_last_searched",
+            "profile_id",
+            "last_searched_at",
+        ),
+        # 중복 경로 합산: 사용자 · 경로 키별 최근 기록
+        Index(
+            "ix_route_history_profile_route_key",
+            "profile_id",
+            "route_key",
+            "last_searched_at",
+        ),
+    )
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
     profile_id: UUID = Field(foreign_key="profiles.id", index=True)
@@ -47,10 +56,15 @@ class RouteHistory(SQLModel, table=True):
     start_point: Any = Field(
         sa_column=Column(Geography(geometry_type="POINT", srid=4326))
     )
+    # 응답용 좌표 (start_point와 동일 값, 조회 시 WKB 파싱 회피)
+    start_lat: float = Field()
+    start_lng: float = Field()
     end_name: str = Field()
     end_point: Any = Field(
         sa_column=Column(Geography(geometry_type="POINT", srid=4326))
     )
+    end_lat: float = Field()
+    end_lng: float = Field()
     # 경유지 (JSON)
     waypoints: list[dict] | None = Field(default=None, sa_column=Column(JSON))
     route_option: str = Field(default=RouteOption.TRAOPTIMAL.value)
@@ -59,27 +73,38 @@ class RouteHistory(SQLModel, table=True):
     # 경로 데이터 (JSON) - [[lng, lat], ...] 형식 (네이버 API 원본)
     path_data: list[list[float]] = Field(sa_column=Column(JSON))
     created_at: datetime = Field(default_factory=_utcnow, index=True)
+    # 중복 경로 판정 키 (출발/도착/경유지 격자 + 옵션, _utils.route_key)
+    route_key: str | None = Field(default=None, max_length=64)
+    # 중복 검색 합산 (마지막 검색 후 합산 기간 내 동일 경로 재검색 시 증가)
+    search_count: int = Field(default=1)
+    last_searched_at: datetime = Field(default_factory=_utcnow)
+
+
+class RouteDestination(SQLModel, table=True):
+    """자주 가는 도착지 클러스터
+
+    route_history.end 좌표를 격자 셀(cell) 단위로 묶어 방문 횟수를 누적
+    - 기록 저장 시 증분 갱신 (조회 시 전체 기록 스캔 없음)
+    - lat/lng는 셀 내 도착지 좌표의 누적 평균
+    """
+
+    __tablename__ = "route_destinations"
+    __table_args__ = (
+        UniqueConstraint("profile_id", "cell", name="uq_route_destination_cell"),
+        # 자주 가는 도착지: 사용자별 방문 횟수 → 최근 방문 순
+        Index(
+            "ix_route_destinations_profile_visits",
+            "profile_id",
+            "visit_count",
+            "last_visited_at",
+        ),
+    )
 
-    @property
-    def start_lat(self) -> float | None:
-        """Start point latitude."""
-        coords = get_coords(self.start_point)
-        return coords[0] if coords else None
-
-    @property
-    def start_lng(self) -> float | None:
-        """Start point longitude."""
-        coords = get_coords(self.start_point)
-        return coords[1] if coords else None
-
-    @property
-    def end_lat(self) -> float | None:
-        """End point latitude."""
-        coords = get_coords(self.end_point)
-        return coords[0] if coords else None
-
-    @property
-    def end_lng(self) -> float | None:
-        """End point longitude."""
-        coords = get_coords(self.end_point)
-        return coords[1] if coords else None
+    id: UUID = Field(default_factory=uuid4, primary_key=True)
+    profile_id: UUID = Field(foreign_key="profiles.id", index=True)
+    cell: str = Field(max_length=32)
+    name: str = Field()  # 가장 최근 도착지 이름
+    lat: float = Field()
+    lng: float = Field()
+    visit_count: int = Field(default=0)
+    last_visited_at: datetime = Field(default_factory=_utcnow)
@@ -3,21 +3,140 @@
 DB 접근 함수
 """
 
-from uuid import UUID
+from datetime import datetime
+from uuid import UUID, uuid4
 
+from sqlalchemy import func, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import load_only
 from sqlmodel import Session, select
 
-from ._models import RouteHistory
+from ._models import RouteDestination, RouteHistory
+from ._utils import grid_cell
 
 
 def create(session: Session, route: RouteHistory) -> RouteHistory:
-    """경로 기록 생성"""
-    session.add(route)
+    """경로 기록 생성 (같은 ID가 있으면 검색 횟수 합산, refresh 생략)"""
+    upsert_many(session, [route])
     session.commit()
-    session.refresh(route)
     return route
 
 
+def upsert_many(session: Session, routes: list[RouteHistory]) -> None:
+    """경로 기록 multi-row upsert + 도착지 클러스터 갱신 (commit은 호출자)
+
+    ID 충돌(동일 경로 재검색) 시 search_count 합산,
+    last_searched_at/거리/시간/경로 좌표는 최신 검색 결과로 갱신
+    """
+    # 같은 배치 내 중복 ID는 먼저 합침 (ON CONFLICT는 한 행을 두 번 갱신 불가)
+    merged: dict[UUID, dict] = {}
+    columns = RouteHistory.__table__.columns
+    for route in routes:
+        values = {c.name: getattr(route, c.name) for c in columns}
+        prev = merged.get(route.id)
+        if prev is not None:
+            values["search_count"] += prev["search_count"]
+            values["created_at"] = prev["created_at"]
+        merged[route.id] = values
+
+    stmt = pg_insert(RouteHistory).values(list(merged.values()))
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[RouteHistory.id],
+        set_={
+            "search_count": RouteHistory.search_count + stmt.excluded.search_count,
+            "last_searched_at": stmt.excluded.last_searched_at,
+            "total_distance_m": stmt.excluded.total_distance_m,
+            "total_duration_s": stmt.excluded.total_duration_s,
+            "path_data": stmt.excluded.path_data,
+        },
+    )
+    session.exec(stmt)
+    for route in routes:
+        record_destination(session, route)
+
+
+def record_destination(session: Session, route: RouteHistory) -> None:
+    """도착지 클러스터 증분 갱신 (commit은 호출자 트랜잭션에 포함)
+
+    도착 좌표의 격자 셀이 이미 있으면 방문 횟수/평균 좌표/이름 갱신, 없으면 생성
+    단일 upsert (동시 저장이 같은 셀에 들어와도 유니크 제약 충돌 없음)
+    """
+    stmt = pg_insert(RouteDestination).values(
+        id=uuid4(),
+        profile_id=route.profile_id,
+        cell=grid_cell(route.end_lat, route.end_lng),
+        name=route.end_name,
+        lat=route.end_lat,
+        lng=route.end_lng,
+        visit_count=1,
+        last_visited_at=route.created_at,
+    )
+    # 누적 평균 좌표
+    count = RouteDestination.visit_count + 1
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[RouteDestination.profile_id, RouteDestination.cell],
+        set_={
+            "lat": RouteDestination.lat
+            + (stmt.excluded.lat - RouteDestination.lat) / count,
+            "lng": RouteDestination.lng
+            + (stmt.excluded.lng - RouteDestination.lng) / count,
+            "visit_count": count,
+            "name": stmt.excluded.name,
+            "last_visited_at": stmt.excluded.last_visited_at,
+        },
+    )
+    session.exec(stmt)
+
+
+def lock_route_key(session: Session, profile_id: UUID, route_key: str) -> None:
+    """같은 사용자 · 경로 키의 합산 조회~저장 직렬화 (commit/rollback 시 해제)
+
+    PostgreSQL 트랜잭션 advisory lock, 다른 DB는 생략
+    """
+    if session.get_bind().dialect.name != "postgresql":
+        return
+    lock_id = func.hashtextextended(f"{profile_id}:{route_key}", 0)
+    session.exec(select(func.pg_advisory_xact_lock(lock_id)))
+
+
+def find_recent_id(
+    session: Session,
+    profile_id: UUID,
+    route_key: str,
+    since: datetime,
+) -> UUID | None:
+    """since 이후 검색된 같은 경로의 최근 기록 ID (없으면 None)"""
+    query = (
+        select(RouteHistory.id)
+        .where(
+            RouteHistory.profile_id == profile_id,
+            RouteHistory.route_key == route_key,
+            RouteHistory.last_searched_at >= since,
+        )
+        .order_by(RouteHistory.last_searched_at.desc())
+        .limit(1)
+    )
+    return session.exec(query).first()
+
+
+def get_frequent_destinations(
+    session: Session,
+    profile_id: UUID,
+    limit: int = 5,
+) -> list[RouteDestination]:
+    """사용자별 자주 가는 도착지 조회 (방문 횟수 → 최근 방문 순)"""
+    query = (
+        select(RouteDestination)
+        .where(RouteDestination.profile_id == profile_id)
+        .order_by(
+            RouteDestination.visit_count.desc(),
+            RouteDestination.last_visited_at.desc(),
+        )
+        .limit(limit)
+    )
+    return list(session.exec(query).all())
+
+
 def get_by_id(
     session: Session,
     route_id: UUID,
@@ -36,11 +155,72 @@ def get_by_profile_id(
     profile_id: UUID,
     limit: int = 10,
 ) -> list[RouteHistory]:
-    """사용자별 최근 경로 조회"""
+    """사용자별 최근 경로 조회 (최근 검색 순)
+
+    목록 응답에 필요한 컬럼만 로드 (path_data, 좌표, 경유지 제외)
+    """
     query = (
         select(RouteHistory)
+        .options(
+            load_only(
+                RouteHistory.id,
+                RouteHistory.start_name,
+                RouteHistory.end_name,
+                RouteHistory.total_distance_m,
+                RouteHistory.total_duration_s,
+                RouteHistory.created_at,
+                RouteHistory.search_count,
+                RouteHistory.last_searched_at,
+            )
+        )
         .where(RouteHistory.profile_id == profile_id)
-        .order_by(RouteHistory.created_at.desc())
+        .order_by(RouteHistory.last_searched_at.desc())
         .limit(limit)
     )
     return list(session.exec(query).all())
+
+
+def get_endpoints_by_id(
+    session: Session,
+    route_id: UUID,
+    profile_id: UUID,
+) -> RouteHistory | None:
+    """ETA 재조회용 경로 조회 (출발/도착/경유지/옵션만 로드, path_data 제외)"""
+    query = (
+        select(RouteHistory)
+        .options(
+            load_only(
+                RouteHistory.id,
+                RouteHistory.start_lat,
+                RouteHistory.start_lng,
+                RouteHistory.end_lat,
+                RouteHistory.end_lng,
+                RouteHistory.waypoints,
+                RouteHistory.route_option,
+            )
+        )
+        .where(
+            RouteHistory.id == route_id,
+            RouteHistory.profile_id == profile_id,
+        )
+    )
+    return session.exec(query).first()
+
+
+def update_summary(
+    session: Session,
+    route_id: UUID,
+    total_distance_m: int,
+    total_duration_s: int,
+) -> None:
+    """경로 요약(거리/시간)만 갱신 (path_data는 건드리지 않음)"""
+    stmt = (
+        update(RouteHistory)
+        .where(RouteHistory.id == route_id)
+        .values(
+            total_distance_m=total_distance_m,
+            total_duration_s=total_duration_s,
+        )
+    )
+    session.exec(stmt)
+    session.commit()
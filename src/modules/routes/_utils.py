@@ -1,8 +1,16 @@
 """routes 유틸리티
 
-거리/시간 포맷팅 함수
+거리/시간 포맷팅, 좌표 격자 함수
 """
 
+import hashlib
+import math
+
+# 도착지 클러스터 격자 크기 (위경도 0.002도 ≈ 200m)
+DESTINATION_CELL_DEG = 0.002
+# 중복 경로 판정 격자 크기 (위경도 0.0005도 ≈ 50m)
+ROUTE_SNAP_DEG = 0.0005
+
 
 def format_distance(meters: int) -> str:
     """거리를 읽기 쉬운 형식으로 변환"""
@@ -22,3 +30,20 @@ def format_duration(seconds: int) -> str:
     if remaining_minutes == 0:
         return f"약 {hours}시간"
     return f"약 {hours}시간 {remaining_minutes}분"
+
+
+def grid_cell(lat: float, lng: float, size_deg: float = DESTINATION_CELL_DEG) -> str:
+    """좌표를 격자 셀 키로 변환 ("{lat_idx}:{lng_idx}")"""
+    return f"{math.floor(lat / size_deg)}:{math.floor(lng / size_deg)}"
+
+
+def route_key(
+    start: tuple[float, float],
+    end: tuple[float, float],
+    waypoints: list[tuple[float, float]] | None,
+    option: str,
+) -> str:
+    """중복 경로 판정 키 (출발/도착/경유지 (lat, lng) 격자 + 옵션)"""
+    points = [start, *(waypoints or []), end]
+    cells = ",".join(grid_cell(lat, lng, ROUTE_SNAP_DEG) for lat, lng in points)
+    return hashlib.sha256(f"{cells}|{option}".encode()).hexdigest()
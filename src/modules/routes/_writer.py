@@ -0,0 +1,254 @@
+"""routes write-behind 저장소
+
+경로 검색 응답에서 DB 왕복을 제거하기 위한 비동기 배치 저장
+- bounded asyncio.Queue에 RouteHistory 적재
+- 백그라운드 태스크가 batch_size개 또는 flush_interval_s마다 multi-row INSERT
+- 종료 시 큐에 남은 기록을 모두 저장 (durable shutdown)
+- 배치 저장 실패 시 별도 태스크에서 backoff 재시도 (수집 루프는 계속 큐를 비움)
+  → 그래도 실패하면 행 단위 저장 (실패 행만 유실)
+- 저장 전 기록은 pending()으로 조회 가능 (상세/ETA 조회 read-through)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Callable
+from datetime import UTC, datetime
+from uuid import UUID
+
+from sqlmodel import Session
+
+from src.core.config import settings
+from src.core.database import engine
+
+from . import _repository
+from ._models import RouteHistory
+
+logger = logging.getLogger(__name__)
+
+# 종료 신호 (큐 마지막에 적재)
+_STOP = object()
+
+
+def _aware(dt: datetime) -> datetime:
+    """naive datetime은 UTC로 간주"""
+    if dt.tzinfo is None:
+        return dt.replace(tzinfo=UTC)
+    return dt
+
+
+def _default_session_factory() -> Session:
+    return Session(engine)
+
+
+class RouteHistoryWriter:
+    """RouteHistory 비동기 배치 저장기"""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = _default_session_factory,
+        max_queue_size: int = 1000,
+        batch_size: int = 50,
+        flush_interval_s: float = 0.5,
+        *,
+        max_retries: int = 3,
+        retry_backoff_s: float = 0.2,
+    ) -> None:
+        """Writer 초기화
+
+        Args:
+            session_factory: 배치 저장에 사용할 세션 생성 함수
+            max_queue_size: 큐 최대 크기 (가득 차면 submit 실패)
+            batch_size: 한 번에 INSERT할 최대 행 수
+            flush_interval_s: 배치 수집 최대 대기 시간 (초)
+            max_retries: 배치 저장 재시도 횟수 (이후 행 단위 저장)
+            retry_backoff_s: 첫 재시도 대기 시간 (초, 재시도마다 2배)
+        """
+        self._session_factory = session_factory
+        self._max_queue_size = max_queue_size
+        self._batch_size = batch_size
+        self._flush_interval_s = flush_interval_s
+        self._max_retries = max_retries
+        self._retry_backoff_s = retry_backoff_s
+        self._pending: dict[UUID, RouteHistory] = {}
+        # 재시도 중인 배치 상한 (초과 시 수집 루프가 재시도 완료를 대기)
+        self._max_retry_batches = max(1, max_queue_size // batch_size)
+        self._retry_tasks: set[asyncio.Task] = set()
+        self._queue: asyncio.Queue | None = None
+        self._task: asyncio.Task | None = None
+        self._closing = False
+
+    @property
+    def is_running(self) -> bool:
+        """백그라운드 태스크 동작 여부"""
+        return self._task is not None and not self._task.done() and not self._closing
+
+    async def start(self) -> None:
+        """백그라운드 flush 태스크 시작"""
+        if self.is_running:
+            return
+        self._closing = False
+        self._queue = asyncio.Queue(maxsize=self._max_queue_size)
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """남은 기록을 모두 저장한 뒤 종료"""
+        if self._task is None or self._queue is None:
+            return
+        self._closing = True
+        await self._queue.put(_STOP)
+        await self._task
+        if self._retry_tasks:
+            await asyncio.gather(*self._retry_tasks)
+        self._task = None
+        self._queue = None
+
+    def submit(self, route: RouteHistory) -> bool:
+        """경로 기록 적재
+
+        Returns:
+            적재 성공 여부 (미동작 또는 큐 가득 참이면 False → 호출자가 동기 저장)
+        """
+        if not self.is_running or self._queue is None:
+            return False
+        try:
+            self._queue.put_nowait(route)
+        except asyncio.QueueFull:
+            logger.warning("route_history 큐가 가득 차서 동기 저장으로 전환")
+            return False
+        self._pending[route.id] = route
+        return True
+
+    def pending(self, route_id: UUID, profile_id: UUID) -> RouteHistory | None:
+        """아직 저장되지 않은 경로 기록 (본인 소유만, 없으면 None)"""
+        route = self._pending.get(route_id)
+        if route is None or route.profile_id != profile_id:
+            return None
+        return route
+
+    def find_pending_id(
+        self, profile_id: UUID, route_key: str, since: datetime
+    ) -> UUID | None:
+        """since 이후 검색된 같은 경로의 저장 대기 기록 ID (없으면 None)"""
+        latest: RouteHistory | None = None
+        for route in self._pending.values():
+            if route.profile_id != profile_id or route.route_key != route_key:
+                continue
+            searched_at = _aware(route.last_searched_at)
+            if searched_at >= since and (
+                latest is None or searched_at > _aware(latest.last_searched_at)
+            ):
+                latest = route
+        return latest.id if latest is not None else None
+
+    async def _run(self) -> None:
+        """배치 수집 → 저장 루프"""
+        stopped = False
+        while not stopped:
+            batch, stopped = await self._collect_batch()
+            if batch:
+                await self._flush(batch)
+
+    async def _collect_batch(self) -> tuple[list[RouteHistory], bool]:
+        """첫 항목을 기다린 뒤 flush_interval_s 동안 batch_size개까지 수집"""
+        assert self._queue is not None
+        loop = asyncio.get_running_loop()
+
+        item = await self._queue.get()
+        if item is _STOP:
+            return [], True
+
+        batch = [item]
+        deadline = loop.time() + self._flush_interval_s
+        while len(batch) < self._batch_size:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                item = await asyncio.wait_for(self._queue.get(), timeout)
+            except TimeoutError:
+                break
+            if item is _STOP:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    async def _flush(self, batch: list[RouteHistory]) -> None:
+        """배치 저장 (동기 DB I/O는 스레드에서 실행)
+
+        실패한 배치는 재시도 태스크로 넘기고 바로 반환 (backoff 동안에도 큐 수집 계속)
+        """
+        try:
+            await asyncio.to_thread(self._insert, batch)
+        except Exception:
+            logger.warning(
+                "route_history 배치 저장 실패, 재시도 대기: %d건",
+                len(batch),
+                exc_info=True,
+            )
+            if len(self._retry_tasks) >= self._max_retry_batches:
+                await asyncio.wait(
+                    self._retry_tasks, return_when=asyncio.FIRST_COMPLETED
+                )
+            task = asyncio.create_task(self._retry(batch))
+            self._retry_tasks.add(task)
+            task.add_done_callback(self._retry_tasks.discard)
+            return
+        self._release(batch)
+
+    async def _retry(self, batch: list[RouteHistory]) -> None:
+        """실패 배치 backoff 재시도, 모두 실패하면 행 단위로 저장해 실패 행만 버림"""
+        try:
+            for attempt in range(self._max_retries):
+                await asyncio.sleep(self._retry_backoff_s * 2**attempt)
+                try:
+                    await asyncio.to_thread(self._insert, batch)
+                    return
+                except Exception:
+                    logger.warning(
+                        "route_history 배치 재시도 실패 (%d/%d): %d건",
+                        attempt + 1,
+                        self._max_retries,
+                        len(batch),
+                        exc_info=True,
+                    )
+
+            logger.warning("route_history 배치 저장 재시도 실패, 행 단위 저장으로 전환")
+            for route in batch:
+                try:
+                    await asyncio.to_thread(self._insert, [route])
+                except Exception:
+                    logger.exception("route_history 저장 실패: %s", route.id)
+        finally:
+            self._release(batch)
+
+    def _release(self, batch: list[RouteHistory]) -> None:
+        """저장(또는 유실) 처리된 기록을 저장 대기 목록에서 제거"""
+        for route in batch:
+            if self._pending.get(route.id) is route:
+                del self._pending[route.id]
+
+    def _insert(self, batch: list[RouteHistory]) -> None:
+        """multi-row upsert + 도착지 클러스터 갱신 (단일 트랜잭션)"""
+        with self._session_factory() as session:
+            _repository.upsert_many(session, batch)
+            session.commit()
+
+
+# 싱글톤 인스턴스
+_writer: RouteHistoryWriter | None = None
+
+
+def get_route_history_writer() -> RouteHistoryWriter:
+    """RouteHistoryWriter 싱글톤 반환"""
+    global _writer
+    if _writer is None:
+        _writer = RouteHistoryWriter(
+            max_queue_size=settings.ROUTE_HISTORY_QUEUE_SIZE,
+            batch_size=settings.ROUTE_HISTORY_BATCH_SIZE,
+            flush_interval_s=settings.ROUTE_HISTORY_FLUSH_INTERVAL_S,
+            max_retries=settings.ROUTE_HISTORY_FLUSH_RETRIES,
+            retry_backoff_s=settings.ROUTE_HISTORY_RETRY_BACKOFF_S,
+        )
+    return _writer
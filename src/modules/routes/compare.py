@@ -0,0 +1,197 @@
+"""경로 옵션 비교
+
+POST /routes/compare
+"""
+
+import asyncio
+from uuid import UUID
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, Field, field_validator
+from sqlmodel import Session
+
+from src.core.database import get_session
+from src.core.deps import CurrentProfile
+from src.core.enums import RouteOption
+from src.core.exceptions import ExternalServiceError
+from src.core.response import ApiResponse, Status
+
+from ._utils import format_distance, format_duration
+from .search import (
+    PointRequest,
+    PointResponse,
+    build_route_history,
+    fetch_directions,
+    record_route_history,
+)
+
+# ─────────────────────────────────────────────────
+# Request/Response DTO
+# ─────────────────────────────────────────────────
+
+
+class RouteCompareRequest(BaseModel):
+    """경로 옵션 비교 요청"""
+
+    start: PointRequest
+    end: PointRequest
+    waypoints: list[PointRequest] | None = Field(default=None, max_length=5)
+    options: list[RouteOption] = Field(min_length=1, max_length=len(RouteOption))
+
+    @field_validator("options")
+    @classmethod
+    def unique_options(cls, v: list[RouteOption]) -> list[RouteOption]:
+        # 요청 순서 유지하며 중복 제거
+        return list(dict.fromkeys(v))
+
+
+class RouteAlternative(BaseModel):
+    """경로 대안 (동일 경로를 반환한 옵션은 하나로 병합)"""
+
+    options: list[str]
+    total_distance_m: int
+    total_duration_s: int
+    distance_text: str
+    duration_text: str
+    path: list[list[float]] = Field(
+        description="경로 좌표 [[lng, lat], ...] - 경도, 위도 순서"
+    )
+
+
+class RouteCompareResponse(BaseModel):
+    """경로 옵션 비교 응답"""
+
+    id: str = Field(description="공유 경로 기록 ID (첫 번째 대안 기준)")
+    start: PointResponse
+    end: PointResponse
+    alternatives: list[RouteAlternative]
+
+
+# ─────────────────────────────────────────────────
+# Service (비즈니스 로직)
+# ─────────────────────────────────────────────────
+
+
+def _route_key(route_data: dict) -> tuple:
+    """요약 + 경로가 동일한 결과를 식별하는 키"""
+    return (
+        route_data["total_distance_m"],
+        route_data["total_duration_s"],
+        tuple(tuple(point) for point in route_data["path"]),
+    )
+
+
+def dedupe_routes(
+    results: list[tuple[str, dict]],
+) -> list[tuple[list[str], dict]]:
+    """요약과 경로가 같은 결과를 병합 (첫 등장 순서 유지)"""
+    merged: dict[tuple, tuple[list[str], dict]] = {}
+    for option, route_data in results:
+        key = _route_key(route_data)
+        if key in merged:
+            merged[key][0].append(option)
+        else:
+            merged[key] = ([option], route_data)
+    return list(merged.values())
+
+
+async def compare_routes(
+    session: Session,
+    profile_id: UUID,
+    request: RouteCompareRequest,
+) -> RouteCompareResponse:
+    """여러 경로 옵션 동시 검색 및 공유 기록 저장"""
+    waypoints_coords: list[tuple[float, float]] | None = None
+    if request.waypoints:
+        waypoints_coords = [(wp.lng, wp.lat) for wp in request.waypoints]
+
+    options = [option.value for option in request.options]
+    responses = await asyncio.gather(
+        *(
+            fetch_directions(request.start, request.end, waypoints_coords, option)
+            for option in options
+        ),
+        return_exceptions=True,
+    )
+
+    # 실패한 옵션은 제외, 전부 실패하면 경로 없음
+    results = [
+        (option, route_data)
+        for option, route_data in zip(options, responses, strict=True)
+        if not isinstance(route_data, BaseException)
+    ]
+    if not results:
+        raise ExternalServiceError("경로를 찾을 수 없어요")
+
+    alternatives = dedupe_routes(results)
+
+    # 첫 번째 대안을 공유 경로 기록으로 저장
+    first_options, first_route = alternatives[0]
+    route_history = build_route_history(
+        profile_id,
+        start=request.start,
+        end=request.end,
+        waypoints=request.waypoints,
+        option=first_options[0],
+        route_data=first_route,
+    )
+    route_id = record_route_history(session, route_history)
+
+    return RouteCompareResponse(
+        id=str(route_id),
+        start=PointResponse(
+            name=request.start.name,
+            lat=request.start.lat,
+            lng=request.start.lng,
+        ),
+        end=PointResponse(
+            name=request.end.name,
+            lat=request.end.lat,
+            lng=request.end.lng,
+        ),
+        alternatives=[
+            RouteAlternative(
+                options=alt_options,
+                total_distance_m=route_data["total_distance_m"],
+                total_duration_s=route_data["total_duration_s"],
+                distance_text=format_distance(route_data["total_distance_m"]),
+                duration_text=format_duration(route_data["total_duration_s"]),
+                path=route_data["path"],
+            )
+            for alt_options, route_data in alternatives
+        ],
+    )
+
+
+# ─────────────────────────────────────────────────
+# Controller (엔드포인트)
+# ─────────────────────────────────────────────────
+
+router = APIRouter()
+
+
+@router.post("/compare", response_model=ApiResponse[RouteCompareResponse])
+async def compare_routes_endpoint(
+    request: RouteCompareRequest,
+    profile: CurrentProfile,
+    session: Session = Depends(get_session),
+) -> ApiResponse[RouteCompareResponse] | JSONResponse:
+    """경로 옵션 비교"""
+    try:
+        result = await compare_routes(session, profile.id, request)
+
+        return ApiResponse(
+            status=Status.SUCCESS,
+            message="경로 비교에 성공했어요",
+            data=result,
+        )
+    except ExternalServiceError:
+        return JSONResponse(
+            status_code=404,
+            content={
+                "status": Status.ROUTE_NOT_FOUND,
+                "message": "경로를 찾을 수 없어요",
+                "data": None,
+            },
+        )
@@ -0,0 +1,83 @@
+"""자주 가는 도착지 조회
+
+GET /routes/destinations/frequent
+"""
+
+from datetime import datetime
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Query
+from pydantic import BaseModel
+from sqlmodel import Session
+
+from src.core.database import get_session
+from src.core.deps import CurrentProfile
+from src.core.response import ApiResponse, Status
+
+from . import _repository
+from ._models import RouteDestination
+
+# ─────────────────────────────────────────────────
+# Response DTO
+# ─────────────────────────────────────────────────
+
+
+class FrequentDestinationResponse(BaseModel):
+    """자주 가는 도착지 응답"""
+
+    name: str
+    lat: float
+    lng: float
+    visit_count: int
+    last_visited_at: datetime
+
+
+# ─────────────────────────────────────────────────
+# Service (비즈니스 로직)
+# ─────────────────────────────────────────────────
+
+
+def get_frequent_destinations(
+    session: Session,
+    profile_id: UUID,
+    limit: int = 5,
+) -> list[RouteDestination]:
+    """자주 가는 도착지 조회 (증분 갱신된 클러스터만 조회, 기록 스캔 없음)"""
+    return _repository.get_frequent_destinations(session, profile_id, limit)
+
+
+# ─────────────────────────────────────────────────
+# Controller (엔드포인트)
+# ─────────────────────────────────────────────────
+
+router = APIRouter()
+
+
+@router.get(
+    "/destinations/frequent",
+    response_model=ApiResponse[list[FrequentDestinationResponse]],
+)
+def get_frequent_destinations_endpoint(
+    profile: CurrentProfile,
+    session: Session = Depends(get_session),
+    limit: int = Query(default=5, ge=1, le=20),
+) -> ApiResponse[list[FrequentDestinationResponse]]:
+    """자주 가는 도착지 조회"""
+    destinations = get_frequent_destinations(session, profile.id, limit)
+
+    items = [
+        FrequentDestinationResponse(
+            name=d.name,
+            lat=d.lat,
+            lng=d.lng,
+            visit_count=d.visit_count,
+            last_visited_at=d.last_visited_at,
+        )
+        for d in destinations
+    ]
+
+    return ApiResponse(
+        status=Status.SUCCESS,
+        message="조회에 성공했어요",
+        data=items,
+    )
@@ -1,6 +1,8 @@
 """경로 상세 조회
 
 GET /routes/{route_id}
+
+write-behind 저장 중(아직 DB에 없는) 기록은 저장 큐에서 조회 (read-through)
 """
 
 from uuid import UUID
@@ -15,6 +17,7 @@ from src.core.response import ApiResponse, Status
 
 from . import _repository
 from ._utils import format_distance, format_duration
+from ._writer import get_route_history_writer
 from .search import PointResponse, RouteSearchResponse
 
 # ─────────────────────────────────────────────────
@@ -27,8 +30,10 @@ def get_route_detail(
     profile_id: UUID,
     route_id: UUID,
 ) -> RouteSearchResponse:
-    """경로 상세 조회"""
+    """경로 상세 조회 (DB → write-behind 저장 대기 기록)"""
     route = _repository.get_by_id(session, route_id, profile_id)
+    if route is None:
+        route = get_route_history_writer().pending(route_id, profile_id)
     if route is None:
         raise NotFoundError("경로 기록을 찾을 수 없어요")
 
@@ -0,0 +1,128 @@
+"""경로 ETA 갱신
+
+POST /routes/{route_id}/eta
+
+write-behind 저장 중(아직 DB에 없는) 기록은 저장 큐의 기록을 갱신 (read-through)
+"""
+
+from uuid import UUID
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from sqlmodel import Session
+
+from src.core.database import get_session
+from src.core.deps import CurrentProfile
+from src.core.exceptions import ExternalServiceError, NotFoundError
+from src.core.response import ApiResponse, Status
+from src.external.kakao import get_kakao_provider
+
+from . import _repository
+from ._utils import format_distance, format_duration
+from ._writer import get_route_history_writer
+
+# ─────────────────────────────────────────────────
+# Response DTO
+# ─────────────────────────────────────────────────
+
+
+class RouteEtaResponse(BaseModel):
+    """경로 ETA 응답 (경로 좌표 제외)"""
+
+    id: str
+    total_distance_m: int
+    total_duration_s: int
+    distance_text: str
+    duration_text: str
+
+
+# ─────────────────────────────────────────────────
+# Service (비즈니스 로직)
+# ─────────────────────────────────────────────────
+
+
+async def refresh_route_eta(
+    session: Session,
+    profile_id: UUID,
+    route_id: UUID,
+) -> RouteEtaResponse:
+    """저장된 경로의 거리/시간만 재조회하여 갱신
+
+    summary 모드로 요청하므로 sections/roads(경로 좌표)는 전송/파싱하지 않음
+    """
+    route = _repository.get_endpoints_by_id(session, route_id, profile_id)
+    pending = None
+    if route is None:
+        route = pending = get_route_history_writer().pending(route_id, profile_id)
+    if route is None:
+        raise NotFoundError("경로 기록을 찾을 수 없어요")
+
+    waypoints_coords: list[tuple[float, float]] | None = None
+    if route.waypoints:
+        waypoints_coords = [(wp["lng"], wp["lat"]) for wp in route.waypoints]
+
+    try:
+        summary = await get_kakao_provider().directions(
+            start_lng=route.start_lng,
+            start_lat=route.start_lat,
+            goal_lng=route.end_lng,
+            goal_lat=route.end_lat,
+            waypoints=waypoints_coords,
+            option=route.route_option,
+            summary_only=True,
+        )
+    except Exception as e:
+        raise ExternalServiceError("경로를 찾을 수 없어요") from e
+
+    if pending is not None:
+        # 아직 저장 전이면 저장될 기록에 반영 (저장 중이었다면 아래 UPDATE가 반영)
+        pending.total_distance_m = summary["total_distance_m"]
+        pending.total_duration_s = summary["total_duration_s"]
+    _repository.update_summary(
+        session,
+        route_id,
+        summary["total_distance_m"],
+        summary["total_duration_s"],
+    )
+
+    return RouteEtaResponse(
+        id=str(route_id),
+        total_distance_m=summary["total_distance_m"],
+        total_duration_s=summary["total_duration_s"],
+        distance_text=format_distance(summary["total_distance_m"]),
+        duration_text=format_duration(summary["total_duration_s"]),
+    )
+
+
+# ─────────────────────────────────────────────────
+# Controller (엔드포인트)
+# ─────────────────────────────────────────────────
+
+router = APIRouter()
+
+
+@router.post("/{route_id}/eta", response_model=ApiResponse[RouteEtaResponse])
+async def refresh_route_eta_endpoint(
+    route_id: UUID,
+    profile: CurrentProfile,
+    session: Session = Depends(get_session),
+) -> ApiResponse[RouteEtaResponse] | JSONResponse:
+    """경로 ETA 갱신"""
+    try:
+        result = await refresh_route_eta(session, profile.id, route_id)
+
+        return ApiResponse(
+            status=Status.SUCCESS,
+            message="도착 예정 시간을 갱신했어요",
+            data=result,
+        )
+    except ExternalServiceError:
+        return JSONResponse(
+            status_code=404,
+            content={
+                "status": Status.ROUTE_NOT_FOUND,
+                "message": "경로를 찾을 수 없어요",
+                "data": None,
+            },
+        )
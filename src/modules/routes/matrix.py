@@ -0,0 +1,149 @@
+"""ETA 매트릭스
+
+POST /routes/matrix
+
+한 출발지 → 여러 후보 도착지의 거리/시간 (미션 후보 비교용)
+- summary 모드 Directions 동시 호출 (동시성 제한)
+- (출발 셀, 도착 셀, 옵션) 단위 캐시
+- 경로 기록 저장 없음
+"""
+
+import asyncio
+
+from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, Field
+
+from src.core.config import settings
+from src.core.deps import CurrentProfile
+from src.core.exceptions import ExternalServiceError
+from src.core.response import ApiResponse, Status
+from src.external.kakao import get_kakao_provider
+
+from ._eta_cache import EtaKey, EtaValue, get_eta_cache
+from ._utils import ROUTE_SNAP_DEG, grid_cell
+
+# ─────────────────────────────────────────────────
+# Request/Response DTO
+# ─────────────────────────────────────────────────
+
+
+class CoordRequest(BaseModel):
+    """좌표 요청 (이름 없음)"""
+
+    lat: float = Field(ge=-90, le=90)
+    lng: float = Field(ge=-180, le=180)
+
+
+class RouteMatrixRequest(BaseModel):
+    """ETA 매트릭스 요청"""
+
+    origin: CoordRequest
+    destinations: list[CoordRequest] = Field(min_length=1, max_length=20)
+    option: str = "traoptimal"
+
+
+class RouteMatrixResponse(BaseModel):
+    """ETA 매트릭스 응답
+
+    destinations 순서와 동일, 경로를 찾지 못한 도착지는 null
+    """
+
+    distances_m: list[int | None]
+    durations_s: list[int | None]
+
+
+# ─────────────────────────────────────────────────
+# Service (비즈니스 로직)
+# ─────────────────────────────────────────────────
+
+
+def _cell(coord: CoordRequest) -> str:
+    return grid_cell(coord.lat, coord.lng, ROUTE_SNAP_DEG)
+
+
+async def build_eta_matrix(request: RouteMatrixRequest) -> RouteMatrixResponse:
+    """ETA 매트릭스 계산 (캐시 → summary Directions 동시 호출)"""
+    cache = get_eta_cache()
+    provider = get_kakao_provider()
+    semaphore = asyncio.Semaphore(settings.ROUTE_MATRIX_CONCURRENCY)
+    origin_cell = _cell(request.origin)
+
+    async def fetch(destination: CoordRequest) -> EtaValue:
+        async with semaphore:
+            summary = await provider.directions(
+                start_lng=request.origin.lng,
+                start_lat=request.origin.lat,
+                goal_lng=destination.lng,
+                goal_lat=destination.lat,
+                option=request.option,
+                summary_only=True,
+            )
+        return summary["total_distance_m"], summary["total_duration_s"]
+
+    # 캐시 미스만 호출 (같은 셀의 도착지는 한 번만)
+    keys: list[EtaKey] = [
+        (origin_cell, _cell(d), request.option) for d in request.destinations
+    ]
+    values: dict[EtaKey, EtaValue | None] = {}
+    misses: dict[EtaKey, CoordRequest] = {}
+    for key, destination in zip(keys, request.destinations, strict=True):
+        if key in values or key in misses:
+            continue
+        cached = cache.get(key)
+        if cached is not None:
+            values[key] = cached
+        else:
+            misses[key] = destination
+
+    responses = await asyncio.gather(
+        *(fetch(d) for d in misses.values()),
+        return_exceptions=True,
+    )
+    for key, result in zip(misses, responses, strict=True):
+        if isinstance(result, BaseException):
+            values[key] = None
+            continue
+        cache.set(key, result)
+        values[key] = result
+
+    if all(values[key] is None for key in keys):
+        raise ExternalServiceError("경로를 찾을 수 없어요")
+
+    cells = [values[key] for key in keys]
+    return RouteMatrixResponse(
+        distances_m=[c[0] if c else None for c in cells],
+        durations_s=[c[1] if c else None for c in cells],
+    )
+
+
+# ─────────────────────────────────────────────────
+# Controller (엔드포인트)
+# ─────────────────────────────────────────────────
+
+router = APIRouter()
+
+
+@router.post("/matrix", response_model=ApiResponse[RouteMatrixResponse])
+async def route_matrix_endpoint(
+    request: RouteMatrixRequest,
+    _: CurrentProfile,  # 인증 필요
+) -> ApiResponse[RouteMatrixResponse] | JSONResponse:
+    """ETA 매트릭스 조회"""
+    try:
+        result = await build_eta_matrix(request)
+
+        return ApiResponse(
+            status=Status.SUCCESS,
+            message="ETA 조회에 성공했어요",
+            data=result,
+        )
+    except ExternalServiceError:
+        return JSONResponse(
+            status_code=404,
+            content={
+                "status": Status.ROUTE_NOT_FOUND,
+                "message": "경로를 찾을 수 없어요",
+                "data": None,
+            },
+        )
@@ -31,6 +31,8 @@ class RouteHistoryResponse(BaseModel):
     total_distance_m: int
     total_duration_s: int
     created_at: datetime
+    search_count: int
+    last_searched_at: datetime
 
 
 # ─────────────────────────────────────────────────
@@ -43,7 +45,7 @@ def get_recent_routes(
     profile_id: UUID,
     limit: int = 10,
 ) -> list[RouteHistory]:
-    """최근 경로 조회"""
+    """최근 경로 조회 (최근 검색 순, 반복 검색은 한 항목)"""
     # 최대 50개 제한
     limit = min(limit, 50)
     return _repository.get_by_profile_id(session, profile_id, limit)
@@ -73,6 +75,8 @@ def get_recent_routes_endpoint(
             total_distance_m=r.total_distance_m,
             total_duration_s=r.total_duration_s,
             created_at=r.created_at,
+            search_count=r.search_count,
+            last_searched_at=r.last_searched_at,
         )
         for r in routes
     ]
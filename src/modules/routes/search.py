@@ -3,23 +3,27 @@
 POST /routes/search
 """
 
-from datetime import UTC, datetime
-from uuid import UUID, uuid4
+from datetime import UTC, datetime, timedelta
+from uuid import UUID
 
 from fastapi import APIRouter, Depends
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field, field_validator
 from sqlmodel import Session
 
+from src.core.config import settings
 from src.core.database import get_session
 from src.core.deps import CurrentProfile
 from src.core.exceptions import ExternalServiceError
 from src.core.response import ApiResponse, Status
 from src.external.kakao import get_kakao_provider
+from src.external.naver import get_naver_provider
 
 from . import _repository
+from ._directions import DirectionsProvider, get_hedged_directions
 from ._models import RouteHistory, make_point
-from ._utils import format_distance, format_duration
+from ._utils import format_distance, format_duration, route_key
+from ._writer import get_route_history_writer
 
 # ─────────────────────────────────────────────────
 # Request/Response DTO
@@ -83,68 +87,202 @@ def _utcnow() -> datetime:
     return datetime.now(UTC)
 
 
-async def search_route(
+def find_route_id(
     session: Session,
     profile_id: UUID,
-    request: RouteSearchRequest,
-) -> RouteSearchResponse:
-    """경로 검색 및 저장"""
+    key: str,
+    searched_at: datetime,
+) -> UUID | None:
+    """합산 대상 경로 기록 ID 조회
+
+    같은 사용자 · 같은 경로 키의 마지막 검색이 합산 기간 이내면 그 기록 ID
+    (write-behind 저장 대기 기록 포함, 합산 기간 0이거나 없으면 None)
+    """
+    window = settings.ROUTE_HISTORY_DEDUP_WINDOW_S
+    if window <= 0:
+        return None
+    since = searched_at - timedelta(seconds=window)
+    route_id = get_route_history_writer().find_pending_id(profile_id, key, since)
+    if route_id is None:
+        route_id = _repository.find_recent_id(session, profile_id, key, since)
+    return route_id
+
+
+def _hedge_provider() -> DirectionsProvider | None:
+    """Hedged request용 보조 Provider (설정 및 Naver 인증 정보 있을 때만)"""
+    if not settings.ROUTE_HEDGE_ENABLED or not settings.NAVER_CLIENT_ID:
+        return None
+    return ("naver", get_naver_provider())
+
+
+async def fetch_directions(
+    start: PointRequest,
+    end: PointRequest,
+    waypoints_coords: list[tuple[float, float]] | None,
+    option: str,
+) -> dict:
+    """경로 검색 Provider 호출 (Kakao 기본, Naver hedge)"""
+    return await get_hedged_directions().directions(
+        ("kakao", get_kakao_provider()),
+        _hedge_provider(),
+        start_lng=start.lng,
+        start_lat=start.lat,
+        goal_lng=end.lng,
+        goal_lat=end.lat,
+        waypoints=waypoints_coords,
+        option=option,
+    )
+
+
+def save_route_history(session: Session, route_history: RouteHistory) -> None:
+    """경로 기록 저장 (동일 ID가 있으면 검색 횟수 합산)
+
+    ROUTE_HISTORY_WRITE_BEHIND 설정 시 백그라운드 배치 저장 큐에 적재하고,
+    큐가 동작하지 않거나 가득 찬 경우 동기 저장으로 폴백
+    """
+    writer = get_route_history_writer()
+    if settings.ROUTE_HISTORY_WRITE_BEHIND and writer.submit(route_history):
+        return
+    _repository.create(session, route_history)
+
+
+def record_route_history(session: Session, route_history: RouteHistory) -> UUID:
+    """경로 기록 저장 (합산 기간 내 같은 경로 기록이 있으면 그 ID로 합산)
+
+    조회~저장 사이에 다른 워커의 같은 경로 검색이 끼어들면 중복 행이 생기므로
+    같은 사용자 · 경로 키 단위로 advisory lock을 잡고 조회/저장.
+    새 기록은 락을 쥔 채 바로 저장하고, 기존 기록 합산만 write-behind 큐에 적재
+
+    Returns:
+        저장된 경로 기록 ID
+    """
+    if settings.ROUTE_HISTORY_DEDUP_WINDOW_S <= 0:
+        save_route_history(session, route_history)
+        return route_history.id
+
+    profile_id, key = route_history.profile_id, route_history.route_key
+    _repository.lock_route_key(session, profile_id, key)
+    route_id = find_route_id(session, profile_id, key, route_history.last_searched_at)
+    if route_id is None:
+        # commit 시 락 해제 → 다른 워커의 조회에 바로 보임
+        _repository.create(session, route_history)
+        return route_history.id
+
+    route_history.id = route_id
+    save_route_history(session, route_history)
+    session.commit()  # 큐 적재 시에도 락 해제
+    return route_id
+
+
+def build_route_history(
+    profile_id: UUID,
+    *,
+    start: PointRequest,
+    end: PointRequest,
+    waypoints: list[PointRequest] | None,
+    option: str,
+    route_data: dict,
+) -> RouteHistory:
+    """경로 기록 Entity 생성 (PostGIS GEOGRAPHY + float 좌표)"""
+    now = _utcnow()
+    key = route_key(
+        (start.lat, start.lng),
+        (end.lat, end.lng),
+        [(wp.lat, wp.lng) for wp in waypoints] if waypoints else None,
+        option,
+    )
     waypoints_data = None
-    waypoints_coords: list[tuple[float, float]] | None = None
-    if request.waypoints:
+    if waypoints:
         waypoints_data = [
-            {"name": wp.name, "lat": wp.lat, "lng": wp.lng} for wp in request.waypoints
+            {"name": wp.name, "lat": wp.lat, "lng": wp.lng} for wp in waypoints
         ]
+
+    return RouteHistory(
+        profile_id=profile_id,
+        start_name=start.name,
+        start_point=make_point(start.lng, start.lat),
+        start_lat=start.lat,
+        start_lng=start.lng,
+        end_name=end.name,
+        end_point=make_point(end.lng, end.lat),
+        end_lat=end.lat,
+        end_lng=end.lng,
+        waypoints=waypoints_data,
+        route_option=option,
+        route_key=key,
+        total_distance_m=route_data["total_distance_m"],
+        total_duration_s=route_data["total_duration_s"],
+        path_data=route_data["path"],
+        created_at=now,
+        search_count=1,
+        last_searched_at=now,
+    )
+
+
+async def search_and_save_route(
+    session: Session,
+    profile_id: UUID,
+    request: RouteSearchRequest,
+) -> tuple[UUID, dict]:
+    """경로 검색 후 기록 저장
+
+    Returns:
+        (경로 기록 ID, Provider 결과)
+    """
+    waypoints_coords: list[tuple[float, float]] | None = None
+    if request.waypoints:
         waypoints_coords = [(wp.lng, wp.lat) for wp in request.waypoints]
 
     try:
-        # Kakao Mobility Directions API 호출
-        route_data = await get_kakao_provider().directions(
-            start_lng=request.start.lng,
-            start_lat=request.start.lat,
-            goal_lng=request.end.lng,
-            goal_lat=request.end.lat,
-            waypoints=waypoints_coords,
-            option=request.option,
+        # Kakao Mobility Directions API 호출 (설정 시 Naver hedge)
+        route_data = await fetch_directions(
+            request.start,
+            request.end,
+            waypoints_coords,
+            request.option,
         )
     except Exception as e:
         raise ExternalServiceError("경로를 찾을 수 없어요") from e
 
-    # 경로 기록 저장 (PostGIS GEOGRAPHY 타입 사용)
-    route_history = RouteHistory(
-        id=uuid4(),
-        profile_id=profile_id,
-        start_name=request.start.name,
-        start_point=make_point(request.start.lng, request.start.lat),
-        end_name=request.end.name,
-        end_point=make_point(request.end.lng, request.end.lat),
-        waypoints=waypoints_data,
-        route_option=request.option,
-        total_distance_m=route_data["total_distance_m"],
-        total_duration_s=route_data["total_duration_s"],
-        path_data=route_data["path"],
-        created_at=_utcnow(),
+    # 경로 기록 저장 (PostGIS GEOGRAPHY 타입 사용, 동일 경로는 합산)
+    route_history = build_route_history(
+        profile_id,
+        start=request.start,
+        end=request.end,
+        waypoints=request.waypoints,
+        option=request.option,
+        route_data=route_data,
     )
+    route_id = record_route_history(session, route_history)
+    return route_id, route_data
 
-    saved_route = _repository.create(session, route_history)
 
+async def search_route(
+    session: Session,
+    profile_id: UUID,
+    request: RouteSearchRequest,
+) -> RouteSearchResponse:
+    """경로 검색 및 저장"""
+    route_id, route_data = await search_and_save_route(session, profile_id, request)
+
+    # 응답은 요청과 Provider 결과로 직접 구성 (저장 후 재조회/WKB 파싱 없음)
     return RouteSearchResponse(
-        id=str(saved_route.id),
+        id=str(route_id),
         start=PointResponse(
-            name=saved_route.start_name,
-            lat=saved_route.start_lat,
-            lng=saved_route.start_lng,
+            name=request.start.name,
+            lat=request.start.lat,
+            lng=request.start.lng,
         ),
         end=PointResponse(
-            name=saved_route.end_name,
-            lat=saved_route.end_lat,
-            lng=saved_route.end_lng,
+            name=request.end.name,
+            lat=request.end.lat,
+            lng=request.end.lng,
         ),
-        total_distance_m=saved_route.total_distance_m,
-        total_duration_s=saved_route.total_duration_s,
-        distance_text=format_distance(saved_route.total_distance_m),
-        duration_text=format_duration(saved_route.total_duration_s),
-        path=saved_route.path_data,
+        total_distance_m=route_data["total_distance_m"],
+        total_duration_s=route_data["total_duration_s"],
+        distance_text=format_distance(route_data["total_distance_m"]),
+        duration_text=format_duration(route_data["total_duration_s"]),
+        path=route_data["path"],
     )
 
 
@@ -0,0 +1,128 @@
+"""경로 검색 (스트리밍)
+
+POST /routes/search/stream
+
+긴 경로용 NDJSON 스트리밍 응답
+- 1행: 요약 {"type": "summary", "data": {...}}
+- 이후: 경로 좌표 청크 {"type": "path", "data": [[lng, lat], ...]}
+- 마지막: {"type": "end", "data": {"path_count": N}}
+
+전체 path를 pydantic으로 검증/직렬화하지 않고 청크 단위로 직렬화하므로
+클라이언트는 요약 수신 직후 그리기를 시작할 수 있음
+"""
+
+import json
+from collections.abc import Iterator
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel
+from sqlmodel import Session
+
+from src.core.database import get_session
+from src.core.deps import CurrentProfile
+from src.core.exceptions import ExternalServiceError, RouteNotFoundError
+from src.core.response import Status
+
+from ._utils import format_distance, format_duration
+from .search import PointResponse, RouteSearchRequest, search_and_save_route
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+DEFAULT_CHUNK_SIZE = 500
+
+# ─────────────────────────────────────────────────
+# Response DTO
+# ─────────────────────────────────────────────────
+
+
+class RouteStreamSummary(BaseModel):
+    """스트리밍 첫 행 (path 제외 요약)"""
+
+    id: str
+    start: PointResponse
+    end: PointResponse
+    total_distance_m: int
+    total_duration_s: int
+    distance_text: str
+    duration_text: str
+    path_count: int
+
+
+# ─────────────────────────────────────────────────
+# Service (비즈니스 로직)
+# ─────────────────────────────────────────────────
+
+
+def _line(event_type: str, data: object) -> bytes:
+    return (
+        json.dumps({"type": event_type, "data": data}, ensure_ascii=False) + "\n"
+    ).encode()
+
+
+def iter_route_stream(
+    summary: RouteStreamSummary,
+    path: list[list[float]],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[bytes]:
+    """요약 → path 청크 → 종료 순서로 NDJSON 행 생성"""
+    yield _line("summary", summary.model_dump())
+    for i in range(0, len(path), chunk_size):
+        yield _line("path", path[i : i + chunk_size])
+    yield _line("end", {"path_count": len(path)})
+
+
+# ─────────────────────────────────────────────────
+# Controller (엔드포인트)
+# ─────────────────────────────────────────────────
+
+router = APIRouter()
+
+
+@router.post(
+    "/search/stream",
+    response_class=StreamingResponse,
+    response_model=None,
+    responses={200: {"content": {NDJSON_MEDIA_TYPE: {}}}},
+)
+async def search_route_stream_endpoint(
+    request: RouteSearchRequest,
+    profile: CurrentProfile,
+    session: Session = Depends(get_session),
+    chunk_size: int = Query(DEFAULT_CHUNK_SIZE, ge=50, le=5000),
+) -> StreamingResponse | JSONResponse:
+    """경로 검색 (NDJSON 스트리밍)"""
+    try:
+        route_id, route_data = await search_and_save_route(session, profile.id, request)
+    except (RouteNotFoundError, ExternalServiceError):
+        return JSONResponse(
+            status_code=404,
+            content={
+                "status": Status.ROUTE_NOT_FOUND,
+                "message": "경로를 찾을 수 없어요",
+                "data": None,
+            },
+        )
+
+    path = route_data["path"]
+    summary = RouteStreamSummary(
+        id=str(route_id),
+        start=PointResponse(
+            name=request.start.name,
+            lat=request.start.lat,
+            lng=request.start.lng,
+        ),
+        end=PointResponse(
+            name=request.end.name,
+            lat=request.end.lat,
+            lng=request.end.lng,
+        ),
+        total_distance_m=route_data["total_distance_m"],
+        total_duration_s=route_data["total_duration_s"],
+        distance_text=format_distance(route_data["total_distance_m"]),
+        duration_text=format_duration(route_data["total_duration_s"]),
+        path_count=len(path),
+    )
+    return StreamingResponse(
+        iter_route_stream(summary, path, chunk_size),
+        media_type=NDJSON_MEDIA_TYPE,
+    )
@@ -2,6 +2,10 @@
 
 Vertical Slice Architecture:
 - translate_text.py: POST /translate/text
+- translate_text_batch.py: POST /translate/text/batch
+- translate_text_stream.py: POST /translate/text/stream (SSE)
+- translate_voice.py: POST /translate/voice (STT → 번역 → TTS, SSE)
+- phrases_translation.py: GET /translate/phrases/{phrase_id} (사전 계산 조회)
 - list.py: GET /translations
 - delete.py: DELETE /translations/{id}
 - categories_list.py: GET /translation/categories
@@ -9,12 +13,16 @@ Vertical Slice Architecture:
 - threads_list.py: GET /translation/threads
 - threads_detail.py: GET /translation/threads/{thread_id}
 - threads_delete.py: DELETE /translation/threads/{thread_id}
+- threads_conversation.py: WS /translation/threads/{thread_id}/conversation
 
 공유 모듈 (언더스코어 prefix):
-- _models.py: Translation, Category, Thread 모델
+- _models.py: Translation, Category, Thread, Counter, PhraseAsset 모델
 - _repository.py: DB 접근
 - _translation_service.py: 외부 번역 API
 - _context_service.py: AI 컨텍스트 프롬프트 서비스
+- _voice_pipeline.py: 음성 번역 STT → 번역 → TTS 파이프라인
+- _audio_cache.py: TTS 결과 캐시 (메모리 → 디스크 → Storage)
+- _phrase_warmup.py: 추천 문장 사전 합성 백그라운드 작업
 """
 
 from fastapi import APIRouter
@@ -22,15 +30,24 @@ from fastapi import APIRouter
 from .categories_list import router as categories_list_router
 from .delete import router as delete_router
 from .list import router as list_router
+from .phrases_translation import router as phrases_translation_router
+from .threads_conversation import router as threads_conversation_router
 from .threads_create import router as threads_create_router
 from .threads_delete import router as threads_delete_router
 from .threads_detail import router as threads_detail_router
 from .threads_list import router as threads_list_router
 from .translate_text import router as translate_text_router
+from .translate_text_batch import router as translate_text_batch_router
+from .translate_text_stream import router as translate_text_stream_router
+from .translate_voice import router as translate_voice_router
 
 # 모든 라우터 조합
 router = APIRouter()
 router.include_router(translate_text_router)
+router.include_router(translate_text_batch_router)
+router.include_router(translate_text_stream_router)
+router.include_router(translate_voice_router)
+router.include_router(phrases_translation_router)
 router.include_router(list_router)
 router.include_router(delete_router)
 router.include_router(categories_list_router)
@@ -38,6 +55,7 @@ router.include_router(threads_create_router)
 router.include_router(threads_list_router)
 router.include_router(threads_detail_router)
 router.include_router(threads_delete_router)
+router.include_router(threads_conversation_router)
 
 # 외부에서 사용할 수 있도록 모델 re-export
 from ._models import Translation  # noqa: E402, F401
@@ -0,0 +1,351 @@
+"""번역 음성 캐시 (내용 주소 기반 TTS 결과 재사용)
+
+같은 번역문("Where is the restroom?")을 반복 합성하지 않기 위한 캐시
+- 키: (텍스트, 언어, 목소리, 오디오 형식) + 버전의 SHA-256
+- 1차: 프로세스 내 LRU (오디오 바이트 총량 제한) + 서명 URL
+- 2차: 로컬 디스크 ({key}.mp3, TRANSLATION_AUDIO_CACHE_DIR 설정 시)
+- 3차: Supabase Storage (tts/{key 앞 2자}/{key}.mp3)
+- 모두 없으면 TTS 합성 후 모든 계층에 저장
+
+반복 문장은 합성 없이 기존 오디오와 서명 URL 반환
+무효화: 목소리/형식 변경은 키가 달라짐, 그 외는 TRANSLATION_AUDIO_CACHE_VERSION 올림
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import hashlib
+import io
+import logging
+import os
+import re
+import tempfile
+import time
+import unicodedata
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from src.core.config import settings
+from src.core.metrics import get_metrics
+from src.external.supabase import StorageError
+
+if TYPE_CHECKING:
+    from src.external.google import IAsyncTextToSpeechProvider
+    from src.external.supabase import IAsyncStorageProvider
+
+logger = logging.getLogger(__name__)
+
+# 적중 계층별 카운터 (translation.audio_cache.{memory,disk,storage,miss})
+METRIC_PREFIX = "translation.audio_cache"
+
+STORAGE_PREFIX = "tts"
+
+# 서명 URL 만료 직전에는 새로 발급 (재생 도중 만료 방지)
+_URL_REFRESH_MARGIN_S = 300
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def audio_key(
+    text: str,
+    language: str,
+    *,
+    voice: str,
+    audio_format: str,
+    version: str,
+) -> str:
+    """음성 캐시 키 (SHA-256 hex)
+
+    대소문자/문장 부호는 억양에 영향을 주므로 유지 (NFC, 공백 축약만)
+    """
+    text = _WHITESPACE.sub(" ", unicodedata.normalize("NFC", text)).strip()
+    parts = [version, language, voice, audio_format, text]
+    return hashlib.sha256("\x1f".join(parts).encode()).hexdigest()
+
+
+@dataclass(frozen=True)
+class CachedAudio:
+    """합성(또는 캐시) 결과"""
+
+    key: str
+    audio: bytes
+    url: str | None  # 스토리지 서명 URL (스토리지 미설정/실패 시 None)
+    source: str  # memory | disk | storage | tts
+    url_expires_in: float | None = None  # 서명 URL 남은 유효 시간 (초)
+
+
+class AudioMemory:
+    """프로세스 내 음성 캐시 (바이트 총량 LRU + 서명 URL)"""
+
+    def __init__(
+        self,
+        max_bytes: int = 64 * 1024 * 1024,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """음성 캐시 초기화
+
+        Args:
+            max_bytes: 오디오 바이트 총량 (초과 시 가장 오래 사용하지 않은 항목 제거)
+            clock: 시간 함수 (테스트용 주입)
+        """
+        self._max_bytes = max_bytes
+        self._clock = clock
+        self._items: OrderedDict[str, bytes] = OrderedDict()
+        self._size = 0
+        self._urls: dict[str, tuple[float, str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    @property
+    def size(self) -> int:
+        """저장된 오디오 바이트 총량"""
+        return self._size
+
+    def get(self, key: str) -> bytes | None:
+        """오디오 조회"""
+        audio = self._items.get(key)
+        if audio is not None:
+            self._items.move_to_end(key)
+        return audio
+
+    def set(self, key: str, audio: bytes) -> None:
+        """오디오 저장 (한 항목이 전체 한도보다 크면 저장 안 함)"""
+        if len(audio) > self._max_bytes:
+            return
+        previous = self._items.pop(key, None)
+        if previous is not None:
+            self._size -= len(previous)
+        self._items[key] = audio
+        self._size += len(audio)
+        while self._size > self._max_bytes:
+            evicted_key, evicted = self._items.popitem(last=False)
+            self._size -= len(evicted)
+            self._urls.pop(evicted_key, None)
+
+    def get_url(self, key: str) -> str | None:
+        """서명 URL 조회 (만료 임박 시 None)"""
+        item = self._urls.get(key)
+        if item is None:
+            return None
+        expires_at, url = item
+        if expires_at - _URL_REFRESH_MARGIN_S <= self._clock():
+            del self._urls[key]
+            return None
+        return url
+
+    def url_expires_in(self, key: str) -> float | None:
+        """서명 URL 남은 유효 시간 (초, 없으면 None)"""
+        item = self._urls.get(key)
+        if item is None:
+            return None
+        return item[0] - self._clock()
+
+    def set_url(self, key: str, url: str, expires_in: float) -> None:
+        """서명 URL 저장"""
+        self._urls[key] = (self._clock() + expires_in, url)
+
+    def clear(self) -> None:
+        """전체 삭제"""
+        self._items.clear()
+        self._urls.clear()
+        self._size = 0
+
+
+class AudioCache:
+    """TTS 앞단 음성 캐시 (메모리 → 디스크 → 스토리지 → 합성)"""
+
+    def __init__(
+        self,
+        tts_provider: IAsyncTextToSpeechProvider,
+        *,
+        memory: AudioMemory,
+        storage: IAsyncStorageProvider | None = None,
+        disk_dir: str | None = None,
+        url_expires_in: int = 7 * 24 * 3600,
+        version: str = "1",
+    ) -> None:
+        """음성 캐시 초기화
+
+        Args:
+            tts_provider: 캐시 미스 시 합성 Provider
+            memory: 프로세스 내 캐시 (요청 간 공유)
+            storage: Supabase Storage (None이면 URL 없이 로컬 계층만)
+            disk_dir: 로컬 디스크 캐시 디렉터리 (None이면 사용 안 함)
+            url_expires_in: 서명 URL 유효 시간 (초)
+            version: 키 버전 (올리면 기존 캐시 전체 무효화)
+        """
+        self._tts_provider = tts_provider
+        self._memory = memory
+        self._storage = storage
+        self._disk_dir = Path(disk_dir) if disk_dir else None
+        self._url_expires_in = url_expires_in
+        self._version = version
+
+    def key(self, text: str, language: str) -> str:
+        """텍스트/언어 → 캐시 키 (Provider의 목소리/형식 포함)"""
+        return audio_key(
+            text,
+            language,
+            voice=self._tts_provider.voice(language),
+            audio_format=self._tts_provider.audio_format,
+            version=self._version,
+        )
+
+    @property
+    def has_storage(self) -> bool:
+        """스토리지 계층 사용 여부 (서명 URL 발급 가능)"""
+        return self._storage is not None
+
+    def _storage_key(self, key: str) -> str:
+        return f"{STORAGE_PREFIX}/{key[:2]}/{key}.{self._tts_provider.audio_format}"
+
+    async def synthesize(
+        self, text: str, language: str, *, fresh_url: bool = False
+    ) -> CachedAudio:
+        """캐시된 오디오 반환 (없으면 합성 후 저장)
+
+        fresh_url=True면 메모리의 서명 URL 대신 새로 발급 (오래 보관할 URL용)
+
+        Raises:
+            SpeechError: 캐시 미스 후 합성 실패 (스토리지/디스크 오류는 미스로 처리)
+        """
+        key = self.key(text, language)
+
+        source = "memory"
+        audio = self._memory.get(key)
+        if audio is None:
+            source = "disk"
+            audio = await self._read_disk(key)
+        if audio is None:
+            source = "storage"
+            audio = await self._download(key)
+        if audio is None:
+            source = "tts"
+            audio = await self._tts_provider.synthesize(text, language)
+            await self._upload(key, audio)
+        get_metrics().increment(
+            f"{METRIC_PREFIX}.{'miss' if source == 'tts' else source}"
+        )
+
+        if source != "memory":
+            self._memory.set(key, audio)
+        if source in ("storage", "tts"):
+            await self._write_disk(key, audio)
+
+        url, url_expires_in = await self._url(key, fresh=fresh_url)
+        return CachedAudio(key, audio, url, source, url_expires_in)
+
+    # ─────────────────────────────────────────────────
+    # 디스크
+    # ─────────────────────────────────────────────────
+
+    def _disk_path(self, key: str) -> Path | None:
+        if self._disk_dir is None:
+            return None
+        return self._disk_dir / f"{key}.{self._tts_provider.audio_format}"
+
+    async def _read_disk(self, key: str) -> bytes | None:
+        path = self._disk_path(key)
+        if path is None:
+            return None
+        try:
+            return await asyncio.to_thread(path.read_bytes)
+        except OSError:
+            return None
+
+    async def _write_disk(self, key: str, audio: bytes) -> None:
+        path = self._disk_path(key)
+        if path is None:
+            return
+        try:
+            await asyncio.to_thread(_write_atomic, path, audio)
+        except OSError as e:
+            logger.warning("음성 캐시 디스크 저장 실패: %s", e)
+
+    # ─────────────────────────────────────────────────
+    # 스토리지
+    # ─────────────────────────────────────────────────
+
+    async def _download(self, key: str) -> bytes | None:
+        if self._storage is None:
+            return None
+        try:
+            return await self._storage.download(self._storage_key(key))
+        except StorageError:
+            # 객체 없음 또는 스토리지 장애 → 합성으로 진행
+            return None
+
+    async def _upload(self, key: str, audio: bytes) -> None:
+        if self._storage is None:
+            return
+        try:
+            await self._storage.upload(
+                io.BytesIO(audio),
+                self._storage_key(key),
+                content_type=self._tts_provider.content_type,
+            )
+        except StorageError as e:
+            logger.warning("음성 캐시 업로드 실패: %s", e.message)
+
+    async def _url(self, key: str, *, fresh: bool) -> tuple[str | None, float | None]:
+        """서명 URL과 남은 유효 시간 (메모리에 유효한 URL이 있으면 재사용)"""
+        if self._storage is None:
+            return None, None
+        url = None if fresh else self._memory.get_url(key)
+        if url is not None:
+            return url, self._memory.url_expires_in(key)
+        try:
+            url = await self._storage.get_presigned_url(
+                self._storage_key(key), expires_in=self._url_expires_in
+            )
+        except StorageError as e:
+            logger.warning("음성 캐시 URL 발급 실패: %s", e.message)
+            return None, None
+        self._memory.set_url(key, url, self._url_expires_in)
+        return url, self._url_expires_in
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """임시 파일에 쓴 뒤 교체 (동시 읽기 중 잘린 파일 방지)"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        Path(tmp).replace(path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            Path(tmp).unlink()
+        raise
+
+
+# 싱글톤 인스턴스
+_memory: AudioMemory | None = None
+
+
+def get_audio_memory() -> AudioMemory:
+    """AudioMemory 싱글톤 반환"""
+    global _memory
+    if _memory is None:
+        _memory = AudioMemory(max_bytes=settings.TRANSLATION_AUDIO_CACHE_MEMORY_BYTES)
+    return _memory
+
+
+def build_audio_cache(
+    tts_provider: IAsyncTextToSpeechProvider,
+    storage: IAsyncStorageProvider | None,
+) -> AudioCache:
+    """설정 기반 AudioCache 생성 (요청마다, 메모리 계층은 공유)"""
+    return AudioCache(
+        tts_provider,
+        memory=get_audio_memory(),
+        storage=storage,
+        disk_dir=settings.TRANSLATION_AUDIO_CACHE_DIR,
+        url_expires_in=settings.TRANSLATION_AUDIO_URL_EXPIRES_S,
+        version=settings.TRANSLATION_AUDIO_CACHE_VERSION,
+    )
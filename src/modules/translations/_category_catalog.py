@@ -0,0 +1,200 @@
+"""번역 카테고리 카탈로그 (프로세스 내 마스터 데이터)
+
+1차/2차 카테고리, 유효 조합, 컨텍스트 프롬프트는 거의 바뀌지 않는 작은 테이블
+- 시작 시 한 번 적재 (코드 → 이름 dict, 유효 조합 set)
+- 언어별 번역 컨텍스트 문자열을 미리 렌더링
+- 컨텍스트 번역/스레드 생성 시 카테고리 쿼리 없음
+
+갱신 정책:
+- TTL: TRANSLATION_CATALOG_TTL_S 경과 후 다음 조회에서 재적재
+- 버전: TRANSLATION_CATALOG_VERSION 변경 시 다음 조회에서 즉시 재적재
+  → 카테고리/프롬프트 데이터 배포 후 버전만 올리면 반영
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from src.core.config import settings
+
+if TYPE_CHECKING:
+    from ._interfaces import ICategoryRepository
+
+# 미리 렌더링하는 컨텍스트 언어 (그 외 대상 언어는 영어 컨텍스트 사용)
+CONTEXT_LANGS = ("ko", "en")
+
+
+def _context_lang(target_lang: str) -> str:
+    return "ko" if target_lang == "ko" else "en"
+
+
+def render_context(
+    primary_name: str,
+    sub_name: str,
+    category_prompt: str | None,
+    lang: str,
+) -> str:
+    """번역용 전체 컨텍스트 (사용자 상황 설명 + 카테고리별 프롬프트)"""
+    if lang == "ko":
+        situation = f"이 사용자는 {primary_name}에서 {sub_name}을(를) 원합니다."
+    else:
+        situation = f"This user wants {sub_name} at a {primary_name}."
+
+    if category_prompt:
+        return f"{situation}\n{category_prompt}"
+    return situation
+
+
+@dataclass(frozen=True)
+class CategoryCatalog:
+    """카테고리 마스터 데이터 스냅샷 (불변)"""
+
+    version: str
+    primary_names: dict[str, tuple[str, str]]  # code -> (name_ko, name_en)
+    sub_names: dict[str, tuple[str, str]]  # code -> (name_ko, name_en)
+    valid_pairs: frozenset[tuple[str, str]]  # (primary_code, sub_code)
+    contexts: dict[tuple[str, str, str], str]  # (primary, sub, lang) -> 컨텍스트
+
+    @classmethod
+    def load(cls, repository: ICategoryRepository, version: str) -> CategoryCatalog:
+        """Repository에서 전체 적재 및 컨텍스트 렌더링 (쿼리 4회)"""
+        primary_names = {
+            p.code: (p.name_ko, p.name_en) for p in repository.get_primary_categories()
+        }
+        sub_names = {
+            s.code: (s.name_ko, s.name_en) for s in repository.get_sub_categories()
+        }
+        valid_pairs = frozenset(
+            (m.primary_code, m.sub_code) for m in repository.get_category_mappings()
+        )
+        prompts = {
+            (p.primary_code, p.sub_code): {"ko": p.prompt_ko, "en": p.prompt_en}
+            for p in repository.get_context_prompts()
+        }
+
+        catalog = cls(
+            version=version,
+            primary_names=primary_names,
+            sub_names=sub_names,
+            valid_pairs=valid_pairs,
+            contexts={},
+        )
+        for primary_code, sub_code in valid_pairs | prompts.keys():
+            for lang in CONTEXT_LANGS:
+                catalog.contexts[(primary_code, sub_code, lang)] = catalog._render(
+                    primary_code, sub_code, lang, prompts
+                )
+        return catalog
+
+    def _render(
+        self,
+        primary_code: str,
+        sub_code: str,
+        lang: str,
+        prompts: dict[tuple[str, str], dict[str, str]],
+    ) -> str:
+        index = 0 if lang == "ko" else 1
+        primary = self.primary_names.get(primary_code)
+        sub = self.sub_names.get(sub_code)
+        return render_context(
+            primary[index] if primary else primary_code,
+            sub[index] if sub else sub_code,
+            prompts.get((primary_code, sub_code), {}).get(lang),
+            lang,
+        )
+
+    def is_valid_pair(self, primary_code: str, sub_code: str) -> bool:
+        """카테고리 조합 유효성"""
+        return (primary_code, sub_code) in self.valid_pairs
+
+    def context(self, primary_code: str, sub_code: str, target_lang: str) -> str:
+        """번역 컨텍스트 (미리 렌더링된 값, 없으면 코드 이름으로 렌더링)"""
+        lang = _context_lang(target_lang)
+        rendered = self.contexts.get((primary_code, sub_code, lang))
+        if rendered is not None:
+            return rendered
+        return self._render(primary_code, sub_code, lang, {})
+
+
+class CategoryCatalogCache:
+    """카테고리 카탈로그 보관 (TTL + 버전 기반 재적재)"""
+
+    def __init__(
+        self,
+        ttl_s: float = 600,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """카탈로그 캐시 초기화
+
+        Args:
+            ttl_s: 카탈로그 유효 시간 (초)
+            clock: 시간 함수 (테스트용 주입)
+        """
+        self._ttl_s = ttl_s
+        self._clock = clock
+        self._catalog: CategoryCatalog | None = None
+        self._loaded_at = 0.0
+
+    def get(self, repository: ICategoryRepository) -> CategoryCatalog:
+        """카탈로그 조회 (미적재/만료/버전 변경 시에만 재적재)"""
+        catalog = self._current()
+        if catalog is None:
+            catalog = self.refresh(repository)
+        return catalog
+
+    async def get_async(self, repository: ICategoryRepository) -> CategoryCatalog:
+        """카탈로그 조회 (비동기, 재적재 쿼리는 스레드풀에서 실행)"""
+        catalog = self._current()
+        if catalog is None:
+            catalog = await asyncio.to_thread(self.refresh, repository)
+        return catalog
+
+    def _current(self) -> CategoryCatalog | None:
+        """유효한 적재 카탈로그 (미적재/만료/버전 변경이면 None)"""
+        catalog = self._catalog
+        if (
+            catalog is None
+            or catalog.version != settings.TRANSLATION_CATALOG_VERSION
+            or self._clock() - self._loaded_at >= self._ttl_s
+        ):
+            return None
+        return catalog
+
+    def refresh(self, repository: ICategoryRepository) -> CategoryCatalog:
+        """즉시 재적재 (시작 시 미리 적재용)"""
+        catalog = CategoryCatalog.load(repository, settings.TRANSLATION_CATALOG_VERSION)
+        self._catalog = catalog
+        self._loaded_at = self._clock()
+        return catalog
+
+    def invalidate(self) -> None:
+        """적재된 카탈로그 폐기 (다음 조회에서 재적재)"""
+        self._catalog = None
+
+
+# 싱글톤 인스턴스
+_cache: CategoryCatalogCache | None = None
+
+
+def get_category_catalog() -> CategoryCatalogCache:
+    """CategoryCatalogCache 싱글톤 반환"""
+    global _cache
+    if _cache is None:
+        _cache = CategoryCatalogCache(ttl_s=settings.TRANSLATION_CATALOG_TTL_S)
+    return _cache
+
+
+def preload_category_catalog() -> None:
+    """시작 시 카탈로그 적재 (별도 DB 세션)"""
+    from sqlmodel import Session
+
+    from src.core.database import engine
+
+    from ._repository import CategoryRepository
+
+    with Session(engine) as session:
+        get_category_catalog().refresh(CategoryRepository(session))
@@ -2,30 +2,41 @@
 
 카테고리별 AI 번역 컨텍스트 프롬프트를 조회하고 적용하는 서비스
 사용자의 현재 상황 정보(1차, 2차 카테고리)를 포함한 전체 프롬프트 생성
+카테고리 카탈로그(프로세스 내)를 사용하여 번역마다 카테고리 쿼리 없음
 """
 
 from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from ._category_catalog import get_category_catalog
 from ._interfaces import IContextService
 
 if TYPE_CHECKING:
+    from ._category_catalog import CategoryCatalogCache
     from ._interfaces import ICategoryRepository
 
 
 class ContextService(IContextService):
     """컨텍스트 서비스 구현"""
 
-    def __init__(self, category_repository: ICategoryRepository) -> None:
+    def __init__(
+        self,
+        category_repository: ICategoryRepository,
+        category_catalog: CategoryCatalogCache | None = None,
+    ) -> None:
         """컨텍스트 서비스 초기화
 
         Args:
-            category_repository: 카테고리 Repository (DIP)
+            category_repository: 카테고리 Repository (DIP, 카탈로그 재적재용)
+            category_catalog: 카테고리 카탈로그 (None이면 프로세스 공용 카탈로그)
         """
         self._category_repository = category_repository
+        self._category_catalog = (
+            category_catalog if category_catalog is not None else get_category_catalog()
+        )
 
-    def build_translation_context(
+    async def build_translation_context(
         self,
         primary_code: str | None,
         sub_code: str | None,
@@ -35,6 +46,8 @@ class ContextService(IContextService):
 
         사용자의 현재 상황 정보와 카테고리별 프롬프트를 결합하여
         AI 번역에 사용할 전체 컨텍스트를 생성합니다.
+        카탈로그에 미리 렌더링된 문자열을 사용하므로 DB 조회 없음
+        (카탈로그 만료 시 재적재 쿼리는 스레드풀에서 실행)
 
         예시 출력:
         "이 사용자는 음식점에서 주문하기를 원합니다.
@@ -51,62 +64,5 @@ class ContextService(IContextService):
         if not primary_code or not sub_code:
             return None
 
-        # 카테고리 이름 조회
-        primary_name, sub_name = self._get_category_names(
-            primary_code, sub_code, target_lang
-        )
-
-        # 사용자 상황 설명 생성
-        if target_lang == "ko":
-            situation = f"이 사용자는 {primary_name}에서 {sub_name}을(를) 원합니다."
-        else:
-            situation = f"This user wants {sub_name} at a {primary_name}."
-
-        # DB에서 카테고리별 프롬프트 조회
-        category_prompt = self._get_context_prompt(primary_code, sub_code, target_lang)
-
-        # 전체 컨텍스트 조합
-        if category_prompt:
-            return f"{situation}\n{category_prompt}"
-        return situation
-
-    def _get_context_prompt(
-        self,
-        primary_code: str,
-        sub_code: str,
-        target_lang: str = "ko",
-    ) -> str | None:
-        """카테고리별 컨텍스트 프롬프트 조회"""
-        prompt = self._category_repository.get_context_prompt(primary_code, sub_code)
-        if prompt is None:
-            return None
-
-        # 타겟 언어에 따라 프롬프트 선택
-        if target_lang == "ko":
-            return prompt.prompt_ko
-        return prompt.prompt_en
-
-    def _get_category_names(
-        self,
-        primary_code: str,
-        sub_code: str,
-        lang: str = "ko",
-    ) -> tuple[str, str]:
-        """카테고리 코드를 이름으로 변환"""
-        # 1차 카테고리 조회
-        primaries = self._category_repository.get_primary_categories()
-        primary_name = primary_code
-        for p in primaries:
-            if p.code == primary_code:
-                primary_name = p.name_ko if lang == "ko" else p.name_en
-                break
-
-        # 2차 카테고리 조회
-        subs = self._category_repository.get_sub_categories()
-        sub_name = sub_code
-        for s in subs:
-            if s.code == sub_code:
-                sub_name = s.name_ko if lang == "ko" else s.name_en
-                break
-
-        return primary_name, sub_name
+        catalog = await self._category_catalog.get_async(self._category_repository)
+        return catalog.context(primary_code, sub_code, target_lang)
@@ -0,0 +1,54 @@
+"""키셋 페이지네이션 커서
+
+(created_at, id) 기준 키셋 페이지네이션
+- OFFSET 없이 마지막 항목 다음부터 조회 → 깊은 페이지도 일정한 비용
+- 같은 created_at(묶음 저장 등)은 id로 순서 고정
+- 커서는 클라이언트에 불투명한 base64url 문자열
+"""
+
+import base64
+import binascii
+import json
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Protocol
+from uuid import UUID
+
+from ._exceptions import InvalidCursorError
+
+# (created_at, id)
+Cursor = tuple[datetime, UUID]
+
+
+class _Keyed(Protocol):
+    created_at: datetime
+    id: UUID
+
+
+def encode_cursor(created_at: datetime, item_id: UUID) -> str:
+    """커서 인코딩"""
+    raw = json.dumps([created_at.isoformat(), item_id.hex])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Cursor:
+    """커서 디코딩
+
+    Raises:
+        InvalidCursorError: 형식이 잘못된 커서
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, item_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(created_at), UUID(hex=item_id)
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as e:
+        raise InvalidCursorError() from e
+
+
+def paginate[T: _Keyed](rows: Sequence[T], limit: int) -> tuple[list[T], str | None]:
+    """limit + 1개 조회 결과 → (현재 페이지, 다음 커서)"""
+    page = list(rows[:limit])
+    if len(rows) <= limit or not page:
+        return page, None
+    last = page[-1]
+    return page, encode_cursor(last.created_at, last.id)
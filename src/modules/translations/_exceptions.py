@@ -46,3 +46,35 @@ class TranslationNotFoundError(AppError):
     status = Status.TRANSLATION_NOT_FOUND
     message = "번역 기록을 찾을 수 없어요"
     status_code = 404
+
+
+class PhraseNotFoundError(AppError):
+    """추천 문장을 찾을 수 없음 (없거나 비활성)"""
+
+    status = Status.PHRASE_NOT_FOUND
+    message = "문장을 찾을 수 없어요"
+    status_code = 404
+
+
+class InvalidCursorError(AppError):
+    """잘못된 페이지네이션 커서"""
+
+    status = Status.VALIDATION_FAILED
+    message = "잘못된 커서예요"
+    status_code = 400
+
+
+class SpeechNotRecognizedError(AppError):
+    """음성에서 인식된 문장이 없음"""
+
+    status = Status.ERROR_INVALID_AUDIO
+    message = "음성을 인식하지 못했어요"
+    status_code = 400
+
+
+class AudioTooLargeError(AppError):
+    """업로드 오디오 크기 초과"""
+
+    status = Status.ERROR_INVALID_AUDIO
+    message = "음성이 너무 길어요"
+    status_code = 413
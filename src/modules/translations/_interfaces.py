@@ -7,11 +7,17 @@ Infrastructure Layer에서 Adapter로 구현
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from datetime import datetime
 from typing import TYPE_CHECKING
 from uuid import UUID
 
 if TYPE_CHECKING:
+    from src.modules.phrases import Phrase
+
+    from ._cursor import Cursor
     from ._models import (
+        PhraseAsset,
         Translation,
         TranslationCategoryMapping,
         TranslationContextPrompt,
@@ -29,15 +35,21 @@ if TYPE_CHECKING:
 class ITranslationService(ABC):
     """번역 서비스 인터페이스"""
 
+    @property
+    @abstractmethod
+    def model_version(self) -> str:
+        """번역 결과를 만든 모델 식별자 (번역 메모리 무효화 키)"""
+        ...
+
     @abstractmethod
-    def translate(
+    async def translate(
         self,
         text: str,
         source_lang: str,
         target_lang: str,
         context: str | None = None,
     ) -> str:
-        """텍스트 번역
+        """텍스트 번역 (비동기)
 
         Args:
             text: 번역할 텍스트
@@ -50,12 +62,54 @@ class ITranslationService(ABC):
         """
         ...
 
+    @abstractmethod
+    def translate_stream(
+        self,
+        text: str,
+        source_lang: str,
+        target_lang: str,
+        context: str | None = None,
+    ) -> AsyncIterator[str]:
+        """텍스트 번역 스트리밍 (비동기)
+
+        Args:
+            text: 번역할 텍스트
+            source_lang: 원본 언어 코드
+            target_lang: 대상 언어 코드
+            context: 번역 컨텍스트 (선택)
+
+        Yields:
+            생성되는 순서대로의 번역 텍스트 조각
+        """
+        ...
+
+    @abstractmethod
+    async def translate_batch(
+        self,
+        texts: list[str],
+        source_lang: str,
+        target_lang: str,
+        context: str | None = None,
+    ) -> list[str]:
+        """같은 언어쌍/컨텍스트의 여러 텍스트 묶음 번역 (비동기)
+
+        Args:
+            texts: 번역할 텍스트 목록
+            source_lang: 원본 언어 코드
+            target_lang: 대상 언어 코드
+            context: 번역 컨텍스트 (선택)
+
+        Returns:
+            texts와 같은 순서의 번역된 텍스트 목록
+        """
+        ...
+
 
 class IContextService(ABC):
     """컨텍스트 서비스 인터페이스"""
 
     @abstractmethod
-    def build_translation_context(
+    async def build_translation_context(
         self,
         primary_code: str | None,
         sub_code: str | None,
@@ -87,11 +141,21 @@ class ITranslationRepository(ABC):
         """번역 기록 생성"""
         ...
 
+    @abstractmethod
+    def create_many(self, translations: list[Translation]) -> list[Translation]:
+        """번역 기록 일괄 생성"""
+        ...
+
     @abstractmethod
     def get_by_id(self, translation_id: UUID) -> Translation | None:
         """번역 기록 조회"""
         ...
 
+    @abstractmethod
+    def find_by_memory_key(self, memory_key: str, since: datetime) -> str | None:
+        """번역 메모리 키로 since 이후 최신 번역문 조회"""
+        ...
+
     @abstractmethod
     def get_by_profile_id(
         self,
@@ -100,10 +164,37 @@ class ITranslationRepository(ABC):
         limit: int = 20,
         translation_type: str | None = None,
         mission_progress_id: UUID | None = None,
+        *,
+        approximate: bool = False,
     ) -> tuple[list[Translation], int]:
         """사용자별 번역 히스토리 조회"""
         ...
 
+    @abstractmethod
+    def get_by_profile_id_after(
+        self,
+        profile_id: UUID,
+        *,
+        cursor: Cursor | None,
+        limit: int,
+        translation_type: str | None = None,
+        mission_progress_id: UUID | None = None,
+    ) -> list[Translation]:
+        """사용자별 번역 히스토리 키셋 조회 (최신순)"""
+        ...
+
+    @abstractmethod
+    def count_by_profile_id(
+        self,
+        profile_id: UUID,
+        *,
+        translation_type: str | None = None,
+        mission_progress_id: UUID | None = None,
+        approximate: bool = False,
+    ) -> int:
+        """사용자별 번역 기록 수 (approximate: 추정치 허용)"""
+        ...
+
     @abstractmethod
     def delete(self, translation: Translation) -> None:
         """번역 기록 삭제"""
@@ -119,6 +210,17 @@ class ITranslationRepository(ABC):
         """스레드별 번역 기록 조회"""
         ...
 
+    @abstractmethod
+    def get_by_thread_id_after(
+        self,
+        thread_id: UUID,
+        *,
+        cursor: Cursor | None,
+        limit: int,
+    ) -> list[Translation]:
+        """스레드별 번역 기록 키셋 조회 (대화 순서)"""
+        ...
+
 
 class ICategoryRepository(ABC):
     """카테고리 Repository 인터페이스"""
@@ -153,6 +255,11 @@ class ICategoryRepository(ABC):
         """컨텍스트 프롬프트 조회"""
         ...
 
+    @abstractmethod
+    def get_context_prompts(self) -> list[TranslationContextPrompt]:
+        """활성 컨텍스트 프롬프트 전체 조회"""
+        ...
+
     @abstractmethod
     def is_valid_category_mapping(
         self,
@@ -186,7 +293,49 @@ class IThreadRepository(ABC):
         """사용자별 스레드 목록 조회"""
         ...
 
+    @abstractmethod
+    def get_by_profile_id_after(
+        self,
+        profile_id: UUID,
+        *,
+        cursor: Cursor | None,
+        limit: int,
+    ) -> list[TranslationThread]:
+        """사용자별 스레드 목록 키셋 조회 (최신순)"""
+        ...
+
+    @abstractmethod
+    def count_by_profile_id(self, profile_id: UUID) -> int:
+        """사용자별 스레드 수"""
+        ...
+
     @abstractmethod
     def soft_delete(self, thread: TranslationThread) -> TranslationThread:
         """스레드 소프트 삭제"""
         ...
+
+
+class IPhraseAssetRepository(ABC):
+    """추천 문장 사전 계산 결과 Repository 인터페이스"""
+
+    @abstractmethod
+    def get_active_phrases(self) -> list[Phrase]:
+        """활성 추천 문장 전체"""
+        ...
+
+    @abstractmethod
+    def get_all(self) -> list[PhraseAsset]:
+        """사전 계산 결과 전체"""
+        ...
+
+    @abstractmethod
+    def get_phrase_with_asset(
+        self, phrase_id: UUID, target_lang: str
+    ) -> tuple[Phrase, PhraseAsset | None] | None:
+        """활성 추천 문장과 대상 언어 사전 계산 결과 (쿼리 1회, 문장 없으면 None)"""
+        ...
+
+    @abstractmethod
+    def save_many(self, assets: list[PhraseAsset]) -> None:
+        """사전 계산 결과 저장 (phrase_id, target_lang 기준 갱신)"""
+        ...
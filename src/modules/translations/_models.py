@@ -5,12 +5,14 @@ DDD_CLASS_DIAGRAM.md 기반:
 - text/voice 두 가지 타입
 - 스레드 기반 대화 관리
 - 카테고리 컨텍스트 번역
+- 목록 조회 경로별 복합/부분 인덱스 (필터 컬럼 → created_at, id 순서)
+- 추천 문장 사전 계산 결과 (번역문 + 합성 음성)
 """
 
 from datetime import UTC, datetime
 from uuid import UUID, uuid4
 
-from sqlalchemy import UniqueConstraint
+from sqlalchemy import Index, UniqueConstraint, text
 from sqlmodel import Field, SQLModel
 
 from src.core.enums import TranslationType
@@ -20,6 +22,11 @@ def _utcnow() -> datetime:
     return datetime.now(UTC)
 
 
+def _partial_index(name: str, *columns: str, where: str) -> Index:
+    """부분 인덱스 (PostgreSQL/SQLite 공통 조건)"""
+    return Index(name, *columns, postgresql_where=text(where), sqlite_where=text(where))
+
+
 # ─────────────────────────────────────────────────
 # Category Models (마스터 데이터)
 # ─────────────────────────────────────────────────
@@ -96,6 +103,16 @@ class TranslationThread(SQLModel, table=True):
     """번역 대화 스레드"""
 
     __tablename__ = "translation_threads"
+    __table_args__ = (
+        # 스레드 목록: 삭제되지 않은 스레드만 최신순
+        _partial_index(
+            "ix_translation_threads_profile_active_created",
+            "profile_id",
+            "created_at",
+            "id",
+            where="deleted_at IS NULL",
+        ),
+    )
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
     profile_id: UUID = Field(foreign_key="profiles.id", index=True)
@@ -119,9 +136,38 @@ class Translation(SQLModel, table=True):
     """번역 기록"""
 
     __tablename__ = "translations"
+    __table_args__ = (
+        # 번역 히스토리: 사용자별 최신순 (profile_id 단일 인덱스 대체)
+        Index("ix_translations_profile_created", "profile_id", "created_at", "id"),
+        # 번역 히스토리 type 필터
+        Index(
+            "ix_translations_profile_type_created",
+            "profile_id",
+            "translation_type",
+            "created_at",
+            "id",
+        ),
+        # 번역 히스토리 미션 필터 (미션 연결 기록만)
+        _partial_index(
+            "ix_translations_profile_mission_created",
+            "profile_id",
+            "mission_progress_id",
+            "created_at",
+            "id",
+            where="mission_progress_id IS NOT NULL",
+        ),
+        # 스레드 상세: 대화 순서 (thread_id 단일 인덱스 대체)
+        _partial_index(
+            "ix_translations_thread_created",
+            "thread_id",
+            "created_at",
+            "id",
+            where="thread_id IS NOT NULL",
+        ),
+    )
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
-    profile_id: UUID = Field(foreign_key="profiles.id", index=True)
+    profile_id: UUID = Field(foreign_key="profiles.id")
     source_text: str = Field()
     translated_text: str = Field()
     source_lang: str = Field(max_length=5)
@@ -136,8 +182,53 @@ class Translation(SQLModel, table=True):
     created_at: datetime = Field(default_factory=_utcnow, index=True)
 
     # 신규 필드: 스레드 및 컨텍스트
-    thread_id: UUID | None = Field(
-        default=None, foreign_key="translation_threads.id", index=True
-    )
+    thread_id: UUID | None = Field(default=None, foreign_key="translation_threads.id")
     context_primary: str | None = Field(default=None, max_length=10)
     context_sub: str | None = Field(default=None, max_length=50)
+
+    # 번역 메모리 키 (정규화 원문 + 언어쌍 + 카테고리 + 모델 버전 해시)
+    memory_key: str | None = Field(default=None, max_length=64, index=True)
+
+
+# ─────────────────────────────────────────────────
+# Counter Model (목록 전체 개수)
+# ─────────────────────────────────────────────────
+
+
+class TranslationCounter(SQLModel, table=True):
+    """사용자별 목록 개수 카운터 (목록 total을 COUNT 없이 조회)
+
+    Repository의 생성/삭제/소프트 삭제와 같은 트랜잭션에서 증감
+    name: translations, translations.{type}, threads
+    """
+
+    __tablename__ = "translation_counters"
+
+    profile_id: UUID = Field(foreign_key="profiles.id", primary_key=True)
+    name: str = Field(primary_key=True, max_length=32)
+    value: int = Field(default=0)
+
+
+# ─────────────────────────────────────────────────
+# Phrase Asset Model (추천 문장 사전 계산)
+# ─────────────────────────────────────────────────
+
+
+class PhraseAsset(SQLModel, table=True):
+    """추천 문장 대상 언어별 번역문 + 합성 음성 (워밍업 작업이 갱신)
+
+    요청 시에는 조회만 (LLM/TTS 호출 없음)
+    source_hash/audio_key가 현재 문장/음성 설정과 다르면 다음 워밍업에서 갱신
+    """
+
+    __tablename__ = "phrase_assets"
+
+    phrase_id: UUID = Field(foreign_key="phrases.id", primary_key=True)
+    target_lang: str = Field(primary_key=True, max_length=10)
+    source_text: str = Field()
+    translated_text: str = Field()
+    source_hash: str = Field(max_length=64)  # (text_ko, text_en) SHA-256
+    audio_key: str = Field(max_length=64)  # 음성 캐시 키
+    audio_url: str | None = Field(default=None)
+    audio_url_expires_at: datetime | None = Field(default=None)
+    updated_at: datetime = Field(default_factory=_utcnow)
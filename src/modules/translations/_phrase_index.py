@@ -0,0 +1,127 @@
+"""추천 문장 색인 (텍스트 번역 사전 적중)
+
+원문이 활성 추천 문장의 text_ko/text_en과 (정규화 후) 정확히 같으면
+문장 행의 반대 언어 텍스트가 곧 검수된 번역 → 번역 API 호출 없이 사용
+- 키: (원본 언어, 대상 언어, 정규화된 원문) — 번역 메모리와 같은 정규화
+- 같은 원문에 번역이 여러 개인 문장은 색인에서 제외 (임의 선택하지 않음)
+
+갱신 정책:
+- TTL: TRANSLATION_PHRASE_INDEX_TTL_S 경과 후 다음 조회에서 재적재
+- 워밍업 작업이 문장을 대조할 때마다 같은 목록으로 재구성
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from src.core.config import settings
+
+from ._translation_memory import normalize_text
+
+if TYPE_CHECKING:
+    from src.modules.phrases import Phrase
+
+    from ._interfaces import IPhraseAssetRepository
+
+HIT_METRIC = "translation.dictionary.hit"  # 추천 문장 사전 적중 (번역 API 생략)
+MISS_METRIC = "translation.dictionary.miss"
+
+
+@dataclass(frozen=True)
+class PhraseIndex:
+    """활성 추천 문장 색인 스냅샷 (불변)"""
+
+    translations: dict[tuple[str, str, str], str]  # (원본, 대상, 원문) -> 번역문
+
+    @classmethod
+    def build(cls, phrases: Iterable[Phrase]) -> PhraseIndex:
+        """문장마다 ko→en, en→ko 두 방향 색인"""
+        translations: dict[tuple[str, str, str], str] = {}
+        ambiguous: set[tuple[str, str, str]] = set()
+        for phrase in phrases:
+            for source_lang, target_lang, source_text, translated_text in (
+                ("ko", "en", phrase.text_ko, phrase.text_en),
+                ("en", "ko", phrase.text_en, phrase.text_ko),
+            ):
+                key = (source_lang, target_lang, normalize_text(source_text))
+                if translations.setdefault(key, translated_text) != translated_text:
+                    ambiguous.add(key)
+        for key in ambiguous:
+            del translations[key]
+        return cls(translations=translations)
+
+    def lookup(
+        self, source_text: str, source_lang: str, target_lang: str
+    ) -> str | None:
+        """정확히 일치하는 추천 문장의 번역문 (없으면 None)"""
+        return self.translations.get(
+            (source_lang, target_lang, normalize_text(source_text))
+        )
+
+
+class PhraseIndexCache:
+    """추천 문장 색인 보관 (TTL 기반 재적재)"""
+
+    def __init__(
+        self,
+        ttl_s: float = 60,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """색인 캐시 초기화
+
+        Args:
+            ttl_s: 색인 유효 시간 (초)
+            clock: 시간 함수 (테스트용 주입)
+        """
+        self._ttl_s = ttl_s
+        self._clock = clock
+        self._index: PhraseIndex | None = None
+        self._loaded_at = 0.0
+
+    def get(self, repository: IPhraseAssetRepository) -> PhraseIndex:
+        """색인 조회 (미적재/만료 시에만 재적재)"""
+        index = self._current()
+        if index is None:
+            index = self.load(repository.get_active_phrases())
+        return index
+
+    async def get_async(self, repository: IPhraseAssetRepository) -> PhraseIndex:
+        """색인 조회 (비동기, 재적재 쿼리는 스레드풀에서 실행)"""
+        index = self._current()
+        if index is None:
+            index = self.load(await asyncio.to_thread(repository.get_active_phrases))
+        return index
+
+    def _current(self) -> PhraseIndex | None:
+        """유효한 적재 색인 (미적재/만료면 None)"""
+        index = self._index
+        if index is None or self._clock() - self._loaded_at >= self._ttl_s:
+            return None
+        return index
+
+    def load(self, phrases: Iterable[Phrase]) -> PhraseIndex:
+        """활성 문장 목록으로 즉시 재구성"""
+        index = PhraseIndex.build(phrases)
+        self._index = index
+        self._loaded_at = self._clock()
+        return index
+
+    def invalidate(self) -> None:
+        """적재된 색인 폐기 (다음 조회에서 재적재)"""
+        self._index = None
+
+
+# 싱글톤 인스턴스
+_cache: PhraseIndexCache | None = None
+
+
+def get_phrase_index() -> PhraseIndexCache:
+    """PhraseIndexCache 싱글톤 반환"""
+    global _cache
+    if _cache is None:
+        _cache = PhraseIndexCache(ttl_s=settings.TRANSLATION_PHRASE_INDEX_TTL_S)
+    return _cache
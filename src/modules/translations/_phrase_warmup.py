@@ -0,0 +1,265 @@
+"""추천 문장 워밍업 (사전 번역 + 사전 합성)
+
+추천 문장(phrases)은 고정된 작은 집합 → 요청 시 번역/TTS 대신 미리 계산해 두고 조회만
+- 번역: 문장 행의 text_ko/text_en이 검수된 번역 (LLM 호출 없음)
+- 음성: 대상 언어 문장을 음성 캐시로 합성 → Storage 서명 URL
+- 결과는 phrase_assets (phrase_id, target_lang)에 저장
+
+갱신 대상 (주기적으로 현재 문장과 대조 → 생성/수정 경로와 무관하게 감지):
+- 새 문장 (사전 계산 결과 없음)
+- 문장 변경 (text_ko/text_en 해시 불일치)
+- 음성 설정 변경 (음성 캐시 키 불일치: 목소리/형식/버전)
+- 서명 URL 미발급 또는 만료 임박
+
+대조한 활성 문장 목록으로 텍스트 번역용 추천 문장 색인도 재구성
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import hashlib
+import logging
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
+
+from sqlmodel import Session
+
+from src.core.config import settings
+from src.core.database import engine
+from src.core.metrics import get_metrics
+from src.external.google import SpeechError
+
+from ._models import PhraseAsset
+from ._phrase_index import get_phrase_index
+from ._repository import PhraseAssetRepository
+
+if TYPE_CHECKING:
+    from src.modules.phrases import Phrase
+
+    from ._audio_cache import AudioCache
+
+logger = logging.getLogger(__name__)
+
+WARMED_METRIC = "translation.phrase_warmup.warmed"  # 갱신한 (문장, 대상 언어) 수
+ERROR_METRIC = "translation.phrase_warmup.error"  # 합성 실패 (다음 실행에서 재시도)
+
+# 사전 계산하는 대상 언어 (문장 행이 가진 두 언어)
+PHRASE_TARGET_LANGS = ("ko", "en")
+
+
+def _utcnow() -> datetime:
+    return datetime.now(UTC)
+
+
+def _aware(dt: datetime) -> datetime:
+    """SQLite에서 읽은 naive datetime은 UTC로 간주"""
+    if dt.tzinfo is None:
+        return dt.replace(tzinfo=UTC)
+    return dt
+
+
+def phrase_hash(phrase: Phrase) -> str:
+    """문장 내용 해시 (text_ko, text_en 중 하나라도 바뀌면 달라짐)"""
+    return hashlib.sha256(f"{phrase.text_ko}\x1f{phrase.text_en}".encode()).hexdigest()
+
+
+def phrase_texts(phrase: Phrase, target_lang: str) -> tuple[str, str]:
+    """대상 언어 기준 (원문, 번역문)"""
+    if target_lang == "ko":
+        return phrase.text_en, phrase.text_ko
+    return phrase.text_ko, phrase.text_en
+
+
+def _default_session_factory() -> Session:
+    return Session(engine)
+
+
+async def _default_audio_cache() -> AudioCache | None:
+    """실제 TTS Provider가 있을 때만 음성 캐시 (가짜 음성은 영구 저장하지 않음)"""
+    from src.external.google import get_async_tts_provider
+    from src.external.supabase import get_async_storage_provider
+
+    from ._audio_cache import build_audio_cache
+
+    tts_provider = get_async_tts_provider()
+    if tts_provider is None:
+        return None
+    return build_audio_cache(tts_provider, await get_async_storage_provider())
+
+
+class PhraseWarmupJob:
+    """추천 문장 사전 계산 백그라운드 작업"""
+
+    def __init__(
+        self,
+        audio_cache_factory: Callable[
+            [], Awaitable[AudioCache | None]
+        ] = _default_audio_cache,
+        session_factory: Callable[[], Session] = _default_session_factory,
+        interval_s: float = 600,
+        url_refresh_s: float = 24 * 3600,
+    ) -> None:
+        """작업 초기화
+
+        Args:
+            audio_cache_factory: 실행마다 음성 캐시 생성 (None이면 실행 생략)
+            session_factory: 조회/저장에 사용할 세션 생성 함수
+            interval_s: 주기적 대조 간격 (초)
+            url_refresh_s: 서명 URL 남은 유효 시간이 이보다 짧으면 재발급 (초)
+        """
+        self._audio_cache_factory = audio_cache_factory
+        self._session_factory = session_factory
+        self._interval_s = interval_s
+        self._url_refresh = timedelta(seconds=url_refresh_s)
+        self._lock = asyncio.Lock()
+        self._wake = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    @property
+    def is_running(self) -> bool:
+        """백그라운드 태스크 동작 여부"""
+        return self._task is not None and not self._task.done()
+
+    async def start(self) -> None:
+        """백그라운드 주기 실행 시작 (시작 직후 한 번 실행)"""
+        if self.is_running:
+            return
+        self._wake = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """백그라운드 실행 중단 (진행 중인 실행은 취소, 다음 기동 시 이어서 갱신)"""
+        if self._task is None:
+            return
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    def wake(self) -> None:
+        """다음 주기를 기다리지 않고 바로 실행 (사전 계산 누락/불일치 발견 시)"""
+        self._wake.set()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.run_once()
+            except Exception:
+                logger.exception("추천 문장 워밍업 실패")
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._wake.wait(), self._interval_s)
+            self._wake.clear()
+
+    async def run_once(self) -> int:
+        """변경/누락된 (문장, 대상 언어)만 사전 계산
+
+        Returns:
+            갱신한 사전 계산 결과 수
+        """
+        async with self._lock:
+            audio_cache = await self._audio_cache_factory()
+            if audio_cache is None:
+                logger.info("TTS Provider 없음 → 추천 문장 워밍업 생략")
+                return 0
+
+            phrases, assets = await asyncio.to_thread(self._load)
+            get_phrase_index().load(phrases)
+            current = {(a.phrase_id, a.target_lang): a for a in assets}
+            now = _utcnow()
+
+            updated: list[PhraseAsset] = []
+            for phrase in phrases:
+                source_hash = phrase_hash(phrase)
+                for target_lang in PHRASE_TARGET_LANGS:
+                    source_text, translated_text = phrase_texts(phrase, target_lang)
+                    audio_key = audio_cache.key(translated_text, target_lang)
+                    asset = current.get((phrase.id, target_lang))
+                    if not self._is_stale(
+                        asset, source_hash, audio_key, audio_cache.has_storage, now
+                    ):
+                        continue
+
+                    try:
+                        cached = await audio_cache.synthesize(
+                            translated_text, target_lang, fresh_url=True
+                        )
+                    except SpeechError as e:
+                        logger.warning(
+                            "추천 문장 합성 실패 (%s, %s): %s",
+                            phrase.id,
+                            target_lang,
+                            e.message,
+                        )
+                        get_metrics().increment(ERROR_METRIC)
+                        continue
+
+                    updated.append(
+                        PhraseAsset(
+                            phrase_id=phrase.id,
+                            target_lang=target_lang,
+                            source_text=source_text,
+                            translated_text=translated_text,
+                            source_hash=source_hash,
+                            audio_key=cached.key,
+                            audio_url=cached.url,
+                            audio_url_expires_at=(
+                                now + timedelta(seconds=cached.url_expires_in)
+                                if cached.url_expires_in is not None
+                                else None
+                            ),
+                            updated_at=now,
+                        )
+                    )
+
+            if updated:
+                await asyncio.to_thread(self._save, updated)
+                get_metrics().increment(WARMED_METRIC, len(updated))
+            return len(updated)
+
+    def _is_stale(
+        self,
+        asset: PhraseAsset | None,
+        source_hash: str,
+        audio_key: str,
+        has_storage: bool,
+        now: datetime,
+    ) -> bool:
+        if asset is None:
+            return True
+        if asset.source_hash != source_hash or asset.audio_key != audio_key:
+            return True
+        if not has_storage:
+            return False
+        if asset.audio_url is None or asset.audio_url_expires_at is None:
+            return True
+        return _aware(asset.audio_url_expires_at) - now <= self._url_refresh
+
+    def _load(self) -> tuple[list[Phrase], list[PhraseAsset]]:
+        with self._session_factory() as session:
+            repository = PhraseAssetRepository(session)
+            phrases = repository.get_active_phrases()
+            assets = repository.get_all()
+            session.expunge_all()
+            return phrases, assets
+
+    def _save(self, assets: list[PhraseAsset]) -> None:
+        with self._session_factory() as session:
+            PhraseAssetRepository(session).save_many(assets)
+            session.commit()
+
+
+# 싱글톤 인스턴스
+_job: PhraseWarmupJob | None = None
+
+
+def get_phrase_warmup_job() -> PhraseWarmupJob:
+    """PhraseWarmupJob 싱글톤 반환"""
+    global _job
+    if _job is None:
+        _job = PhraseWarmupJob(
+            interval_s=settings.TRANSLATION_PHRASE_WARMUP_INTERVAL_S,
+            url_refresh_s=settings.TRANSLATION_PHRASE_WARMUP_URL_REFRESH_S,
+        )
+    return _job
@@ -3,30 +3,151 @@
 클린 아키텍처: Infrastructure Layer
 - 인터페이스를 구현하여 데이터 접근 추상화
 - Session을 생성자에서 주입받아 사용
+- 목록 조회는 페이지(OFFSET) 방식과 (created_at, id) 키셋 방식 모두 제공
+- 목록 전체 개수는 translation_counters에서 조회 (생성/삭제와 같은 트랜잭션에서 증감)
 """
 
 from __future__ import annotations
 
 from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
+from sqlalchemy import bindparam, literal, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlmodel import Session, func, select
 
-from ._interfaces import ICategoryRepository, IThreadRepository, ITranslationRepository
+from src.modules.phrases import Phrase
+
+from ._interfaces import (
+    ICategoryRepository,
+    IPhraseAssetRepository,
+    IThreadRepository,
+    ITranslationRepository,
+)
 from ._models import (
+    PhraseAsset,
     Translation,
     TranslationCategoryMapping,
     TranslationContextPrompt,
+    TranslationCounter,
     TranslationPrimaryCategory,
     TranslationSubCategory,
     TranslationThread,
 )
 
+if TYPE_CHECKING:
+    from ._cursor import Cursor
+
 
 def _utcnow() -> datetime:
     return datetime.now(UTC)
 
 
+def _keyset(
+    query: Any,
+    model: type[Translation] | type[TranslationThread],
+    cursor: Cursor | None,
+    *,
+    descending: bool,
+) -> Any:
+    """(created_at, id) 키셋 조건 및 정렬 (행 값 비교 → 인덱스 범위 스캔)"""
+    key = tuple_(model.created_at, model.id)
+    if cursor is not None:
+        created_at, item_id = cursor
+        bound = tuple_(
+            literal(created_at, model.created_at.type),  # type: ignore[attr-defined]
+            literal(item_id, model.id.type),  # type: ignore[attr-defined]
+        )
+        query = query.where(key < bound if descending else key > bound)
+    if descending:
+        return query.order_by(model.created_at.desc(), model.id.desc())  # type: ignore[attr-defined]
+    return query.order_by(model.created_at.asc(), model.id.asc())  # type: ignore[attr-defined]
+
+
+# ─────────────────────────────────────────────────
+# Counters (목록 전체 개수)
+# ─────────────────────────────────────────────────
+
+TRANSLATIONS_COUNTER = "translations"
+THREADS_COUNTER = "threads"
+
+
+def _type_counter(translation_type: str) -> str:
+    return f"{TRANSLATIONS_COUNTER}.{translation_type}"
+
+
+def _counted_rows(profile_id: UUID, name: str) -> Any:
+    """카운터가 나타내는 행 수의 정확한 COUNT 쿼리"""
+    if name == THREADS_COUNTER:
+        return (
+            select(func.count())
+            .select_from(TranslationThread)
+            .where(TranslationThread.profile_id == profile_id)
+            .where(TranslationThread.deleted_at == None)  # noqa: E711
+        )
+    query = (
+        select(func.count())
+        .select_from(Translation)
+        .where(Translation.profile_id == profile_id)
+    )
+    _, _, translation_type = name.partition(".")
+    if translation_type:
+        query = query.where(Translation.translation_type == translation_type)
+    return query
+
+
+# 증감 UPDATE (미리 만들어 둔 문장, ORM 세션 동기화 생략)
+_COUNTER_UPDATE = (
+    update(TranslationCounter)
+    .where(TranslationCounter.profile_id == bindparam("counter_profile_id"))  # type: ignore[arg-type]
+    .where(TranslationCounter.name == bindparam("counter_name"))  # type: ignore[arg-type]
+    .values(value=TranslationCounter.value + bindparam("counter_delta"))
+    .execution_options(synchronize_session=False)
+)
+
+
+def _bump_counter(session: Session, profile_id: UUID, name: str, delta: int) -> None:
+    """카운터 증감 (호출자 트랜잭션에 포함, flush 이후 호출)
+
+    카운터가 있으면 UPDATE로 증감 (행 잠금으로 동시 갱신 직렬화)
+    없을 때 증가는 현재 행 수로 생성 (원자적 upsert, 동시 생성도 합산)
+    없을 때 감소는 무시 (조회 시 정확한 COUNT로 대체)
+    """
+    result = session.exec(
+        _COUNTER_UPDATE,
+        params={
+            "counter_profile_id": profile_id,
+            "counter_name": name,
+            "counter_delta": delta,
+        },
+    )
+    if result.rowcount or delta < 0:
+        return
+
+    dialect = session.get_bind().dialect.name
+    insert = pg_insert if dialect == "postgresql" else sqlite_insert
+    seed = _counted_rows(profile_id, name).add_columns(
+        literal(profile_id, TranslationCounter.profile_id.type),  # type: ignore[attr-defined]
+        literal(name),
+    )
+    stmt = insert(TranslationCounter).from_select(["value", "profile_id", "name"], seed)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[TranslationCounter.profile_id, TranslationCounter.name],
+        set_={"value": TranslationCounter.value + delta},
+    )
+    session.exec(stmt)
+
+
+def _read_counter(session: Session, profile_id: UUID, name: str) -> int | None:
+    query = select(TranslationCounter.value).where(
+        TranslationCounter.profile_id == profile_id,
+        TranslationCounter.name == name,
+    )
+    return session.exec(query).first()
+
+
 # ─────────────────────────────────────────────────
 # Translation Repository
 # ─────────────────────────────────────────────────
@@ -42,12 +163,55 @@ class TranslationRepository(ITranslationRepository):
         """번역 기록 생성 (commit은 Use Case에서 수행)"""
         self._session.add(translation)
         self._session.flush()
+        self._bump_counters([translation], 1)
+        self._touch_threads([translation])
         return translation
 
+    def create_many(self, translations: list[Translation]) -> list[Translation]:
+        """번역 기록 일괄 생성 (한 번의 flush → 다중 행 INSERT)"""
+        self._session.add_all(translations)
+        self._session.flush()
+        self._bump_counters(translations, 1)
+        self._touch_threads(translations)
+        return translations
+
+    def _bump_counters(self, translations: list[Translation], sign: int) -> None:
+        deltas: dict[tuple[UUID, str], int] = {}
+        for t in translations:
+            for name in (TRANSLATIONS_COUNTER, _type_counter(t.translation_type)):
+                key = (t.profile_id, name)
+                deltas[key] = deltas.get(key, 0) + sign
+        for (profile_id, name), delta in deltas.items():
+            _bump_counter(self._session, profile_id, name, delta)
+
+    def _touch_threads(self, translations: list[Translation]) -> None:
+        """번역 기록이 바뀐 스레드의 updated_at 갱신 (상세 조회 ETag 기준)"""
+        thread_ids = {t.thread_id for t in translations if t.thread_id is not None}
+        if not thread_ids:
+            return
+        self._session.exec(
+            update(TranslationThread)
+            .where(TranslationThread.id.in_(thread_ids))  # type: ignore[attr-defined]
+            .values(updated_at=_utcnow())
+        )
+
     def get_by_id(self, translation_id: UUID) -> Translation | None:
         """번역 기록 조회"""
         return self._session.get(Translation, translation_id)
 
+    def find_by_memory_key(self, memory_key: str, since: datetime) -> str | None:
+        """번역 메모리 키로 since 이후 최신 번역문 조회 (번역문 컬럼만 로드)"""
+        query = (
+            select(Translation.translated_text)
+            .where(
+                Translation.memory_key == memory_key,
+                Translation.created_at >= since,
+            )
+            .order_by(Translation.created_at.desc())  # type: ignore[union-attr]
+            .limit(1)
+        )
+        return self._session.exec(query).first()
+
     def get_by_profile_id(
         self,
         profile_id: UUID,
@@ -55,28 +219,102 @@ class TranslationRepository(ITranslationRepository):
         limit: int = 20,
         translation_type: str | None = None,
         mission_progress_id: UUID | None = None,
+        *,
+        approximate: bool = False,
     ) -> tuple[list[Translation], int]:
         """사용자별 번역 히스토리 조회 (페이지네이션)"""
-        query = select(Translation).where(Translation.profile_id == profile_id)
-
-        if translation_type:
-            query = query.where(Translation.translation_type == translation_type)
-        if mission_progress_id:
-            query = query.where(Translation.mission_progress_id == mission_progress_id)
-
-        count_query = select(func.count()).select_from(query.subquery())
-        total = self._session.exec(count_query).one()
+        query = self._profile_query(profile_id, translation_type, mission_progress_id)
+        total = self.count_by_profile_id(
+            profile_id,
+            translation_type=translation_type,
+            mission_progress_id=mission_progress_id,
+            approximate=approximate,
+        )
 
-        query = query.order_by(Translation.created_at.desc())  # type: ignore[union-attr]
+        query = _keyset(query, Translation, None, descending=True)
         query = query.offset((page - 1) * limit).limit(limit)
 
         translations = list(self._session.exec(query).all())
         return translations, total
 
+    def get_by_profile_id_after(
+        self,
+        profile_id: UUID,
+        *,
+        cursor: Cursor | None,
+        limit: int,
+        translation_type: str | None = None,
+        mission_progress_id: UUID | None = None,
+    ) -> list[Translation]:
+        """사용자별 번역 히스토리 키셋 조회 (최신순, cursor 다음부터)"""
+        query = self._profile_query(profile_id, translation_type, mission_progress_id)
+        query = _keyset(query, Translation, cursor, descending=True).limit(limit)
+        return list(self._session.exec(query).all())
+
+    def count_by_profile_id(
+        self,
+        profile_id: UUID,
+        *,
+        translation_type: str | None = None,
+        mission_progress_id: UUID | None = None,
+        approximate: bool = False,
+    ) -> int:
+        """사용자별 번역 기록 수
+
+        미션 필터가 없으면 카운터 조회 (O(1), 카운터 없으면 COUNT)
+        미션 필터는 COUNT, approximate이면 PostgreSQL 실행 계획 추정치
+        """
+        if mission_progress_id is None:
+            name = (
+                _type_counter(translation_type)
+                if translation_type
+                else TRANSLATIONS_COUNTER
+            )
+            value = _read_counter(self._session, profile_id, name)
+            if value is not None:
+                return value
+            return self._session.exec(_counted_rows(profile_id, name)).one()
+
+        query = self._profile_query(profile_id, translation_type, mission_progress_id)
+        if approximate:
+            estimate = self._estimate_rows(query)
+            if estimate is not None:
+                return estimate
+        count_query = select(func.count()).select_from(query.subquery())
+        return self._session.exec(count_query).one()
+
+    def _estimate_rows(self, query: Any) -> int | None:
+        """플래너 행 수 추정치 (PostgreSQL 통계 기반, 그 외 DB는 None)"""
+        dialect = self._session.get_bind().dialect
+        if dialect.name != "postgresql":
+            return None
+        compiled = query.compile(dialect=dialect)
+        plan = (
+            self._session.connection()
+            .exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}", compiled.params)
+            .scalar_one()
+        )
+        return int(plan[0]["Plan"]["Plan Rows"])
+
+    def _profile_query(
+        self,
+        profile_id: UUID,
+        translation_type: str | None,
+        mission_progress_id: UUID | None,
+    ) -> Any:
+        query = select(Translation).where(Translation.profile_id == profile_id)
+        if translation_type:
+            query = query.where(Translation.translation_type == translation_type)
+        if mission_progress_id:
+            query = query.where(Translation.mission_progress_id == mission_progress_id)
+        return query
+
     def delete(self, translation: Translation) -> None:
         """번역 기록 삭제 (commit은 Use Case에서 수행)"""
         self._session.delete(translation)
         self._session.flush()
+        self._bump_counters([translation], -1)
+        self._touch_threads([translation])
 
     def get_by_thread_id(
         self,
@@ -90,12 +328,24 @@ class TranslationRepository(ITranslationRepository):
         count_query = select(func.count()).select_from(query.subquery())
         total = self._session.exec(count_query).one()
 
-        query = query.order_by(Translation.created_at.asc())  # type: ignore[union-attr]
+        query = _keyset(query, Translation, None, descending=False)
         query = query.offset((page - 1) * limit).limit(limit)
 
         translations = list(self._session.exec(query).all())
         return translations, total
 
+    def get_by_thread_id_after(
+        self,
+        thread_id: UUID,
+        *,
+        cursor: Cursor | None,
+        limit: int,
+    ) -> list[Translation]:
+        """스레드별 번역 기록 키셋 조회 (대화 순서, cursor 다음부터)"""
+        query = select(Translation).where(Translation.thread_id == thread_id)
+        query = _keyset(query, Translation, cursor, descending=False).limit(limit)
+        return list(self._session.exec(query).all())
+
 
 # ─────────────────────────────────────────────────
 # Category Repository
@@ -149,6 +399,13 @@ class CategoryRepository(ICategoryRepository):
         )
         return self._session.exec(query).first()
 
+    def get_context_prompts(self) -> list[TranslationContextPrompt]:
+        """활성 컨텍스트 프롬프트 전체 조회 (카탈로그 적재용)"""
+        query = select(TranslationContextPrompt).where(
+            TranslationContextPrompt.is_active == True  # noqa: E712
+        )
+        return list(self._session.exec(query).all())
+
     def is_valid_category_mapping(
         self,
         primary_code: str,
@@ -178,6 +435,7 @@ class ThreadRepository(IThreadRepository):
         """스레드 생성 (commit은 Use Case에서 수행)"""
         self._session.add(thread)
         self._session.flush()
+        _bump_counter(self._session, thread.profile_id, THREADS_COUNTER, 1)
         return thread
 
     def get_by_id(self, thread_id: UUID) -> TranslationThread | None:
@@ -194,24 +452,92 @@ class ThreadRepository(IThreadRepository):
         limit: int = 20,
     ) -> tuple[list[TranslationThread], int]:
         """사용자별 스레드 목록 조회 (페이지네이션)"""
-        query = (
-            select(TranslationThread)
-            .where(TranslationThread.profile_id == profile_id)
-            .where(TranslationThread.deleted_at == None)  # noqa: E711
-        )
-
-        count_query = select(func.count()).select_from(query.subquery())
-        total = self._session.exec(count_query).one()
+        query = self._profile_query(profile_id)
+        total = self.count_by_profile_id(profile_id)
 
-        query = query.order_by(TranslationThread.created_at.desc())  # type: ignore[union-attr]
+        query = _keyset(query, TranslationThread, None, descending=True)
         query = query.offset((page - 1) * limit).limit(limit)
 
         threads = list(self._session.exec(query).all())
         return threads, total
 
+    def get_by_profile_id_after(
+        self,
+        profile_id: UUID,
+        *,
+        cursor: Cursor | None,
+        limit: int,
+    ) -> list[TranslationThread]:
+        """사용자별 스레드 목록 키셋 조회 (최신순, cursor 다음부터)"""
+        query = self._profile_query(profile_id)
+        query = _keyset(query, TranslationThread, cursor, descending=True).limit(limit)
+        return list(self._session.exec(query).all())
+
+    def count_by_profile_id(self, profile_id: UUID) -> int:
+        """사용자별 스레드 수 (삭제 제외, 카운터 없으면 COUNT)"""
+        value = _read_counter(self._session, profile_id, THREADS_COUNTER)
+        if value is not None:
+            return value
+        return self._session.exec(_counted_rows(profile_id, THREADS_COUNTER)).one()
+
+    def _profile_query(self, profile_id: UUID) -> Any:
+        return (
+            select(TranslationThread)
+            .where(TranslationThread.profile_id == profile_id)
+            .where(TranslationThread.deleted_at == None)  # noqa: E711
+        )
+
     def soft_delete(self, thread: TranslationThread) -> TranslationThread:
         """스레드 소프트 삭제 (commit은 Use Case에서 수행)"""
         thread.deleted_at = _utcnow()
         self._session.add(thread)
         self._session.flush()
+        _bump_counter(self._session, thread.profile_id, THREADS_COUNTER, -1)
         return thread
+
+
+# ─────────────────────────────────────────────────
+# Phrase Asset Repository
+# ─────────────────────────────────────────────────
+
+
+class PhraseAssetRepository(IPhraseAssetRepository):
+    """추천 문장 사전 계산 결과 Repository"""
+
+    def __init__(self, session: Session) -> None:
+        self._session = session
+
+    def get_active_phrases(self) -> list[Phrase]:
+        """활성 추천 문장 전체"""
+        query = select(Phrase).where(Phrase.is_active == True)  # noqa: E712
+        return list(self._session.exec(query).all())
+
+    def get_all(self) -> list[PhraseAsset]:
+        """사전 계산 결과 전체"""
+        return list(self._session.exec(select(PhraseAsset)).all())
+
+    def get_phrase_with_asset(
+        self, phrase_id: UUID, target_lang: str
+    ) -> tuple[Phrase, PhraseAsset | None] | None:
+        """활성 추천 문장과 대상 언어 사전 계산 결과 (LEFT JOIN 1회)"""
+        query = (
+            select(Phrase, PhraseAsset)
+            .outerjoin(
+                PhraseAsset,
+                (PhraseAsset.phrase_id == Phrase.id)  # type: ignore[arg-type]
+                & (PhraseAsset.target_lang == target_lang),
+            )
+            .where(Phrase.id == phrase_id)
+            .where(Phrase.is_active == True)  # noqa: E712
+        )
+        row = self._session.exec(query).first()
+        if row is None:
+            return None
+        phrase, asset = row
+        return phrase, asset
+
+    def save_many(self, assets: list[PhraseAsset]) -> None:
+        """사전 계산 결과 저장 (기본 키 기준 갱신, commit은 호출자)"""
+        for asset in assets:
+            self._session.merge(asset)
+        self._session.flush()
@@ -0,0 +1,113 @@
+"""번역 메모리 (Translation Memory)
+
+자주 반복되는 짧은 문장("화장실 어디예요?", "카드 돼요?")의 번역 재사용
+- 키: 정규화된 (원문, 원본 언어, 대상 언어, 1차/2차 카테고리) + 버전의 SHA-256
+- 1차: 프로세스 내 LRU (TTL)
+- 2차: translations.memory_key 인덱스 조회 (TTL 이내 기록만)
+
+무효화 정책:
+- TTL: TRANSLATION_MEMORY_TTL_S 경과 기록은 재사용하지 않음
+- 버전: 키에 VERTEX_MODEL과 TRANSLATION_MEMORY_VERSION 포함
+  → 모델 변경 또는 프롬프트 변경 시 버전만 올리면 기존 기록 전체 무효화
+"""
+
+import hashlib
+import re
+import time
+import unicodedata
+from collections import OrderedDict
+from collections.abc import Callable
+
+from src.core.config import settings
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    """메모리 키용 원문 정규화 (NFC, 공백 축약, 대소문자 무시)"""
+    text = unicodedata.normalize("NFC", text)
+    return _WHITESPACE.sub(" ", text).strip().casefold()
+
+
+def memory_key(
+    source_text: str,
+    source_lang: str,
+    target_lang: str,
+    *,
+    context_primary: str | None,
+    context_sub: str | None,
+    version: str,
+) -> str:
+    """번역 메모리 키 (SHA-256 hex)"""
+    parts = [
+        version,
+        source_lang,
+        target_lang,
+        context_primary or "",
+        context_sub or "",
+        normalize_text(source_text),
+    ]
+    return hashlib.sha256("\x1f".join(parts).encode()).hexdigest()
+
+
+class TranslationMemory:
+    """프로세스 내 번역 메모리 (LRU + TTL)"""
+
+    def __init__(
+        self,
+        max_size: int = 5000,
+        ttl_s: float = 30 * 24 * 3600,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """번역 메모리 초기화
+
+        Args:
+            max_size: 최대 항목 수 (초과 시 가장 오래 사용하지 않은 항목 제거)
+            ttl_s: 항목 유효 시간 (초)
+            clock: 시간 함수 (테스트용 주입)
+        """
+        self._max_size = max_size
+        self._ttl_s = ttl_s
+        self._clock = clock
+        self._items: OrderedDict[str, tuple[float, str]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def get(self, key: str) -> str | None:
+        """번역 조회 (만료 항목은 제거 후 None)"""
+        item = self._items.get(key)
+        if item is None:
+            return None
+        expires_at, translated_text = item
+        if expires_at <= self._clock():
+            del self._items[key]
+            return None
+        self._items.move_to_end(key)
+        return translated_text
+
+    def set(self, key: str, translated_text: str) -> None:
+        """번역 저장"""
+        self._items[key] = (self._clock() + self._ttl_s, translated_text)
+        self._items.move_to_end(key)
+        while len(self._items) > self._max_size:
+            self._items.popitem(last=False)
+
+    def clear(self) -> None:
+        """전체 삭제"""
+        self._items.clear()
+
+
+# 싱글톤 인스턴스
+_memory: TranslationMemory | None = None
+
+
+def get_translation_memory() -> TranslationMemory:
+    """TranslationMemory 싱글톤 반환"""
+    global _memory
+    if _memory is None:
+        _memory = TranslationMemory(
+            max_size=settings.TRANSLATION_MEMORY_SIZE,
+            ttl_s=settings.TRANSLATION_MEMORY_TTL_S,
+        )
+    return _memory
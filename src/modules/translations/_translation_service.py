@@ -1,26 +1,47 @@
 """translations 번역 서비스 구현
 
-Vertex AI (Gemini) 번역 API 호출
+Vertex AI (Gemini) 번역 API 비동기 호출
+- LLM 대기 중 스레드풀을 점유하지 않음 (동시 번역 수가 스레드풀 크기와 무관)
+- 묶음 번역은 한 프롬프트로 호출, 응답 파싱 실패 시 항목별 호출로 폴백
+- 스트리밍 번역은 Gemini 스트리밍 생성 조각을 그대로 전달
 Provider가 설정되지 않으면 mock 응답 반환 (개발/테스트용)
 """
 
-from src.external.google import IVertexAIProvider, get_vertex_provider
+import asyncio
+import logging
+from collections.abc import AsyncIterator
+
+from src.core.config import settings
+from src.external.google import (
+    IAsyncVertexAIProvider,
+    VertexAIResponseFormatError,
+    get_async_vertex_provider,
+)
 
 from ._interfaces import ITranslationService
 
+logger = logging.getLogger(__name__)
+
 
 class TranslationService(ITranslationService):
     """Vertex AI 기반 번역 서비스 구현"""
 
-    def __init__(self, provider: IVertexAIProvider | None = None) -> None:
+    def __init__(self, provider: IAsyncVertexAIProvider | None = None) -> None:
         """번역 서비스 초기화
 
         Args:
             provider: 번역 Provider (None이면 자동 생성)
         """
-        self._provider = provider if provider is not None else get_vertex_provider()
+        self._provider = (
+            provider if provider is not None else get_async_vertex_provider()
+        )
 
-    def translate(
+    @property
+    def model_version(self) -> str:
+        """Gemini 모델 이름 (Provider 없으면 mock)"""
+        return settings.VERTEX_MODEL if self._provider else "mock"
+
+    async def translate(
         self,
         text: str,
         source_lang: str,
@@ -39,13 +60,73 @@ class TranslationService(ITranslationService):
             번역된 텍스트
         """
         if self._provider:
-            return self._provider.translate(
+            return await self._provider.translate(
                 text, source_lang, target_lang, context
             )
 
         # Fallback: Mock 응답 (개발/테스트용)
         return self._mock_translate(source_lang, target_lang, text)
 
+    async def translate_stream(
+        self,
+        text: str,
+        source_lang: str,
+        target_lang: str,
+        context: str | None = None,
+    ) -> AsyncIterator[str]:
+        """텍스트 번역 스트리밍 (Provider 없으면 mock 번역 한 조각)
+
+        Args:
+            text: 번역할 텍스트
+            source_lang: 원본 언어 코드
+            target_lang: 대상 언어 코드
+            context: 번역 컨텍스트 (상황 설명, 선택)
+
+        Yields:
+            생성되는 순서대로의 번역 텍스트 조각
+        """
+        if self._provider:
+            async for delta in self._provider.translate_stream(
+                text, source_lang, target_lang, context
+            ):
+                yield delta
+            return
+
+        yield self._mock_translate(source_lang, target_lang, text)
+
+    async def translate_batch(
+        self,
+        texts: list[str],
+        source_lang: str,
+        target_lang: str,
+        context: str | None = None,
+    ) -> list[str]:
+        """여러 텍스트 묶음 번역 (단일 프롬프트, 파싱 실패 시 항목별 폴백)
+
+        Args:
+            texts: 번역할 텍스트 목록 (같은 언어쌍/컨텍스트)
+            source_lang: 원본 언어 코드
+            target_lang: 대상 언어 코드
+            context: 번역 컨텍스트 (상황 설명, 선택)
+
+        Returns:
+            texts와 같은 순서의 번역된 텍스트 목록
+        """
+        if self._provider and len(texts) > 1:
+            try:
+                return await self._provider.translate_batch(
+                    texts, source_lang, target_lang, context
+                )
+            except VertexAIResponseFormatError:
+                logger.warning(
+                    "묶음 번역 응답 파싱 실패, 항목별 번역으로 전환: %d건", len(texts)
+                )
+
+        translations = await asyncio.gather(
+            *(self.translate(text, source_lang, target_lang, context) for text in texts)
+        )
+        return list(translations)
+
     def _mock_translate(self, source_lang: str, target_lang: str, text: str) -> str:
         """Mock 번역 (Provider 없을 때)"""
         src = source_lang.split("-")[0].lower() if source_lang else ""
@@ -8,28 +8,51 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import threading
+from collections.abc import AsyncIterator
 from dataclasses import dataclass
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING
 from uuid import UUID, uuid4
 
 from sqlmodel import Session
 
+from src.core.config import settings
+from src.core.metrics import get_metrics
+
+from ._category_catalog import get_category_catalog
+from ._cursor import decode_cursor, encode_cursor, paginate
 from ._exceptions import (
     InvalidCategoryError,
+    PhraseNotFoundError,
+    SpeechNotRecognizedError,
     ThreadAccessDeniedError,
     ThreadNotFoundError,
 )
 from ._models import TranslationThread
+from ._phrase_index import HIT_METRIC, MISS_METRIC, get_phrase_index
+from ._translation_memory import memory_key
 
 if TYPE_CHECKING:
+    from src.core.enums import TranslationType
+    from src.external.google import IAsyncSpeechProvider
+
+    from ._audio_cache import AudioCache
+    from ._category_catalog import CategoryCatalogCache
     from ._interfaces import (
         ICategoryRepository,
         IContextService,
+        IPhraseAssetRepository,
         IThreadRepository,
         ITranslationRepository,
         ITranslationService,
     )
+    from ._models import Translation
+    from ._phrase_index import PhraseIndexCache
+    from ._translation_memory import TranslationMemory
+    from ._voice_pipeline import VoiceEvent
 
 
 def _utcnow() -> datetime:
@@ -82,6 +105,26 @@ class TranslationResult:
     confidence_score: float | None
     created_at: datetime
 
+    @classmethod
+    def from_entity(cls, translation: Translation) -> TranslationResult:
+        return cls(
+            id=translation.id,
+            profile_id=translation.profile_id,
+            source_text=translation.source_text,
+            translated_text=translation.translated_text,
+            source_lang=translation.source_lang,
+            target_lang=translation.target_lang,
+            translation_type=translation.translation_type,
+            mission_progress_id=translation.mission_progress_id,
+            thread_id=translation.thread_id,
+            context_primary=translation.context_primary,
+            context_sub=translation.context_sub,
+            audio_url=translation.audio_url,
+            duration_ms=translation.duration_ms,
+            confidence_score=translation.confidence_score,
+            created_at=translation.created_at,
+        )
+
 
 @dataclass
 class ThreadDetailResult:
@@ -93,16 +136,22 @@ class ThreadDetailResult:
     sub_category: str
     created_at: datetime
     translations: list[TranslationResult]
+    next_cursor: str | None = None
+    latest_cursor: str | None = None
+    etag: str = ""
+    not_modified: bool = False
 
 
 @dataclass
 class ThreadListResult:
-    """스레드 목록 결과 DTO"""
+    """스레드 목록 결과 DTO (커서 모드는 page 없음, total은 요청 시에만)"""
 
     items: list[ThreadResult]
-    total: int
-    page: int
+    total: int | None
+    page: int | None
     limit: int
+    next_cursor: str | None = None
+    has_more: bool = False
 
 
 @dataclass
@@ -136,10 +185,14 @@ class CreateThreadUseCase:
         session: Session,
         category_repository: ICategoryRepository,
         thread_repository: IThreadRepository,
+        category_catalog: CategoryCatalogCache | None = None,
     ) -> None:
         self._session = session
         self._category_repository = category_repository
         self._thread_repository = thread_repository
+        self._category_catalog = (
+            category_catalog if category_catalog is not None else get_category_catalog()
+        )
 
     def execute(
         self,
@@ -148,19 +201,20 @@ class CreateThreadUseCase:
         sub_category: str,
     ) -> ThreadResult:
         """스레드 생성 실행"""
-        # 비즈니스 규칙: 카테고리 조합 유효성 검증
-        if not self._category_repository.is_valid_category_mapping(
-            primary_category, sub_category
-        ):
+        # 비즈니스 규칙: 카테고리 조합 유효성 검증 (카탈로그, DB 조회 없음)
+        catalog = self._category_catalog.get(self._category_repository)
+        if not catalog.is_valid_pair(primary_category, sub_category):
             raise InvalidCategoryError()
 
         # Entity 생성
+        now = _utcnow()
         thread = TranslationThread(
             id=uuid4(),
             profile_id=profile_id,
             primary_category=primary_category,
             sub_category=sub_category,
-            created_at=_utcnow(),
+            created_at=now,
+            updated_at=now,
         )
 
         # 저장 및 커밋
@@ -170,8 +224,29 @@ class CreateThreadUseCase:
         return ThreadResult.from_entity(thread)
 
 
+def _thread_etag(thread: TranslationThread, cursor: str | None, limit: int) -> str:
+    """스레드 상세 응답 ETag (스레드 변경 시각 + 조회 범위)
+
+    번역 기록 추가/삭제 시 updated_at이 갱신되므로 스레드 한 행만으로 변경 판단
+    """
+    version = thread.updated_at or thread.created_at
+    raw = f"{thread.id.hex}:{version.isoformat()}:{cursor or ''}:{limit}"
+    return f'W/"{hashlib.sha256(raw.encode()).hexdigest()[:32]}"'
+
+
+def _etag_matches(etag: str, if_none_match: str | None) -> bool:
+    if not if_none_match:
+        return False
+    tags = {tag.strip() for tag in if_none_match.split(",")}
+    return "*" in tags or etag in tags
+
+
 class GetThreadUseCase:
-    """스레드 상세 조회 Use Case"""
+    """스레드 상세 조회 Use Case
+
+    폴링: since(마지막으로 본 번역의 커서) 이후 번역만 조회
+    If-None-Match가 현재 ETag와 같으면 번역 기록 조회 없이 not_modified
+    """
 
     def __init__(
         self,
@@ -185,8 +260,18 @@ class GetThreadUseCase:
         self,
         thread_id: UUID,
         profile_id: UUID,
+        cursor: str | None = None,
+        limit: int = 50,
+        if_none_match: str | None = None,
     ) -> ThreadDetailResult:
-        """스레드 상세 조회 실행"""
+        """스레드 상세 조회 실행 (번역 기록은 대화 순서 키셋 페이지)
+
+        Args:
+            cursor: 이 커서 다음 번역부터 조회 (페이지 이동/since 폴링 공통)
+            if_none_match: 이전 응답의 ETag
+        """
+        after = decode_cursor(cursor) if cursor else None
+
         thread = self._thread_repository.get_by_id(thread_id)
 
         if thread is None:
@@ -195,28 +280,31 @@ class GetThreadUseCase:
         if thread.profile_id != profile_id:
             raise ThreadAccessDeniedError()
 
-        translations, _ = self._translation_repository.get_by_thread_id(thread_id)
-
-        translation_results = [
-            TranslationResult(
-                id=t.id,
-                profile_id=t.profile_id,
-                source_text=t.source_text,
-                translated_text=t.translated_text,
-                source_lang=t.source_lang,
-                target_lang=t.target_lang,
-                translation_type=t.translation_type,
-                mission_progress_id=t.mission_progress_id,
-                thread_id=t.thread_id,
-                context_primary=t.context_primary,
-                context_sub=t.context_sub,
-                audio_url=t.audio_url,
-                duration_ms=t.duration_ms,
-                confidence_score=t.confidence_score,
-                created_at=t.created_at,
+        etag = _thread_etag(thread, cursor, limit)
+        if _etag_matches(etag, if_none_match):
+            return ThreadDetailResult(
+                id=thread.id,
+                profile_id=thread.profile_id,
+                primary_category=thread.primary_category,
+                sub_category=thread.sub_category,
+                created_at=thread.created_at,
+                translations=[],
+                latest_cursor=cursor,
+                etag=etag,
+                not_modified=True,
             )
-            for t in translations
-        ]
+
+        rows = self._translation_repository.get_by_thread_id_after(
+            thread_id, cursor=after, limit=limit + 1
+        )
+        translations, next_cursor = paginate(rows, limit)
+        latest_cursor = (
+            encode_cursor(translations[-1].created_at, translations[-1].id)
+            if translations
+            else cursor
+        )
+
+        translation_results = [TranslationResult.from_entity(t) for t in translations]
 
         return ThreadDetailResult(
             id=thread.id,
@@ -225,6 +313,9 @@ class GetThreadUseCase:
             sub_category=thread.sub_category,
             created_at=thread.created_at,
             translations=translation_results,
+            next_cursor=next_cursor,
+            latest_cursor=latest_cursor,
+            etag=etag,
         )
 
 
@@ -239,19 +330,51 @@ class ListThreadsUseCase:
         profile_id: UUID,
         page: int = 1,
         limit: int = 20,
+        cursor: str | None = None,
+        include_total: bool = False,
     ) -> ThreadListResult:
-        """스레드 목록 조회 실행"""
+        """스레드 목록 조회 실행
+
+        cursor가 있으면 키셋 모드 (OFFSET/COUNT 없음, include_total 시에만 COUNT)
+        없으면 페이지 모드 (호환)
+        """
+        if cursor:
+            rows = self._thread_repository.get_by_profile_id_after(
+                profile_id, cursor=decode_cursor(cursor), limit=limit + 1
+            )
+            threads, next_cursor = paginate(rows, limit)
+            return ThreadListResult(
+                items=[ThreadResult.from_entity(t) for t in threads],
+                total=(
+                    self._thread_repository.count_by_profile_id(profile_id)
+                    if include_total
+                    else None
+                ),
+                page=None,
+                limit=limit,
+                next_cursor=next_cursor,
+                has_more=next_cursor is not None,
+            )
+
         threads, total = self._thread_repository.get_by_profile_id(
             profile_id, page, limit
         )
 
         items = [ThreadResult.from_entity(t) for t in threads]
+        has_more = page * limit < total
 
         return ThreadListResult(
             items=items,
             total=total,
             page=page,
             limit=limit,
+            # 페이지 모드에서 커서 모드로 전환할 수 있도록 다음 커서 제공
+            next_cursor=(
+                encode_cursor(threads[-1].created_at, threads[-1].id)
+                if has_more and threads
+                else None
+            ),
+            has_more=has_more,
         )
 
 
@@ -323,6 +446,70 @@ class GetCategoriesUseCase:
         )
 
 
+# ─────────────────────────────────────────────────
+# Phrase Use Cases
+# ─────────────────────────────────────────────────
+
+
+@dataclass
+class PhraseTranslationResult:
+    """추천 문장 번역 결과 (사전 계산 조회)"""
+
+    phrase_id: UUID
+    source_lang: str
+    target_lang: str
+    source_text: str
+    translated_text: str
+    audio_url: str | None
+    is_warm: bool  # 현재 문장 기준 사전 계산 결과 존재 여부
+
+
+class GetPhraseTranslationUseCase:
+    """추천 문장 번역 조회 Use Case (LLM/TTS 호출 없음)
+
+    번역문은 문장 행에서, 음성 URL은 워밍업 작업이 저장한 결과에서 조회
+    사전 계산이 없거나 문장이 바뀐 뒤라면 음성 URL 없이 반환 (is_warm=False)
+    """
+
+    def __init__(self, phrase_asset_repository: IPhraseAssetRepository) -> None:
+        self._phrase_asset_repository = phrase_asset_repository
+
+    def execute(self, phrase_id: UUID, target_lang: str) -> PhraseTranslationResult:
+        """추천 문장 번역 조회 실행
+
+        Raises:
+            PhraseNotFoundError: 없거나 비활성 문장
+        """
+        from ._phrase_warmup import phrase_hash, phrase_texts
+
+        row = self._phrase_asset_repository.get_phrase_with_asset(
+            phrase_id, target_lang
+        )
+        if row is None:
+            raise PhraseNotFoundError()
+        phrase, asset = row
+
+        source_text, translated_text = phrase_texts(phrase, target_lang)
+        is_warm = asset is not None and asset.source_hash == phrase_hash(phrase)
+        audio_url = None
+        if is_warm and asset.audio_url_expires_at is not None:
+            expires_at = asset.audio_url_expires_at
+            if expires_at.tzinfo is None:
+                expires_at = expires_at.replace(tzinfo=UTC)
+            if expires_at > _utcnow():
+                audio_url = asset.audio_url
+
+        return PhraseTranslationResult(
+            phrase_id=phrase.id,
+            source_lang="ko" if target_lang == "en" else "en",
+            target_lang=target_lang,
+            source_text=source_text,
+            translated_text=translated_text,
+            audio_url=audio_url,
+            is_warm=is_warm,
+        )
+
+
 # ─────────────────────────────────────────────────
 # Translation Use Cases
 # ─────────────────────────────────────────────────
@@ -342,8 +529,8 @@ class TextTranslationInput:
     context_sub: str | None = None
 
 
-class CreateTextTranslationUseCase:
-    """텍스트 번역 Use Case (Vertex AI Gemini)"""
+class _TextTranslationUseCaseBase:
+    """텍스트 번역 Use Case 공통 (추천 문장 사전, 번역 메모리, 컨텍스트)"""
 
     def __init__(
         self,
@@ -351,6 +538,10 @@ class CreateTextTranslationUseCase:
         translation_repository: ITranslationRepository,
         translation_service: ITranslationService,
         context_service: IContextService,
+        translation_memory: TranslationMemory | None = None,
+        *,
+        phrase_repository: IPhraseAssetRepository | None = None,
+        phrase_index: PhraseIndexCache | None = None,
     ) -> None:
         """Use Case 초기화
 
@@ -359,69 +550,504 @@ class CreateTextTranslationUseCase:
             translation_repository: 번역 기록 Repository (DIP)
             translation_service: 번역 서비스 (DIP)
             context_service: 컨텍스트 서비스 (DIP)
+            translation_memory: 번역 메모리 (None이면 메모리 미사용)
+            phrase_repository: 추천 문장 Repository (None이면 사전 미사용)
+            phrase_index: 추천 문장 색인 (None이면 프로세스 공용 색인)
         """
         self._session = session
         self._translation_repository = translation_repository
         self._translation_service = translation_service
         self._context_service = context_service
+        self._translation_memory = translation_memory
+        self._phrase_repository = phrase_repository
+        self._phrase_index = (
+            phrase_index if phrase_index is not None else get_phrase_index()
+        )
 
-    def execute(self, input_data: TextTranslationInput) -> TranslationResult:
-        """텍스트 번역 실행"""
-        from src.core.enums import TranslationType
+    def _memory_key(self, input_data: TextTranslationInput) -> str | None:
+        """번역 메모리 키 (메모리 미사용 또는 긴 원문이면 None)"""
+        if (
+            self._translation_memory is None
+            or not settings.TRANSLATION_MEMORY_ENABLED
+            or len(input_data.source_text) > settings.TRANSLATION_MEMORY_MAX_CHARS
+        ):
+            return None
+        version = (
+            f"{self._translation_service.model_version}"
+            f":{settings.TRANSLATION_MEMORY_VERSION}"
+        )
+        return memory_key(
+            input_data.source_text,
+            input_data.source_lang,
+            input_data.target_lang,
+            context_primary=input_data.context_primary,
+            context_sub=input_data.context_sub,
+            version=version,
+        )
 
-        from ._models import Translation
+    async def _recall(self, key: str) -> str | None:
+        """번역 메모리 조회 (LRU → DB, DB 적중 시 LRU 적재, DB 조회는 스레드풀)"""
+        assert self._translation_memory is not None
+        translated_text = self._translation_memory.get(key)
+        if translated_text is not None:
+            return translated_text
 
-        # 컨텍스트 빌드 (카테고리가 있으면)
-        context = None
-        if input_data.context_primary and input_data.context_sub:
-            context = self._context_service.build_translation_context(
-                input_data.context_primary,
-                input_data.context_sub,
-                input_data.target_lang,
-            )
+        since = _utcnow() - timedelta(seconds=settings.TRANSLATION_MEMORY_TTL_S)
+        translated_text = await asyncio.to_thread(
+            self._translation_repository.find_by_memory_key, key, since
+        )
+        if translated_text is not None:
+            self._translation_memory.set(key, translated_text)
+        return translated_text
+
+    async def _lookup_phrase(self, input_data: TextTranslationInput) -> str | None:
+        """추천 문장과 정확히 일치하면 문장 행의 번역문 (사전 적중/미적중 기록)"""
+        if (
+            self._phrase_repository is None
+            or not settings.TRANSLATION_PHRASE_INDEX_ENABLED
+        ):
+            return None
+        index = await self._phrase_index.get_async(self._phrase_repository)
+        translated_text = index.lookup(
+            input_data.source_text, input_data.source_lang, input_data.target_lang
+        )
+        get_metrics().increment(MISS_METRIC if translated_text is None else HIT_METRIC)
+        return translated_text
+
+    async def _context(self, input_data: TextTranslationInput) -> str | None:
+        """카테고리 컨텍스트 빌드 (1차/2차 모두 있을 때만)"""
+        if not (input_data.context_primary and input_data.context_sub):
+            return None
+        return await self._context_service.build_translation_context(
+            input_data.context_primary,
+            input_data.context_sub,
+            input_data.target_lang,
+        )
+
+    async def _translate(self, input_data: TextTranslationInput) -> str:
+        """컨텍스트 빌드 후 번역 서비스 호출"""
+        context = await self._context(input_data)
 
-        # 번역 수행
-        translated_text = self._translation_service.translate(
+        return await self._translation_service.translate(
             input_data.source_text,
             input_data.source_lang,
             input_data.target_lang,
             context,
         )
 
-        # Entity 생성
-        translation = Translation(
+    async def _translated_text(
+        self, input_data: TextTranslationInput
+    ) -> tuple[str, str | None]:
+        """추천 문장 사전 → 번역 메모리 조회 후 미적중 시 번역 (번역문, 메모리 키)"""
+        key = self._memory_key(input_data)
+        translated_text = await self._lookup_phrase(input_data)
+        if translated_text is None and key:
+            translated_text = await self._recall(key)
+        if translated_text is None:
+            translated_text = await self._translate(input_data)
+            if key and self._translation_memory is not None:
+                self._translation_memory.set(key, translated_text)
+        return translated_text, key
+
+    def _entity(
+        self,
+        input_data: TextTranslationInput,
+        translated_text: str,
+        key: str | None,
+        translation_type: TranslationType | None = None,
+        **fields: object,
+    ) -> Translation:
+        """번역 기록 Entity 생성 (저장 전, fields는 음성 메타데이터 등 추가 컬럼)"""
+        from src.core.enums import TranslationType
+
+        from ._models import Translation
+
+        fields.setdefault("created_at", _utcnow())
+        return Translation(
             id=uuid4(),
             profile_id=input_data.profile_id,
             source_text=input_data.source_text,
             translated_text=translated_text,
             source_lang=input_data.source_lang,
             target_lang=input_data.target_lang,
-            translation_type=TranslationType.TEXT.value,
+            translation_type=(translation_type or TranslationType.TEXT).value,
             mission_progress_id=input_data.mission_progress_id,
             thread_id=input_data.thread_id,
             context_primary=input_data.context_primary,
             context_sub=input_data.context_sub,
-            created_at=_utcnow(),
+            memory_key=key,
+            **fields,
         )
 
-        # 저장 및 커밋
-        translation = self._translation_repository.create(translation)
+    async def _save(
+        self,
+        input_data: TextTranslationInput,
+        translated_text: str,
+        key: str | None,
+        translation_type: TranslationType | None = None,
+        **fields: object,
+    ) -> TranslationResult:
+        """번역 기록 저장 및 커밋 (동기 세션 작업은 스레드풀에서 실행)"""
+        translation = self._entity(
+            input_data, translated_text, key, translation_type, **fields
+        )
+        [result] = await asyncio.to_thread(self._persist, [translation])
+        return result
+
+    def _persist(self, translations: list[Translation]) -> list[TranslationResult]:
+        """번역 기록 INSERT 및 커밋 (커밋 후 만료된 속성도 같은 스레드에서 읽음)"""
+        self._translation_repository.create_many(translations)
         self._session.commit()
+        return [TranslationResult.from_entity(t) for t in translations]
 
-        return TranslationResult(
-            id=translation.id,
-            profile_id=translation.profile_id,
-            source_text=translation.source_text,
-            translated_text=translation.translated_text,
-            source_lang=translation.source_lang,
-            target_lang=translation.target_lang,
-            translation_type=translation.translation_type,
-            mission_progress_id=translation.mission_progress_id,
-            thread_id=translation.thread_id,
-            context_primary=translation.context_primary,
-            context_sub=translation.context_sub,
-            audio_url=translation.audio_url,
-            duration_ms=translation.duration_ms,
-            confidence_score=translation.confidence_score,
-            created_at=translation.created_at,
+
+class CreateTextTranslationUseCase(_TextTranslationUseCaseBase):
+    """텍스트 번역 Use Case (Vertex AI Gemini)"""
+
+    async def execute(self, input_data: TextTranslationInput) -> TranslationResult:
+        """텍스트 번역 실행 (비동기)
+
+        추천 문장 사전/번역 메모리 적중 시 컨텍스트 빌드와 Vertex AI 호출을 모두 생략
+        """
+        translated_text, key = await self._translated_text(input_data)
+
+        return await self._save(input_data, translated_text, key)
+
+
+class ThreadConversationUseCase(CreateTextTranslationUseCase):
+    """스레드 대화 Use Case (WebSocket 연결 하나에 하나)
+
+    - 연결 시 스레드/소유권을 한 번 확인하고 카테고리 컨텍스트는 언어별로 한 번만 빌드
+    - 번역 기록은 즉시 저장하지 않고 모아 두었다가 flush()에서 다중 행 INSERT
+    """
+
+    def __init__(
+        self,
+        session: Session,
+        *,
+        thread_repository: IThreadRepository,
+        translation_repository: ITranslationRepository,
+        translation_service: ITranslationService,
+        context_service: IContextService,
+        translation_memory: TranslationMemory | None = None,
+        phrase_repository: IPhraseAssetRepository | None = None,
+    ) -> None:
+        super().__init__(
+            session=session,
+            translation_repository=translation_repository,
+            translation_service=translation_service,
+            context_service=context_service,
+            translation_memory=translation_memory,
+            phrase_repository=phrase_repository,
+        )
+        self._thread_repository = thread_repository
+        self._thread: TranslationThread | None = None
+        self._contexts: dict[str, str | None] = {}
+        self._pending: list[Translation] = []
+        # 스레드풀 flush()와 연결 종료 시 flush()가 세션을 동시에 쓰지 않도록
+        self._flush_lock = threading.Lock()
+
+    @property
+    def pending(self) -> int:
+        """저장 대기 중인 번역 기록 수"""
+        return len(self._pending)
+
+    def open(self, thread_id: UUID, profile_id: UUID) -> ThreadResult:
+        """대화 시작 (스레드 존재/소유권 확인)"""
+        thread = self._thread_repository.get_by_id(thread_id)
+
+        if thread is None:
+            raise ThreadNotFoundError()
+
+        if thread.profile_id != profile_id:
+            raise ThreadAccessDeniedError()
+
+        self._thread = thread
+        return ThreadResult.from_entity(thread)
+
+    def message(
+        self, source_text: str, source_lang: str, target_lang: str
+    ) -> TextTranslationInput:
+        """대화 메시지 → 스레드 컨텍스트가 적용된 번역 입력"""
+        assert self._thread is not None
+        return TextTranslationInput(
+            profile_id=self._thread.profile_id,
+            source_text=source_text,
+            source_lang=source_lang,
+            target_lang=target_lang,
+            thread_id=self._thread.id,
+            context_primary=self._thread.primary_category,
+            context_sub=self._thread.sub_category,
         )
+
+    async def _context(self, input_data: TextTranslationInput) -> str | None:
+        """카테고리 컨텍스트 (대상 언어별로 한 번만 빌드)"""
+        if input_data.target_lang not in self._contexts:
+            self._contexts[input_data.target_lang] = await super()._context(input_data)
+        return self._contexts[input_data.target_lang]
+
+    async def _save(
+        self,
+        input_data: TextTranslationInput,
+        translated_text: str,
+        key: str | None,
+        translation_type: TranslationType | None = None,
+        **fields: object,
+    ) -> TranslationResult:
+        """번역 기록 저장 대기열에 추가 (flush()에서 일괄 저장)"""
+        translation = self._entity(
+            input_data, translated_text, key, translation_type, **fields
+        )
+        self._pending.append(translation)
+        return TranslationResult.from_entity(translation)
+
+    def flush(self) -> int:
+        """대기 중인 번역 기록 일괄 저장 및 커밋
+
+        INSERT는 SAVEPOINT 안에서 실행 → 실패 시 그 부분만 롤백
+        실패한 기록은 대기열 앞에 되돌려 다음 flush()에서 재시도
+        동시에 호출되면 앞선 flush()가 끝날 때까지 대기 (스레드풀 호출 대비)
+
+        Returns:
+            저장한 번역 기록 수
+
+        Raises:
+            SQLAlchemyError: 저장/커밋 실패 (기록은 대기열에 유지)
+        """
+        with self._flush_lock:
+            if not self._pending:
+                return 0
+            translations, self._pending = self._pending, []
+            try:
+                with self._session.begin_nested():
+                    self._translation_repository.create_many(translations)
+                try:
+                    self._session.commit()
+                except Exception:
+                    self._session.rollback()
+                    raise
+            except Exception:
+                self._pending = translations + self._pending
+                raise
+            return len(translations)
+
+
+@dataclass
+class VoiceTranslationInput:
+    """음성 번역 입력 DTO (원문은 음성 인식 결과)"""
+
+    profile_id: UUID
+    source_lang: str
+    target_lang: str
+    mission_progress_id: UUID | None = None
+    thread_id: UUID | None = None
+    context_primary: str | None = None
+    context_sub: str | None = None
+
+    def text(self, source_text: str) -> TextTranslationInput:
+        """인식된 구간 → 텍스트 번역 입력"""
+        return TextTranslationInput(
+            profile_id=self.profile_id,
+            source_text=source_text,
+            source_lang=self.source_lang,
+            target_lang=self.target_lang,
+            mission_progress_id=self.mission_progress_id,
+            thread_id=self.thread_id,
+            context_primary=self.context_primary,
+            context_sub=self.context_sub,
+        )
+
+
+class CreateVoiceTranslationUseCase(_TextTranslationUseCaseBase):
+    """음성 번역 Use Case (STT → 번역 → TTS 파이프라인)
+
+    - 확정 구간마다 번역 (번역 메모리/카테고리 컨텍스트는 텍스트 번역과 동일)
+    - 파이프라인 이벤트를 발생 순서대로 전달하고, 끝나면 전체 발화를 한 건으로 저장
+    """
+
+    def __init__(
+        self,
+        session: Session,
+        *,
+        translation_repository: ITranslationRepository,
+        translation_service: ITranslationService,
+        context_service: IContextService,
+        speech_provider: IAsyncSpeechProvider,
+        audio_cache: AudioCache,
+        translation_memory: TranslationMemory | None = None,
+    ) -> None:
+        super().__init__(
+            session=session,
+            translation_repository=translation_repository,
+            translation_service=translation_service,
+            context_service=context_service,
+            translation_memory=translation_memory,
+        )
+        self._speech_provider = speech_provider
+        self._audio_cache = audio_cache
+
+    async def execute(
+        self,
+        input_data: VoiceTranslationInput,
+        audio_chunks: AsyncIterator[bytes],
+        content_type: str | None = None,
+        started: float | None = None,
+    ) -> AsyncIterator[VoiceEvent | TranslationResult]:
+        """음성 번역 실행
+
+        파이프라인 이벤트(인식/번역/오디오)를 전달한 뒤 마지막 항목으로
+        저장된 TranslationResult 전달
+
+        Raises:
+            SpeechNotRecognizedError: 인식된 음성이 없음
+        """
+        from src.core.enums import TranslationType
+
+        from ._voice_pipeline import VoicePipeline
+
+        async def translate(segment: str) -> str:
+            translated_text, _ = await self._translated_text(input_data.text(segment))
+            return translated_text
+
+        pipeline = VoicePipeline(
+            speech_provider=self._speech_provider,
+            audio_cache=self._audio_cache,
+            translate=translate,
+            source_lang=input_data.source_lang,
+            target_lang=input_data.target_lang,
+        )
+        async for event in pipeline.run(audio_chunks, content_type, started):
+            yield event
+
+        result = pipeline.result
+        if not result.source_texts:
+            raise SpeechNotRecognizedError()
+
+        yield await self._save(
+            input_data.text(result.source_text),
+            result.translated_text,
+            None,
+            translation_type=TranslationType.VOICE,
+            duration_ms=result.end_offset_ms,
+            confidence_score=result.confidence,
+            audio_url=result.audio_url,
+        )
+
+
+class StreamTextTranslationUseCase(_TextTranslationUseCaseBase):
+    """텍스트 번역 스트리밍 Use Case (Gemini 스트리밍 생성)"""
+
+    async def execute(
+        self, input_data: TextTranslationInput
+    ) -> AsyncIterator[str | TranslationResult]:
+        """텍스트 번역 스트리밍 실행
+
+        번역 조각(str)을 생성되는 대로 전달하고, 스트림이 끝나면 기록을 저장한 뒤
+        마지막 항목으로 TranslationResult 전달
+        번역 메모리 적중 시 전체 번역문을 한 조각으로 전달
+        """
+        key = self._memory_key(input_data)
+        translated_text = await self._recall(key) if key else None
+        if translated_text is not None:
+            yield translated_text
+        else:
+            context = await self._context(input_data)
+            chunks: list[str] = []
+            async for delta in self._translation_service.translate_stream(
+                input_data.source_text,
+                input_data.source_lang,
+                input_data.target_lang,
+                context,
+            ):
+                chunks.append(delta)
+                yield delta
+            translated_text = "".join(chunks).strip()
+            if key and self._translation_memory is not None:
+                self._translation_memory.set(key, translated_text)
+
+        yield await self._save(input_data, translated_text, key)
+
+
+@dataclass
+class BatchTextTranslationInput:
+    """묶음 텍스트 번역 입력 DTO (같은 언어쌍/컨텍스트)"""
+
+    profile_id: UUID
+    source_texts: list[str]
+    source_lang: str
+    target_lang: str
+    mission_progress_id: UUID | None = None
+    thread_id: UUID | None = None
+    context_primary: str | None = None
+    context_sub: str | None = None
+
+    def items(self) -> list[TextTranslationInput]:
+        """항목별 텍스트 번역 입력으로 분해"""
+        return [
+            TextTranslationInput(
+                profile_id=self.profile_id,
+                source_text=source_text,
+                source_lang=self.source_lang,
+                target_lang=self.target_lang,
+                mission_progress_id=self.mission_progress_id,
+                thread_id=self.thread_id,
+                context_primary=self.context_primary,
+                context_sub=self.context_sub,
+            )
+            for source_text in self.source_texts
+        ]
+
+
+class CreateBatchTextTranslationUseCase(_TextTranslationUseCaseBase):
+    """묶음 텍스트 번역 Use Case (메뉴판/안내문 등 여러 문장)
+
+    - 번역 메모리 적중 항목은 제외, 같은 문장은 한 번만 번역
+    - 나머지는 한 번의 프롬프트로 묶어 번역 (파싱 실패 시 서비스가 항목별 폴백)
+    - 전체 기록을 한 번의 flush로 저장
+    """
+
+    async def execute(
+        self, input_data: BatchTextTranslationInput
+    ) -> list[TranslationResult]:
+        """묶음 텍스트 번역 실행 (비동기)"""
+        items = input_data.items()
+        keys = [self._memory_key(item) for item in items]
+        translated: dict[str, str] = {}
+        pending: dict[str, str] = {}  # 중복 제거 키 → 원문
+        for item, key in zip(items, keys, strict=True):
+            dedup_key = key or item.source_text
+            if dedup_key in translated or dedup_key in pending:
+                continue
+            recalled = await self._recall(key) if key else None
+            if recalled is not None:
+                translated[dedup_key] = recalled
+            else:
+                pending[dedup_key] = item.source_text
+
+        if pending:
+            context = await self._context(items[0])
+            results = await self._translation_service.translate_batch(
+                list(pending.values()),
+                input_data.source_lang,
+                input_data.target_lang,
+                context,
+            )
+            for dedup_key, translated_text in zip(pending, results, strict=True):
+                translated[dedup_key] = translated_text
+                if self._translation_memory is not None and dedup_key in keys:
+                    self._translation_memory.set(dedup_key, translated_text)
+
+        # Entity 생성 (같은 묶음도 요청 순서대로 created_at 1µs씩 증가 → 목록 정렬 고정)
+        now = _utcnow()
+        translations = [
+            self._entity(
+                item,
+                translated[key or item.source_text],
+                key,
+                created_at=now + timedelta(microseconds=i),
+            )
+            for i, (item, key) in enumerate(zip(items, keys, strict=True))
+        ]
+
+        # 일괄 저장 및 커밋 (스레드풀)
+        return await asyncio.to_thread(self._persist, translations)
@@ -0,0 +1,285 @@
+"""음성 번역 파이프라인 (STT → 번역 → TTS 단계 중첩)
+
+전체 발화 처리 전에 첫 번역 음성을 내보내기 위한 단계별 비동기 파이프라인
+- STT: 업로드되는 오디오 조각을 스트리밍 인식, 부분 인식 결과는 바로 전달
+- 번역: 확정 구간이 나오는 즉시 번역 (다음 구간 인식과 동시 진행)
+- TTS: 번역문을 문장 단위로 합성 (다음 구간 번역과 동시 진행, 음성 캐시 우선)
+
+단계 사이는 asyncio.Queue로 연결하고 한 단계가 실패하면 나머지 단계 취소
+단계별 지연은 translation.voice.* 히스토그램에 기록
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import re
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Coroutine
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from src.core.metrics import get_metrics
+
+if TYPE_CHECKING:
+    from src.external.google import IAsyncSpeechProvider
+
+    from ._audio_cache import AudioCache
+
+# 단계별 지연 (초)
+STT_METRIC = "translation.voice.stt"  # 시작/이전 확정 구간 → 다음 확정 구간
+TRANSLATE_METRIC = "translation.voice.translate"  # 구간 번역 호출
+TTS_METRIC = "translation.voice.tts"  # 문장 합성 (캐시 적중 포함)
+FIRST_AUDIO_METRIC = "translation.voice.first_audio"  # 요청 시작 → 첫 오디오
+
+# 문장 경계 (문장 부호 + 공백)
+_SENTENCE_END = re.compile(r"(?<=[.!?\u3002\uff1f\uff01])\s+")
+
+# 단계 종료 신호 (큐 마지막에 적재)
+_END = object()
+
+
+def split_sentences(text: str) -> list[str]:
+    """문장 단위 분리 (TTS 합성 단위)"""
+    return [s.strip() for s in _SENTENCE_END.split(text) if s.strip()]
+
+
+# ─────────────────────────────────────────────────
+# Pipeline Events
+# ─────────────────────────────────────────────────
+
+
+@dataclass(frozen=True)
+class TranscriptEvent:
+    """인식 결과 (is_final=False는 이후 바뀔 수 있는 부분 인식)"""
+
+    text: str
+    is_final: bool
+
+
+@dataclass(frozen=True)
+class SegmentEvent:
+    """확정 구간 번역"""
+
+    index: int
+    source_text: str
+    translated_text: str
+
+
+@dataclass(frozen=True)
+class AudioEvent:
+    """문장 단위 번역 음성 (MP3)"""
+
+    index: int  # 오디오 순서
+    segment_index: int  # 번역 구간
+    text: str
+    audio: bytes
+    audio_url: str | None = None  # 캐시 스토리지 서명 URL
+
+
+VoiceEvent = TranscriptEvent | SegmentEvent | AudioEvent
+
+
+@dataclass
+class VoicePipelineResult:
+    """파이프라인 종료 후 전체 발화 요약 (번역 기록 저장용)"""
+
+    source_texts: list[str] = field(default_factory=list)
+    translated_texts: list[str] = field(default_factory=list)
+    confidences: list[float] = field(default_factory=list)
+    audio_urls: list[str | None] = field(default_factory=list)
+    end_offset_ms: int | None = None
+    first_audio_s: float | None = None
+
+    @property
+    def source_text(self) -> str:
+        return " ".join(self.source_texts)
+
+    @property
+    def translated_text(self) -> str:
+        return " ".join(self.translated_texts)
+
+    @property
+    def confidence(self) -> float | None:
+        if not self.confidences:
+            return None
+        return sum(self.confidences) / len(self.confidences)
+
+    @property
+    def audio_url(self) -> str | None:
+        """번역문 전체가 한 오디오일 때의 URL (여러 문장이면 None)"""
+        if len(self.audio_urls) != 1:
+            return None
+        return self.audio_urls[0]
+
+
+# ─────────────────────────────────────────────────
+# Pipeline
+# ─────────────────────────────────────────────────
+
+
+class VoicePipeline:
+    """STT → 번역 → TTS 단계 중첩 파이프라인 (요청 하나에 하나)"""
+
+    def __init__(
+        self,
+        speech_provider: IAsyncSpeechProvider,
+        audio_cache: AudioCache,
+        translate: Callable[[str], Awaitable[str]],
+        source_lang: str,
+        target_lang: str,
+    ) -> None:
+        """파이프라인 초기화
+
+        Args:
+            speech_provider: 스트리밍 음성 인식 Provider
+            audio_cache: 음성 캐시 (미스 시 TTS 합성)
+            translate: 확정 구간 번역 함수 (컨텍스트/번역 메모리 적용)
+            source_lang: 음성 언어 코드
+            target_lang: 번역/합성 언어 코드
+        """
+        self._speech_provider = speech_provider
+        self._audio_cache = audio_cache
+        self._translate = translate
+        self._source_lang = source_lang
+        self._target_lang = target_lang
+        self.result = VoicePipelineResult()
+
+    async def run(
+        self,
+        audio_chunks: AsyncIterator[bytes],
+        content_type: str | None = None,
+        started: float | None = None,
+    ) -> AsyncIterator[VoiceEvent]:
+        """파이프라인 실행 (이벤트를 발생 순서대로 전달)
+
+        Args:
+            audio_chunks: 업로드 순서대로의 오디오 조각
+            content_type: 오디오 MIME 타입
+            started: 요청 시작 시각 (perf_counter, 첫 오디오 지연 기준)
+
+        Raises:
+            단계에서 발생한 첫 예외 (SpeechError, VertexAIError 등)
+        """
+        started = time.perf_counter() if started is None else started
+        events: asyncio.Queue = asyncio.Queue()
+        segments: asyncio.Queue = asyncio.Queue()
+        sentences: asyncio.Queue = asyncio.Queue()
+
+        runner = asyncio.create_task(
+            self._run_stages(
+                events,
+                self._recognize(audio_chunks, content_type, started, segments, events),
+                self._translate_segments(segments, sentences, events),
+                self._synthesize(sentences, started, events),
+            )
+        )
+        try:
+            while (event := await events.get()) is not _END:
+                yield event
+            try:
+                await runner
+            except ExceptionGroup as group:
+                raise group.exceptions[0] from None
+        finally:
+            # 클라이언트 연결 종료 등으로 소비가 중단되면 남은 단계 취소
+            if not runner.done():
+                runner.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await runner
+
+    @staticmethod
+    async def _run_stages(
+        events: asyncio.Queue, *stages: Coroutine[None, None, None]
+    ) -> None:
+        """단계 동시 실행 (하나가 실패하면 나머지 취소)"""
+        try:
+            async with asyncio.TaskGroup() as group:
+                for stage in stages:
+                    group.create_task(stage)
+        finally:
+            events.put_nowait(_END)
+
+    async def _recognize(
+        self,
+        audio_chunks: AsyncIterator[bytes],
+        content_type: str | None,
+        started: float,
+        segments: asyncio.Queue,
+        events: asyncio.Queue,
+    ) -> None:
+        """STT 단계: 부분 인식은 이벤트로, 확정 구간은 번역 큐로"""
+        metrics = get_metrics()
+        segment_started = started
+        try:
+            async for result in self._speech_provider.streaming_recognize(
+                audio_chunks, self._source_lang, content_type
+            ):
+                text = result.transcript.strip()
+                if not text:
+                    continue
+                await events.put(TranscriptEvent(text, result.is_final))
+                if not result.is_final:
+                    continue
+
+                now = time.perf_counter()
+                metrics.observe(STT_METRIC, now - segment_started)
+                segment_started = now
+                self.result.source_texts.append(text)
+                if result.confidence is not None:
+                    self.result.confidences.append(result.confidence)
+                if result.end_offset_ms is not None:
+                    self.result.end_offset_ms = result.end_offset_ms
+                await segments.put(text)
+        finally:
+            await segments.put(_END)
+
+    async def _translate_segments(
+        self,
+        segments: asyncio.Queue,
+        sentences: asyncio.Queue,
+        events: asyncio.Queue,
+    ) -> None:
+        """번역 단계: 확정 구간 순서대로 번역 후 문장 단위로 TTS 큐에"""
+        metrics = get_metrics()
+        index = 0
+        try:
+            while (segment := await segments.get()) is not _END:
+                translate_started = time.perf_counter()
+                translated_text = await self._translate(segment)
+                metrics.observe(
+                    TRANSLATE_METRIC, time.perf_counter() - translate_started
+                )
+
+                self.result.translated_texts.append(translated_text)
+                await events.put(SegmentEvent(index, segment, translated_text))
+                for sentence in split_sentences(translated_text):
+                    await sentences.put((index, sentence))
+                index += 1
+        finally:
+            await sentences.put(_END)
+
+    async def _synthesize(
+        self,
+        sentences: asyncio.Queue,
+        started: float,
+        events: asyncio.Queue,
+    ) -> None:
+        """TTS 단계: 문장 순서대로 합성 (첫 오디오까지의 지연 기록)"""
+        metrics = get_metrics()
+        index = 0
+        while (item := await sentences.get()) is not _END:
+            segment_index, sentence = item
+            tts_started = time.perf_counter()
+            cached = await self._audio_cache.synthesize(sentence, self._target_lang)
+            now = time.perf_counter()
+            metrics.observe(TTS_METRIC, now - tts_started)
+            if index == 0:
+                self.result.first_audio_s = now - started
+                metrics.observe(FIRST_AUDIO_METRIC, self.result.first_audio_s)
+
+            self.result.audio_urls.append(cached.url)
+            await events.put(
+                AudioEvent(index, segment_index, sentence, cached.audio, cached.url)
+            )
+            index += 1
@@ -1,6 +1,9 @@
 """GET /translations 엔드포인트
 
 번역 히스토리 조회 기능을 담당하는 Vertical Slice
+- 페이지 모드 (page): 기존 호환, 매 요청 COUNT 포함
+- 커서 모드 (cursor): (created_at, id) 키셋, include_total=true일 때만 total
+- total은 사용자별 카운터에서 조회 (미션 필터만 COUNT, approximate_total=true면 추정치)
 """
 
 from datetime import datetime
@@ -14,6 +17,7 @@ from src.core.database import get_session
 from src.core.deps import CurrentProfile
 from src.core.response import ApiResponse, Status
 
+from ._cursor import decode_cursor, encode_cursor, paginate
 from ._models import Translation
 
 router = APIRouter(tags=["translations"])
@@ -61,29 +65,69 @@ def get_translations(
     limit: int = 20,
     translation_type: str | None = None,
     mission_progress_id: str | None = None,
+    *,
+    cursor: str | None = None,
+    include_total: bool = False,
+    approximate_total: bool = False,
 ) -> tuple[list[Translation], dict]:
-    """번역 히스토리 조회"""
+    """번역 히스토리 조회
+
+    Raises:
+        InvalidCursorError: 잘못된 커서
+    """
     # Repository 인스턴스 생성 (DIP)
     from ._repository import TranslationRepository
 
     mission_id = UUID(mission_progress_id) if mission_progress_id else None
     translation_repository = TranslationRepository(session)
 
+    if cursor:
+        rows = translation_repository.get_by_profile_id_after(
+            profile_id,
+            cursor=decode_cursor(cursor),
+            limit=limit + 1,
+            translation_type=translation_type,
+            mission_progress_id=mission_id,
+        )
+        translations, next_cursor = paginate(rows, limit)
+        pagination: dict = {
+            "limit": limit,
+            "next_cursor": next_cursor,
+            "has_more": next_cursor is not None,
+        }
+        if include_total:
+            pagination["total"] = translation_repository.count_by_profile_id(
+                profile_id,
+                translation_type=translation_type,
+                mission_progress_id=mission_id,
+                approximate=approximate_total,
+            )
+        return translations, pagination
+
     translations, total = translation_repository.get_by_profile_id(
         profile_id,
         page=page,
         limit=limit,
         translation_type=translation_type,
         mission_progress_id=mission_id,
+        approximate=approximate_total,
     )
 
     total_pages = (total + limit - 1) // limit if total > 0 else 0
+    has_more = page * limit < total
 
     pagination = {
         "page": page,
         "limit": limit,
         "total": total,
         "total_pages": total_pages,
+        # 페이지 모드에서 커서 모드로 전환할 수 있도록 다음 커서 제공
+        "next_cursor": (
+            encode_cursor(translations[-1].created_at, translations[-1].id)
+            if has_more and translations
+            else None
+        ),
+        "has_more": has_more,
     }
 
     return translations, pagination
@@ -102,8 +146,16 @@ def list_translations(
     limit: int = Query(default=20, ge=1, le=100),
     type: str | None = Query(default=None, alias="type"),
     mission_progress_id: str | None = Query(default=None),
+    *,
+    cursor: str | None = Query(default=None),
+    include_total: bool = Query(default=False),
+    approximate_total: bool = Query(default=False),
 ) -> ApiResponse[TranslationListResponse]:
-    """번역 히스토리 조회"""
+    """번역 히스토리 조회
+
+    Raises:
+        InvalidCursorError: 잘못된 커서 (400)
+    """
     translations, pagination = get_translations(
         session,
         profile.id,
@@ -111,6 +163,9 @@ def list_translations(
         limit=limit,
         translation_type=type,
         mission_progress_id=mission_progress_id,
+        cursor=cursor,
+        include_total=include_total,
+        approximate_total=approximate_total,
     )
 
     items = [
@@ -0,0 +1,82 @@
+"""GET /translate/phrases/{phrase_id} 엔드포인트
+
+추천 문장 번역 조회 API (사전 계산 결과 조회만, LLM/TTS 호출 없음)
+- 번역문: 문장 행의 text_ko/text_en
+- 음성: 워밍업 작업이 미리 합성한 Storage 서명 URL
+
+사전 계산이 없거나 문장이 바뀐 뒤라면 audio_url 없이 응답하고 워밍업을 앞당김
+
+Controller는 HTTP 처리만 담당, 비즈니스 로직은 Use Case에서 처리
+"""
+
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Query
+from pydantic import BaseModel
+from sqlmodel import Session
+
+from src.core.database import get_session
+from src.core.deps import CurrentProfile
+from src.core.response import ApiResponse, Status
+
+from ._use_cases import GetPhraseTranslationUseCase
+
+router = APIRouter(tags=["translations"])
+
+
+# ─────────────────────────────────────────────────
+# Response DTO
+# ─────────────────────────────────────────────────
+
+
+class PhraseTranslationResponse(BaseModel):
+    """추천 문장 번역 응답"""
+
+    phrase_id: UUID
+    source_lang: str
+    target_lang: str
+    source_text: str
+    translated_text: str
+    audio_url: str | None = None
+
+
+# ─────────────────────────────────────────────────
+# Controller
+# ─────────────────────────────────────────────────
+
+
+@router.get(
+    "/translate/phrases/{phrase_id}",
+    response_model=ApiResponse[PhraseTranslationResponse],
+)
+def get_phrase_translation(
+    phrase_id: UUID,
+    _: CurrentProfile,  # 인증 필요
+    target_lang: str = Query(pattern=r"^(ko|en)$"),
+    session: Session = Depends(get_session),
+) -> ApiResponse[PhraseTranslationResponse]:
+    """추천 문장 번역 조회"""
+    # Repository 인스턴스 생성 (DIP)
+    from ._phrase_warmup import get_phrase_warmup_job
+    from ._repository import PhraseAssetRepository
+
+    use_case = GetPhraseTranslationUseCase(
+        phrase_asset_repository=PhraseAssetRepository(session)
+    )
+    result = use_case.execute(phrase_id, target_lang)
+
+    if not result.is_warm:
+        get_phrase_warmup_job().wake()
+
+    return ApiResponse(
+        status=Status.SUCCESS,
+        message="조회에 성공했어요",
+        data=PhraseTranslationResponse(
+            phrase_id=result.phrase_id,
+            source_lang=result.source_lang,
+            target_lang=result.target_lang,
+            source_text=result.source_text,
+            translated_text=result.translated_text,
+            audio_url=result.audio_url,
+        ),
+    )
@@ -0,0 +1,254 @@
+"""WS /translation/threads/{thread_id}/conversation 엔드포인트
+
+스레드 대화 WebSocket (대면 대화의 짧은 번역을 빠르게 주고받기)
+- 연결 시 한 번만 인증/프로필/스레드 조회, 카테고리 컨텍스트는 연결 동안 재사용
+- 클라이언트 → {"source_text", "source_lang", "target_lang", "client_id"?}
+- 서버 → {"type": "translation", "client_id", "data": TranslationResponse}
+         {"type": "error", "client_id", "status", "message"} (연결 유지)
+
+메시지는 받은 순서대로 하나씩 번역
+번역 대기 큐가 가득 차면 소켓 수신을 멈춰 클라이언트에 backpressure 전달
+번역 기록은 FLUSH_SIZE개 또는 FLUSH_INTERVAL_S 유휴마다 스레드풀에서, 연결 종료 시 동기로 일괄 저장
+- 저장 실패 시 error 메시지 (DATABASE_ERROR, 연결 유지), 기록은 다음 저장 때 재시도
+- 연결 종료 시 저장은 실패하면 바로 재시도
+"""
+
+import asyncio
+import contextlib
+import logging
+import time
+from uuid import UUID
+
+from fastapi import (
+    APIRouter,
+    Depends,
+    WebSocket,
+    WebSocketDisconnect,
+    WebSocketException,
+    status,
+)
+from pydantic import BaseModel, Field, ValidationError, model_validator
+from sqlalchemy.exc import SQLAlchemyError
+from sqlmodel import Session
+
+from src.core.config import settings
+from src.core.database import get_session
+from src.core.deps import WebSocketProfile
+from src.core.exceptions import AppError
+from src.core.metrics import get_metrics
+from src.core.response import Status
+from src.external.google import VertexAIError
+
+from ._use_cases import ThreadConversationUseCase
+from .translate_text import TranslationResponse
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(tags=["translations"])
+
+LATENCY_METRIC = "translation.conversation.latency"
+ERROR_METRIC = "translation.conversation.error"
+
+# 수신 종료 신호 (큐 마지막에 적재)
+_STOP = object()
+
+# 연결 종료 시 번역 기록 저장 시도 횟수 (대기 없이 재시도)
+_FINAL_FLUSH_ATTEMPTS = 3
+
+
+# ─────────────────────────────────────────────────
+# Message DTOs
+# ─────────────────────────────────────────────────
+
+
+class ConversationMessage(BaseModel):
+    """대화 메시지 (클라이언트 → 서버)"""
+
+    source_text: str = Field(min_length=1, max_length=1000)
+    source_lang: str = Field(pattern=r"^(ko|en)$")
+    target_lang: str = Field(pattern=r"^(ko|en)$")
+    client_id: str | None = Field(default=None, max_length=64)  # 응답 매칭용
+
+    @model_validator(mode="after")
+    def validate_different_languages(self):
+        if self.source_lang == self.target_lang:
+            msg = "같은 언어로는 번역할 수 없어요"
+            raise ValueError(msg)
+        return self
+
+
+def _error(status_: Status, message: str, client_id: str | None = None) -> dict:
+    return {
+        "type": "error",
+        "client_id": client_id,
+        "status": status_,
+        "message": message,
+    }
+
+
+# ─────────────────────────────────────────────────
+# Service (수신/번역 루프)
+# ─────────────────────────────────────────────────
+
+
+async def _receive(websocket: WebSocket, queue: asyncio.Queue) -> None:
+    """소켓 메시지 → 번역 대기 큐 (큐가 가득 차면 다음 수신 대기)"""
+    try:
+        while True:
+            raw = await websocket.receive_text()
+            try:
+                item: ConversationMessage | dict = (
+                    ConversationMessage.model_validate_json(raw)
+                )
+            except ValidationError:
+                item = _error(Status.VALIDATION_FAILED, "잘못된 메시지예요")
+            await queue.put(item)
+    except WebSocketDisconnect:
+        pass
+    finally:
+        await queue.put(_STOP)
+
+
+async def _translate(
+    websocket: WebSocket,
+    use_case: ThreadConversationUseCase,
+    message: ConversationMessage,
+) -> None:
+    """메시지 하나 번역 후 응답 (번역 실패는 error 메시지, 연결 유지)"""
+    started = time.perf_counter()
+    input_data = use_case.message(
+        message.source_text, message.source_lang, message.target_lang
+    )
+    try:
+        result = await use_case.execute(input_data)
+    except VertexAIError as e:
+        logger.warning("대화 번역 실패: %s", e.message)
+        get_metrics().increment(ERROR_METRIC)
+        await websocket.send_json(
+            _error(
+                Status.EXTERNAL_SERVICE_ERROR, "번역에 실패했어요", message.client_id
+            )
+        )
+        return
+
+    get_metrics().observe(LATENCY_METRIC, time.perf_counter() - started)
+    await websocket.send_json(
+        {
+            "type": "translation",
+            "client_id": message.client_id,
+            "data": TranslationResponse.from_result(result).model_dump(mode="json"),
+        }
+    )
+
+
+async def _flush(websocket: WebSocket, use_case: ThreadConversationUseCase) -> None:
+    """대화 중 저장 (스레드풀, 실패 시 error 메시지, 기록은 다음 저장 때 재시도)"""
+    if not use_case.pending:
+        return
+    try:
+        await asyncio.to_thread(use_case.flush)
+    except SQLAlchemyError:
+        logger.exception("대화 번역 기록 저장 실패: %d건", use_case.pending)
+        get_metrics().increment(ERROR_METRIC)
+        await websocket.send_json(
+            _error(Status.DATABASE_ERROR, "번역 기록을 저장하지 못했어요")
+        )
+
+
+def _final_flush(use_case: ThreadConversationUseCase) -> None:
+    """연결 종료 시 남은 번역 기록 저장 (실패 시 재시도, 모두 실패하면 유실 기록)
+
+    취소(연결 종료/서버 종료) 중에도 끝까지 실행되도록 동기 호출
+    (취소된 스레드풀 flush()가 아직 실행 중이면 flush() 잠금으로 끝날 때까지 대기)
+    """
+    for _ in range(_FINAL_FLUSH_ATTEMPTS):
+        try:
+            use_case.flush()
+        except SQLAlchemyError:
+            logger.exception("대화 번역 기록 저장 실패: %d건", use_case.pending)
+            get_metrics().increment(ERROR_METRIC)
+        else:
+            return
+    logger.error("대화 번역 기록 유실: %d건", use_case.pending)
+
+
+async def run_conversation(
+    websocket: WebSocket, use_case: ThreadConversationUseCase
+) -> None:
+    """수신 태스크와 번역 루프 실행, 종료 시 남은 번역 기록 저장"""
+    queue: asyncio.Queue = asyncio.Queue(
+        maxsize=settings.TRANSLATION_CONVERSATION_QUEUE_SIZE
+    )
+    receiver = asyncio.create_task(_receive(websocket, queue))
+    try:
+        while True:
+            try:
+                item = await asyncio.wait_for(
+                    queue.get(), settings.TRANSLATION_CONVERSATION_FLUSH_INTERVAL_S
+                )
+            except TimeoutError:
+                await _flush(websocket, use_case)
+                continue
+
+            if item is _STOP:
+                break
+            if isinstance(item, dict):
+                await websocket.send_json(item)
+                continue
+
+            await _translate(websocket, use_case, item)
+            if use_case.pending >= settings.TRANSLATION_CONVERSATION_FLUSH_SIZE:
+                await _flush(websocket, use_case)
+    except WebSocketDisconnect:
+        pass
+    finally:
+        receiver.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await receiver
+        _final_flush(use_case)
+
+
+# ─────────────────────────────────────────────────
+# Controller
+# ─────────────────────────────────────────────────
+
+
+@router.websocket("/translation/threads/{thread_id}/conversation")
+async def thread_conversation(
+    websocket: WebSocket,
+    thread_id: UUID,
+    profile: WebSocketProfile,
+    session: Session = Depends(get_session),
+) -> None:
+    """스레드 대화 (WebSocket)"""
+    # Repository/Service 인스턴스 생성 (DIP)
+    from ._context_service import ContextService
+    from ._repository import (
+        CategoryRepository,
+        PhraseAssetRepository,
+        ThreadRepository,
+        TranslationRepository,
+    )
+    from ._translation_memory import get_translation_memory
+    from ._translation_service import TranslationService
+
+    use_case = ThreadConversationUseCase(
+        session,
+        thread_repository=ThreadRepository(session),
+        translation_repository=TranslationRepository(session),
+        translation_service=TranslationService(),
+        context_service=ContextService(CategoryRepository(session)),
+        translation_memory=get_translation_memory(),
+        phrase_repository=PhraseAssetRepository(session),
+    )
+
+    # 스레드 확인 실패 시 핸드셰이크 거부
+    try:
+        use_case.open(thread_id, profile.id)
+    except AppError as e:
+        raise WebSocketException(
+            code=status.WS_1008_POLICY_VIOLATION, reason=e.message
+        ) from e
+
+    await websocket.accept()
+    await run_conversation(websocket, use_case)
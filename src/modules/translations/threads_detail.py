@@ -1,13 +1,18 @@
 """GET /translation/threads/{thread_id} 엔드포인트
 
 번역 스레드 상세 조회 API (번역 기록 포함)
+번역 기록은 대화 순서 키셋 페이지 (limit개씩, next_cursor로 다음 페이지)
+
+채팅형 폴링:
+- since=<latest_cursor>: 마지막으로 본 번역 이후의 새 번역만 조회
+- If-None-Match=<ETag>: 스레드가 바뀌지 않았으면 304 (스레드 한 행만 조회)
 Controller는 HTTP 처리만 담당, 비즈니스 로직은 Use Case에서 처리
 """
 
 from datetime import datetime
 from uuid import UUID
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header, Query, Response, status
 from pydantic import BaseModel
 from sqlmodel import Session
 
@@ -46,6 +51,8 @@ class ThreadDetailData(BaseModel):
     sub_category: str
     created_at: datetime
     translations: list[TranslationInThread]
+    next_cursor: str | None = None
+    latest_cursor: str | None = None
 
 
 # ─────────────────────────────────────────────────
@@ -60,12 +67,21 @@ class ThreadDetailData(BaseModel):
 def get_thread(
     thread_id: UUID,
     profile: CurrentProfile,
+    response: Response,
+    *,
+    cursor: str | None = Query(None),
+    since: str | None = Query(None),
+    limit: int = Query(50, ge=1, le=100),
+    if_none_match: str | None = Header(None),
     session: Session = Depends(get_session),
-) -> ApiResponse[ThreadDetailData]:
+) -> ApiResponse[ThreadDetailData] | Response:
     """번역 스레드 상세 조회
 
+    since는 마지막으로 본 번역의 커서 (cursor와 같은 키셋, 폴링용 이름)
+
     Raises:
         ThreadNotFoundError: 스레드를 찾을 수 없음 (404)
+        InvalidCursorError: 잘못된 커서 (400)
     """
     # Repository 인스턴스 생성 (DIP)
     from ._repository import ThreadRepository, TranslationRepository
@@ -78,7 +94,20 @@ def get_thread(
         thread_repository=thread_repository,
         translation_repository=translation_repository,
     )
-    result = use_case.execute(thread_id=thread_id, profile_id=profile.id)
+    result = use_case.execute(
+        thread_id=thread_id,
+        profile_id=profile.id,
+        cursor=since or cursor,
+        limit=limit,
+        if_none_match=if_none_match,
+    )
+
+    if result.not_modified:
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={"ETag": result.etag},
+        )
+    response.headers["ETag"] = result.etag
 
     # 응답 변환
     translation_items = [
@@ -104,5 +133,7 @@ def get_thread(
             sub_category=result.sub_category,
             created_at=result.created_at,
             translations=translation_items,
+            next_cursor=result.next_cursor,
+            latest_cursor=result.latest_cursor,
         ),
     )
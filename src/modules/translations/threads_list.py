@@ -1,6 +1,8 @@
 """GET /translation/threads 엔드포인트
 
 번역 스레드 목록 조회 API
+- 페이지 모드 (page): 기존 호환, 매 요청 COUNT 포함
+- 커서 모드 (cursor): (created_at, id) 키셋, include_total=true일 때만 COUNT
 Controller는 HTTP 처리만 담당, 비즈니스 로직은 Use Case에서 처리
 """
 
@@ -34,12 +36,14 @@ class ThreadListItem(BaseModel):
 
 
 class PaginationInfo(BaseModel):
-    """페이지네이션 정보"""
+    """페이지네이션 정보 (커서 모드는 page/total_pages 없음)"""
 
-    page: int
+    page: int | None = None
     limit: int
-    total: int
-    total_pages: int
+    total: int | None = None
+    total_pages: int | None = None
+    next_cursor: str | None = None
+    has_more: bool
 
 
 class ThreadListData(BaseModel):
@@ -59,9 +63,16 @@ def list_threads(
     profile: CurrentProfile,
     page: int = Query(1, ge=1),
     limit: int = Query(20, ge=1, le=100),
+    *,
+    cursor: str | None = Query(None),
+    include_total: bool = Query(False),
     session: Session = Depends(get_session),
 ) -> ApiResponse[ThreadListData]:
-    """번역 스레드 목록 조회"""
+    """번역 스레드 목록 조회
+
+    Raises:
+        InvalidCursorError: 잘못된 커서 (400)
+    """
     # Repository 인스턴스 생성 (DIP)
     from ._repository import ThreadRepository
 
@@ -69,7 +80,13 @@ def list_threads(
 
     # Use Case 실행
     use_case = ListThreadsUseCase(thread_repository=thread_repository)
-    result = use_case.execute(profile_id=profile.id, page=page, limit=limit)
+    result = use_case.execute(
+        profile_id=profile.id,
+        page=page,
+        limit=limit,
+        cursor=cursor,
+        include_total=include_total,
+    )
 
     # 응답 변환
     items = [
@@ -82,9 +99,9 @@ def list_threads(
         for t in result.items
     ]
 
-    total_pages = (
-        (result.total + result.limit - 1) // result.limit if result.total > 0 else 0
-    )
+    total_pages = None
+    if result.page is not None and result.total is not None:
+        total_pages = (result.total + result.limit - 1) // result.limit
 
     return ApiResponse(
         status=Status.SUCCESS,
@@ -96,6 +113,8 @@ def list_threads(
                 limit=result.limit,
                 total=result.total,
                 total_pages=total_pages,
+                next_cursor=result.next_cursor,
+                has_more=result.has_more,
             ),
         ),
     )
@@ -3,6 +3,8 @@
 텍스트 번역 API
 Controller는 HTTP 처리만 담당, 비즈니스 로직은 Use Case에서 처리
 서비스 인스턴스를 생성하여 Use Case에 주입 (DIP)
+async 엔드포인트: LLM 응답 대기 중 스레드풀을 점유하지 않음
+(동기 세션 DB 작업만 스레드풀에서 실행, 이벤트 루프 차단 없음)
 """
 
 from datetime import datetime
@@ -16,7 +18,11 @@ from src.core.database import get_session
 from src.core.deps import CurrentProfile
 from src.core.response import ApiResponse, Status
 
-from ._use_cases import CreateTextTranslationUseCase, TextTranslationInput
+from ._use_cases import (
+    CreateTextTranslationUseCase,
+    TextTranslationInput,
+    TranslationResult,
+)
 
 router = APIRouter(tags=["translations"])
 
@@ -62,6 +68,24 @@ class TranslationResponse(BaseModel):
 
     model_config = {"from_attributes": True}
 
+    @classmethod
+    def from_result(cls, result: TranslationResult) -> "TranslationResponse":
+        return cls(
+            id=str(result.id),
+            source_text=result.source_text,
+            translated_text=result.translated_text,
+            source_lang=result.source_lang,
+            target_lang=result.target_lang,
+            translation_type=result.translation_type,
+            mission_progress_id=(
+                str(result.mission_progress_id) if result.mission_progress_id else None
+            ),
+            audio_url=result.audio_url,
+            duration_ms=result.duration_ms,
+            confidence_score=result.confidence_score,
+            created_at=result.created_at,
+        )
+
 
 # ─────────────────────────────────────────────────
 # Controller
@@ -69,7 +93,7 @@ class TranslationResponse(BaseModel):
 
 
 @router.post("/translate/text", response_model=ApiResponse[TranslationResponse])
-def translate_text(
+async def translate_text(
     request: TextTranslateRequest,
     profile: CurrentProfile,
     session: Session = Depends(get_session),
@@ -91,7 +115,12 @@ def translate_text(
 
     # Repository/Service 인스턴스 생성 (DIP)
     from ._context_service import ContextService
-    from ._repository import CategoryRepository, TranslationRepository
+    from ._repository import (
+        CategoryRepository,
+        PhraseAssetRepository,
+        TranslationRepository,
+    )
+    from ._translation_memory import get_translation_memory
     from ._translation_service import TranslationService
 
     translation_repository = TranslationRepository(session)
@@ -105,26 +134,14 @@ def translate_text(
         translation_repository=translation_repository,
         translation_service=translation_service,
         context_service=context_service,
+        translation_memory=get_translation_memory(),
+        phrase_repository=PhraseAssetRepository(session),
     )
-    result = use_case.execute(input_data)
+    result = await use_case.execute(input_data)
 
     # 응답 변환
     return ApiResponse(
         status=Status.SUCCESS,
         message="번역이 완료됐어요",
-        data=TranslationResponse(
-            id=str(result.id),
-            source_text=result.source_text,
-            translated_text=result.translated_text,
-            source_lang=result.source_lang,
-            target_lang=result.target_lang,
-            translation_type=result.translation_type,
-            mission_progress_id=(
-                str(result.mission_progress_id) if result.mission_progress_id else None
-            ),
-            audio_url=result.audio_url,
-            duration_ms=result.duration_ms,
-            confidence_score=result.confidence_score,
-            created_at=result.created_at,
-        ),
+        data=TranslationResponse.from_result(result),
     )
@@ -0,0 +1,115 @@
+"""POST /translate/text/batch 엔드포인트
+
+묶음 텍스트 번역 API (메뉴판, 안내문 등 여러 문장)
+- 같은 언어쌍/컨텍스트의 문장을 한 번의 Gemini 프롬프트로 번역
+- 응답 파싱 실패 시 문장별 번역으로 폴백
+- 번역 기록은 한 번의 다중 행 INSERT로 저장
+"""
+
+from typing import Annotated
+from uuid import UUID
+
+from fastapi import APIRouter, Depends
+from pydantic import BaseModel, Field, model_validator
+from sqlmodel import Session
+
+from src.core.config import settings
+from src.core.database import get_session
+from src.core.deps import CurrentProfile
+from src.core.response import ApiResponse, Status
+
+from ._use_cases import BatchTextTranslationInput, CreateBatchTextTranslationUseCase
+from .translate_text import TranslationResponse
+
+router = APIRouter(tags=["translations"])
+
+Segment = Annotated[str, Field(min_length=1, max_length=1000)]
+
+
+# ─────────────────────────────────────────────────
+# Request/Response DTOs
+# ─────────────────────────────────────────────────
+
+
+class BatchTextTranslateRequest(BaseModel):
+    """묶음 텍스트 번역 요청"""
+
+    source_texts: list[Segment] = Field(
+        min_length=1, max_length=settings.TRANSLATION_BATCH_MAX_SEGMENTS
+    )
+    source_lang: str = Field(pattern=r"^(ko|en)$")
+    target_lang: str = Field(pattern=r"^(ko|en)$")
+    mission_progress_id: str | None = None
+    thread_id: str | None = None
+    context_primary: str | None = None  # 1차 카테고리 코드 (FD6, CE7 등)
+    context_sub: str | None = None  # 2차 카테고리 코드 (ordering, payment 등)
+
+    @model_validator(mode="after")
+    def validate_different_languages(self):
+        if self.source_lang == self.target_lang:
+            msg = "같은 언어로는 번역할 수 없어요"
+            raise ValueError(msg)
+        return self
+
+
+class BatchTranslationResponse(BaseModel):
+    """묶음 번역 응답 (source_texts 순서)"""
+
+    items: list[TranslationResponse]
+
+
+# ─────────────────────────────────────────────────
+# Controller
+# ─────────────────────────────────────────────────
+
+
+@router.post(
+    "/translate/text/batch", response_model=ApiResponse[BatchTranslationResponse]
+)
+async def translate_text_batch(
+    request: BatchTextTranslateRequest,
+    profile: CurrentProfile,
+    session: Session = Depends(get_session),
+) -> ApiResponse[BatchTranslationResponse]:
+    """묶음 텍스트 번역"""
+    # Use Case 입력 생성
+    input_data = BatchTextTranslationInput(
+        profile_id=profile.id,
+        source_texts=request.source_texts,
+        source_lang=request.source_lang,
+        target_lang=request.target_lang,
+        mission_progress_id=(
+            UUID(request.mission_progress_id) if request.mission_progress_id else None
+        ),
+        thread_id=UUID(request.thread_id) if request.thread_id else None,
+        context_primary=request.context_primary,
+        context_sub=request.context_sub,
+    )
+
+    # Repository/Service 인스턴스 생성 (DIP)
+    from ._context_service import ContextService
+    from ._repository import CategoryRepository, TranslationRepository
+    from ._translation_memory import get_translation_memory
+    from ._translation_service import TranslationService
+
+    translation_repository = TranslationRepository(session)
+    category_repository = CategoryRepository(session)
+
+    # Use Case 실행
+    use_case = CreateBatchTextTranslationUseCase(
+        session=session,
+        translation_repository=translation_repository,
+        translation_service=TranslationService(),
+        context_service=ContextService(category_repository),
+        translation_memory=get_translation_memory(),
+    )
+    results = await use_case.execute(input_data)
+
+    # 응답 변환
+    return ApiResponse(
+        status=Status.SUCCESS,
+        message="번역이 완료됐어요",
+        data=BatchTranslationResponse(
+            items=[TranslationResponse.from_result(r) for r in results]
+        ),
+    )
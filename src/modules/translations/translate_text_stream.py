@@ -0,0 +1,133 @@
+"""POST /translate/text/stream 엔드포인트
+
+텍스트 번역 스트리밍 API (Server-Sent Events)
+긴 원문도 생성되는 대로 번역 조각을 받아 바로 표시
+- event: delta  → {"text": "..."} 번역 조각
+- event: done   → 저장된 번역 기록 (TranslationResponse) + ttft_ms
+- event: error  → {"status": "...", "message": "..."} (스트림 도중 실패, 기록 미저장)
+
+번역 기록은 스트림이 끝난 뒤 한 번 저장
+첫 조각까지의 시간(TTFT)은 translation.stream.ttft 히스토그램에 기록
+"""
+
+import json
+import logging
+import time
+from collections.abc import AsyncIterator
+from uuid import UUID
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
+from sqlmodel import Session
+
+from src.core.database import get_session
+from src.core.deps import CurrentProfile
+from src.core.metrics import get_metrics
+from src.core.response import Status
+from src.external.google import VertexAIError
+
+from ._use_cases import (
+    StreamTextTranslationUseCase,
+    TextTranslationInput,
+    TranslationResult,
+)
+from .translate_text import TextTranslateRequest, TranslationResponse
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(tags=["translations"])
+
+SSE_MEDIA_TYPE = "text/event-stream"
+TTFT_METRIC = "translation.stream.ttft"
+ERROR_METRIC = "translation.stream.error"
+
+
+# ─────────────────────────────────────────────────
+# Service (SSE 직렬화)
+# ─────────────────────────────────────────────────
+
+
+def sse_event(event_type: str, data: object) -> bytes:
+    """SSE 이벤트 직렬화 (event + JSON data)"""
+    payload = json.dumps(data, ensure_ascii=False)
+    return f"event: {event_type}\ndata: {payload}\n\n".encode()
+
+
+async def iter_translation_events(
+    use_case: StreamTextTranslationUseCase,
+    input_data: TextTranslationInput,
+    started: float,
+) -> AsyncIterator[bytes]:
+    """번역 스트림 → SSE 이벤트 (첫 조각 시점에 TTFT 기록)"""
+    metrics = get_metrics()
+    ttft_s: float | None = None
+    try:
+        async for item in use_case.execute(input_data):
+            if isinstance(item, TranslationResult):
+                data = TranslationResponse.from_result(item).model_dump(mode="json")
+                data["ttft_ms"] = round(ttft_s * 1000) if ttft_s is not None else None
+                yield sse_event("done", data)
+                continue
+
+            if ttft_s is None:
+                ttft_s = time.perf_counter() - started
+                metrics.observe(TTFT_METRIC, ttft_s)
+            yield sse_event("delta", {"text": item})
+    except VertexAIError as e:
+        # 헤더 전송 후이므로 HTTP 상태 대신 error 이벤트로 전달
+        logger.warning("번역 스트리밍 실패: %s", e.message)
+        metrics.increment(ERROR_METRIC)
+        yield sse_event(
+            "error",
+            {"status": Status.EXTERNAL_SERVICE_ERROR, "message": "번역에 실패했어요"},
+        )
+
+
+# ─────────────────────────────────────────────────
+# Controller
+# ─────────────────────────────────────────────────
+
+
+@router.post("/translate/text/stream", response_class=StreamingResponse)
+async def translate_text_stream(
+    request: TextTranslateRequest,
+    profile: CurrentProfile,
+    session: Session = Depends(get_session),
+) -> StreamingResponse:
+    """텍스트 번역 스트리밍 (SSE)"""
+    started = time.perf_counter()
+
+    # Use Case 입력 생성
+    input_data = TextTranslationInput(
+        profile_id=profile.id,
+        source_text=request.source_text,
+        source_lang=request.source_lang,
+        target_lang=request.target_lang,
+        mission_progress_id=(
+            UUID(request.mission_progress_id) if request.mission_progress_id else None
+        ),
+        thread_id=UUID(request.thread_id) if request.thread_id else None,
+        context_primary=request.context_primary,
+        context_sub=request.context_sub,
+    )
+
+    # Repository/Service 인스턴스 생성 (DIP)
+    from ._context_service import ContextService
+    from ._repository import CategoryRepository, TranslationRepository
+    from ._translation_memory import get_translation_memory
+    from ._translation_service import TranslationService
+
+    use_case = StreamTextTranslationUseCase(
+        session=session,
+        translation_repository=TranslationRepository(session),
+        translation_service=TranslationService(),
+        context_service=ContextService(CategoryRepository(session)),
+        translation_memory=get_translation_memory(),
+    )
+
+    return StreamingResponse(
+        iter_translation_events(use_case, input_data, started),
+        media_type=SSE_MEDIA_TYPE,
+        # 프록시 버퍼링 방지 (조각 즉시 전달)
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -0,0 +1,234 @@
+"""POST /translate/voice 엔드포인트
+
+음성 번역 API (STT → 컨텍스트 → 번역 → TTS, Server-Sent Events)
+요청 본문은 녹음 오디오 (Content-Type: audio/webm 등), 업로드되는 대로 인식 시작
+- event: transcript  → {"text", "is_final"} 인식 결과 (부분/확정)
+- event: translation → {"index", "source_text", "translated_text"} 확정 구간 번역
+- event: audio       → {"index", "segment_index", "text", "audio", "audio_url"}
+                        문장 MP3 (base64, 음성 캐시 적중 시 합성 생략)
+- event: done        → 저장된 번역 기록 (TranslationResponse) + first_audio_ms
+- event: error       → {"status", "message"} (도중 실패, 기록 미저장)
+
+단계가 겹쳐 실행되므로 첫 문장 오디오가 발화 전체 처리 전에 전달됨
+단계별 지연은 translation.voice.* 히스토그램에 기록
+Google Cloud 인증 정보가 없으면 502 EXTERNAL_SERVICE_ERROR (가짜 음성을 저장하지 않음)
+"""
+
+import base64
+import logging
+import time
+from collections.abc import AsyncIterator
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import StreamingResponse
+from sqlmodel import Session
+from starlette.requests import ClientDisconnect
+from starlette.types import Receive, Scope, Send
+
+from src.core.config import settings
+from src.core.database import get_session
+from src.core.deps import CurrentProfile
+from src.core.exceptions import AppError, ExternalServiceError, ValidationError
+from src.core.metrics import get_metrics
+from src.core.response import Status
+from src.external.google import SpeechError, VertexAIError
+
+from ._exceptions import AudioTooLargeError
+from ._use_cases import (
+    CreateVoiceTranslationUseCase,
+    TranslationResult,
+    VoiceTranslationInput,
+)
+from ._voice_pipeline import AudioEvent, SegmentEvent, TranscriptEvent
+from .translate_text import TranslationResponse
+from .translate_text_stream import SSE_MEDIA_TYPE, sse_event
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(tags=["translations"])
+
+ERROR_METRIC = "translation.voice.error"
+
+_LANGUAGE_PATTERN = r"^(ko|en)$"
+
+
+# ─────────────────────────────────────────────────
+# Service (업로드 스트림, SSE 직렬화)
+# ─────────────────────────────────────────────────
+
+
+async def _audio_chunks(request: Request) -> AsyncIterator[bytes]:
+    """업로드 본문을 받는 대로 전달 (최대 크기 초과 시 중단)"""
+    total = 0
+    async for chunk in request.stream():
+        if not chunk:
+            continue
+        total += len(chunk)
+        if total > settings.TRANSLATION_VOICE_MAX_AUDIO_BYTES:
+            raise AudioTooLargeError()
+        yield chunk
+
+
+class _UploadStreamingResponse(StreamingResponse):
+    """업로드 본문을 읽으면서 내보내는 스트리밍 응답
+
+    기본 StreamingResponse는 연결 종료 감지를 위해 receive()를 함께 읽어
+    아직 받지 않은 업로드 조각을 가로챔 → 연결 종료는 본문 스트림/전송 실패로 감지
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        try:
+            await self.stream_response(send)
+        except OSError:
+            raise ClientDisconnect from None
+        if self.background is not None:
+            await self.background()
+
+
+def _serialize(item: object) -> bytes:
+    if isinstance(item, TranscriptEvent):
+        return sse_event("transcript", {"text": item.text, "is_final": item.is_final})
+    if isinstance(item, SegmentEvent):
+        return sse_event(
+            "translation",
+            {
+                "index": item.index,
+                "source_text": item.source_text,
+                "translated_text": item.translated_text,
+            },
+        )
+    if isinstance(item, AudioEvent):
+        return sse_event(
+            "audio",
+            {
+                "index": item.index,
+                "segment_index": item.segment_index,
+                "text": item.text,
+                "audio": base64.b64encode(item.audio).decode(),
+                "audio_url": item.audio_url,
+            },
+        )
+    msg = f"알 수 없는 음성 번역 이벤트: {item!r}"
+    raise TypeError(msg)
+
+
+async def iter_voice_events(
+    use_case: CreateVoiceTranslationUseCase,
+    input_data: VoiceTranslationInput,
+    audio_chunks: AsyncIterator[bytes],
+    content_type: str | None,
+    started: float,
+) -> AsyncIterator[bytes]:
+    """음성 번역 파이프라인 → SSE 이벤트"""
+    first_audio_s: float | None = None
+    try:
+        async for item in use_case.execute(
+            input_data, audio_chunks, content_type, started
+        ):
+            if isinstance(item, TranslationResult):
+                data = TranslationResponse.from_result(item).model_dump(mode="json")
+                data["first_audio_ms"] = (
+                    round(first_audio_s * 1000) if first_audio_s is not None else None
+                )
+                yield sse_event("done", data)
+                continue
+
+            if isinstance(item, AudioEvent) and first_audio_s is None:
+                first_audio_s = time.perf_counter() - started
+            yield _serialize(item)
+    except AppError as e:
+        # 헤더 전송 후이므로 HTTP 상태 대신 error 이벤트로 전달
+        yield sse_event("error", {"status": e.status, "message": e.message})
+    except (SpeechError, VertexAIError) as e:
+        logger.warning("음성 번역 실패: %s", e.message)
+        get_metrics().increment(ERROR_METRIC)
+        yield sse_event(
+            "error",
+            {"status": Status.EXTERNAL_SERVICE_ERROR, "message": "번역에 실패했어요"},
+        )
+
+
+# ─────────────────────────────────────────────────
+# Controller
+# ─────────────────────────────────────────────────
+
+
+@router.post("/translate/voice", response_class=StreamingResponse)
+async def translate_voice(
+    request: Request,
+    profile: CurrentProfile,
+    *,
+    source_lang: str = Query(pattern=_LANGUAGE_PATTERN),
+    target_lang: str = Query(pattern=_LANGUAGE_PATTERN),
+    mission_progress_id: UUID | None = None,
+    thread_id: UUID | None = None,
+    context_primary: str | None = None,
+    context_sub: str | None = None,
+    session: Session = Depends(get_session),
+) -> StreamingResponse:
+    """음성 번역 (SSE)"""
+    started = time.perf_counter()
+
+    if source_lang == target_lang:
+        raise ValidationError("같은 언어로는 번역할 수 없어요")
+
+    content_length = request.headers.get("content-length")
+    if (
+        content_length
+        and content_length.isdigit()
+        and int(content_length) > settings.TRANSLATION_VOICE_MAX_AUDIO_BYTES
+    ):
+        raise AudioTooLargeError()
+
+    # Use Case 입력 생성
+    input_data = VoiceTranslationInput(
+        profile_id=profile.id,
+        source_lang=source_lang,
+        target_lang=target_lang,
+        mission_progress_id=mission_progress_id,
+        thread_id=thread_id,
+        context_primary=context_primary,
+        context_sub=context_sub,
+    )
+
+    # Repository/Service/Provider 인스턴스 생성 (DIP)
+    from src.external.google import get_async_speech_provider, get_async_tts_provider
+    from src.external.supabase import get_async_storage_provider
+
+    from ._audio_cache import build_audio_cache
+    from ._context_service import ContextService
+    from ._repository import CategoryRepository, TranslationRepository
+    from ._translation_memory import get_translation_memory
+    from ._translation_service import TranslationService
+
+    speech_provider = get_async_speech_provider()
+    tts_provider = get_async_tts_provider()
+    if speech_provider is None or tts_provider is None:
+        raise ExternalServiceError("음성 번역을 사용할 수 없어요")
+
+    use_case = CreateVoiceTranslationUseCase(
+        session,
+        translation_repository=TranslationRepository(session),
+        translation_service=TranslationService(),
+        context_service=ContextService(CategoryRepository(session)),
+        speech_provider=speech_provider,
+        audio_cache=build_audio_cache(
+            tts_provider,
+            await get_async_storage_provider(),
+        ),
+        translation_memory=get_translation_memory(),
+    )
+
+    return _UploadStreamingResponse(
+        iter_voice_events(
+            use_case,
+            input_data,
+            _audio_chunks(request),
+            request.headers.get("content-type"),
+            started,
+        ),
+        media_type=SSE_MEDIA_TYPE,
+        # 프록시 버퍼링 방지 (이벤트 즉시 전달)
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
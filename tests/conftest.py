@@ -6,17 +6,20 @@
 """
 
 import os
-from collections.abc import Generator
+import re
+from collections.abc import Callable, Generator
 from datetime import UTC, datetime
 from unittest.mock import MagicMock, patch
 from uuid import UUID, uuid4
 
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import event
 from sqlmodel import Session, SQLModel, create_engine
 from sqlmodel.pool import StaticPool
 
 from src.app.main import app
+from src.core.config import settings
 from src.core.database import get_session
 
 
@@ -73,6 +76,45 @@ def session_fixture(engine) -> Generator[Session, None, None]:
     connection.close()
 
 
+# 실행 계획에서 전체 정렬/순차 스캔 (SQLite: 인덱스 없는 SCAN, PostgreSQL: Seq Scan)
+_SORT_PLAN = re.compile(r"USE TEMP B-TREE FOR .*ORDER BY|\bSort\b")
+_SEQ_SCAN_PLAN = re.compile(r"^SCAN \w+$|\bSeq Scan\b", re.MULTILINE)
+
+
+@pytest.fixture(name="assert_index_scan")
+def assert_index_scan_fixture(session: Session) -> Callable[..., None]:
+    """Repository 호출이 실행한 SELECT 문이 인덱스 범위 스캔인지 EXPLAIN으로 검증
+
+    정렬(Sort) 없이 지정 인덱스로 조회해야 통과 (SQLite/PostgreSQL 공통)
+    """
+    prefix = "EXPLAIN " if _USE_POSTGRES else "EXPLAIN QUERY PLAN "
+
+    def check(call: Callable[[], object], index: str) -> None:
+        statements: list[tuple[str, object]] = []
+
+        def record(_conn, _cursor, statement, parameters, *_args) -> None:
+            if statement.lstrip().upper().startswith("SELECT"):
+                statements.append((statement, parameters))
+
+        engine = session.get_bind().engine
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            call()
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        assert statements, "SELECT 문이 실행되지 않음"
+        connection = session.connection()
+        for statement, parameters in statements:
+            rows = connection.exec_driver_sql(prefix + statement, parameters).all()
+            plan = "\n".join(str(row[-1]) for row in rows)
+            assert index in plan, plan
+            assert not _SORT_PLAN.search(plan), plan
+            assert not _SEQ_SCAN_PLAN.search(plan), plan
+
+    return check
+
+
 @pytest.fixture(name="client")
 def client_fixture(session: Session) -> Generator[TestClient, None, None]:
     """테스트 클라이언트 (인증 없음)"""
@@ -82,7 +124,11 @@ def client_fixture(session: Session) -> Generator[TestClient, None, None]:
 
     app.dependency_overrides[get_session] = get_session_override
 
-    with TestClient(app) as client:
+    # 시작 시 카탈로그 적재는 운영 DB 엔진을 사용하므로 비활성화
+    with (
+        patch.object(settings, "TRANSLATION_CATALOG_PRELOAD", False),
+        TestClient(app) as client,
+    ):
         yield client
 
     app.dependency_overrides.clear()
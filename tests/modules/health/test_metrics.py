@@ -0,0 +1,47 @@
+"""GET /health/metrics 테스트 (인증 필요)"""
+
+from fastapi.testclient import TestClient
+
+from src.core.metrics import Metrics, get_metrics
+from src.core.response import Status
+from src.modules.profiles import Profile
+
+
+def test_metrics_snapshot(auth_client: TestClient, test_profile: Profile) -> None:
+    """기록된 히스토그램/카운터 조회"""
+    metrics = get_metrics()
+    metrics.clear()
+    metrics.observe("test.latency", 0.12)
+    metrics.increment("test.count", 2)
+
+    response = auth_client.get("/health/metrics")
+    metrics.clear()
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["status"] == Status.SUCCESS
+    assert data["data"]["histograms"]["test.latency"] == {
+        "count": 1,
+        "p50_s": 0.15,
+        "p95_s": 0.15,
+    }
+    assert data["data"]["counters"] == {"test.count": 2}
+
+
+def test_metrics_unauthorized(client: TestClient) -> None:
+    """인증 없이 조회 -> 401"""
+    response = client.get("/health/metrics")
+
+    assert response.status_code == 401
+
+
+def test_metrics_empty_histogram() -> None:
+    """샘플 없는 히스토그램은 분위 None"""
+    metrics = Metrics()
+    metrics.histogram("empty")
+
+    assert metrics.snapshot()["histograms"]["empty"] == {
+        "count": 0,
+        "p50_s": None,
+        "p95_s": None,
+    }
@@ -90,8 +90,12 @@ def created_route_history(session: Session, test_profile: Profile) -> RouteHisto
         profile_id=test_profile.id,
         start_name="서울역",
         start_point=make_point(126.9706, 37.5547),  # lng, lat 순서
+        start_lat=37.5547,
+        start_lng=126.9706,
         end_name="강남역",
         end_point=make_point(127.0276, 37.4979),  # lng, lat 순서
+        end_lat=37.4979,
+        end_lng=127.0276,
         waypoints=None,
         route_option=RouteOption.TRAOPTIMAL,
         total_distance_m=12500,
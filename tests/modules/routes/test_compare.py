@@ -0,0 +1,167 @@
+"""경로 옵션 비교 테스트
+
+POST /routes/compare
+
+테스트 케이스:
+- 여러 옵션 동시 검색 성공
+- 동일 경로 결과 병합 (중복 제거)
+- 일부 옵션 실패 시 나머지만 반환
+- 모든 옵션 실패 -> 404
+- 옵션 누락 -> 422
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from fastapi.testclient import TestClient
+
+from src.modules.profiles import Profile
+
+_FAST_ROUTE = {
+    "total_distance_m": 14000,
+    "total_duration_s": 1500,
+    "path": [[126.9706, 37.5547], [127.0276, 37.4979]],
+}
+_OPTIMAL_ROUTE = {
+    "total_distance_m": 12500,
+    "total_duration_s": 1800,
+    "path": [[126.9706, 37.5547], [126.9800, 37.5500], [127.0276, 37.4979]],
+}
+
+
+def _mock_provider(routes: dict[str, dict | Exception]) -> MagicMock:
+    """옵션별 결과를 반환하는 Provider"""
+
+    async def directions(**kwargs) -> dict:
+        result = routes[kwargs["option"]]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    provider = MagicMock()
+    provider.directions = AsyncMock(side_effect=directions)
+    return provider
+
+
+class TestCompareRoutes:
+    """POST /routes/compare 테스트"""
+
+    def test_compare_routes_success(
+        self,
+        auth_client: TestClient,
+        test_profile: Profile,
+        route_search_request: dict,
+    ) -> None:
+        """여러 옵션을 한 번에 검색"""
+        request = {**route_search_request, "options": ["traoptimal", "trafast"]}
+        request.pop("option")
+        provider = _mock_provider(
+            {"traoptimal": _OPTIMAL_ROUTE, "trafast": _FAST_ROUTE}
+        )
+
+        with patch(
+            "src.modules.routes.search.get_kakao_provider",
+            return_value=provider,
+        ):
+            response = auth_client.post("/routes/compare", json=request)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "SUCCESS"
+        assert data["message"] == "경로 비교에 성공했어요"
+        assert "id" in data["data"]
+        alternatives = data["data"]["alternatives"]
+        assert [alt["options"] for alt in alternatives] == [
+            ["traoptimal"],
+            ["trafast"],
+        ]
+        assert alternatives[1]["total_duration_s"] == 1500
+        assert provider.directions.await_count == 2
+
+    def test_compare_routes_dedupes_identical(
+        self,
+        auth_client: TestClient,
+        test_profile: Profile,
+        route_search_request: dict,
+    ) -> None:
+        """요약과 경로가 같은 옵션은 하나의 대안으로 병합"""
+        request = {
+            **route_search_request,
+            "options": ["traoptimal", "trafast", "traavoidtoll"],
+        }
+        request.pop("option")
+        provider = _mock_provider(
+            {
+                "traoptimal": _OPTIMAL_ROUTE,
+                "trafast": _FAST_ROUTE,
+                "traavoidtoll": dict(_OPTIMAL_ROUTE),
+            }
+        )
+
+        with patch(
+            "src.modules.routes.search.get_kakao_provider",
+            return_value=provider,
+        ):
+            response = auth_client.post("/routes/compare", json=request)
+
+        assert response.status_code == 200
+        alternatives = response.json()["data"]["alternatives"]
+        assert len(alternatives) == 2
+        assert alternatives[0]["options"] == ["traoptimal", "traavoidtoll"]
+
+    def test_compare_routes_partial_failure(
+        self,
+        auth_client: TestClient,
+        test_profile: Profile,
+        route_search_request: dict,
+    ) -> None:
+        """일부 옵션 실패 시 성공한 옵션만 반환"""
+        request = {**route_search_request, "options": ["traoptimal", "trafast"]}
+        request.pop("option")
+        provider = _mock_provider(
+            {"traoptimal": Exception("Route not found"), "trafast": _FAST_ROUTE}
+        )
+
+        with patch(
+            "src.modules.routes.search.get_kakao_provider",
+            return_value=provider,
+        ):
+            response = auth_client.post("/routes/compare", json=request)
+
+        assert response.status_code == 200
+        alternatives = response.json()["data"]["alternatives"]
+        assert [alt["options"] for alt in alternatives] == [["trafast"]]
+
+    def test_compare_routes_all_failed(
+        self,
+        auth_client: TestClient,
+        test_profile: Profile,
+        route_search_request: dict,
+    ) -> None:
+        """모든 옵션 실패 -> 404"""
+        request = {**route_search_request, "options": ["traoptimal"]}
+        request.pop("option")
+        provider = _mock_provider({"traoptimal": Exception("Route not found")})
+
+        with patch(
+            "src.modules.routes.search.get_kakao_provider",
+            return_value=provider,
+        ):
+            response = auth_client.post("/routes/compare", json=request)
+
+        assert response.status_code == 404
+        assert response.json()["status"] == "ROUTE_NOT_FOUND"
+
+    def test_compare_routes_missing_options(
+        self,
+        auth_client: TestClient,
+        test_profile: Profile,
+        route_search_request: dict,
+    ) -> None:
+        """옵션 누락 -> 422"""
+        request = {**route_search_request, "options": []}
+        request.pop("option")
+
+        response = auth_client.post("/routes/compare", json=request)
+
+        assert response.status_code == 422
+        assert response.json()["status"] == "VALIDATION_FAILED"
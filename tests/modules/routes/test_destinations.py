@@ -0,0 +1,111 @@
+"""자주 가는 도착지 테스트
+
+GET /routes/destinations/frequent
+
+- 같은 격자 셀 도착지는 하나의 클러스터로 누적
+- 방문 횟수 순 정렬
+- 본인 클러스터만 조회
+"""
+
+from datetime import UTC, datetime
+from uuid import uuid4
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from src.modules.profiles import Profile
+from src.modules.routes import _repository
+from src.modules.routes._models import RouteHistory
+
+
+def _route(profile: Profile, name: str, lat: float, lng: float) -> RouteHistory:
+    """도착지만 의미 있는 경로 기록 (route_history 테이블에는 저장하지 않음)"""
+    return RouteHistory(
+        id=uuid4(),
+        profile_id=profile.id,
+        start_name="서울역",
+        start_lat=37.5547,
+        start_lng=126.9706,
+        end_name=name,
+        end_lat=lat,
+        end_lng=lng,
+        total_distance_m=12500,
+        total_duration_s=1800,
+        path_data=[],
+        created_at=datetime.now(UTC),
+    )
+
+
+class TestRecordDestination:
+    """도착지 클러스터 증분 갱신 테스트"""
+
+    def test_same_cell_accumulates(
+        self,
+        session: Session,
+        test_profile: Profile,
+    ) -> None:
+        """같은 셀 도착지는 방문 횟수 증가 + 평균 좌표"""
+        _repository.record_destination(
+            session, _route(test_profile, "강남역", 37.4975, 127.0276)
+        )
+        _repository.record_destination(
+            session, _route(test_profile, "강남역 2번 출구", 37.4977, 127.0278)
+        )
+        session.commit()
+
+        destinations = _repository.get_frequent_destinations(session, test_profile.id)
+
+        assert len(destinations) == 1
+        assert destinations[0].visit_count == 2
+        assert destinations[0].name == "강남역 2번 출구"
+        assert destinations[0].lat == pytest.approx(37.4976)
+        assert destinations[0].lng == pytest.approx(127.0277)
+
+
+class TestFrequentDestinations:
+    """GET /routes/destinations/frequent 테스트"""
+
+    def test_ordered_by_visit_count(
+        self,
+        auth_client: TestClient,
+        session: Session,
+        test_profile: Profile,
+    ) -> None:
+        """방문 횟수 내림차순"""
+        for _ in range(3):
+            _repository.record_destination(
+                session, _route(test_profile, "회사", 37.5665, 126.9780)
+            )
+        _repository.record_destination(
+            session, _route(test_profile, "강남역", 37.4979, 127.0276)
+        )
+        other = Profile(
+            id=uuid4(),
+            user_id=uuid4(),
+            display_name="Other",
+            preferred_language="en",
+        )
+        session.add(other)
+        _repository.record_destination(
+            session, _route(other, "다른 사용자", 35.1796, 129.0756)
+        )
+        session.commit()
+
+        response = auth_client.get("/routes/destinations/frequent")
+
+        assert response.status_code == 200
+        data = response.json()["data"]
+        assert [d["name"] for d in data] == ["회사", "강남역"]
+        assert data[0]["visit_count"] == 3
+
+    def test_empty(
+        self,
+        auth_client: TestClient,
+        test_profile: Profile,
+    ) -> None:
+        """기록 없음 -> 빈 목록"""
+        response = auth_client.get("/routes/destinations/frequent")
+
+        assert response.status_code == 200
+        assert response.json()["data"] == []
@@ -5,11 +5,14 @@ GET /routes/{route_id}
 SPEC 기반 테스트 케이스:
 - TC-R-005: 경로 상세 조회
 - TC-R-104: 존재하지 않는 경로 상세 조회
+- 조회 경로에서 WKB 파싱(shapely) 없음
 """
 
+from unittest.mock import patch
 from uuid import uuid4
 
 import pytest
+import shapely.wkb
 from fastapi.testclient import TestClient
 
 from src.modules.profiles import Profile
@@ -49,6 +52,24 @@ class TestRouteDetail:
         assert "path" in route
         assert len(route["path"]) >= 2
 
+    def test_get_route_detail_no_wkb_parsing(
+        self,
+        auth_client: TestClient,
+        test_profile: Profile,
+        created_route_history: RouteHistory,
+    ) -> None:
+        """조회 시 좌표는 float 컬럼에서 읽고 shapely 호출은 0회"""
+        route_id = str(created_route_history.id)
+
+        with patch.object(
+            shapely.wkb, "loads", wraps=shapely.wkb.loads
+        ) as mock_wkb_loads:
+            response = auth_client.get(f"/routes/{route_id}")
+
+        assert response.status_code == 200
+        assert response.json()["data"]["start"]["lat"] == pytest.approx(37.5547)
+        assert mock_wkb_loads.call_count == 0
+
     def test_get_route_detail_not_found(
         self,
         auth_client: TestClient,
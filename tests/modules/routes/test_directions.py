@@ -0,0 +1,160 @@
+"""경로 검색 hedged request 전략 테스트
+
+HedgedDirections:
+- 기본 Provider가 hedge 지연 내 응답하면 보조 Provider 미호출
+- 기본 Provider 지연 시 보조 Provider 결과 사용 + 기본 요청 취소
+- 기본 Provider 실패 시 보조 Provider로 즉시 전환
+- 지연 히스토그램 p95로 hedge 지연 조정
+- Naver Provider는 summary_only(Kakao 요약 모드) 인자를 받아 무시
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.external.naver import NaverProvider
+from src.modules.routes._directions import HedgedDirections, LatencyHistogram
+
+_PARAMS = {
+    "start_lng": 126.9706,
+    "start_lat": 37.5547,
+    "goal_lng": 127.0276,
+    "goal_lat": 37.4979,
+}
+
+
+def _provider(result: dict | None = None, delay_s: float = 0.0, error=None):
+    """지연/실패를 흉내내는 Provider"""
+    provider = MagicMock()
+    state = {"cancelled": False}
+
+    async def directions(**kwargs) -> dict:
+        try:
+            await asyncio.sleep(delay_s)
+        except asyncio.CancelledError:
+            state["cancelled"] = True
+            raise
+        if error is not None:
+            raise error
+        return result or {}
+
+    provider.directions = AsyncMock(side_effect=directions)
+    provider.state = state
+    return provider
+
+
+class TestHedgedDirections:
+    """HedgedDirections 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_primary_fast_no_hedge(self) -> None:
+        """기본 Provider가 빠르면 보조 Provider 미호출"""
+        kakao = _provider({"source": "kakao"})
+        naver = _provider({"source": "naver"})
+        strategy = HedgedDirections(default_delay_s=0.5)
+
+        result = await strategy.directions(
+            ("kakao", kakao), ("naver", naver), **_PARAMS
+        )
+
+        assert result == {"source": "kakao"}
+        naver.directions.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_primary_slow_secondary_wins(self) -> None:
+        """기본 Provider 지연 시 보조 Provider 결과 사용, 기본 요청 취소"""
+        kakao = _provider({"source": "kakao"}, delay_s=5)
+        naver = _provider({"source": "naver"})
+        strategy = HedgedDirections(default_delay_s=0.01)
+
+        result = await strategy.directions(
+            ("kakao", kakao), ("naver", naver), **_PARAMS
+        )
+
+        assert result == {"source": "naver"}
+        assert kakao.state["cancelled"]
+
+    @pytest.mark.asyncio
+    async def test_primary_error_falls_back(self) -> None:
+        """기본 Provider 실패 시 보조 Provider로 전환"""
+        kakao = _provider(error=RuntimeError("kakao down"))
+        naver = _provider({"source": "naver"})
+        strategy = HedgedDirections(default_delay_s=5)
+
+        result = await strategy.directions(
+            ("kakao", kakao), ("naver", naver), **_PARAMS
+        )
+
+        assert result == {"source": "naver"}
+
+    @pytest.mark.asyncio
+    async def test_all_providers_fail(self) -> None:
+        """모든 Provider 실패 시 예외 전파"""
+        kakao = _provider(error=RuntimeError("kakao down"))
+        naver = _provider(error=RuntimeError("naver down"))
+        strategy = HedgedDirections(default_delay_s=0.01)
+
+        with pytest.raises(RuntimeError, match="naver down"):
+            await strategy.directions(("kakao", kakao), ("naver", naver), **_PARAMS)
+
+    @pytest.mark.asyncio
+    async def test_without_secondary(self) -> None:
+        """보조 Provider 없으면 기본 Provider만 호출"""
+        kakao = _provider({"source": "kakao"})
+        strategy = HedgedDirections()
+
+        result = await strategy.directions(("kakao", kakao), None, **_PARAMS)
+
+        assert result == {"source": "kakao"}
+        kakao.directions.assert_awaited_once_with(**_PARAMS)
+
+    @pytest.mark.asyncio
+    async def test_summary_only_hedged_to_naver(self) -> None:
+        """요약 모드 요청이 Naver로 hedge되어도 인자 오류 없이 전체 경로 조회"""
+        kakao = _provider(error=RuntimeError("kakao down"))
+        naver = NaverProvider()
+        strategy = HedgedDirections(default_delay_s=0.5)
+
+        with patch(
+            "src.external.naver._directions",
+            AsyncMock(return_value={"source": "naver"}),
+        ) as naver_directions:
+            result = await strategy.directions(
+                ("kakao", kakao), ("naver", naver), **_PARAMS, summary_only=True
+            )
+
+        assert result == {"source": "naver"}
+        naver_directions.assert_awaited_once()
+
+    def test_hedge_delay_adapts_to_p95(self) -> None:
+        """샘플이 충분하면 p95 기반, 부족하면 기본 지연"""
+        strategy = HedgedDirections(default_delay_s=1.0, min_samples=20)
+        assert strategy.hedge_delay("kakao") == 1.0
+
+        histogram = strategy.histogram("kakao")
+        for _ in range(95):
+            histogram.record(0.18)
+        for _ in range(5):
+            histogram.record(2.5)
+
+        assert strategy.hedge_delay("kakao") == pytest.approx(0.2)
+
+
+class TestLatencyHistogram:
+    """LatencyHistogram 테스트"""
+
+    def test_percentile_empty(self) -> None:
+        """샘플 없으면 None"""
+        assert LatencyHistogram().percentile(0.95) is None
+
+    def test_decay_keeps_recent_weight(self) -> None:
+        """max_samples 도달 시 카운트 감쇠로 최근 지연 반영"""
+        histogram = LatencyHistogram(max_samples=100)
+        for _ in range(100):
+            histogram.record(0.1)
+        for _ in range(200):
+            histogram.record(1.0)
+
+        assert histogram.count <= 100
+        assert histogram.percentile(0.5) == pytest.approx(1.0)
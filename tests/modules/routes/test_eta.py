@@ -0,0 +1,97 @@
+"""경로 ETA 갱신 테스트
+
+POST /routes/{route_id}/eta
+
+테스트 케이스:
+- summary 모드로 재조회 후 거리/시간 갱신
+- 경로 좌표(path_data)는 유지
+- 존재하지 않는 경로 -> 404
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from src.modules.profiles import Profile
+from src.modules.routes._models import RouteHistory
+
+
+class TestRouteEta:
+    """POST /routes/{route_id}/eta 테스트"""
+
+    def test_refresh_eta_success(
+        self,
+        auth_client: TestClient,
+        session: Session,
+        test_profile: Profile,
+        created_route_history: RouteHistory,
+    ) -> None:
+        """summary 모드로 재조회하고 거리/시간만 갱신"""
+        route_id = created_route_history.id
+        original_path = list(created_route_history.path_data)
+
+        mock_provider = MagicMock()
+        mock_provider.directions = AsyncMock(
+            return_value={
+                "total_distance_m": 12600,
+                "total_duration_s": 2400,
+                "path": [],
+            }
+        )
+
+        with patch(
+            "src.modules.routes.eta.get_kakao_provider",
+            return_value=mock_provider,
+        ):
+            response = auth_client.post(f"/routes/{route_id}/eta")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "SUCCESS"
+        assert data["message"] == "도착 예정 시간을 갱신했어요"
+        assert data["data"]["id"] == str(route_id)
+        assert data["data"]["total_duration_s"] == 2400
+        assert data["data"]["duration_text"] == "약 40분"
+        assert "path" not in data["data"]
+
+        call_kwargs = mock_provider.directions.await_args.kwargs
+        assert call_kwargs["summary_only"] is True
+        assert call_kwargs["option"] == "traoptimal"
+
+        session.expire_all()
+        route = session.get(RouteHistory, route_id)
+        assert route is not None
+        assert route.total_duration_s == 2400
+        assert route.path_data == original_path
+
+    def test_refresh_eta_not_found(
+        self,
+        auth_client: TestClient,
+        test_profile: Profile,
+    ) -> None:
+        """존재하지 않는 경로 -> 404"""
+        response = auth_client.post(f"/routes/{uuid4()}/eta")
+
+        assert response.status_code == 404
+        assert response.json()["status"] == "RESOURCE_NOT_FOUND"
+
+    def test_refresh_eta_provider_error(
+        self,
+        auth_client: TestClient,
+        test_profile: Profile,
+        created_route_history: RouteHistory,
+    ) -> None:
+        """Provider 실패 -> 404 (ROUTE_NOT_FOUND)"""
+        mock_provider = MagicMock()
+        mock_provider.directions = AsyncMock(side_effect=Exception("timeout"))
+
+        with patch(
+            "src.modules.routes.eta.get_kakao_provider",
+            return_value=mock_provider,
+        ):
+            response = auth_client.post(f"/routes/{created_route_history.id}/eta")
+
+        assert response.status_code == 404
+        assert response.json()["status"] == "ROUTE_NOT_FOUND"
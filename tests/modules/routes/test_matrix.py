@@ -0,0 +1,182 @@
+"""ETA 매트릭스 테스트
+
+POST /routes/matrix
+
+- 도착지 순서대로 거리/시간 반환 (summary 모드)
+- 캐시 적중 시 Provider 미호출, 같은 셀 도착지는 한 번만 호출
+- 일부 실패는 null, 전부 실패는 404
+- 경로 기록 저장 없음
+- EtaCache LRU/TTL
+"""
+
+from collections.abc import Iterator
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.modules.profiles import Profile
+from src.modules.routes._eta_cache import EtaCache, get_eta_cache
+
+
+@pytest.fixture(autouse=True)
+def _clear_eta_cache() -> Iterator[None]:
+    get_eta_cache().clear()
+    yield
+    get_eta_cache().clear()
+
+
+@pytest.fixture
+def matrix_request() -> dict:
+    return {
+        "origin": {"lat": 37.5547, "lng": 126.9706},
+        "destinations": [
+            {"lat": 37.4979, "lng": 127.0276},
+            {"lat": 37.5636, "lng": 126.9869},
+        ],
+        "option": "trafast",
+    }
+
+
+def _provider(*results: object) -> MagicMock:
+    provider = MagicMock()
+    provider.directions = AsyncMock(side_effect=list(results))
+    return provider
+
+
+def _summary(distance_m: int, duration_s: int) -> dict:
+    return {"total_distance_m": distance_m, "total_duration_s": duration_s, "path": []}
+
+
+class TestRouteMatrix:
+    """POST /routes/matrix 테스트"""
+
+    def test_matrix_success(
+        self,
+        auth_client: TestClient,
+        test_profile: Profile,
+        matrix_request: dict,
+    ) -> None:
+        """도착지 순서대로 거리/시간, summary 모드, 저장 없음"""
+        provider = _provider(_summary(12500, 1800), _summary(2500, 600))
+
+        with (
+            patch(
+                "src.modules.routes.matrix.get_kakao_provider", return_value=provider
+            ),
+            patch("src.modules.routes._repository.create") as mock_create,
+        ):
+            response = auth_client.post("/routes/matrix", json=matrix_request)
+
+        assert response.status_code == 200
+        data = response.json()["data"]
+        assert data == {"distances_m": [12500, 2500], "durations_s": [1800, 600]}
+        assert all(
+            call.kwargs["summary_only"] is True and call.kwargs["option"] == "trafast"
+            for call in provider.directions.await_args_list
+        )
+        mock_create.assert_not_called()
+
+    def test_matrix_uses_cache(
+        self,
+        auth_client: TestClient,
+        test_profile: Profile,
+        matrix_request: dict,
+    ) -> None:
+        """두 번째 요청은 캐시 적중, 같은 셀 도착지는 한 번만 호출"""
+        matrix_request["destinations"].append(
+            {"lat": 37.49791, "lng": 127.02761}  # 첫 도착지와 같은 셀
+        )
+        provider = _provider(_summary(12500, 1800), _summary(2500, 600))
+
+        with patch(
+            "src.modules.routes.matrix.get_kakao_provider", return_value=provider
+        ):
+            first = auth_client.post("/routes/matrix", json=matrix_request)
+            second = auth_client.post("/routes/matrix", json=matrix_request)
+
+        assert provider.directions.await_count == 2
+        assert first.json()["data"]["distances_m"] == [12500, 2500, 12500]
+        assert second.json()["data"] == first.json()["data"]
+
+    def test_matrix_partial_failure(
+        self,
+        auth_client: TestClient,
+        test_profile: Profile,
+        matrix_request: dict,
+    ) -> None:
+        """일부 도착지 실패 -> null (실패는 캐시하지 않음)"""
+        provider = _provider(_summary(12500, 1800), Exception("no route"))
+
+        with patch(
+            "src.modules.routes.matrix.get_kakao_provider", return_value=provider
+        ):
+            response = auth_client.post("/routes/matrix", json=matrix_request)
+
+        assert response.status_code == 200
+        data = response.json()["data"]
+        assert data == {"distances_m": [12500, None], "durations_s": [1800, None]}
+        assert len(get_eta_cache()) == 1
+
+    def test_matrix_all_failed(
+        self,
+        auth_client: TestClient,
+        test_profile: Profile,
+        matrix_request: dict,
+    ) -> None:
+        """전부 실패 -> 404"""
+        provider = _provider(Exception("no route"), Exception("no route"))
+
+        with patch(
+            "src.modules.routes.matrix.get_kakao_provider", return_value=provider
+        ):
+            response = auth_client.post("/routes/matrix", json=matrix_request)
+
+        assert response.status_code == 404
+        assert response.json()["status"] == "ROUTE_NOT_FOUND"
+
+    def test_matrix_too_many_destinations(
+        self,
+        auth_client: TestClient,
+        test_profile: Profile,
+        matrix_request: dict,
+    ) -> None:
+        """도착지 21개 -> 422"""
+        matrix_request["destinations"] = [
+            {"lat": 37.5, "lng": 127.0 + i * 0.01} for i in range(21)
+        ]
+
+        response = auth_client.post("/routes/matrix", json=matrix_request)
+
+        assert response.status_code == 422
+
+
+class TestEtaCache:
+    """EtaCache 테스트"""
+
+    KEY = ("1:1", "2:2", "traoptimal")
+
+    def test_ttl_expiry(self) -> None:
+        """TTL 경과 시 만료"""
+        now = [0.0]
+        cache = EtaCache(ttl_s=10, clock=lambda: now[0])
+        cache.set(self.KEY, (100, 60))
+
+        assert cache.get(self.KEY) == (100, 60)
+        now[0] = 10.0
+        assert cache.get(self.KEY) is None
+        assert len(cache) == 0
+
+    def test_lru_eviction(self) -> None:
+        """최대 크기 초과 시 가장 오래 사용하지 않은 항목 제거"""
+        cache = EtaCache(max_size=2)
+        other = ("1:1", "3:3", "traoptimal")
+        newest = ("1:1", "4:4", "traoptimal")
+        cache.set(self.KEY, (100, 60))
+        cache.set(other, (200, 120))
+        cache.get(self.KEY)
+        cache.set(newest, (300, 180))
+
+        assert cache.get(other) is None
+        assert cache.get(self.KEY) == (100, 60)
+        assert cache.get(newest) == (300, 180)
@@ -0,0 +1,108 @@
+"""경로 목록 쿼리 실행 계획 테스트
+
+대량 데이터에서 사용자별 목록 쿼리가 복합 인덱스 범위 스캔으로
+정렬 없이 처리되는지 EXPLAIN으로 검증 (순차 스캔 + 정렬 회귀 방지)
+"""
+
+from datetime import UTC, datetime, timedelta
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy import insert, text
+from sqlmodel import Session
+
+from src.modules.profiles import Profile
+from src.modules.routes import _repository
+from src.modules.routes._models import RouteDestination, RouteHistory, make_point
+
+_PROFILES = 10
+_ROWS_PER_PROFILE = 300
+_BASE = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+def _seed_profiles(session: Session) -> list[UUID]:
+    profile_ids = [uuid4() for _ in range(_PROFILES)]
+    session.execute(
+        insert(Profile),
+        [
+            {
+                "id": profile_id,
+                "user_id": uuid4(),
+                "display_name": f"user{p}",
+                "preferred_language": "en",
+                "created_at": _BASE,
+                "updated_at": _BASE,
+            }
+            for p, profile_id in enumerate(profile_ids)
+        ],
+    )
+    return profile_ids
+
+
+class TestRouteQueryPlans:
+    """사용자별 경로 목록 쿼리"""
+
+    def test_frequent_destinations(self, session: Session, assert_index_scan) -> None:
+        """자주 가는 도착지 -> ix_route_destinations_profile_visits"""
+        profile_ids = _seed_profiles(session)
+        session.execute(
+            insert(RouteDestination),
+            [
+                {
+                    "id": uuid4(),
+                    "profile_id": profile_id,
+                    "cell": f"cell-{i}",
+                    "name": f"도착지 {i}",
+                    "lat": 37.5,
+                    "lng": 127.0,
+                    "visit_count": i % 17,
+                    "last_visited_at": _BASE + timedelta(minutes=i),
+                }
+                for profile_id in profile_ids
+                for i in range(_ROWS_PER_PROFILE)
+            ],
+        )
+        session.execute(text("ANALYZE"))
+
+        assert_index_scan(
+            lambda: _repository.get_frequent_destinations(session, profile_ids[-1]),
+            "ix_route_destinations_profile_visits",
+        )
+
+    def test_recent_routes(self, session: Session, assert_index_scan) -> None:
+        """최근 경로 -> ix_route_history_profile_last_searched (PostGIS 필요)"""
+        if session.get_bind().dialect.name != "postgresql":
+            pytest.skip("route_history는 PostGIS 테이블")
+
+        profile_ids = _seed_profiles(session)
+        point = make_point(127.0, 37.5)
+        session.execute(
+            insert(RouteHistory),
+            [
+                {
+                    "id": uuid4(),
+                    "profile_id": profile_id,
+                    "start_name": "출발",
+                    "start_point": point,
+                    "start_lat": 37.5,
+                    "start_lng": 127.0,
+                    "end_name": "도착",
+                    "end_point": point,
+                    "end_lat": 37.5,
+                    "end_lng": 127.0,
+                    "total_distance_m": 1000,
+                    "total_duration_s": 600,
+                    "path_data": [],
+                    "created_at": _BASE,
+                    "last_searched_at": _BASE + timedelta(minutes=i),
+                }
+                for profile_id in profile_ids
+                for i in range(_ROWS_PER_PROFILE)
+            ],
+        )
+        session.execute(text("ANALYZE"))
+
+        assert_index_scan(
+            lambda: _repository.get_by_profile_id(session, profile_ids[-1]),
+            "ix_route_history_profile_last_searched",
+        )
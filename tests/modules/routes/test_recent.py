@@ -4,11 +4,18 @@ GET /routes/recent
 
 SPEC 기반 테스트 케이스:
 - TC-R-004: 최근 경로 조회
+- 목록 조회 시 path_data 미로드
+- 동일 경로 재검색 합산 (search_count, last_searched_at 순)
 """
 
+from datetime import UTC, datetime, timedelta
+
 from fastapi.testclient import TestClient
+from sqlalchemy import inspect
+from sqlmodel import Session
 
 from src.modules.profiles import Profile
+from src.modules.routes import _repository
 from src.modules.routes._models import RouteHistory
 
 
@@ -73,3 +80,62 @@ class TestRecentRoutes:
 
         # 최대 50개로 제한되거나 에러
         assert response.status_code in [200, 422]
+
+    def test_get_recent_routes_defers_path_data(
+        self,
+        session: Session,
+        test_profile: Profile,
+        created_route_history: RouteHistory,
+    ) -> None:
+        """목록 쿼리는 path_data 등 대용량 컬럼을 로드하지 않음"""
+        session.expunge_all()
+
+        routes = _repository.get_by_profile_id(session, test_profile.id)
+
+        assert len(routes) == 1
+        unloaded = inspect(routes[0]).unloaded
+        assert "path_data" in unloaded
+        assert "start_point" in unloaded
+        assert "end_point" in unloaded
+        assert "start_name" not in unloaded
+
+    def test_repeated_search_upserts_one_row(
+        self,
+        auth_client: TestClient,
+        session: Session,
+        test_profile: Profile,
+        created_route_history: RouteHistory,
+    ) -> None:
+        """같은 ID 재저장 시 새 행 없이 search_count 합산, 최근 검색 순 정렬"""
+        from src.modules.routes._models import make_point
+
+        other = RouteHistory(
+            profile_id=test_profile.id,
+            start_name="홍대입구역",
+            start_point=make_point(126.9246, 37.5571),
+            start_lat=37.5571,
+            start_lng=126.9246,
+            end_name="여의도역",
+            end_point=make_point(126.9244, 37.5216),
+            end_lat=37.5216,
+            end_lng=126.9244,
+            total_distance_m=6000,
+            total_duration_s=900,
+            path_data=[],
+            last_searched_at=datetime.now(UTC) + timedelta(minutes=1),
+        )
+        _repository.create(session, other)
+
+        repeated = RouteHistory.model_validate(
+            created_route_history.model_dump()
+            | {"last_searched_at": datetime.now(UTC) + timedelta(minutes=2)}
+        )
+        session.expunge_all()
+        _repository.create(session, repeated)
+
+        response = auth_client.get("/routes/recent")
+
+        data = response.json()["data"]
+        assert [r["end_name"] for r in data] == ["강남역", "여의도역"]
+        assert data[0]["id"] == str(created_route_history.id)
+        assert data[0]["search_count"] == 2
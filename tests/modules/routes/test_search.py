@@ -9,13 +9,34 @@ SPEC 기반 테스트 케이스:
 - TC-R-101: 경로 없음
 - TC-R-102: 잘못된 좌표
 - TC-R-103: 경유지 초과
+- write-behind 저장 모드
+- 동일 경로 기록 ID (중복 합산)
+- 동시 검색 시 같은 사용자 · 경로 키 직렬화
 """
 
+import asyncio
+from collections.abc import Iterator
+from datetime import UTC, datetime, timedelta
+from typing import ClassVar
 from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
 
+import pytest
 from fastapi.testclient import TestClient
 
+from src.core.config import settings
 from src.modules.profiles import Profile
+from src.modules.routes import _repository
+from src.modules.routes._models import RouteHistory
+from src.modules.routes._utils import route_key
+from src.modules.routes.search import (
+    PointRequest,
+    RouteSearchRequest,
+    build_route_history,
+    find_route_id,
+    record_route_history,
+    search_and_save_route,
+)
 
 
 class TestSearchRoute:
@@ -182,3 +203,246 @@ class TestSearchRoute:
 
         assert response.status_code == 422
         # 경유지 최대 5개 제한
+
+    def test_search_route_write_behind(
+        self,
+        auth_client: TestClient,
+        test_profile: Profile,
+        route_search_request: dict,
+    ) -> None:
+        """write-behind 모드: 큐에 적재하고 요청 좌표로 응답 구성"""
+        mock_provider = MagicMock()
+        mock_provider.directions = AsyncMock(
+            return_value={
+                "total_distance_m": 12500,
+                "total_duration_s": 1800,
+                "path": [
+                    [126.9706, 37.5547],
+                    [127.0276, 37.4979],
+                ],
+            }
+        )
+        mock_writer = MagicMock()
+        mock_writer.submit.return_value = True
+
+        with (
+            patch.object(settings, "ROUTE_HISTORY_WRITE_BEHIND", True),
+            patch(
+                "src.modules.routes.search.get_kakao_provider",
+                return_value=mock_provider,
+            ),
+            patch(
+                "src.modules.routes.search.get_route_history_writer",
+                return_value=mock_writer,
+            ),
+            patch("src.modules.routes.search._repository.create") as mock_create,
+        ):
+            response = auth_client.post("/routes/search", json=route_search_request)
+
+        assert response.status_code == 200
+        data = response.json()["data"]
+        assert data["start"]["lat"] == pytest.approx(37.5547)
+        assert data["end"]["lng"] == pytest.approx(127.0276)
+        mock_writer.submit.assert_called_once()
+        mock_create.assert_not_called()
+
+        queued = mock_writer.submit.call_args.args[0]
+        assert str(queued.id) == data["id"]
+        assert queued.profile_id == test_profile.id
+
+
+class TestFindRouteId:
+    """합산 대상 경로 기록 ID 조회 테스트 (합산 기간 내 마지막 검색 기록)"""
+
+    PROFILE_ID = uuid4()
+    NOW = datetime(2026, 10, 19, 9, 0, tzinfo=UTC)
+    KEY = route_key((37.5547, 126.9706), (37.4979, 127.0276), None, "traoptimal")
+
+    @pytest.fixture
+    def writer(self) -> Iterator[MagicMock]:
+        writer = MagicMock()
+        writer.find_pending_id.return_value = None
+        with patch(
+            "src.modules.routes.search.get_route_history_writer",
+            return_value=writer,
+        ):
+            yield writer
+
+    def test_recent_row_reused(self, writer: MagicMock) -> None:
+        """합산 기간 내 같은 경로 기록이 있으면 그 ID"""
+        existing = uuid4()
+        session = MagicMock()
+        with patch(
+            "src.modules.routes.search._repository.find_recent_id",
+            return_value=existing,
+        ) as find:
+            route_id = find_route_id(session, self.PROFILE_ID, self.KEY, self.NOW)
+
+        assert route_id == existing
+        since = self.NOW - timedelta(seconds=settings.ROUTE_HISTORY_DEDUP_WINDOW_S)
+        find.assert_called_once_with(session, self.PROFILE_ID, self.KEY, since)
+        writer.find_pending_id.assert_called_once_with(self.PROFILE_ID, self.KEY, since)
+
+    def test_pending_row_reused(self, writer: MagicMock) -> None:
+        """아직 저장 전인 write-behind 기록도 합산 대상 (DB 조회 생략)"""
+        pending = uuid4()
+        writer.find_pending_id.return_value = pending
+        with patch("src.modules.routes.search._repository.find_recent_id") as find:
+            route_id = find_route_id(MagicMock(), self.PROFILE_ID, self.KEY, self.NOW)
+
+        assert route_id == pending
+        find.assert_not_called()
+
+    def test_no_recent_row(self, writer: MagicMock) -> None:
+        """합산 기간 내 기록이 없으면 None (새 기록)"""
+        with patch(
+            "src.modules.routes.search._repository.find_recent_id",
+            return_value=None,
+        ):
+            route_id = find_route_id(MagicMock(), self.PROFILE_ID, self.KEY, self.NOW)
+
+        assert route_id is None
+
+    def test_different_option_or_waypoint(self) -> None:
+        """옵션/경유지가 다르면 다른 경로 키, 격자 내 좌표 차이는 같은 키"""
+        start, end = (37.5547, 126.9706), (37.4979, 127.0276)
+
+        assert route_key(start, (37.49795, 127.0276), None, "traoptimal") == self.KEY
+        assert route_key(start, end, None, "trafast") != self.KEY
+        assert route_key(start, end, [(37.5636, 126.9869)], "traoptimal") != self.KEY
+
+    def test_dedup_disabled(self, writer: MagicMock) -> None:
+        """합산 기간 0이면 조회 없이 None (새 기록)"""
+        with (
+            patch.object(settings, "ROUTE_HISTORY_DEDUP_WINDOW_S", 0),
+            patch("src.modules.routes.search._repository.find_recent_id") as find,
+        ):
+            route_id = find_route_id(MagicMock(), self.PROFILE_ID, self.KEY, self.NOW)
+
+        assert route_id is None
+        find.assert_not_called()
+        writer.find_pending_id.assert_not_called()
+
+
+class TestRecordRouteHistory:
+    """경로 기록 저장 테스트 (같은 사용자 · 경로 키 단위 직렬화)"""
+
+    PROFILE_ID = uuid4()
+    ROUTE_DATA: ClassVar[dict] = {
+        "total_distance_m": 12500,
+        "total_duration_s": 1800,
+        "path": [[126.9706, 37.5547], [127.0276, 37.4979]],
+    }
+
+    @pytest.fixture
+    def repository(self) -> Iterator[MagicMock]:
+        """DB 대신 메모리에 저장하는 Repository (호출 순서 기록)"""
+        rows: list[RouteHistory] = []
+
+        def find_recent_id(_session, profile_id, key, since):
+            for row in reversed(rows):
+                if (row.profile_id, row.route_key) == (profile_id, key):
+                    return row.id if row.last_searched_at >= since else None
+            return None
+
+        repository = MagicMock()
+        repository.rows = rows
+        repository.find_recent_id.side_effect = find_recent_id
+        repository.create.side_effect = lambda _session, row: rows.append(row)
+        with patch("src.modules.routes.search._repository", repository):
+            yield repository
+
+    def _route(self) -> RouteHistory:
+        return build_route_history(
+            self.PROFILE_ID,
+            start=PointRequest(name="서울역", lat=37.5547, lng=126.9706),
+            end=PointRequest(name="강남역", lat=37.4979, lng=127.0276),
+            waypoints=None,
+            option="traoptimal",
+            route_data=self.ROUTE_DATA,
+        )
+
+    def test_new_route_saved_under_lock(self, repository: MagicMock) -> None:
+        """새 기록은 락 → 조회 → 저장 순서로 바로 저장"""
+        route = self._route()
+
+        route_id = record_route_history(MagicMock(), route)
+
+        assert route_id == route.id
+        assert [c[0] for c in repository.mock_calls] == [
+            "lock_route_key",
+            "find_recent_id",
+            "create",
+        ]
+
+    def test_new_route_not_queued(self, repository: MagicMock) -> None:
+        """write-behind 모드여도 새 기록은 락을 쥔 채 동기 저장"""
+        writer = MagicMock()
+        writer.find_pending_id.return_value = None
+        with (
+            patch.object(settings, "ROUTE_HISTORY_WRITE_BEHIND", True),
+            patch(
+                "src.modules.routes.search.get_route_history_writer",
+                return_value=writer,
+            ),
+        ):
+            record_route_history(MagicMock(), self._route())
+
+        writer.submit.assert_not_called()
+        assert len(repository.rows) == 1
+
+    def test_repeated_route_queued(self, repository: MagicMock) -> None:
+        """기존 기록 합산은 write-behind 큐에 적재하고 commit으로 락 해제"""
+        existing = uuid4()
+        repository.find_recent_id.side_effect = None
+        repository.find_recent_id.return_value = existing
+        writer = MagicMock()
+        writer.find_pending_id.return_value = None
+        session = MagicMock()
+        with (
+            patch.object(settings, "ROUTE_HISTORY_WRITE_BEHIND", True),
+            patch(
+                "src.modules.routes.search.get_route_history_writer",
+                return_value=writer,
+            ),
+        ):
+            route_id = record_route_history(session, self._route())
+
+        assert route_id == existing
+        assert writer.submit.call_args.args[0].id == existing
+        repository.create.assert_not_called()
+        session.commit.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_searches_share_row(self, repository: MagicMock) -> None:
+        """같은 경로를 동시에 검색해도 한 기록에 합산"""
+        provider = MagicMock()
+        provider.directions = AsyncMock(return_value=self.ROUTE_DATA)
+        request = RouteSearchRequest(
+            start=PointRequest(name="서울역", lat=37.5547, lng=126.9706),
+            end=PointRequest(name="강남역", lat=37.4979, lng=127.0276),
+        )
+
+        with patch(
+            "src.modules.routes.search.get_kakao_provider", return_value=provider
+        ):
+            results = await asyncio.gather(
+                search_and_save_route(MagicMock(), self.PROFILE_ID, request),
+                search_and_save_route(MagicMock(), self.PROFILE_ID, request),
+            )
+
+        first_id, second_id = (route_id for route_id, _ in results)
+        assert first_id == second_id
+        assert {row.id for row in repository.rows} == {first_id}
+
+    def test_lock_route_key(self) -> None:
+        """PostgreSQL에서만 트랜잭션 advisory lock"""
+        session = MagicMock()
+        session.get_bind.return_value.dialect.name = "sqlite"
+        _repository.lock_route_key(session, self.PROFILE_ID, "key")
+        session.exec.assert_not_called()
+
+        session.get_bind.return_value.dialect.name = "postgresql"
+        _repository.lock_route_key(session, self.PROFILE_ID, "key")
+        statement = str(session.exec.call_args.args[0])
+        assert "pg_advisory_xact_lock(hashtextextended(" in statement
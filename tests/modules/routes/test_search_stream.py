@@ -0,0 +1,119 @@
+"""경로 검색 스트리밍 테스트
+
+POST /routes/search/stream
+
+- 요약 → path 청크 → 종료 순서의 NDJSON
+- chunk_size 적용
+- 경로 없음 404
+"""
+
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from fastapi.testclient import TestClient
+
+from src.core.config import settings
+from src.modules.profiles import Profile
+
+
+def _parse_ndjson(text: str) -> list[dict]:
+    return [json.loads(line) for line in text.splitlines() if line]
+
+
+class TestSearchRouteStream:
+    """POST /routes/search/stream 테스트"""
+
+    def test_stream_summary_then_path_chunks(
+        self,
+        auth_client: TestClient,
+        test_profile: Profile,
+        route_search_request: dict,
+    ) -> None:
+        """요약이 먼저 오고 path가 chunk_size 단위로 분할됨"""
+        path = [[126.97 + i * 0.0001, 37.55 - i * 0.0001] for i in range(120)]
+        mock_provider = MagicMock()
+        mock_provider.directions = AsyncMock(
+            return_value={
+                "total_distance_m": 12500,
+                "total_duration_s": 1800,
+                "path": path,
+            }
+        )
+        mock_writer = MagicMock()
+        mock_writer.submit.return_value = True
+
+        with (
+            patch.object(settings, "ROUTE_HISTORY_WRITE_BEHIND", True),
+            patch(
+                "src.modules.routes.search.get_kakao_provider",
+                return_value=mock_provider,
+            ),
+            patch(
+                "src.modules.routes.search.get_route_history_writer",
+                return_value=mock_writer,
+            ),
+        ):
+            response = auth_client.post(
+                "/routes/search/stream?chunk_size=50", json=route_search_request
+            )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+
+        lines = _parse_ndjson(response.text)
+        assert [line["type"] for line in lines] == [
+            "summary",
+            "path",
+            "path",
+            "path",
+            "end",
+        ]
+
+        summary = lines[0]["data"]
+        assert summary["start"]["name"] == "서울역"
+        assert summary["total_distance_m"] == 12500
+        assert summary["distance_text"] == "12.5km"
+        assert summary["path_count"] == 120
+        assert "path" not in summary
+
+        assert [len(line["data"]) for line in lines[1:4]] == [50, 50, 20]
+        streamed = [p for line in lines[1:4] for p in line["data"]]
+        assert streamed == path
+        assert lines[-1]["data"] == {"path_count": 120}
+
+        queued = mock_writer.submit.call_args.args[0]
+        assert str(queued.id) == summary["id"]
+
+    def test_stream_not_found(
+        self,
+        auth_client: TestClient,
+        test_profile: Profile,
+        route_search_request: dict,
+    ) -> None:
+        """경로 없음 -> 스트림 시작 전 404"""
+        mock_provider = MagicMock()
+        mock_provider.directions = AsyncMock(side_effect=Exception("Route not found"))
+
+        with patch(
+            "src.modules.routes.search.get_kakao_provider",
+            return_value=mock_provider,
+        ):
+            response = auth_client.post(
+                "/routes/search/stream", json=route_search_request
+            )
+
+        assert response.status_code == 404
+        assert response.json()["status"] == "ROUTE_NOT_FOUND"
+
+    def test_stream_invalid_chunk_size(
+        self,
+        auth_client: TestClient,
+        test_profile: Profile,
+        route_search_request: dict,
+    ) -> None:
+        """chunk_size 범위 초과 -> 422"""
+        response = auth_client.post(
+            "/routes/search/stream?chunk_size=1", json=route_search_request
+        )
+
+        assert response.status_code == 422
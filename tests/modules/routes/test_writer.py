@@ -0,0 +1,239 @@
+"""경로 기록 write-behind 저장 테스트
+
+RouteHistoryWriter:
+- 배치 단위 multi-row upsert
+- 종료 시 남은 기록 flush
+- 미동작/큐 초과 시 submit 실패 (동기 저장 폴백)
+- 저장 실패 배치는 별도 태스크에서 재시도 (수집은 계속)
+"""
+
+import asyncio
+from collections.abc import Iterator
+from datetime import UTC, datetime, timedelta
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from src.modules.routes._models import RouteHistory
+from src.modules.routes._writer import RouteHistoryWriter
+
+
+def _route() -> RouteHistory:
+    return RouteHistory(
+        id=uuid4(),
+        profile_id=uuid4(),
+        start_name="서울역",
+        start_lat=37.5547,
+        start_lng=126.9706,
+        end_name="강남역",
+        end_lat=37.4979,
+        end_lng=127.0276,
+        total_distance_m=12500,
+        total_duration_s=1800,
+        path_data=[],
+    )
+
+
+def _session_factory() -> MagicMock:
+    session = MagicMock()
+    session.__enter__.return_value = session
+    return MagicMock(return_value=session)
+
+
+@pytest.fixture
+def batches() -> Iterator[list[list[RouteHistory]]]:
+    """upsert_many 호출마다 배치를 기록"""
+    recorded: list[list[RouteHistory]] = []
+    with patch(
+        "src.modules.routes._writer._repository.upsert_many",
+        side_effect=lambda _session, rows: recorded.append(list(rows)),
+    ):
+        yield recorded
+
+
+class TestRouteHistoryWriter:
+    """RouteHistoryWriter 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_flush_on_stop(self, batches: list[list[RouteHistory]]) -> None:
+        """종료 시 큐에 남은 기록을 한 배치로 저장"""
+        writer = RouteHistoryWriter(
+            session_factory=_session_factory(),
+            batch_size=10,
+            flush_interval_s=60,
+        )
+        await writer.start()
+
+        routes = [_route() for _ in range(3)]
+        for route in routes:
+            assert writer.submit(route)
+
+        await writer.stop()
+
+        assert batches == [routes]
+        assert not writer.is_running
+
+    @pytest.mark.asyncio
+    async def test_batch_size_limit(self, batches: list[list[RouteHistory]]) -> None:
+        """batch_size 단위로 나누어 저장"""
+        writer = RouteHistoryWriter(
+            session_factory=_session_factory(),
+            batch_size=2,
+            flush_interval_s=60,
+        )
+        await writer.start()
+        for _ in range(5):
+            writer.submit(_route())
+        await writer.stop()
+
+        assert [len(b) for b in batches] == [2, 2, 1]
+
+    @pytest.mark.asyncio
+    async def test_submit_rejected_when_full(self) -> None:
+        """큐가 가득 차면 submit 실패"""
+        writer = RouteHistoryWriter(
+            session_factory=_session_factory(),
+            max_queue_size=1,
+            flush_interval_s=60,
+        )
+        await writer.start()
+        # 백그라운드 태스크가 아직 소비하지 않은 상태에서 두 번 적재
+        assert writer.submit(_route())
+        assert not writer.submit(_route())
+        await writer.stop()
+
+    def test_submit_rejected_when_not_running(self) -> None:
+        """시작 전에는 submit 실패 (호출자가 동기 저장)"""
+        writer = RouteHistoryWriter(session_factory=_session_factory())
+        assert not writer.submit(_route())
+
+    @pytest.mark.asyncio
+    async def test_retry_then_success(self) -> None:
+        """일시적 저장 실패는 재시도로 배치 그대로 저장"""
+        calls: list[int] = []
+
+        def flaky(_session, rows) -> None:
+            calls.append(len(rows))
+            if len(calls) == 1:
+                raise RuntimeError("connection reset")
+
+        writer = RouteHistoryWriter(
+            session_factory=_session_factory(), flush_interval_s=60, retry_backoff_s=0
+        )
+        with patch("src.modules.routes._writer._repository.upsert_many", flaky):
+            await writer.start()
+            writer.submit(_route())
+            writer.submit(_route())
+            await writer.stop()
+
+        assert calls == [2, 2]
+
+    @pytest.mark.asyncio
+    async def test_per_row_fallback_keeps_good_rows(self) -> None:
+        """재시도까지 실패하면 행 단위 저장 (실패 행만 버림)"""
+        bad, good = _route(), _route()
+        saved: list[RouteHistory] = []
+
+        def upsert(_session, rows) -> None:
+            if bad in rows:
+                raise RuntimeError("bad row")
+            saved.extend(rows)
+
+        writer = RouteHistoryWriter(
+            session_factory=_session_factory(),
+            flush_interval_s=60,
+            max_retries=1,
+            retry_backoff_s=0,
+        )
+        with patch("src.modules.routes._writer._repository.upsert_many", upsert):
+            await writer.start()
+            writer.submit(bad)
+            writer.submit(good)
+            await writer.stop()
+
+        assert saved == [good]
+        assert writer.pending(bad.id, bad.profile_id) is None
+
+    @pytest.mark.asyncio
+    async def test_queue_drains_during_retry(self) -> None:
+        """재시도 backoff 중에도 다음 배치를 계속 수집/저장"""
+        failing, later = _route(), _route()
+        saved: list[RouteHistory] = []
+        failed: list[RouteHistory] = []
+
+        def upsert(_session, rows) -> None:
+            if failing in rows and not failed:
+                failed.append(failing)
+                raise RuntimeError("connection reset")
+            saved.extend(rows)
+
+        writer = RouteHistoryWriter(
+            session_factory=_session_factory(),
+            batch_size=1,
+            flush_interval_s=60,
+            retry_backoff_s=0.5,
+        )
+        with patch("src.modules.routes._writer._repository.upsert_many", upsert):
+            await writer.start()
+            writer.submit(failing)
+            while not failed:
+                await asyncio.sleep(0.01)
+
+            writer.submit(later)
+            for _ in range(100):
+                if saved:
+                    break
+                await asyncio.sleep(0.01)
+
+            # 첫 배치는 아직 backoff 중, 뒤 배치는 이미 저장
+            assert saved == [later]
+            assert writer.pending(failing.id, failing.profile_id) is failing
+
+            # 종료 시 재시도 완료까지 대기
+            await writer.stop()
+
+        assert saved == [later, failing]
+        assert writer.pending(failing.id, failing.profile_id) is None
+
+    @pytest.mark.asyncio
+    async def test_pending_until_flushed(
+        self, batches: list[list[RouteHistory]]
+    ) -> None:
+        """저장 전 기록은 본인에게만 pending()으로 조회"""
+        writer = RouteHistoryWriter(
+            session_factory=_session_factory(), flush_interval_s=60
+        )
+        await writer.start()
+        route = _route()
+        writer.submit(route)
+
+        assert writer.pending(route.id, route.profile_id) is route
+        assert writer.pending(route.id, uuid4()) is None
+
+        await writer.stop()
+        assert writer.pending(route.id, route.profile_id) is None
+
+    @pytest.mark.asyncio
+    async def test_find_pending_id(self, batches: list[list[RouteHistory]]) -> None:
+        """since 이후 검색된 같은 경로의 저장 대기 기록 중 가장 최근 ID"""
+        writer = RouteHistoryWriter(
+            session_factory=_session_factory(), flush_interval_s=60
+        )
+        await writer.start()
+        now = datetime(2026, 10, 19, 9, 0, tzinfo=UTC)
+        old, recent = _route(), _route()
+        for route, searched_at in ((old, now - timedelta(hours=1)), (recent, now)):
+            route.profile_id = old.profile_id
+            route.route_key = "key"
+            route.last_searched_at = searched_at
+            writer.submit(route)
+
+        since = now - timedelta(hours=2)
+        assert writer.find_pending_id(old.profile_id, "key", since) == recent.id
+        assert writer.find_pending_id(old.profile_id, "other", since) is None
+        assert writer.find_pending_id(uuid4(), "key", since) is None
+        assert writer.find_pending_id(old.profile_id, "key", now) == recent.id
+
+        await writer.stop()
+        assert writer.find_pending_id(old.profile_id, "key", since) is None
@@ -1,11 +1,15 @@
 """translations 도메인 테스트 픽스처"""
 
+from collections.abc import Callable, Iterator
+from contextlib import AbstractContextManager, contextmanager
 from datetime import UTC, datetime
 from uuid import uuid4
 
 import pytest
+from sqlalchemy import event
 from sqlmodel import Session
 
+from src.external.supabase.fakes import MemoryStorageProvider
 from src.modules.profiles import Profile
 from src.modules.translations._models import (
     Translation,
@@ -21,6 +25,76 @@ def _utcnow() -> datetime:
     return datetime.now(UTC)
 
 
+@pytest.fixture(autouse=True)
+def _clear_translation_memory() -> Iterator[None]:
+    """테스트 간 프로세스 내 번역 메모리 격리"""
+    from src.modules.translations._translation_memory import get_translation_memory
+
+    get_translation_memory().clear()
+    yield
+    get_translation_memory().clear()
+
+
+@pytest.fixture(autouse=True)
+def _clear_audio_memory() -> Iterator[None]:
+    """테스트 간 프로세스 내 음성 캐시 격리"""
+    from src.modules.translations._audio_cache import get_audio_memory
+
+    get_audio_memory().clear()
+    yield
+    get_audio_memory().clear()
+
+
+@pytest.fixture(autouse=True)
+def _clear_phrase_index() -> Iterator[None]:
+    """테스트별 추천 문장이 다르므로 색인 격리"""
+    from src.modules.translations._phrase_index import get_phrase_index
+
+    get_phrase_index().invalidate()
+    yield
+    get_phrase_index().invalidate()
+
+
+@pytest.fixture
+def memory_storage() -> MemoryStorageProvider:
+    """메모리 Supabase Storage (음성 캐시 스토리지 계층용)"""
+    return MemoryStorageProvider()
+
+
+@pytest.fixture(autouse=True)
+def _clear_category_catalog() -> Iterator[None]:
+    """테스트별 카테고리 seed가 다르므로 카탈로그 격리"""
+    from src.modules.translations._category_catalog import get_category_catalog
+
+    get_category_catalog().invalidate()
+    yield
+    get_category_catalog().invalidate()
+
+
+@pytest.fixture
+def count_queries(
+    session: Session,
+) -> Callable[[], AbstractContextManager[list[str]]]:
+    """블록 안에서 실행된 COUNT 문 기록"""
+
+    @contextmanager
+    def record_counts() -> Iterator[list[str]]:
+        statements: list[str] = []
+
+        def record(_conn, _cursor, statement, *_args) -> None:
+            if "count(" in statement.lower():
+                statements.append(statement)
+
+        engine = session.get_bind().engine
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            yield statements
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+    return record_counts
+
+
 # ─────────────────────────────────────────────────
 # Category Fixtures
 # ─────────────────────────────────────────────────
@@ -47,7 +121,9 @@ def seeded_categories(
     )
     subs = list(
         session.exec(
-            select(TranslationSubCategory).order_by(TranslationSubCategory.display_order)
+            select(TranslationSubCategory).order_by(
+                TranslationSubCategory.display_order
+            )
         ).all()
     )
     mappings = list(session.exec(select(TranslationCategoryMapping)).all())
@@ -0,0 +1,159 @@
+"""번역 음성 캐시 테스트 (메모리 → 디스크 → 스토리지 → 합성)
+
+- 키: 텍스트/언어/목소리/형식/버전별로 다르고 공백 차이는 무시
+- 반복 문장은 합성 없이 기존 오디오 + 서명 URL
+- 새 프로세스(빈 메모리)는 디스크/스토리지에서 재사용
+- 스토리지 장애는 캐시 미스로 처리 (합성 결과는 반환)
+"""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src.core.metrics import get_metrics
+from src.external.google.fakes import FAKE_AUDIO_HEADER, FakeTextToSpeechProvider
+from src.external.supabase import StorageError
+from src.external.supabase.fakes import MemoryStorageProvider
+from src.modules.translations._audio_cache import AudioCache, AudioMemory, audio_key
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _cache(
+    tts: FakeTextToSpeechProvider,
+    *,
+    storage: MemoryStorageProvider | None = None,
+    disk_dir: Path | None = None,
+) -> AudioCache:
+    return AudioCache(
+        tts,
+        memory=AudioMemory(),
+        storage=storage,
+        disk_dir=str(disk_dir) if disk_dir else None,
+        url_expires_in=3600,
+    )
+
+
+@pytest.fixture(autouse=True)
+def _clear_metrics() -> None:
+    get_metrics().clear()
+
+
+class TestAudioKey:
+    """음성 캐시 키 테스트"""
+
+    def test_key_components(self) -> None:
+        """목소리/형식/언어/버전이 다르면 다른 키, 공백 차이는 같은 키"""
+        base = {"voice": "en-US:NEUTRAL", "audio_format": "mp3", "version": "1"}
+        key = audio_key("Hello there.", "en", **base)
+
+        assert audio_key("  Hello   there. ", "en", **base) == key
+        assert audio_key("hello there.", "en", **base) != key
+        assert audio_key("Hello there.", "ko", **base) != key
+        assert (
+            audio_key("Hello there.", "en", **{**base, "voice": "en-US:FEMALE"}) != key
+        )
+        assert audio_key("Hello there.", "en", **{**base, "audio_format": "ogg"}) != key
+        assert audio_key("Hello there.", "en", **{**base, "version": "2"}) != key
+
+
+class TestAudioCache:
+    """AudioCache 계층 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_repeat_hits_memory(self) -> None:
+        """두 번째 요청은 합성/스토리지 호출 없이 같은 오디오와 URL"""
+        tts = FakeTextToSpeechProvider()
+        storage = MemoryStorageProvider()
+        cache = _cache(tts, storage=storage)
+
+        first = await cache.synthesize("Water, please.", "en")
+        calls = len(storage.calls)
+        second = await cache.synthesize("Water, please.", "en")
+
+        assert first.source == "tts"
+        assert second.source == "memory"
+        assert tts.calls == ["Water, please."]
+        assert second.audio == first.audio == FAKE_AUDIO_HEADER + b"Water, please."
+        assert second.url == first.url is not None
+        assert len(storage.calls) == calls
+        assert get_metrics().counter("translation.audio_cache.miss") == 1
+        assert get_metrics().counter("translation.audio_cache.memory") == 1
+
+    @pytest.mark.asyncio
+    async def test_new_process_hits_storage(self) -> None:
+        """빈 메모리(다른 인스턴스) -> 스토리지 객체 재사용, 합성 없음"""
+        storage = MemoryStorageProvider()
+        await _cache(FakeTextToSpeechProvider(), storage=storage).synthesize(
+            "Water, please.", "en"
+        )
+
+        tts = FakeTextToSpeechProvider()
+        cached = await _cache(tts, storage=storage).synthesize("Water, please.", "en")
+
+        assert cached.source == "storage"
+        assert tts.calls == []
+        assert cached.url is not None
+        assert cached.url.startswith(f"https://storage.test/sign/tts/{cached.key[:2]}/")
+
+    @pytest.mark.asyncio
+    async def test_disk_tier(self, tmp_path: Path) -> None:
+        """스토리지 없이도 디스크에서 재사용 (URL 없음)"""
+        await _cache(FakeTextToSpeechProvider(), disk_dir=tmp_path).synthesize(
+            "Water, please.", "en"
+        )
+
+        tts = FakeTextToSpeechProvider()
+        cached = await _cache(tts, disk_dir=tmp_path).synthesize("Water, please.", "en")
+
+        assert cached.source == "disk"
+        assert cached.url is None
+        assert tts.calls == []
+        assert list(tmp_path.iterdir()) == [tmp_path / f"{cached.key}.mp3"]
+
+    @pytest.mark.asyncio
+    async def test_storage_failure_is_miss(self) -> None:
+        """스토리지 업로드 실패 -> 합성 결과는 반환, URL 없음"""
+        storage = MemoryStorageProvider()
+        tts = FakeTextToSpeechProvider()
+
+        with patch.object(storage, "upload", side_effect=StorageError("down")):
+            cached = await _cache(tts, storage=storage).synthesize("Hi.", "en")
+
+        assert cached.source == "tts"
+        assert cached.audio == FAKE_AUDIO_HEADER + b"Hi."
+        assert cached.url is None
+
+
+class TestAudioMemory:
+    """AudioMemory 테스트"""
+
+    def test_evicts_by_total_bytes(self) -> None:
+        """바이트 총량 초과 시 가장 오래 사용하지 않은 항목 제거"""
+        memory = AudioMemory(max_bytes=10)
+        memory.set("a", b"1234")
+        memory.set("b", b"1234")
+        memory.get("a")
+        memory.set("c", b"1234")
+
+        assert memory.get("b") is None
+        assert memory.get("a") == b"1234"
+        assert memory.size == 8
+
+    def test_url_refreshed_before_expiry(self) -> None:
+        """만료 5분 전부터는 서명 URL 재발급 대상"""
+        clock = _Clock()
+        memory = AudioMemory(clock=clock)
+        memory.set_url("a", "https://signed", expires_in=3600)
+
+        clock.now = 3600 - 301
+        assert memory.get_url("a") == "https://signed"
+        clock.now = 3600 - 299
+        assert memory.get_url("a") is None
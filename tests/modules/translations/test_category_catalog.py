@@ -0,0 +1,163 @@
+"""번역 카테고리 카탈로그 테스트
+
+- 카탈로그 적재 후 컨텍스트 번역/스레드 생성은 카테고리 쿼리 없음
+- 미리 렌더링된 컨텍스트 문자열
+- 버전 변경/TTL 경과 시 재적재
+"""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlmodel import Session
+
+from src.core.config import settings
+from src.modules.profiles import Profile
+from src.modules.translations._category_catalog import (
+    CategoryCatalogCache,
+    get_category_catalog,
+)
+from src.modules.translations._repository import CategoryRepository
+
+_CATEGORY_TABLES = (
+    "translation_primary_categories",
+    "translation_sub_categories",
+    "translation_category_mappings",
+    "translation_context_prompts",
+)
+
+
+@contextmanager
+def _category_queries(session: Session) -> Iterator[list[str]]:
+    """카테고리 테이블 SELECT 문 기록"""
+    statements: list[str] = []
+
+    def record(_conn, _cursor, statement, *_args) -> None:
+        if statement.startswith("SELECT") and any(
+            table in statement for table in _CATEGORY_TABLES
+        ):
+            statements.append(statement)
+
+    engine = session.get_bind().engine
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+
+class TestCategoryCatalogUsage:
+    """카탈로그 적용 테스트"""
+
+    def test_contextual_translation_no_category_queries(
+        self,
+        auth_client: TestClient,
+        session: Session,
+        test_profile: Profile,
+        seeded_context_prompts: list,
+    ) -> None:
+        """적재 후 컨텍스트 번역은 카테고리 쿼리 없음"""
+        get_category_catalog().refresh(CategoryRepository(session))
+
+        with (
+            patch(
+                "src.modules.translations._translation_service.TranslationService.translate",
+                return_value="Kimchi stew, please",
+            ) as mock_translate,
+            _category_queries(session) as statements,
+        ):
+            response = auth_client.post(
+                "/translate/text",
+                json={
+                    "source_text": "김치찌개 주세요",
+                    "source_lang": "ko",
+                    "target_lang": "en",
+                    "context_primary": "FD6",
+                    "context_sub": "ordering",
+                },
+            )
+
+        assert response.status_code == 200
+        assert statements == []
+        context = mock_translate.call_args.args[3]
+        assert context.startswith("This user wants ")
+        assert context.endswith("This is a situation of ordering food at a restaurant.")
+
+    def test_thread_create_no_category_queries(
+        self,
+        auth_client: TestClient,
+        session: Session,
+        test_profile: Profile,
+        seeded_categories: tuple,
+    ) -> None:
+        """적재 후 스레드 생성 조합 검증은 카테고리 쿼리 없음"""
+        get_category_catalog().refresh(CategoryRepository(session))
+
+        with _category_queries(session) as statements:
+            valid = auth_client.post(
+                "/translation/threads",
+                json={"primary_category": "FD6", "sub_category": "ordering"},
+            )
+            invalid = auth_client.post(
+                "/translation/threads",
+                json={"primary_category": "FD6", "sub_category": "no_such_sub"},
+            )
+
+        assert valid.status_code == 201
+        assert invalid.status_code == 400
+        assert statements == []
+
+
+class TestCategoryCatalogCache:
+    """CategoryCatalogCache 테스트"""
+
+    def test_prerendered_context(
+        self,
+        session: Session,
+        seeded_context_prompts: list,
+    ) -> None:
+        """언어별 컨텍스트 미리 렌더링, 프롬프트 없는 조합은 상황 설명만"""
+        catalog = CategoryCatalogCache().get(CategoryRepository(session))
+
+        assert catalog.context("FD6", "ordering", "ko").endswith(
+            "음식점에서 음식을 주문하는 상황입니다."
+        )
+        assert catalog.context("FD6", "ordering", "ja") == catalog.context(
+            "FD6", "ordering", "en"
+        )
+        assert catalog.context("XX", "yy", "en") == "This user wants yy at a XX."
+
+    def test_version_bump_reloads(
+        self,
+        session: Session,
+        seeded_categories: tuple,
+    ) -> None:
+        """TRANSLATION_CATALOG_VERSION 변경 시 재적재"""
+        cache = CategoryCatalogCache()
+        repository = CategoryRepository(session)
+        first = cache.get(repository)
+
+        assert cache.get(repository) is first
+        with patch.object(settings, "TRANSLATION_CATALOG_VERSION", "2"):
+            second = cache.get(repository)
+
+        assert second is not first
+        assert second.version == "2"
+
+    def test_ttl_reloads(
+        self,
+        session: Session,
+        seeded_categories: tuple,
+    ) -> None:
+        """TTL 경과 시 재적재"""
+        now = [0.0]
+        cache = CategoryCatalogCache(ttl_s=60, clock=lambda: now[0])
+        repository = CategoryRepository(session)
+        first = cache.get(repository)
+
+        now[0] = 59.0
+        assert cache.get(repository) is first
+        now[0] = 60.0
+        assert cache.get(repository) is not first
@@ -0,0 +1,153 @@
+"""목록 개수 카운터 테스트
+
+- 번역 생성/삭제, 스레드 생성/삭제 시 같은 트랜잭션에서 카운터 증감
+- 카운터가 있으면 목록 total을 COUNT 없이 조회
+- 카운터가 없으면 정확한 COUNT로 대체 (첫 증가 시 현재 행 수로 생성)
+"""
+
+from uuid import UUID
+
+from fastapi.testclient import TestClient
+from sqlmodel import Session, select
+
+from src.modules.profiles import Profile
+from src.modules.translations._models import (
+    Translation,
+    TranslationCounter,
+    TranslationThread,
+)
+
+
+def _counters(session: Session, profile_id: UUID) -> dict[str, int]:
+    rows = session.exec(
+        select(TranslationCounter.name, TranslationCounter.value).where(
+            TranslationCounter.profile_id == profile_id
+        )
+    ).all()
+    return dict(rows)
+
+
+def _translate(client: TestClient, text: str) -> str:
+    response = client.post(
+        "/translate/text",
+        json={"source_text": text, "source_lang": "ko", "target_lang": "en"},
+    )
+    assert response.status_code == 200
+    return response.json()["data"]["id"]
+
+
+class TestTranslationCounters:
+    """번역 기록 카운터 테스트"""
+
+    def test_create_and_delete(
+        self,
+        auth_client: TestClient,
+        session: Session,
+        test_profile: Profile,
+    ) -> None:
+        """생성 시 증가, 삭제 시 감소 (전체 + 유형별)"""
+        first = _translate(auth_client, "안녕하세요")
+        _translate(auth_client, "감사합니다")
+
+        assert _counters(session, test_profile.id) == {
+            "translations": 2,
+            "translations.text": 2,
+        }
+
+        auth_client.delete(f"/translations/{first}")
+
+        assert _counters(session, test_profile.id)["translations"] == 1
+
+    def test_list_total_without_count(
+        self,
+        auth_client: TestClient,
+        session: Session,
+        test_profile: Profile,
+        count_queries,
+    ) -> None:
+        """카운터가 있으면 page/cursor 모드 total 모두 COUNT 없음"""
+        for i in range(3):
+            _translate(auth_client, f"문장 {i}")
+
+        with count_queries() as statements:
+            page = auth_client.get("/translations?limit=2").json()["data"]
+            cursor = page["pagination"]["next_cursor"]
+            by_type = auth_client.get("/translations?type=text").json()["data"]
+            after = auth_client.get(
+                f"/translations?limit=2&cursor={cursor}&include_total=true"
+            ).json()["data"]
+
+        assert statements == []
+        assert page["pagination"]["total"] == 3
+        assert by_type["pagination"]["total"] == 3
+        assert after["pagination"]["total"] == 3
+
+    def test_counter_seeded_from_existing_rows(
+        self,
+        auth_client: TestClient,
+        session: Session,
+        count_queries,
+        created_translation: Translation,
+        voice_translation: Translation,
+    ) -> None:
+        """카운터 없던 사용자는 COUNT, 첫 생성 시 현재 행 수로 카운터 생성"""
+        with count_queries() as statements:
+            total = auth_client.get("/translations").json()["data"]["pagination"]
+        assert total["total"] == 2
+        assert statements
+
+        _translate(auth_client, "안녕히 가세요")
+
+        assert _counters(session, created_translation.profile_id) == {
+            "translations": 3,
+            "translations.text": 2,
+        }
+        voice = auth_client.get("/translations?type=voice").json()["data"]
+        assert voice["pagination"]["total"] == 1
+
+    def test_mission_filter_counts(
+        self,
+        auth_client: TestClient,
+        session: Session,
+        test_profile: Profile,
+        created_translation: Translation,
+    ) -> None:
+        """미션 필터는 카운터 대상 아님 -> COUNT (approximate도 SQLite는 COUNT)"""
+        mission_id = UUID(int=1)
+        created_translation.mission_progress_id = mission_id
+        session.add(created_translation)
+        session.commit()
+
+        response = auth_client.get(
+            f"/translations?mission_progress_id={mission_id}&approximate_total=true"
+        )
+
+        assert response.json()["data"]["pagination"]["total"] == 1
+
+
+class TestThreadCounters:
+    """스레드 카운터 테스트"""
+
+    def test_create_and_soft_delete(
+        self,
+        auth_client: TestClient,
+        session: Session,
+        test_profile: Profile,
+        count_queries,
+        created_thread: TranslationThread,
+    ) -> None:
+        """생성 시 증가 (기존 스레드 포함), 소프트 삭제 시 감소"""
+        response = auth_client.post(
+            "/translation/threads",
+            json={"primary_category": "FD6", "sub_category": "ordering"},
+        )
+        assert response.status_code == 201
+        assert _counters(session, test_profile.id) == {"threads": 2}
+
+        auth_client.delete(f"/translation/threads/{created_thread.id}")
+
+        assert _counters(session, test_profile.id) == {"threads": 1}
+        with count_queries() as statements:
+            listed = auth_client.get("/translation/threads").json()["data"]
+        assert statements == []
+        assert listed["pagination"]["total"] == 1
@@ -0,0 +1,219 @@
+"""키셋(커서) 페이지네이션 테스트
+
+- /translations, /translation/threads, 스레드 상세의 cursor 모드
+- 같은 created_at(묶음 저장) 항목도 id 순서로 누락/중복 없이 순회
+- 커서 모드는 include_total=true일 때만 COUNT
+- 잘못된 커서 -> 400
+- page 모드 호환 (기존 필드 유지 + next_cursor/has_more)
+"""
+
+from datetime import UTC, datetime, timedelta
+from uuid import UUID, uuid4
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from src.modules.profiles import Profile
+from src.modules.translations._cursor import decode_cursor, encode_cursor
+from src.modules.translations._exceptions import InvalidCursorError
+from src.modules.translations._models import Translation, TranslationThread
+
+_BASE = datetime(2026, 1, 27, 10, 0, tzinfo=UTC)
+
+
+def _walk(client: TestClient, url: str, *, detail: bool = False) -> list[str]:
+    """next_cursor를 따라 끝까지 순회한 id 목록 (첫 요청은 커서 없음)"""
+    ids: list[str] = []
+    cursor: str | None = None
+    while True:
+        params = {"cursor": cursor} if cursor else {}
+        response = client.get(url, params=params)
+        assert response.status_code == 200
+        data = response.json()["data"]
+        if detail:
+            ids += [t["id"] for t in data["translations"]]
+            cursor = data["next_cursor"]
+        else:
+            ids += [t["id"] for t in data["items"]]
+            cursor = data["pagination"]["next_cursor"]
+        if cursor is None:
+            return ids
+
+
+@pytest.fixture
+def translations(session: Session, test_profile: Profile) -> list[Translation]:
+    """번역 기록 7개 (3개는 같은 created_at)"""
+    rows = [
+        Translation(
+            id=uuid4(),
+            profile_id=test_profile.id,
+            source_text=f"문장 {i}",
+            translated_text=f"sentence {i}",
+            source_lang="ko",
+            target_lang="en",
+            translation_type="text",
+            created_at=_BASE + timedelta(minutes=min(i, 3)),
+        )
+        for i in range(7)
+    ]
+    session.add_all(rows)
+    session.commit()
+    return rows
+
+
+def _newest_first(rows: list[Translation]) -> list[str]:
+    ordered = sorted(rows, key=lambda t: (t.created_at, t.id), reverse=True)
+    return [str(t.id) for t in ordered]
+
+
+class TestCursor:
+    """커서 인코딩 테스트"""
+
+    def test_round_trip(self) -> None:
+        """인코딩 -> 디코딩 복원"""
+        item_id = uuid4()
+
+        assert decode_cursor(encode_cursor(_BASE, item_id)) == (_BASE, item_id)
+
+    @pytest.mark.parametrize("cursor", ["not-a-cursor", "W10", "WyJ4IiwgInkiXQ"])
+    def test_invalid(self, cursor: str) -> None:
+        """형식 오류 -> InvalidCursorError"""
+        with pytest.raises(InvalidCursorError):
+            decode_cursor(cursor)
+
+
+class TestTranslationHistoryCursor:
+    """GET /translations cursor 모드 테스트"""
+
+    def test_walk_covers_ties(
+        self,
+        auth_client: TestClient,
+        test_profile: Profile,
+        translations: list[Translation],
+    ) -> None:
+        """같은 created_at 포함 전체를 최신순으로 누락/중복 없이 순회"""
+        ids = _walk(auth_client, "/translations?page=1&limit=2")
+
+        assert ids == _newest_first(translations)
+
+    def test_cursor_mode_skips_count(
+        self,
+        auth_client: TestClient,
+        session: Session,
+        test_profile: Profile,
+        count_queries,
+        translations: list[Translation],
+    ) -> None:
+        """cursor 모드는 COUNT 없음, include_total=true일 때만 total 포함"""
+        first = auth_client.get("/translations?limit=2").json()["data"]
+        cursor = first["pagination"]["next_cursor"]
+
+        with count_queries() as statements:
+            response = auth_client.get(f"/translations?limit=2&cursor={cursor}")
+        pagination = response.json()["data"]["pagination"]
+
+        assert statements == []
+        assert "total" not in pagination
+        assert "page" not in pagination
+        assert pagination["has_more"] is True
+
+        response = auth_client.get(
+            f"/translations?limit=2&cursor={cursor}&include_total=true"
+        )
+        assert response.json()["data"]["pagination"]["total"] == len(translations)
+
+    def test_page_mode_compatible(
+        self,
+        auth_client: TestClient,
+        test_profile: Profile,
+        translations: list[Translation],
+    ) -> None:
+        """page 모드는 기존 필드 유지, 마지막 페이지는 next_cursor 없음"""
+        response = auth_client.get("/translations?page=4&limit=2")
+
+        pagination = response.json()["data"]["pagination"]
+        assert pagination["page"] == 4
+        assert pagination["total"] == len(translations)
+        assert pagination["total_pages"] == 4
+        assert pagination["has_more"] is False
+        assert pagination["next_cursor"] is None
+
+    def test_invalid_cursor(
+        self,
+        auth_client: TestClient,
+        test_profile: Profile,
+    ) -> None:
+        """잘못된 커서 -> 400"""
+        response = auth_client.get("/translations?cursor=garbage")
+
+        assert response.status_code == 400
+        assert response.json()["status"] == "VALIDATION_FAILED"
+
+
+class TestThreadCursor:
+    """스레드 목록/상세 cursor 모드 테스트"""
+
+    def test_thread_list_walk(
+        self,
+        auth_client: TestClient,
+        session: Session,
+        test_profile: Profile,
+        created_thread: TranslationThread,
+    ) -> None:
+        """스레드 목록 cursor 순회 (같은 created_at 포함)"""
+        threads = [
+            TranslationThread(
+                id=uuid4(),
+                profile_id=test_profile.id,
+                primary_category="FD6",
+                sub_category="ordering",
+                created_at=_BASE,
+            )
+            for _ in range(4)
+        ]
+        session.add_all(threads)
+        session.commit()
+        expected = sorted(
+            [*threads, created_thread],
+            key=lambda t: (t.created_at.replace(tzinfo=None), t.id),
+            reverse=True,
+        )
+
+        ids = _walk(auth_client, "/translation/threads?page=1&limit=2")
+
+        assert ids == [str(t.id) for t in expected]
+
+    def test_thread_detail_pages(
+        self,
+        auth_client: TestClient,
+        session: Session,
+        test_profile: Profile,
+        created_thread: TranslationThread,
+    ) -> None:
+        """스레드 상세 번역 기록을 대화 순서로 limit개씩 조회"""
+        rows = [
+            Translation(
+                id=uuid4(),
+                profile_id=test_profile.id,
+                thread_id=created_thread.id,
+                source_text=f"문장 {i}",
+                translated_text=f"sentence {i}",
+                source_lang="ko",
+                target_lang="en",
+                translation_type="text",
+                created_at=_BASE + timedelta(minutes=i // 2),
+            )
+            for i in range(5)
+        ]
+        session.add_all(rows)
+        session.commit()
+        expected = sorted(rows, key=lambda t: (t.created_at, t.id))
+
+        ids = _walk(
+            auth_client,
+            f"/translation/threads/{created_thread.id}?limit=2",
+            detail=True,
+        )
+
+        assert [UUID(i) for i in ids] == [t.id for t in expected]
@@ -0,0 +1,126 @@
+"""Vertex AI 번역 마이크로 배칭 테스트
+
+- 동시 단건 번역은 (언어쌍, 컨텍스트)별로 묶음 번역 한 번, 결과는 요청별로 전달
+- 최대 수 도달 시 대기 없이 전송, 중복 원문은 한 번만 번역
+- 묶음 응답 파싱 실패 시 항목별 호출로 전환, 그 외 에러는 모든 요청에 전달
+"""
+
+import asyncio
+
+import pytest
+
+from src.external.google import VertexAIError, VertexAIResponseFormatError
+from src.external.google.batching import MicroBatchingVertexAIProvider
+from src.external.google.fakes import FakeAsyncVertexAIProvider
+from src.modules.translations._translation_service import TranslationService
+
+
+class _RecordingProvider(FakeAsyncVertexAIProvider):
+    """묶음 호출 기록 (batch_error가 있으면 묶음 호출 시 발생)"""
+
+    def __init__(self, batch_error: Exception | None = None) -> None:
+        super().__init__()
+        self.batch_error = batch_error
+        self.batches: list[tuple[list[str], str, str | None]] = []
+
+    async def translate_batch(
+        self,
+        texts: list[str],
+        source_lang: str,
+        target_lang: str,
+        context: str | None = None,
+    ) -> list[str]:
+        self.batches.append((texts, target_lang, context))
+        if self.batch_error is not None:
+            raise self.batch_error
+        return [f"[{target_lang}] {text}" for text in texts]
+
+
+class TestMicroBatchingVertexAIProvider:
+    """MicroBatchingVertexAIProvider 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_groups_by_pair_and_context(self) -> None:
+        """같은 언어쌍/컨텍스트끼리 한 번씩 묶음 호출, 결과는 요청 순서대로"""
+        provider = _RecordingProvider()
+        batcher = MicroBatchingVertexAIProvider(provider, window_s=0.01)
+
+        results = await asyncio.gather(
+            batcher.translate("물", "ko", "en"),
+            batcher.translate("밥", "ko", "en"),
+            batcher.translate("water", "en", "ko"),
+            batcher.translate("메뉴", "ko", "en", "restaurant"),
+            batcher.translate("물", "ko", "en"),
+        )
+
+        assert results == [
+            "[en] 물",
+            "[en] 밥",
+            "[ko] water",
+            "[en] 메뉴",
+            "[en] 물",
+        ]
+        assert provider.batches == [(["물", "밥"], "en", None)]
+        # 혼자인 묶음은 단건 호출
+        assert sorted(provider.calls) == ["water", "메뉴"]
+
+    @pytest.mark.asyncio
+    async def test_max_items_sends_immediately(self) -> None:
+        """최대 수에 도달하면 모으는 시간을 기다리지 않음"""
+        provider = _RecordingProvider()
+        batcher = MicroBatchingVertexAIProvider(provider, window_s=60, max_items=2)
+
+        results = await asyncio.wait_for(
+            asyncio.gather(
+                batcher.translate("물", "ko", "en"),
+                batcher.translate("밥", "ko", "en"),
+            ),
+            timeout=1,
+        )
+
+        assert results == ["[en] 물", "[en] 밥"]
+        assert provider.batches == [(["물", "밥"], "en", None)]
+
+    @pytest.mark.asyncio
+    async def test_parse_error_falls_back_to_single_calls(self) -> None:
+        """묶음 응답 파싱 실패 -> 항목별 단건 번역"""
+        provider = _RecordingProvider(VertexAIResponseFormatError("bad json"))
+        batcher = MicroBatchingVertexAIProvider(provider, window_s=0.01)
+
+        results = await asyncio.gather(
+            batcher.translate("물", "ko", "en"),
+            batcher.translate("밥", "ko", "en"),
+        )
+
+        assert results == ["[en] 물", "[en] 밥"]
+        assert len(provider.batches) == 1
+        assert sorted(provider.calls) == ["물", "밥"]
+
+    @pytest.mark.asyncio
+    async def test_provider_error_reaches_every_request(self) -> None:
+        """파싱 외 에러는 묶음의 모든 요청에 전달"""
+        provider = _RecordingProvider(VertexAIError("quota"))
+        batcher = MicroBatchingVertexAIProvider(provider, window_s=0.01)
+
+        results = await asyncio.gather(
+            batcher.translate("물", "ko", "en"),
+            batcher.translate("밥", "ko", "en"),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, VertexAIError) for r in results)
+        assert provider.calls == []
+
+    @pytest.mark.asyncio
+    async def test_batch_fallback_not_rebatched(self) -> None:
+        """묶음 번역 파싱 실패 폴백은 다시 묶지 않고 단건 호출"""
+        provider = _RecordingProvider(VertexAIResponseFormatError("bad json"))
+        service = TranslationService(
+            provider=MicroBatchingVertexAIProvider(provider, window_s=0.01)
+        )
+
+        results = await service.translate_batch(["a", "b", "c"], "en", "ko")
+
+        assert results == ["[ko] a", "[ko] b", "[ko] c"]
+        assert provider.batches == [(["a", "b", "c"], "ko", None)]
+        assert sorted(provider.calls) == ["a", "b", "c"]
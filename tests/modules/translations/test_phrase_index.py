@@ -0,0 +1,163 @@
+"""추천 문장 색인 테스트
+
+POST /translate/text + PhraseIndexCache
+
+- 원문이 활성 추천 문장과 (정규화 후) 같으면 Vertex AI 미호출, 문장 행의 번역 사용
+- 비활성 문장/다른 문장은 기존 번역 경로
+- TTL 경과 후 문장 변경 반영, 번역이 여러 개인 원문은 색인 제외
+"""
+
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from src.core.enums import PhraseCategory
+from src.core.metrics import get_metrics
+from src.modules.phrases import Phrase
+from src.modules.profiles import Profile
+from src.modules.translations._phrase_index import (
+    HIT_METRIC,
+    MISS_METRIC,
+    PhraseIndex,
+    PhraseIndexCache,
+)
+
+_TRANSLATE = (
+    "src.modules.translations._translation_service.TranslationService.translate"
+)
+
+
+def _phrase(text_ko: str, text_en: str, *, is_active: bool = True) -> Phrase:
+    return Phrase(
+        id=uuid4(),
+        text_ko=text_ko,
+        text_en=text_en,
+        category=PhraseCategory.REQUEST,
+        is_active=is_active,
+    )
+
+
+class _Repository:
+    def __init__(self, phrases: list[Phrase]) -> None:
+        self.phrases = phrases
+        self.loads = 0
+
+    def get_active_phrases(self) -> list[Phrase]:
+        self.loads += 1
+        return self.phrases
+
+
+@pytest.fixture(autouse=True)
+def _clear_metrics() -> None:
+    get_metrics().clear()
+
+
+@pytest.fixture
+def phrases(session: Session) -> list[Phrase]:
+    rows = [
+        _phrase("물 주세요", "Water, please"),
+        _phrase("안 쓰는 문장", "Unused", is_active=False),
+    ]
+    for row in rows:
+        session.add(row)
+    session.commit()
+    return rows
+
+
+class TestPhraseFastPath:
+    """텍스트 번역 추천 문장 사전 적중 테스트"""
+
+    def test_exact_phrase_skips_llm(
+        self,
+        auth_client: TestClient,
+        test_profile: Profile,
+        phrases: list[Phrase],
+    ) -> None:
+        """공백/대소문자만 다른 추천 문장은 양방향 모두 번역 API 없이"""
+        with patch(_TRANSLATE) as mock:
+            ko_en = auth_client.post(
+                "/translate/text",
+                json={
+                    "source_text": " 물   주세요 ",
+                    "source_lang": "ko",
+                    "target_lang": "en",
+                },
+            )
+            en_ko = auth_client.post(
+                "/translate/text",
+                json={
+                    "source_text": "water, please",
+                    "source_lang": "en",
+                    "target_lang": "ko",
+                },
+            )
+
+        assert mock.call_count == 0
+        assert ko_en.status_code == 200
+        assert ko_en.json()["data"]["translated_text"] == "Water, please"
+        assert en_ko.json()["data"]["translated_text"] == "물 주세요"
+        assert get_metrics().counter(HIT_METRIC) == 2
+
+    def test_other_text_uses_provider(
+        self,
+        auth_client: TestClient,
+        test_profile: Profile,
+        phrases: list[Phrase],
+    ) -> None:
+        """비활성 문장/언어쌍 불일치는 기존 번역 경로"""
+        with patch(_TRANSLATE, return_value="translated") as mock:
+            inactive = auth_client.post(
+                "/translate/text",
+                json={
+                    "source_text": "안 쓰는 문장",
+                    "source_lang": "ko",
+                    "target_lang": "en",
+                },
+            )
+            wrong_pair = auth_client.post(
+                "/translate/text",
+                json={
+                    "source_text": "물 주세요",
+                    "source_lang": "en",
+                    "target_lang": "ko",
+                },
+            )
+
+        assert mock.call_count == 2
+        assert inactive.json()["data"]["translated_text"] == "translated"
+        assert wrong_pair.json()["data"]["translated_text"] == "translated"
+        assert get_metrics().counter(MISS_METRIC) == 2
+
+
+class TestPhraseIndexUnit:
+    """PhraseIndex / PhraseIndexCache 단위 테스트"""
+
+    def test_ambiguous_source_excluded(self) -> None:
+        """같은 원문에 번역이 다르면 색인에서 제외 (다른 방향은 유지)"""
+        index = PhraseIndex.build(
+            [_phrase("네", "Yes"), _phrase("네", "Okay"), _phrase("좋아요", "Okay")]
+        )
+
+        assert index.lookup("네", "ko", "en") is None
+        assert index.lookup("Yes", "en", "ko") == "네"
+        assert index.lookup("okay", "en", "ko") is None
+        assert index.lookup("좋아요", "ko", "en") == "Okay"
+
+    def test_reload_after_ttl(self) -> None:
+        """TTL 이내에는 재적재 없이, 경과 후 변경 반영"""
+        now = [0.0]
+        repository = _Repository([_phrase("물 주세요", "Water, please")])
+        cache = PhraseIndexCache(ttl_s=60, clock=lambda: now[0])
+
+        assert cache.get(repository).lookup("물 주세요", "ko", "en") == "Water, please"
+        repository.phrases = [_phrase("물 주세요", "Some water, please")]
+        now[0] = 59.0
+        assert cache.get(repository).lookup("물 주세요", "ko", "en") == "Water, please"
+        now[0] = 60.0
+        assert cache.get(repository).lookup("물 주세요", "ko", "en") == (
+            "Some water, please"
+        )
+        assert repository.loads == 2
@@ -0,0 +1,185 @@
+"""추천 문장 워밍업 + GET /translate/phrases/{id} 테스트
+
+- 활성 문장마다 대상 언어(ko/en) 음성을 미리 합성해 phrase_assets에 저장
+- 변경 없는 문장은 다시 합성하지 않고, 바뀐 문장만 갱신
+- 조회 API는 사전 계산 결과만 읽음 (LLM/TTS 호출 없음)
+"""
+
+from collections.abc import Callable
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session, select
+
+from src.core.enums import PhraseCategory
+from src.external.google.fakes import FakeTextToSpeechProvider
+from src.external.supabase.fakes import MemoryStorageProvider
+from src.modules.phrases import Phrase
+from src.modules.profiles import Profile
+from src.modules.translations._audio_cache import AudioCache, AudioMemory
+from src.modules.translations._models import PhraseAsset
+from src.modules.translations._phrase_warmup import PhraseWarmupJob
+
+
+def _phrase(session: Session, text_ko: str, text_en: str, **fields) -> Phrase:
+    phrase = Phrase(
+        id=uuid4(),
+        text_ko=text_ko,
+        text_en=text_en,
+        category=PhraseCategory.REQUEST,
+        **fields,
+    )
+    session.add(phrase)
+    session.commit()
+    session.refresh(phrase)
+    return phrase
+
+
+@pytest.fixture
+def tts() -> FakeTextToSpeechProvider:
+    return FakeTextToSpeechProvider()
+
+
+@pytest.fixture
+def make_job(
+    session: Session,
+    tts: FakeTextToSpeechProvider,
+    memory_storage: MemoryStorageProvider,
+) -> Callable[[], PhraseWarmupJob]:
+    """테스트 트랜잭션을 공유하는 워밍업 작업 (가짜 TTS + 메모리 스토리지)"""
+    memory = AudioMemory()
+
+    async def audio_cache() -> AudioCache:
+        return AudioCache(tts, memory=memory, storage=memory_storage)
+
+    def make() -> PhraseWarmupJob:
+        return PhraseWarmupJob(
+            audio_cache_factory=audio_cache,
+            session_factory=lambda: Session(bind=session.connection()),
+        )
+
+    return make
+
+
+def _assets(session: Session) -> dict[tuple, PhraseAsset]:
+    session.expire_all()
+    rows = session.exec(select(PhraseAsset)).all()
+    return {(a.phrase_id, a.target_lang): a for a in rows}
+
+
+class TestPhraseWarmupJob:
+    """PhraseWarmupJob 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_warms_both_languages_once(
+        self,
+        session: Session,
+        tts: FakeTextToSpeechProvider,
+        make_job: Callable[[], PhraseWarmupJob],
+    ) -> None:
+        """문장당 ko/en 한 번씩 합성, 다시 실행하면 할 일 없음"""
+        water = _phrase(session, "물 주세요", "Water, please")
+        _phrase(session, "안 쓰는 문장", "Unused", is_active=False)
+        job = make_job()
+
+        assert await job.run_once() == 2
+        assert await job.run_once() == 0
+
+        assert sorted(tts.calls) == ["Water, please", "물 주세요"]
+        assets = _assets(session)
+        assert set(assets) == {(water.id, "en"), (water.id, "ko")}
+        en = assets[(water.id, "en")]
+        assert (en.source_text, en.translated_text) == ("물 주세요", "Water, please")
+        assert en.audio_url is not None
+        assert en.audio_url.startswith("https://storage.test/sign/tts/")
+
+    @pytest.mark.asyncio
+    async def test_changed_phrase_rewarmed(
+        self,
+        session: Session,
+        tts: FakeTextToSpeechProvider,
+        make_job: Callable[[], PhraseWarmupJob],
+    ) -> None:
+        """문장이 바뀌면 두 언어 모두 갱신, 바뀐 텍스트만 새로 합성"""
+        water = _phrase(session, "물 주세요", "Water, please")
+        job = make_job()
+        await job.run_once()
+
+        water.text_en = "Some water, please"
+        session.add(water)
+        session.commit()
+
+        assert await job.run_once() == 2
+        assert tts.calls[-1] == "Some water, please"
+        assert len(tts.calls) == 3
+        assert _assets(session)[(water.id, "en")].translated_text == (
+            "Some water, please"
+        )
+
+    @pytest.mark.asyncio
+    async def test_skipped_without_tts(self, session: Session) -> None:
+        """실제 TTS Provider가 없으면 가짜 음성을 저장하지 않고 생략"""
+        _phrase(session, "물 주세요", "Water, please")
+
+        async def no_cache() -> None:
+            return None
+
+        job = PhraseWarmupJob(
+            audio_cache_factory=no_cache,
+            session_factory=lambda: Session(bind=session.connection()),
+        )
+
+        assert await job.run_once() == 0
+        assert _assets(session) == {}
+
+
+class TestGetPhraseTranslation:
+    """GET /translate/phrases/{id} 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_lookup_after_warmup(
+        self,
+        auth_client: TestClient,
+        session: Session,
+        test_profile: Profile,
+        tts: FakeTextToSpeechProvider,
+        make_job: Callable[[], PhraseWarmupJob],
+    ) -> None:
+        """워밍업 전에는 음성 없이 + 워밍업 요청, 이후에는 합성 없이 음성 URL"""
+        water = _phrase(session, "물 주세요", "Water, please")
+        url = f"/translate/phrases/{water.id}?target_lang=ko"
+
+        with patch(
+            "src.modules.translations._phrase_warmup.get_phrase_warmup_job"
+        ) as get_job:
+            cold = auth_client.get(url)
+        get_job.return_value.wake.assert_called_once()
+
+        await make_job().run_once()
+        calls = list(tts.calls)
+        warm = auth_client.get(url)
+
+        assert cold.status_code == 200
+        assert cold.json()["data"]["translated_text"] == "물 주세요"
+        assert cold.json()["data"]["audio_url"] is None
+        data = warm.json()["data"]
+        assert data["source_lang"] == "en"
+        assert data["source_text"] == "Water, please"
+        assert data["audio_url"].startswith("https://storage.test/sign/tts/")
+        assert tts.calls == calls
+
+    def test_inactive_phrase_not_found(
+        self,
+        auth_client: TestClient,
+        session: Session,
+        test_profile: Profile,
+    ) -> None:
+        """비활성 문장 -> 404 PHRASE_NOT_FOUND"""
+        phrase = _phrase(session, "안 쓰는 문장", "Unused", is_active=False)
+
+        response = auth_client.get(f"/translate/phrases/{phrase.id}?target_lang=en")
+
+        assert response.status_code == 404
+        assert response.json()["status"] == "PHRASE_NOT_FOUND"
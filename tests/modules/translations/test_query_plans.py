@@ -0,0 +1,239 @@
+"""번역 목록 쿼리 실행 계획 테스트
+
+대량 데이터에서 Repository 목록 쿼리가 복합/부분 인덱스 범위 스캔으로
+정렬 없이 처리되는지 EXPLAIN으로 검증 (순차 스캔 + 정렬 회귀 방지)
+"""
+
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy import insert, text
+from sqlmodel import Session
+
+from src.modules.missions._models import MissionProgress, MissionTemplate
+from src.modules.profiles import Profile
+from src.modules.translations._models import (
+    Translation,
+    TranslationCategoryMapping,
+    TranslationPrimaryCategory,
+    TranslationSubCategory,
+    TranslationThread,
+)
+from src.modules.translations._repository import (
+    THREADS_COUNTER,
+    TRANSLATIONS_COUNTER,
+    ThreadRepository,
+    TranslationRepository,
+    _counted_rows,
+)
+
+_PROFILES = 10
+_TRANSLATIONS_PER_PROFILE = 500
+_THREADS_PER_PROFILE = 50
+_BASE = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+@dataclass(frozen=True)
+class _Dataset:
+    """시드 데이터 식별자"""
+
+    profile_id: UUID
+    mission_id: UUID
+    thread_id: UUID
+
+
+@pytest.fixture
+def dataset(
+    session: Session,
+    seeded_categories: tuple[
+        list[TranslationPrimaryCategory],
+        list[TranslationSubCategory],
+        list[TranslationCategoryMapping],
+    ],
+) -> _Dataset:
+    """사용자 10명, 사용자별 번역 500건 / 스레드 50개 (절반 삭제)"""
+    template = MissionTemplate(
+        title_ko="주문",
+        title_en="Order",
+        description_ko="주문하기",
+        description_en="Order food",
+        mission_type="query_plan_order",
+        estimated_duration_min=5,
+    )
+    session.add(template)
+    session.flush()
+
+    profiles, missions, threads, translations = [], [], [], []
+    for p in range(_PROFILES):
+        profile_id = uuid4()
+        mission_id = uuid4()
+        profiles.append(
+            {
+                "id": profile_id,
+                "user_id": uuid4(),
+                "display_name": f"user{p}",
+                "preferred_language": "en",
+                "created_at": _BASE,
+                "updated_at": _BASE,
+            }
+        )
+        missions.append(
+            {
+                "id": mission_id,
+                "profile_id": profile_id,
+                "mission_template_id": template.id,
+                "created_at": _BASE,
+                "updated_at": _BASE,
+            }
+        )
+        thread_ids = [uuid4() for _ in range(_THREADS_PER_PROFILE)]
+        threads += [
+            {
+                "id": thread_id,
+                "profile_id": profile_id,
+                "primary_category": "FD6",
+                "sub_category": "ordering",
+                "created_at": _BASE + timedelta(minutes=i),
+                "deleted_at": _BASE if i % 2 else None,
+            }
+            for i, thread_id in enumerate(thread_ids)
+        ]
+        translations += [
+            {
+                "id": uuid4(),
+                "profile_id": profile_id,
+                "source_text": f"문장 {i}",
+                "translated_text": f"sentence {i}",
+                "source_lang": "ko",
+                "target_lang": "en",
+                "translation_type": "voice" if i % 5 == 0 else "text",
+                "mission_progress_id": mission_id if i % 10 == 0 else None,
+                "thread_id": thread_ids[i % _THREADS_PER_PROFILE] if i % 3 else None,
+                "created_at": _BASE + timedelta(seconds=i),
+            }
+            for i in range(_TRANSLATIONS_PER_PROFILE)
+        ]
+
+    session.execute(insert(Profile), profiles)
+    session.execute(insert(MissionProgress), missions)
+    session.execute(insert(TranslationThread), threads)
+    session.execute(insert(Translation), translations)
+    session.execute(text("ANALYZE"))
+
+    last = translations[-1]
+    return _Dataset(last["profile_id"], missions[-1]["id"], threads[-2]["id"])
+
+
+class TestTranslationQueryPlans:
+    """번역 히스토리/스레드 상세 쿼리"""
+
+    def test_history_keyset(
+        self, session: Session, dataset: _Dataset, assert_index_scan
+    ) -> None:
+        """히스토리 키셋 조회 -> ix_translations_profile_created"""
+        repository = TranslationRepository(session)
+        cursor = (_BASE + timedelta(seconds=250), uuid4())
+
+        assert_index_scan(
+            lambda: repository.get_by_profile_id_after(
+                dataset.profile_id, cursor=cursor, limit=21
+            ),
+            "ix_translations_profile_created",
+        )
+
+    def test_history_count_fallback(
+        self, session: Session, dataset: _Dataset, assert_index_scan
+    ) -> None:
+        """카운터 없을 때 COUNT -> profile_id로 시작하는 인덱스 (테이블 미접근)"""
+        assert_index_scan(
+            lambda: session.exec(
+                _counted_rows(dataset.profile_id, TRANSLATIONS_COUNTER)
+            ).one(),
+            "ix_translations_profile_",
+        )
+
+    def test_history_count_by_mission(
+        self, session: Session, dataset: _Dataset, assert_index_scan
+    ) -> None:
+        """미션 필터 개수 (카운터 없음) -> ix_translations_profile_mission_created"""
+        repository = TranslationRepository(session)
+
+        assert_index_scan(
+            lambda: repository.count_by_profile_id(
+                dataset.profile_id, mission_progress_id=dataset.mission_id
+            ),
+            "ix_translations_profile_mission_created",
+        )
+
+    def test_history_by_type(
+        self, session: Session, dataset: _Dataset, assert_index_scan
+    ) -> None:
+        """type 필터 -> ix_translations_profile_type_created"""
+        repository = TranslationRepository(session)
+
+        assert_index_scan(
+            lambda: repository.get_by_profile_id_after(
+                dataset.profile_id, cursor=None, limit=21, translation_type="voice"
+            ),
+            "ix_translations_profile_type_created",
+        )
+
+    def test_history_by_mission(
+        self, session: Session, dataset: _Dataset, assert_index_scan
+    ) -> None:
+        """미션 필터 -> ix_translations_profile_mission_created (부분 인덱스)"""
+        repository = TranslationRepository(session)
+
+        assert_index_scan(
+            lambda: repository.get_by_profile_id_after(
+                dataset.profile_id,
+                cursor=None,
+                limit=21,
+                mission_progress_id=dataset.mission_id,
+            ),
+            "ix_translations_profile_mission_created",
+        )
+
+    def test_thread_translations(
+        self, session: Session, dataset: _Dataset, assert_index_scan
+    ) -> None:
+        """스레드 상세 번역 기록 -> ix_translations_thread_created (부분 인덱스)"""
+        repository = TranslationRepository(session)
+
+        assert_index_scan(
+            lambda: repository.get_by_thread_id_after(
+                dataset.thread_id, cursor=None, limit=51
+            ),
+            "ix_translations_thread_created",
+        )
+
+
+class TestThreadQueryPlans:
+    """스레드 목록 쿼리"""
+
+    def test_thread_list_keyset(
+        self, session: Session, dataset: _Dataset, assert_index_scan
+    ) -> None:
+        """삭제 제외 스레드 목록 -> ix_translation_threads_profile_active_created"""
+        repository = ThreadRepository(session)
+        cursor = (_BASE + timedelta(minutes=25), uuid4())
+
+        assert_index_scan(
+            lambda: repository.get_by_profile_id_after(
+                dataset.profile_id, cursor=cursor, limit=21
+            ),
+            "ix_translation_threads_profile_active_created",
+        )
+
+    def test_thread_count_fallback(
+        self, session: Session, dataset: _Dataset, assert_index_scan
+    ) -> None:
+        """카운터 없을 때 스레드 COUNT -> 삭제 제외 부분 인덱스"""
+        assert_index_scan(
+            lambda: session.exec(
+                _counted_rows(dataset.profile_id, THREADS_COUNTER)
+            ).one(),
+            "ix_translation_threads_profile_active_created",
+        )
@@ -0,0 +1,418 @@
+"""WS /translation/threads/{thread_id}/conversation 테스트
+
+- 연결 시 한 번 인증/스레드 확인, 메시지는 받은 순서대로 번역
+- 스레드 카테고리 컨텍스트는 대상 언어별로 한 번만 빌드
+- 번역 기록은 FLUSH_SIZE개마다, 연결 종료 시 일괄 저장
+- 잘못된 메시지/번역 실패는 error 메시지 (연결 유지)
+- 기록 저장 실패는 error 메시지, 기록은 다음 저장 때 재시도 (유실 없음)
+- 대화 중 저장은 이벤트 루프 밖(스레드풀), 동시 flush()는 순서대로 실행
+- 인증 실패, 다른 사용자의 스레드는 핸드셰이크 거부 (1008)
+"""
+
+import asyncio
+import threading
+from collections.abc import AsyncIterator, Callable, Iterator
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.exc import OperationalError
+from sqlmodel import Session, select
+from starlette.websockets import WebSocketDisconnect
+
+from src.core.config import settings
+from src.external.google import IAsyncVertexAIProvider, VertexAIError
+from src.modules.profiles import Profile
+from src.modules.translations._context_service import ContextService
+from src.modules.translations._models import Translation, TranslationThread
+from src.modules.translations._repository import TranslationRepository
+
+
+class _RecordingGemini(IAsyncVertexAIProvider):
+    """번역 호출 (원문, 컨텍스트) 기록, fail_text 원문은 실패"""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, str | None]] = []
+        self.fail_text: str | None = None
+
+    async def generate_content(self, prompt: str) -> str:
+        return prompt
+
+    async def translate(
+        self,
+        text: str,
+        source_lang: str,
+        target_lang: str,
+        context: str | None = None,
+    ) -> str:
+        if text == self.fail_text:
+            raise VertexAIError("quota exceeded")
+        self.calls.append((text, context))
+        return f"[{target_lang}] {text}"
+
+    async def translate_stream(
+        self,
+        text: str,
+        source_lang: str,
+        target_lang: str,
+        context: str | None = None,
+    ) -> AsyncIterator[str]:
+        yield await self.translate(text, source_lang, target_lang, context)
+
+    async def translate_batch(
+        self,
+        texts: list[str],
+        source_lang: str,
+        target_lang: str,
+        context: str | None = None,
+    ) -> list[str]:
+        return [await self.translate(t, source_lang, target_lang) for t in texts]
+
+
+@pytest.fixture
+def gemini() -> Iterator[_RecordingGemini]:
+    provider = _RecordingGemini()
+    with patch(
+        "src.modules.translations._translation_service.get_async_vertex_provider",
+        return_value=provider,
+    ):
+        yield provider
+
+
+def _url(thread: TranslationThread) -> str:
+    return f"/translation/threads/{thread.id}/conversation"
+
+
+def _message(text: str, client_id: str | None = None, **overrides) -> dict:
+    return {
+        "source_text": text,
+        "source_lang": "ko",
+        "target_lang": "en",
+        "client_id": client_id,
+        **overrides,
+    }
+
+
+def _fail_once() -> Callable[..., list[Translation]]:
+    """첫 호출은 DB 오류, 이후는 실제 create_many"""
+    create_many = TranslationRepository.create_many
+    calls = []
+
+    def flaky(self, translations: list[Translation]) -> list[Translation]:
+        calls.append(len(translations))
+        if len(calls) == 1:
+            raise OperationalError("INSERT INTO translations", {}, Exception("down"))
+        return create_many(self, translations)
+
+    return flaky
+
+
+def _thread_rows(session: Session, thread: TranslationThread) -> list[Translation]:
+    session.expire_all()
+    return list(
+        session.exec(
+            select(Translation)
+            .where(Translation.thread_id == thread.id)
+            .order_by(Translation.created_at)  # type: ignore[arg-type]
+        ).all()
+    )
+
+
+class TestThreadConversation:
+    """스레드 대화 WebSocket 테스트"""
+
+    def test_translates_in_order(
+        self,
+        auth_client: TestClient,
+        session: Session,
+        seeded_context_prompts,
+        created_thread: TranslationThread,
+        gemini: _RecordingGemini,
+    ) -> None:
+        """받은 순서대로 응답, 스레드 컨텍스트 적용, 종료 시 기록 저장"""
+        texts = ["주문할게요", "물 주세요", "계산서 주세요"]
+        with (
+            patch.object(
+                ContextService,
+                "build_translation_context",
+                autospec=True,
+                side_effect=ContextService.build_translation_context,
+            ) as build_context,
+            auth_client.websocket_connect(_url(created_thread)) as websocket,
+        ):
+            for i, text in enumerate(texts):
+                websocket.send_json(_message(text, client_id=str(i)))
+            replies = [websocket.receive_json() for _ in texts]
+
+        assert [r["type"] for r in replies] == ["translation"] * 3
+        assert [r["client_id"] for r in replies] == ["0", "1", "2"]
+        assert [r["data"]["translated_text"] for r in replies] == [
+            f"[en] {text}" for text in texts
+        ]
+        # 컨텍스트는 연결 동안 한 번만 빌드
+        assert build_context.call_count == 1
+        contexts = {context for _, context in gemini.calls}
+        assert len(contexts) == 1
+        assert None not in contexts
+
+        rows = _thread_rows(session, created_thread)
+        assert [row.source_text for row in rows] == texts
+        assert {row.context_sub for row in rows} == {"ordering"}
+        assert [str(row.id) for row in rows] == [r["data"]["id"] for r in replies]
+
+    def test_flushes_in_batches(
+        self,
+        auth_client: TestClient,
+        session: Session,
+        test_profile: Profile,
+        created_thread: TranslationThread,
+        gemini: _RecordingGemini,
+    ) -> None:
+        """FLUSH_SIZE개가 모이면 저장, 나머지는 연결 종료 시 저장"""
+        with (
+            patch.object(settings, "TRANSLATION_CONVERSATION_FLUSH_SIZE", 2),
+            auth_client.websocket_connect(_url(created_thread)) as websocket,
+        ):
+            for i in range(3):
+                websocket.send_json(_message(f"문장 {i}"))
+                websocket.receive_json()
+
+            assert len(_thread_rows(session, created_thread)) == 2
+
+        assert len(_thread_rows(session, created_thread)) == 3
+
+    def test_errors_keep_connection(
+        self,
+        auth_client: TestClient,
+        session: Session,
+        test_profile: Profile,
+        created_thread: TranslationThread,
+        gemini: _RecordingGemini,
+    ) -> None:
+        """잘못된 메시지/번역 실패는 error 메시지, 다음 메시지는 정상 번역"""
+        gemini.fail_text = "실패"
+        with auth_client.websocket_connect(_url(created_thread)) as websocket:
+            websocket.send_text("not json")
+            websocket.send_json(_message("같은 언어", target_lang="ko"))
+            websocket.send_json(_message("실패", client_id="f"))
+            websocket.send_json(_message("성공"))
+            replies = [websocket.receive_json() for _ in range(4)]
+
+        assert [r["type"] for r in replies] == [
+            "error",
+            "error",
+            "error",
+            "translation",
+        ]
+        assert replies[2]["client_id"] == "f"
+        assert [row.source_text for row in _thread_rows(session, created_thread)] == [
+            "성공"
+        ]
+
+    def test_flush_failure_keeps_rows(
+        self,
+        auth_client: TestClient,
+        session: Session,
+        test_profile: Profile,
+        created_thread: TranslationThread,
+        gemini: _RecordingGemini,
+    ) -> None:
+        """저장 실패 -> error 메시지 후 연결 유지, 실패한 기록은 다음 저장에 포함"""
+        with (
+            patch.object(settings, "TRANSLATION_CONVERSATION_FLUSH_SIZE", 2),
+            patch.object(TranslationRepository, "create_many", _fail_once()),
+            auth_client.websocket_connect(_url(created_thread)) as websocket,
+        ):
+            for i in range(2):
+                websocket.send_json(_message(f"문장 {i}"))
+                assert websocket.receive_json()["type"] == "translation"
+            error = websocket.receive_json()
+            assert _thread_rows(session, created_thread) == []
+
+            websocket.send_json(_message("문장 2"))
+            assert websocket.receive_json()["type"] == "translation"
+            # 다음 응답을 받으면 "문장 2" 뒤의 저장(스레드풀)은 끝난 상태
+            websocket.send_json(_message("문장 3"))
+            assert websocket.receive_json()["type"] == "translation"
+            assert len(_thread_rows(session, created_thread)) == 3
+
+        assert error["type"] == "error"
+        assert error["status"] == "DATABASE_ERROR"
+        rows = _thread_rows(session, created_thread)
+        assert [row.source_text for row in rows] == [f"문장 {i}" for i in range(4)]
+
+    def test_size_flush_off_event_loop(
+        self,
+        auth_client: TestClient,
+        session: Session,
+        test_profile: Profile,
+        created_thread: TranslationThread,
+        gemini: _RecordingGemini,
+    ) -> None:
+        """FLUSH_SIZE 도달 저장은 이벤트 루프가 아닌 스레드에서 실행"""
+        threads: dict[str, int] = {}
+        translate = gemini.translate
+        create_many = TranslationRepository.create_many
+
+        async def record_loop(*args: object) -> str:
+            threads["loop"] = threading.get_ident()
+            return await translate(*args)  # type: ignore[arg-type]
+
+        def record_flush(self, translations: list[Translation]) -> list[Translation]:
+            threads.setdefault("flush", threading.get_ident())
+            return create_many(self, translations)
+
+        with (
+            patch.object(settings, "TRANSLATION_CONVERSATION_FLUSH_SIZE", 1),
+            patch.object(gemini, "translate", record_loop),
+            patch.object(TranslationRepository, "create_many", record_flush),
+            auth_client.websocket_connect(_url(created_thread)) as websocket,
+        ):
+            # 두 번째 응답을 받으면 첫 번째 저장은 끝난 상태
+            for i in range(2):
+                websocket.send_json(_message(f"문장 {i}"))
+                websocket.receive_json()
+
+        assert threads["flush"] != threads["loop"]
+        assert len(_thread_rows(session, created_thread)) == 2
+
+    def test_final_flush_retried(
+        self,
+        auth_client: TestClient,
+        session: Session,
+        test_profile: Profile,
+        created_thread: TranslationThread,
+        gemini: _RecordingGemini,
+    ) -> None:
+        """연결 종료 시 저장 실패 -> 재시도로 기록 저장"""
+        with patch.object(TranslationRepository, "create_many", _fail_once()):
+            with auth_client.websocket_connect(_url(created_thread)) as websocket:
+                websocket.send_json(_message("안녕하세요"))
+                websocket.receive_json()
+
+            rows = _thread_rows(session, created_thread)
+
+        assert [row.source_text for row in rows] == ["안녕하세요"]
+
+    def test_token_query_param(
+        self,
+        client: TestClient,
+        mock_supabase_auth,
+        test_profile: Profile,
+        created_thread: TranslationThread,
+        gemini: _RecordingGemini,
+    ) -> None:
+        """Authorization 헤더 대신 token 쿼리 파라미터 (브라우저)"""
+        url = f"{_url(created_thread)}?token=test-supabase-token"
+        with client.websocket_connect(url) as websocket:
+            websocket.send_json(_message("안녕하세요"))
+            reply = websocket.receive_json()
+
+        assert reply["type"] == "translation"
+
+
+class TestThreadConversationHandshake:
+    """핸드셰이크 거부 테스트"""
+
+    def test_requires_token(
+        self, client: TestClient, created_thread: TranslationThread
+    ) -> None:
+        """토큰 없으면 1008"""
+        with (
+            pytest.raises(WebSocketDisconnect) as exc_info,
+            client.websocket_connect(_url(created_thread)),
+        ):
+            pass
+
+        assert exc_info.value.code == 1008
+
+    def test_other_profile_thread(
+        self,
+        auth_client: TestClient,
+        session: Session,
+        test_profile: Profile,
+        created_thread: TranslationThread,
+    ) -> None:
+        """다른 사용자의 스레드/없는 스레드는 1008"""
+        other = Profile(
+            id=uuid4(),
+            user_id=uuid4(),
+            display_name="Other",
+            preferred_language="ko",
+        )
+        session.add(other)
+        created_thread.profile_id = other.id
+        session.add(created_thread)
+        session.commit()
+
+        for url in (
+            _url(created_thread),
+            f"/translation/threads/{uuid4()}/conversation",
+        ):
+            with (
+                pytest.raises(WebSocketDisconnect) as exc_info,
+                auth_client.websocket_connect(url),
+            ):
+                pass
+            assert exc_info.value.code == 1008
+
+
+class TestThreadConversationFlush:
+    """ThreadConversationUseCase.flush() 동시 호출 테스트"""
+
+    def test_concurrent_flush_serialized(
+        self,
+        session: Session,
+        test_profile: Profile,
+        created_thread: TranslationThread,
+    ) -> None:
+        """스레드풀 flush() 진행 중 호출된 flush()는 끝날 때까지 대기"""
+        from src.modules.translations._repository import ThreadRepository
+        from src.modules.translations._use_cases import ThreadConversationUseCase
+
+        use_case = ThreadConversationUseCase(
+            session,
+            thread_repository=ThreadRepository(session),
+            translation_repository=TranslationRepository(session),
+            translation_service=None,  # type: ignore[arg-type]
+            context_service=None,  # type: ignore[arg-type]
+        )
+        use_case.open(created_thread.id, test_profile.id)
+        entered, release = threading.Event(), threading.Event()
+        active: list[int] = []
+        overlapped: list[bool] = []
+        create_many = TranslationRepository.create_many
+
+        def slow(self, translations: list[Translation]) -> list[Translation]:
+            active.append(1)
+            overlapped.append(len(active) > 1)
+            entered.set()
+            release.wait(5)
+            try:
+                return create_many(self, translations)
+            finally:
+                active.pop()
+
+        def add(text: str) -> None:
+            asyncio.run(use_case._save(use_case.message(text, "ko", "en"), text, None))
+
+        with patch.object(TranslationRepository, "create_many", slow):
+            add("첫 문장")
+            first = threading.Thread(target=use_case.flush)
+            first.start()
+            assert entered.wait(5)
+            add("둘째 문장")
+            second = threading.Thread(target=use_case.flush)
+            second.start()
+            second.join(0.1)
+            assert second.is_alive()  # 첫 flush()가 끝날 때까지 대기
+            release.set()
+            first.join(5)
+            second.join(5)
+
+        assert overlapped == [False, False]
+        assert [row.source_text for row in _thread_rows(session, created_thread)] == [
+            "첫 문장",
+            "둘째 문장",
+        ]
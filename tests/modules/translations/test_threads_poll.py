@@ -0,0 +1,126 @@
+"""GET /translation/threads/{thread_id} 폴링 테스트
+
+- since=<latest_cursor>: 마지막으로 본 번역 이후의 새 번역만 반환
+- ETag/If-None-Match: 변경 없는 스레드는 304 (번역 기록 조회 없음)
+- 스레드에 번역 추가/삭제 시 updated_at 갱신 -> ETag 변경
+"""
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlmodel import Session
+
+from src.modules.profiles import Profile
+from src.modules.translations._models import Translation, TranslationThread
+
+
+def _translate_in_thread(client: TestClient, thread: TranslationThread, text: str):
+    response = client.post(
+        "/translate/text",
+        json={
+            "source_text": text,
+            "source_lang": "ko",
+            "target_lang": "en",
+            "thread_id": str(thread.id),
+        },
+    )
+    assert response.status_code == 200
+    return response.json()["data"]["id"]
+
+
+class TestThreadPolling:
+    """스레드 상세 폴링 테스트"""
+
+    def test_since_returns_only_new(
+        self,
+        auth_client: TestClient,
+        test_profile: Profile,
+        thread_with_translations: tuple[TranslationThread, list[Translation]],
+    ) -> None:
+        """since 이후 번역만 반환, 새 번역이 없으면 빈 목록 + 같은 커서"""
+        thread, _ = thread_with_translations
+        url = f"/translation/threads/{thread.id}"
+        first = auth_client.get(url).json()["data"]
+        assert len(first["translations"]) == 2
+
+        latest = first["latest_cursor"]
+        empty = auth_client.get(url, params={"since": latest}).json()["data"]
+        assert empty["translations"] == []
+        assert empty["latest_cursor"] == latest
+
+        new_id = _translate_in_thread(auth_client, thread, "물 주세요")
+        polled = auth_client.get(url, params={"since": latest}).json()["data"]
+
+        assert [t["id"] for t in polled["translations"]] == [new_id]
+        assert polled["latest_cursor"] != latest
+
+    def test_not_modified(
+        self,
+        auth_client: TestClient,
+        session: Session,
+        test_profile: Profile,
+        thread_with_translations: tuple[TranslationThread, list[Translation]],
+    ) -> None:
+        """같은 ETag -> 304, 번역 기록 테이블 조회 없음"""
+        thread, _ = thread_with_translations
+        url = f"/translation/threads/{thread.id}"
+        etag = auth_client.get(url).headers["ETag"]
+
+        statements: list[str] = []
+
+        def record(_conn, _cursor, statement, *_args) -> None:
+            if "FROM translations" in statement:
+                statements.append(statement)
+
+        engine = session.get_bind().engine
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            response = auth_client.get(url, headers={"If-None-Match": etag})
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        assert response.status_code == 304
+        assert response.headers["ETag"] == etag
+        assert response.content == b""
+        assert statements == []
+
+    def test_etag_changes_on_new_translation(
+        self,
+        auth_client: TestClient,
+        test_profile: Profile,
+        created_thread: TranslationThread,
+    ) -> None:
+        """번역 추가/삭제 시 ETag 변경 -> 200"""
+        url = f"/translation/threads/{created_thread.id}"
+        etag = auth_client.get(url).headers["ETag"]
+
+        translation_id = _translate_in_thread(
+            auth_client, created_thread, "계산서 주세요"
+        )
+        added = auth_client.get(url, headers={"If-None-Match": etag})
+
+        assert added.status_code == 200
+        assert len(added.json()["data"]["translations"]) == 1
+
+        auth_client.delete(f"/translations/{translation_id}")
+        removed = auth_client.get(url, headers={"If-None-Match": added.headers["ETag"]})
+
+        assert removed.status_code == 200
+        assert removed.json()["data"]["translations"] == []
+
+    def test_etag_depends_on_range(
+        self,
+        auth_client: TestClient,
+        test_profile: Profile,
+        thread_with_translations: tuple[TranslationThread, list[Translation]],
+    ) -> None:
+        """다른 조회 범위(limit/since)의 ETag로는 304가 아님"""
+        thread, _ = thread_with_translations
+        url = f"/translation/threads/{thread.id}"
+        etag = auth_client.get(url).headers["ETag"]
+
+        response = auth_client.get(
+            url, params={"limit": 1}, headers={"If-None-Match": etag}
+        )
+
+        assert response.status_code == 200
+        assert len(response.json()["data"]["translations"]) == 1
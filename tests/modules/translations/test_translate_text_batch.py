@@ -0,0 +1,277 @@
+"""POST /translate/text/batch 테스트
+
+- 여러 문장을 한 번의 프롬프트로 번역, 요청 순서대로 반환
+- 응답 파싱 실패 시 문장별 번역으로 폴백
+- 번역 메모리 적중/중복 문장은 프롬프트에서 제외
+- 번역 기록은 한 번의 INSERT로 저장 (문장 순서대로 created_at 증가)
+- 순차 N회 호출 대비 호출 수/문장당 프롬프트 크기/지연 비교
+"""
+
+import asyncio
+import json
+import time
+from collections.abc import AsyncIterator, Iterator
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlmodel import Session, select
+
+from src.external.google import IAsyncVertexAIProvider, VertexAIResponseFormatError
+from src.external.google._prompts import (
+    build_batch_translation_prompt,
+    build_translation_prompt,
+    get_language_name,
+    parse_batch_translation,
+)
+from src.modules.profiles import Profile
+from src.modules.translations._models import Translation
+
+_LATENCY_S = 0.05
+_MENU = ["김치찌개", "된장찌개", "제육볶음"]
+
+
+class _FakeGemini(IAsyncVertexAIProvider):
+    """실제 프롬프트 빌더/파서를 쓰는 고정 지연 Provider (프롬프트 기록)"""
+
+    def __init__(self, *, malformed: bool = False) -> None:
+        self.malformed = malformed
+        self.single_prompts: list[str] = []
+        self.batch_prompts: list[str] = []
+
+    async def generate_content(self, prompt: str) -> str:
+        return prompt
+
+    async def translate(
+        self,
+        text: str,
+        source_lang: str,
+        target_lang: str,
+        context: str | None = None,
+    ) -> str:
+        prompt = build_translation_prompt(text, get_language_name(target_lang), context)
+        self.single_prompts.append(prompt)
+        await asyncio.sleep(_LATENCY_S)
+        return f"T({text})"
+
+    async def translate_stream(
+        self,
+        text: str,
+        source_lang: str,
+        target_lang: str,
+        context: str | None = None,
+    ) -> AsyncIterator[str]:
+        yield await self.translate(text, source_lang, target_lang, context)
+
+    async def translate_batch(
+        self,
+        texts: list[str],
+        source_lang: str,
+        target_lang: str,
+        context: str | None = None,
+    ) -> list[str]:
+        prompt = build_batch_translation_prompt(
+            texts, get_language_name(target_lang), context
+        )
+        self.batch_prompts.append(prompt)
+        await asyncio.sleep(_LATENCY_S)
+        if self.malformed:
+            response = "\n".join(f"{i}. T({t})" for i, t in enumerate(texts, 1))
+        else:
+            # 순서를 뒤집어도 id로 복원
+            response = json.dumps(
+                [
+                    {"id": i, "translation": f"T({t})"}
+                    for i, t in reversed(list(enumerate(texts, 1)))
+                ],
+                ensure_ascii=False,
+            )
+        translations = parse_batch_translation(response, len(texts))
+        if translations is None:
+            raise VertexAIResponseFormatError("parse failed")
+        return translations
+
+
+@pytest.fixture
+def gemini() -> Iterator[_FakeGemini]:
+    provider = _FakeGemini()
+    with patch(
+        "src.modules.translations._translation_service.get_async_vertex_provider",
+        return_value=provider,
+    ):
+        yield provider
+
+
+def _request(texts: list[str]) -> dict:
+    return {"source_texts": texts, "source_lang": "ko", "target_lang": "en"}
+
+
+class TestTranslateTextBatch:
+    """POST /translate/text/batch 테스트"""
+
+    def test_batch_single_prompt(
+        self,
+        auth_client: TestClient,
+        session: Session,
+        test_profile: Profile,
+        gemini: _FakeGemini,
+    ) -> None:
+        """한 번의 프롬프트로 번역, 요청 순서대로 반환 및 저장"""
+        response = auth_client.post("/translate/text/batch", json=_request(_MENU))
+
+        assert response.status_code == 200
+        items = response.json()["data"]["items"]
+        assert [i["source_text"] for i in items] == _MENU
+        assert [i["translated_text"] for i in items] == [f"T({t})" for t in _MENU]
+        assert len(gemini.batch_prompts) == 1
+        assert gemini.single_prompts == []
+
+        rows = session.exec(
+            select(Translation).where(Translation.profile_id == test_profile.id)
+        ).all()
+        assert len(rows) == len(_MENU)
+
+    def test_segments_keep_request_order(
+        self,
+        auth_client: TestClient,
+        session: Session,
+        test_profile: Profile,
+        gemini: _FakeGemini,
+    ) -> None:
+        """문장마다 created_at이 요청 순서대로 증가 (목록 정렬이 요청 순서와 일치)"""
+        auth_client.post("/translate/text/batch", json=_request(_MENU))
+
+        rows = session.exec(
+            select(Translation)
+            .where(Translation.profile_id == test_profile.id)
+            .order_by(Translation.created_at)
+        ).all()
+        assert [r.source_text for r in rows] == _MENU
+        assert len({r.created_at for r in rows}) == len(_MENU)
+
+    def test_parse_failure_falls_back_per_item(
+        self,
+        auth_client: TestClient,
+        test_profile: Profile,
+        gemini: _FakeGemini,
+    ) -> None:
+        """응답 파싱 실패 -> 문장별 번역"""
+        gemini.malformed = True
+
+        response = auth_client.post("/translate/text/batch", json=_request(_MENU))
+
+        assert response.status_code == 200
+        items = response.json()["data"]["items"]
+        assert [i["translated_text"] for i in items] == [f"T({t})" for t in _MENU]
+        assert len(gemini.batch_prompts) == 1
+        assert len(gemini.single_prompts) == len(_MENU)
+
+    def test_memory_hits_and_duplicates_excluded(
+        self,
+        auth_client: TestClient,
+        test_profile: Profile,
+        gemini: _FakeGemini,
+    ) -> None:
+        """메모리 적중 문장은 제외, 같은 문장은 한 번만 프롬프트에 포함"""
+        auth_client.post(
+            "/translate/text",
+            json={"source_text": "김치찌개", "source_lang": "ko", "target_lang": "en"},
+        )
+        texts = ["김치찌개", "된장찌개", "된장찌개 ", "제육볶음"]
+
+        response = auth_client.post("/translate/text/batch", json=_request(texts))
+
+        items = response.json()["data"]["items"]
+        assert len(items) == len(texts)
+        assert items[2]["translated_text"] == "T(된장찌개)"
+        assert len(gemini.batch_prompts) == 1
+        assert "김치찌개" not in gemini.batch_prompts[0]
+        assert "다음 2개의" in gemini.batch_prompts[0]
+
+    def test_rows_saved_with_one_insert(
+        self,
+        auth_client: TestClient,
+        session: Session,
+        test_profile: Profile,
+        gemini: _FakeGemini,
+    ) -> None:
+        """번역 기록은 한 번의 INSERT 문으로 저장"""
+        inserts: list[str] = []
+
+        def record(_conn, _cursor, statement, *_args) -> None:
+            if statement.startswith("INSERT INTO translations"):
+                inserts.append(statement)
+
+        engine = session.get_bind().engine
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            response = auth_client.post("/translate/text/batch", json=_request(_MENU))
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        assert response.status_code == 200
+        assert len(inserts) == 1
+
+    def test_too_many_segments(
+        self,
+        auth_client: TestClient,
+        test_profile: Profile,
+    ) -> None:
+        """최대 문장 수 초과 -> 422"""
+        texts = [f"문장 {i}" for i in range(51)]
+
+        response = auth_client.post("/translate/text/batch", json=_request(texts))
+
+        assert response.status_code == 422
+
+    def test_empty_segment(
+        self,
+        auth_client: TestClient,
+        test_profile: Profile,
+    ) -> None:
+        """빈 문장 -> 422"""
+        response = auth_client.post("/translate/text/batch", json=_request(["", "a"]))
+
+        assert response.status_code == 422
+
+
+class TestBatchVsSequential:
+    """순차 N회 호출 대비 묶음 번역 비용 측정"""
+
+    def test_batch_cost_per_segment(
+        self,
+        auth_client: TestClient,
+        test_profile: Profile,
+        seeded_context_prompts: list,
+        gemini: _FakeGemini,
+    ) -> None:
+        """호출 1회, 문장당 프롬프트 크기/지연이 순차 호출보다 작음"""
+        context = {"context_primary": "FD6", "context_sub": "ordering"}
+        sequential = [f"메뉴 {i}번 주세요" for i in range(10)]
+        batch = [f"반찬 {i}번 주세요" for i in range(10)]
+
+        started = time.perf_counter()
+        for text in sequential:
+            auth_client.post(
+                "/translate/text",
+                json={"source_text": text, "source_lang": "ko", "target_lang": "en"}
+                | context,
+            )
+        sequential_s = time.perf_counter() - started
+
+        started = time.perf_counter()
+        response = auth_client.post(
+            "/translate/text/batch", json=_request(batch) | context
+        )
+        batch_s = time.perf_counter() - started
+
+        assert response.status_code == 200
+        assert len(gemini.single_prompts) == len(sequential)
+        assert len(gemini.batch_prompts) == 1
+        # 프롬프트 글자 수 (토큰 근사): 지시문/컨텍스트를 한 번만 포함
+        per_segment_sequential = sum(map(len, gemini.single_prompts)) / len(sequential)
+        per_segment_batch = len(gemini.batch_prompts[0]) / len(batch)
+        assert per_segment_batch < per_segment_sequential / 2
+        # 지연: LLM 왕복 N회 -> 1회
+        assert batch_s < sequential_s / 2
@@ -0,0 +1,208 @@
+"""POST /translate/text 동시성(부하) 테스트
+
+번역 파이프라인이 끝까지 비동기이므로 LLM 대기 중 스레드풀을 점유하지 않음
+(동기 세션 DB 작업만 스레드풀에서 실행 → 운영처럼 요청마다 별도 세션 사용)
+- 스레드풀 한도(anyio 기본 40)보다 많은 요청이 동시에 Provider를 대기
+- 전체 소요 시간이 "한도 단위 순차 처리" 하한보다 짧음
+- 번역 메모리 조회/저장 쿼리는 이벤트 루프 스레드 밖에서 실행
+"""
+
+import asyncio
+import threading
+import time
+from collections.abc import AsyncIterator, Callable, Generator, Iterator
+from pathlib import Path
+from unittest.mock import patch
+
+import anyio.to_thread
+import pytest
+from fastapi.testclient import TestClient
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import Engine, event
+from sqlalchemy.pool import NullPool
+from sqlmodel import Session, SQLModel, create_engine
+
+from src.app.main import app
+from src.core.database import get_session
+from src.core.deps import get_current_profile
+from src.external.google import IAsyncVertexAIProvider
+from src.modules.profiles import Profile
+from src.modules.translations._repository import TranslationRepository
+
+_LATENCY_S = 1.0  # 요청 처리 오버헤드(DB 스레드풀 포함)보다 충분히 긴 LLM 지연
+
+
+class _SlowProvider(IAsyncVertexAIProvider):
+    """고정 지연 비동기 Provider (동시 대기 수 기록)"""
+
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def generate_content(self, prompt: str) -> str:
+        return prompt
+
+    async def translate(
+        self,
+        text: str,
+        source_lang: str,
+        target_lang: str,
+        context: str | None = None,
+    ) -> str:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(_LATENCY_S)
+        finally:
+            self.in_flight -= 1
+        return f"translated: {text}"
+
+    async def translate_stream(
+        self,
+        text: str,
+        source_lang: str,
+        target_lang: str,
+        context: str | None = None,
+    ) -> AsyncIterator[str]:
+        yield await self.translate(text, source_lang, target_lang)
+
+    async def translate_batch(
+        self,
+        texts: list[str],
+        source_lang: str,
+        target_lang: str,
+        context: str | None = None,
+    ) -> list[str]:
+        return [await self.translate(t, source_lang, target_lang) for t in texts]
+
+
+@pytest.fixture
+def file_engine(tmp_path: Path) -> Iterator[Engine]:
+    """요청마다 별도 연결/세션을 여는 파일 SQLite 엔진 (공용 테스트 세션 대신)"""
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'load.db'}",
+        connect_args={"check_same_thread": False, "timeout": 30},
+        poolclass=NullPool,
+    )
+
+    @event.listens_for(engine, "connect")
+    def _no_fsync(dbapi_connection, _record) -> None:
+        # 측정 대상은 LLM 대기 동시성 (커밋마다 디스크 동기화 제외)
+        dbapi_connection.execute("PRAGMA synchronous=OFF")
+        dbapi_connection.execute("PRAGMA journal_mode=MEMORY")
+
+    SQLModel.metadata.create_all(
+        engine,
+        tables=[
+            table
+            for table in SQLModel.metadata.sorted_tables
+            if table.name != "route_history"
+        ],
+    )
+    yield engine
+    engine.dispose()
+
+
+class TestTranslateTextLoad:
+    """동시 번역 부하 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_concurrency_exceeds_threadpool_limit(
+        self,
+        client: TestClient,  # dependency override 초기화용
+        test_profile: Profile,
+        file_engine: Engine,
+    ) -> None:
+        """스레드풀 한도를 넘는 동시 번역이 한 번의 LLM 지연 안에 처리됨"""
+        limit = int(anyio.to_thread.current_default_thread_limiter().total_tokens)
+        requests = limit * 2
+        provider = _SlowProvider()
+
+        # 인증은 비동기 override (DB 조회 없이 테스트 프로필)
+        async def current_profile() -> Profile:
+            return test_profile
+
+        def request_session() -> Generator[Session, None, None]:
+            with Session(file_engine) as session:
+                yield session
+
+        app.dependency_overrides[get_current_profile] = current_profile
+        app.dependency_overrides[get_session] = request_session
+
+        transport = ASGITransport(app=app)
+        with patch(
+            "src.modules.translations._translation_service.get_async_vertex_provider",
+            return_value=provider,
+        ):
+            async with AsyncClient(transport=transport, base_url="http://test") as ac:
+                started = time.perf_counter()
+                responses = await asyncio.gather(
+                    *(
+                        ac.post(
+                            "/translate/text",
+                            json={
+                                "source_text": f"문장 {i}",
+                                "source_lang": "ko",
+                                "target_lang": "en",
+                            },
+                        )
+                        for i in range(requests)
+                    )
+                )
+                elapsed = time.perf_counter() - started
+
+        assert all(r.status_code == 200 for r in responses)
+        # 모든 요청이 동시에 LLM 대기 (스레드풀 한도에 묶이지 않음)
+        assert provider.max_in_flight > limit
+        # 스레드풀 점유 방식이면 최소 2 * 지연 (한도 단위 2회 순차)
+        assert elapsed < _LATENCY_S * 2
+
+    def test_db_work_off_event_loop(
+        self,
+        auth_client: TestClient,
+        test_profile: Profile,
+    ) -> None:
+        """메모리 조회/INSERT+커밋은 이벤트 루프가 아닌 스레드에서 실행"""
+        threads: dict[str, int] = {}
+
+        class _Provider(_SlowProvider):
+            async def translate(self, text: str, *_args: object) -> str:
+                threads["loop"] = threading.get_ident()
+                return text
+
+        def record(name: str, method: Callable[..., object]) -> Callable[..., object]:
+            def wrapper(*args: object, **kwargs: object) -> object:
+                threads[name] = threading.get_ident()
+                return method(*args, **kwargs)
+
+            return wrapper
+
+        with (
+            patch(
+                "src.modules.translations._translation_service.get_async_vertex_provider",
+                return_value=_Provider(),
+            ),
+            patch.object(
+                TranslationRepository,
+                "find_by_memory_key",
+                record("recall", TranslationRepository.find_by_memory_key),
+            ),
+            patch.object(
+                TranslationRepository,
+                "create_many",
+                record("save", TranslationRepository.create_many),
+            ),
+        ):
+            response = auth_client.post(
+                "/translate/text",
+                json={
+                    "source_text": "스레드 확인용 문장",
+                    "source_lang": "ko",
+                    "target_lang": "en",
+                },
+            )
+
+        assert response.status_code == 200
+        assert set(threads) == {"loop", "recall", "save"}
+        assert threads["recall"] != threads["loop"]
+        assert threads["save"] != threads["loop"]
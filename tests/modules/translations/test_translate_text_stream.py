@@ -0,0 +1,183 @@
+"""POST /translate/text/stream 테스트 (SSE)
+
+- 번역 조각을 생성 순서대로 delta 이벤트로 전달
+- 스트림 종료 후 기록 저장, done 이벤트에 기록과 ttft_ms
+- TTFT는 translation.stream.ttft 히스토그램에 기록
+- 번역 메모리 적중 시 Provider 미호출, 한 조각 전달
+- 스트림 도중 실패 시 error 이벤트, 기록 미저장
+"""
+
+import asyncio
+import json
+from collections.abc import AsyncIterator, Iterator
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session, select
+
+from src.core.metrics import get_metrics
+from src.external.google import IAsyncVertexAIProvider, VertexAIError
+from src.modules.profiles import Profile
+from src.modules.translations._models import Translation
+from src.modules.translations.translate_text_stream import TTFT_METRIC
+
+_CHUNKS = ["Where ", "is the ", "restroom? "]
+
+
+class _StreamingGemini(IAsyncVertexAIProvider):
+    """조각 단위로 응답하는 스트리밍 Provider (호출 수 기록)"""
+
+    def __init__(self, *, fail_after: int | None = None) -> None:
+        self.fail_after = fail_after
+        self.calls = 0
+
+    async def generate_content(self, prompt: str) -> str:
+        return prompt
+
+    async def translate(
+        self,
+        text: str,
+        source_lang: str,
+        target_lang: str,
+        context: str | None = None,
+    ) -> str:
+        return "".join(_CHUNKS).strip()
+
+    async def translate_stream(
+        self,
+        text: str,
+        source_lang: str,
+        target_lang: str,
+        context: str | None = None,
+    ) -> AsyncIterator[str]:
+        self.calls += 1
+        for index, chunk in enumerate(_CHUNKS):
+            if self.fail_after is not None and index >= self.fail_after:
+                raise VertexAIError("stream broken")
+            await asyncio.sleep(0.01)
+            yield chunk
+
+    async def translate_batch(
+        self,
+        texts: list[str],
+        source_lang: str,
+        target_lang: str,
+        context: str | None = None,
+    ) -> list[str]:
+        return [await self.translate(t, source_lang, target_lang) for t in texts]
+
+
+@pytest.fixture
+def gemini() -> Iterator[_StreamingGemini]:
+    provider = _StreamingGemini()
+    get_metrics().clear()
+    with patch(
+        "src.modules.translations._translation_service.get_async_vertex_provider",
+        return_value=provider,
+    ):
+        yield provider
+    get_metrics().clear()
+
+
+def _events(body: str) -> list[tuple[str, dict]]:
+    """SSE 본문 → (event, data) 목록"""
+    events = []
+    for block in body.strip().split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append((fields["event"], json.loads(fields["data"])))
+    return events
+
+
+def _request(text: str = "화장실 어디예요?") -> dict:
+    return {"source_text": text, "source_lang": "ko", "target_lang": "en"}
+
+
+class TestTranslateTextStream:
+    """POST /translate/text/stream 테스트"""
+
+    def test_stream_deltas_then_done(
+        self,
+        auth_client: TestClient,
+        session: Session,
+        test_profile: Profile,
+        gemini: _StreamingGemini,
+    ) -> None:
+        """delta 이벤트 순서대로 전달 후 저장된 기록으로 done"""
+        response = auth_client.post("/translate/text/stream", json=_request())
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = _events(response.text)
+        assert [data["text"] for name, data in events if name == "delta"] == _CHUNKS
+        name, done = events[-1]
+        assert name == "done"
+        assert done["translated_text"] == "Where is the restroom?"
+        assert done["ttft_ms"] is not None
+
+        row = session.exec(
+            select(Translation).where(Translation.profile_id == test_profile.id)
+        ).one()
+        assert str(row.id) == done["id"]
+        assert row.translated_text == "Where is the restroom?"
+
+    def test_ttft_recorded(
+        self,
+        auth_client: TestClient,
+        test_profile: Profile,
+        gemini: _StreamingGemini,
+    ) -> None:
+        """첫 조각 시점이 TTFT 히스토그램에 기록"""
+        auth_client.post("/translate/text/stream", json=_request())
+
+        assert get_metrics().histogram(TTFT_METRIC).count == 1
+
+    def test_memory_hit_single_delta(
+        self,
+        auth_client: TestClient,
+        test_profile: Profile,
+        gemini: _StreamingGemini,
+    ) -> None:
+        """두 번째 요청은 번역 메모리 적중 -> Provider 미호출, 한 조각"""
+        auth_client.post("/translate/text/stream", json=_request())
+        response = auth_client.post("/translate/text/stream", json=_request())
+
+        events = _events(response.text)
+        assert gemini.calls == 1
+        assert events[0] == ("delta", {"text": "Where is the restroom?"})
+        assert events[-1][0] == "done"
+
+    def test_stream_failure_emits_error(
+        self,
+        auth_client: TestClient,
+        session: Session,
+        test_profile: Profile,
+        gemini: _StreamingGemini,
+    ) -> None:
+        """스트림 도중 실패 -> error 이벤트, 기록 미저장"""
+        gemini.fail_after = 1
+
+        response = auth_client.post("/translate/text/stream", json=_request())
+
+        events = _events(response.text)
+        assert events[0] == ("delta", {"text": "Where "})
+        assert events[-1][0] == "error"
+        assert events[-1][1]["status"] == "EXTERNAL_SERVICE_ERROR"
+        assert get_metrics().counter("translation.stream.error") == 1
+        rows = session.exec(
+            select(Translation).where(Translation.profile_id == test_profile.id)
+        ).all()
+        assert rows == []
+
+    def test_same_language_rejected(
+        self,
+        auth_client: TestClient,
+        test_profile: Profile,
+    ) -> None:
+        """같은 언어 -> 422 (스트림 시작 전 검증)"""
+        response = auth_client.post(
+            "/translate/text/stream",
+            json={"source_text": "hi", "source_lang": "en", "target_lang": "en"},
+        )
+
+        assert response.status_code == 422
@@ -0,0 +1,300 @@
+"""POST /translate/voice 테스트 (STT → 번역 → TTS 파이프라인, SSE)
+
+Google Speech/TTS/Gemini는 로컬 가짜 Provider (src.external.google.fakes) 사용
+- 가짜 STT는 오디오 바이트를 텍스트로 간주, 문장 부호마다 확정 구간
+- 확정 구간마다 번역, 번역문은 문장 단위로 합성
+- 첫 오디오가 발화 전체 인식 전에 나오는지 (단계 중첩)
+- 단계별 지연 히스토그램, 실패 시 error 이벤트 + 기록 미저장
+- 반복 문장은 음성 캐시 적중 (합성 생략, 기존 서명 URL)
+- 음성 Provider 미설정 시 502 (가짜 Provider로 대체하지 않음)
+"""
+
+import asyncio
+import base64
+import json
+from collections.abc import AsyncIterator, Iterator
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session, select
+
+from src.core.config import settings
+from src.core.metrics import get_metrics
+from src.external.google import SpeechError
+from src.external.google.fakes import (
+    FAKE_AUDIO_HEADER,
+    FakeAsyncVertexAIProvider,
+    FakeSpeechProvider,
+    FakeTextToSpeechProvider,
+)
+from src.external.supabase.fakes import MemoryStorageProvider
+from src.modules.profiles import Profile
+from src.modules.translations._audio_cache import AudioCache, AudioMemory
+from src.modules.translations._models import Translation
+from src.modules.translations._voice_pipeline import (
+    FIRST_AUDIO_METRIC,
+    STT_METRIC,
+    TRANSLATE_METRIC,
+    TTS_METRIC,
+    AudioEvent,
+    SegmentEvent,
+    TranscriptEvent,
+    VoicePipeline,
+    split_sentences,
+)
+
+_URL = "/translate/voice?source_lang=ko&target_lang=en"
+
+
+class _Google:
+    """요청에 주입되는 가짜 Provider 묶음"""
+
+    def __init__(self, storage: MemoryStorageProvider) -> None:
+        self.speech = FakeSpeechProvider()
+        self.tts = FakeTextToSpeechProvider()
+        self.gemini = FakeAsyncVertexAIProvider()
+        self.storage = storage
+
+
+@pytest.fixture
+def google(memory_storage: MemoryStorageProvider) -> Iterator[_Google]:
+    fakes = _Google(memory_storage)
+    get_metrics().clear()
+    with (
+        patch(
+            "src.external.supabase.get_async_storage_provider",
+            return_value=fakes.storage,
+        ),
+        patch(
+            "src.external.google.get_async_speech_provider", return_value=fakes.speech
+        ),
+        patch("src.external.google.get_async_tts_provider", return_value=fakes.tts),
+        patch(
+            "src.modules.translations._translation_service.get_async_vertex_provider",
+            return_value=fakes.gemini,
+        ),
+    ):
+        yield fakes
+    get_metrics().clear()
+
+
+def _events(body: str) -> list[tuple[str, dict]]:
+    """SSE 본문 → (event, data) 목록"""
+    events = []
+    for block in body.strip().split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append((fields["event"], json.loads(fields["data"])))
+    return events
+
+
+def _voice_rows(session: Session, profile: Profile) -> list[Translation]:
+    return list(
+        session.exec(
+            select(Translation).where(Translation.profile_id == profile.id)
+        ).all()
+    )
+
+
+class TestTranslateVoice:
+    """POST /translate/voice 테스트"""
+
+    def test_pipeline_events_then_done(
+        self,
+        auth_client: TestClient,
+        session: Session,
+        test_profile: Profile,
+        google: _Google,
+    ) -> None:
+        """구간별 인식/번역/오디오 이벤트 후 전체 발화를 한 건으로 저장"""
+        response = auth_client.post(
+            _URL,
+            content="주문할게요. 물 주세요.".encode(),
+            headers={"Content-Type": "audio/webm"},
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = _events(response.text)
+        finals = [d["text"] for n, d in events if n == "transcript" and d["is_final"]]
+        assert finals == ["주문할게요.", "물 주세요."]
+        translations = [d for n, d in events if n == "translation"]
+        assert [t["translated_text"] for t in translations] == [
+            "[en] 주문할게요.",
+            "[en] 물 주세요.",
+        ]
+        audio = [d for n, d in events if n == "audio"]
+        assert [base64.b64decode(a["audio"]) for a in audio] == [
+            FAKE_AUDIO_HEADER + "[en] 주문할게요.".encode(),
+            FAKE_AUDIO_HEADER + "[en] 물 주세요.".encode(),
+        ]
+
+        name, done = events[-1]
+        assert name == "done"
+        assert done["translation_type"] == "voice"
+        assert done["source_text"] == "주문할게요. 물 주세요."
+        assert done["first_audio_ms"] is not None
+
+        row = _voice_rows(session, test_profile)[0]
+        assert str(row.id) == done["id"]
+        assert row.translated_text == "[en] 주문할게요. [en] 물 주세요."
+        assert row.confidence_score == pytest.approx(0.9)
+
+    def test_stage_latency_metrics(
+        self,
+        auth_client: TestClient,
+        test_profile: Profile,
+        google: _Google,
+    ) -> None:
+        """단계별 지연 히스토그램 (STT/번역은 구간마다, TTS는 문장마다)"""
+        auth_client.post(_URL, content="하나. 둘. 셋.".encode())
+
+        metrics = get_metrics()
+        assert metrics.histogram(STT_METRIC).count == 3
+        assert metrics.histogram(TRANSLATE_METRIC).count == 3
+        assert metrics.histogram(TTS_METRIC).count == 3
+        assert metrics.histogram(FIRST_AUDIO_METRIC).count == 1
+
+    def test_tts_failure_emits_error(
+        self,
+        auth_client: TestClient,
+        session: Session,
+        test_profile: Profile,
+        google: _Google,
+    ) -> None:
+        """TTS 실패 -> error 이벤트, 기록 미저장"""
+
+        async def fail(text: str, language: str) -> bytes:
+            raise SpeechError("tts unavailable")
+
+        with patch.object(google.tts, "synthesize", side_effect=fail):
+            response = auth_client.post(_URL, content="주문할게요.".encode())
+
+        name, data = _events(response.text)[-1]
+        assert name == "error"
+        assert data["status"] == "EXTERNAL_SERVICE_ERROR"
+        assert get_metrics().counter("translation.voice.error") == 1
+        assert _voice_rows(session, test_profile) == []
+
+    def test_no_speech(
+        self,
+        auth_client: TestClient,
+        session: Session,
+        test_profile: Profile,
+        google: _Google,
+    ) -> None:
+        """인식된 음성 없음 -> ERROR_INVALID_AUDIO 이벤트"""
+        response = auth_client.post(_URL, content=b"   ")
+
+        assert _events(response.text) == [
+            (
+                "error",
+                {
+                    "status": "ERROR_INVALID_AUDIO",
+                    "message": "음성을 인식하지 못했어요",
+                },
+            )
+        ]
+        assert _voice_rows(session, test_profile) == []
+
+    def test_repeated_phrase_reuses_audio(
+        self,
+        auth_client: TestClient,
+        session: Session,
+        test_profile: Profile,
+        google: _Google,
+    ) -> None:
+        """같은 번역문 반복 -> 합성 없이 같은 서명 URL, 기록에 audio_url 저장"""
+        first = _events(auth_client.post(_URL, content="물 주세요.".encode()).text)
+        second = _events(auth_client.post(_URL, content="물 주세요.".encode()).text)
+
+        assert google.tts.calls == ["[en] 물 주세요."]
+        first_audio = next(d for n, d in first if n == "audio")
+        second_audio = next(d for n, d in second if n == "audio")
+        assert second_audio["audio"] == first_audio["audio"]
+        assert second_audio["audio_url"] == first_audio["audio_url"]
+        assert first_audio["audio_url"].startswith("https://storage.test/sign/tts/")
+        assert get_metrics().counter("translation.audio_cache.memory") == 1
+
+        _, done = second[-1]
+        assert done["audio_url"] == first_audio["audio_url"]
+
+    def test_rejected_before_stream(
+        self,
+        auth_client: TestClient,
+        test_profile: Profile,
+        google: _Google,
+    ) -> None:
+        """같은 언어 422, 최대 크기 초과 413 (스트림 시작 전 검증)"""
+        same = auth_client.post(
+            "/translate/voice?source_lang=en&target_lang=en", content=b"hi"
+        )
+        with patch.object(settings, "TRANSLATION_VOICE_MAX_AUDIO_BYTES", 4):
+            large = auth_client.post(_URL, content=b"too large")
+
+        assert same.status_code == 422
+        assert large.status_code == 413
+        assert google.speech.chunks == []
+
+    def test_unavailable_without_credentials(
+        self,
+        auth_client: TestClient,
+        session: Session,
+        test_profile: Profile,
+        google: _Google,
+    ) -> None:
+        """음성 Provider 미설정 -> 502, 가짜 음성으로 대체/저장하지 않음"""
+        for getter in ("get_async_speech_provider", "get_async_tts_provider"):
+            with patch(f"src.external.google.{getter}", return_value=None):
+                response = auth_client.post(_URL, content=b"Hello.")
+
+            assert response.status_code == 502
+            assert response.json()["status"] == "EXTERNAL_SERVICE_ERROR"
+        assert _voice_rows(session, test_profile) == []
+
+
+class TestVoicePipeline:
+    """파이프라인 단계 중첩 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_first_audio_before_speech_ends(self) -> None:
+        """첫 구간 오디오가 마지막 구간 인식 전에 나옴 (단계 중첩)"""
+        gemini = FakeAsyncVertexAIProvider(latency_s=0.01)
+
+        async def speech() -> AsyncIterator[bytes]:
+            # 말하는 속도로 업로드 (구간 사이 0.05초)
+            for sentence in ("하나. ", "둘. ", "셋."):
+                yield sentence.encode()
+                await asyncio.sleep(0.05)
+
+        async def translate(text: str) -> str:
+            return await gemini.translate(text, "ko", "en")
+
+        pipeline = VoicePipeline(
+            speech_provider=FakeSpeechProvider(),
+            audio_cache=AudioCache(
+                FakeTextToSpeechProvider(latency_s=0.01), memory=AudioMemory()
+            ),
+            translate=translate,
+            source_lang="ko",
+            target_lang="en",
+        )
+        events = [event async for event in pipeline.run(speech())]
+
+        first_audio = next(i for i, e in enumerate(events) if isinstance(e, AudioEvent))
+        last_final = max(
+            i
+            for i, e in enumerate(events)
+            if isinstance(e, TranscriptEvent) and e.is_final
+        )
+        assert first_audio < last_final
+        assert [e.index for e in events if isinstance(e, SegmentEvent)] == [0, 1, 2]
+        assert pipeline.result.source_text == "하나. 둘. 셋."
+
+    def test_split_sentences(self) -> None:
+        """번역문 문장 단위 분리 (TTS 합성 단위)"""
+        assert split_sentences("Hi there. How are you?  Fine!") == [
+            "Hi there.",
+            "How are you?",
+            "Fine!",
+        ]
@@ -0,0 +1,188 @@
+"""번역 메모리 테스트
+
+POST /translate/text + TranslationMemory
+
+- 정규화된 같은 문장 재요청 시 Vertex AI 미호출 (LRU)
+- 프로세스 메모리가 비어도 DB memory_key로 재사용
+- 버전 변경/TTL 경과 시 재번역
+- 긴 원문은 메모리 미사용
+"""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import patch
+from uuid import uuid4
+
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from src.core.config import settings
+from src.modules.profiles import Profile
+from src.modules.translations._models import Translation
+from src.modules.translations._translation_memory import (
+    TranslationMemory,
+    get_translation_memory,
+    memory_key,
+    normalize_text,
+)
+
+_TRANSLATE = (
+    "src.modules.translations._translation_service.TranslationService.translate"
+)
+
+
+def _request(text: str = "화장실 어디예요?") -> dict:
+    return {"source_text": text, "source_lang": "ko", "target_lang": "en"}
+
+
+def _key(text: str = "화장실 어디예요?") -> str:
+    version = f"mock:{settings.TRANSLATION_MEMORY_VERSION}"
+    return memory_key(
+        text, "ko", "en", context_primary=None, context_sub=None, version=version
+    )
+
+
+class TestTranslationMemory:
+    """번역 메모리 적용 테스트"""
+
+    def test_repeated_sentence_skips_llm(
+        self,
+        auth_client: TestClient,
+        test_profile: Profile,
+    ) -> None:
+        """공백/대소문자만 다른 같은 문장은 한 번만 번역"""
+        with patch(_TRANSLATE, return_value="Where is the restroom?") as mock:
+            first = auth_client.post("/translate/text", json=_request())
+            second = auth_client.post(
+                "/translate/text", json=_request("  화장실   어디예요? ")
+            )
+
+        assert first.status_code == 200
+        assert second.status_code == 200
+        assert mock.call_count == 1
+        assert second.json()["data"]["translated_text"] == "Where is the restroom?"
+        # 기록은 요청마다 저장
+        assert first.json()["data"]["id"] != second.json()["data"]["id"]
+
+    def test_db_hit_after_process_restart(
+        self,
+        auth_client: TestClient,
+        session: Session,
+        test_profile: Profile,
+    ) -> None:
+        """LRU가 비어도 DB memory_key 기록 재사용"""
+        session.add(
+            Translation(
+                id=uuid4(),
+                profile_id=test_profile.id,
+                source_text="화장실 어디예요?",
+                translated_text="Where's the bathroom?",
+                source_lang="ko",
+                target_lang="en",
+                memory_key=_key(),
+            )
+        )
+        session.commit()
+
+        with patch(_TRANSLATE) as mock:
+            response = auth_client.post("/translate/text", json=_request())
+
+        mock.assert_not_called()
+        assert response.json()["data"]["translated_text"] == "Where's the bathroom?"
+        assert len(get_translation_memory()) == 1
+
+    def test_expired_db_row_not_reused(
+        self,
+        auth_client: TestClient,
+        session: Session,
+        test_profile: Profile,
+    ) -> None:
+        """TTL 경과 기록은 재사용하지 않음"""
+        session.add(
+            Translation(
+                id=uuid4(),
+                profile_id=test_profile.id,
+                source_text="화장실 어디예요?",
+                translated_text="old",
+                source_lang="ko",
+                target_lang="en",
+                memory_key=_key(),
+                created_at=datetime.now(UTC)
+                - timedelta(seconds=settings.TRANSLATION_MEMORY_TTL_S + 60),
+            )
+        )
+        session.commit()
+
+        with patch(_TRANSLATE, return_value="Where is the restroom?") as mock:
+            response = auth_client.post("/translate/text", json=_request())
+
+        mock.assert_called_once()
+        assert response.json()["data"]["translated_text"] == "Where is the restroom?"
+
+    def test_version_bump_invalidates(
+        self,
+        auth_client: TestClient,
+        test_profile: Profile,
+    ) -> None:
+        """TRANSLATION_MEMORY_VERSION 변경 시 재번역"""
+        with patch(_TRANSLATE, return_value="Where is the restroom?") as mock:
+            auth_client.post("/translate/text", json=_request())
+            with patch.object(settings, "TRANSLATION_MEMORY_VERSION", "2"):
+                auth_client.post("/translate/text", json=_request())
+
+        assert mock.call_count == 2
+
+    def test_context_is_part_of_key(
+        self,
+        auth_client: TestClient,
+        test_profile: Profile,
+        seeded_context_prompts: list,
+    ) -> None:
+        """카테고리가 다르면 다른 메모리 항목"""
+        with patch(_TRANSLATE, return_value="Card OK?") as mock:
+            auth_client.post("/translate/text", json=_request("카드 돼요?"))
+            auth_client.post(
+                "/translate/text",
+                json=_request("카드 돼요?")
+                | {"context_primary": "FD6", "context_sub": "payment"},
+            )
+
+        assert mock.call_count == 2
+
+    def test_long_text_bypasses_memory(
+        self,
+        auth_client: TestClient,
+        test_profile: Profile,
+    ) -> None:
+        """TRANSLATION_MEMORY_MAX_CHARS 초과 원문은 매번 번역"""
+        text = "가" * (settings.TRANSLATION_MEMORY_MAX_CHARS + 1)
+
+        with patch(_TRANSLATE, return_value="A") as mock:
+            auth_client.post("/translate/text", json=_request(text))
+            auth_client.post("/translate/text", json=_request(text))
+
+        assert mock.call_count == 2
+        assert len(get_translation_memory()) == 0
+
+
+class TestTranslationMemoryUnit:
+    """TranslationMemory / 키 정규화 단위 테스트"""
+
+    def test_normalize_text(self) -> None:
+        assert normalize_text("  Where   IS\tit? ") == "where is it?"
+
+    def test_ttl_expiry(self) -> None:
+        now = [0.0]
+        memory = TranslationMemory(ttl_s=10, clock=lambda: now[0])
+        memory.set("k", "v")
+
+        assert memory.get("k") == "v"
+        now[0] = 10.0
+        assert memory.get("k") is None
+
+    def test_lru_eviction(self) -> None:
+        memory = TranslationMemory(max_size=1)
+        memory.set("a", "1")
+        memory.set("b", "2")
+
+        assert memory.get("a") is None
+        assert memory.get("b") == "2"